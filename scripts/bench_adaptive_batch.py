@@ -0,0 +1,195 @@
+"""
+Adaptive batching: batch sizes and send latency, fixed 50 ms vs AdaptiveBatcher.
+
+Feeds the recorded ACC drive (bench_ext_delta.py) into a buffer at the
+capture rate from a thread, the way the capture loop does, and runs the
+sender logic of TelemetryCapture._sender_loop against the real
+WebSocketClient + EncodePipeline, on a socket whose sends take --send-ms:
+
+  fixed     wake every 50 ms, send everything buffered (the old sender)
+  adaptive  network.batcher.AdaptiveBatcher decides when and how much
+
+Scenarios: a fast link (sends ~instant), a slow link (each send blocks for
+--send-ms, longer than 50 ms), and a stall (nothing sent for a second, then
+a burst). Reports messages sent, frames per message (mean / max), the age
+of each message's oldest frame when it hit the socket (p50 / p95) and the
+age of every frame (p95). After the stall adaptive sends fewer, fuller
+messages, which moves the per-message p95 towards the backlog's ages; the
+per-frame one is what the server actually sees.
+
+Checks that on the fast link adaptive batches stay near the 50 ms cadence,
+that on the slow link the age target grows so fewer messages carry the same
+frames, that after the stall no batch exceeds the frame limit, the age
+target is back at its floor and frames are no older than with the fixed
+sender, and that only batches actually sent are counted as flushes.
+
+Usage:
+    python scripts/bench_adaptive_batch.py [--seconds 6] [--send-ms 80]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ                                 # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from capture.tiers import build_plans                             # noqa: E402
+from network.batcher import AdaptiveBatcher                       # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+
+class _Socket:
+    def __init__(self, delay, stall=None):
+        self.delay = delay
+        self.stall = stall  # (start, end) monotonic window where sends hang
+        self.sent = []  # (wall time, frames, capture times)
+        self.pending = deque()
+
+    def send(self, message, opcode=1):
+        if not self.pending:
+            return  # schema announcement etc.
+        if self.stall and self.stall[0] <= time.monotonic() < self.stall[1]:
+            time.sleep(self.stall[1] - time.monotonic())
+        if self.delay:
+            time.sleep(self.delay)
+        frames, times = self.pending.popleft()
+        self.sent.append((time.time(), frames, times))
+
+
+def client(sock):
+    c = WebSocketClient('ws://unused', 'key', tier_plans=build_plans(HZ))
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                    'features': ['zlib']}))
+    return c
+
+
+def feed(buf, lock, frames, stop):
+    interval = 1.0 / HZ
+    tick = time.perf_counter()
+    for f in frames:
+        if stop.is_set():
+            return
+        with lock:
+            buf.append((time.time(), f))
+        tick += interval
+        time.sleep(max(0.0, tick - time.perf_counter()))
+
+
+def run(frames, delay, adaptive, stall_at=None):
+    sock = _Socket(delay)
+    c = client(sock)
+    pipe = EncodePipeline(2, 8)
+    batcher = AdaptiveBatcher() if adaptive else None
+    if batcher:
+        pipe.on_sent = batcher.observe
+    buf, lock, stop = deque(), threading.Lock(), threading.Event()
+    feeder = threading.Thread(target=feed, args=(buf, lock, frames, stop), daemon=True)
+    start = time.monotonic()
+    if stall_at is not None:
+        sock.stall = (start + stall_at, start + stall_at + 1.0)
+    feeder.start()
+
+    def submit(take, reason=None):
+        with lock:
+            batch = [buf.popleft() for _ in range(min(take, len(buf)))]
+        if batch:
+            if reason:
+                batcher.flushed(reason)
+            times, fr = zip(*batch)
+            sock.pending.append((len(batch), times))
+            pipe.submit(c, list(fr), list(times))
+
+    while feeder.is_alive() or buf:
+        if not batcher:
+            time.sleep(0.05)
+            if pipe.room:
+                submit(len(buf))
+            continue
+        time.sleep(batcher.tick_s)
+        with lock:
+            n = len(buf)
+            age = time.time() - buf[0][0] if n else 0.0
+        reason = batcher.due(n, age)
+        if pipe.room and reason:
+            submit(batcher.limit(), reason)
+    pipe.flush(30)
+    stop.set()
+    return sock.sent, batcher
+
+
+def summary(sent):
+    sizes = [n for _, n, _ in sent]
+    ages = sorted((t - times[0]) * 1000 for t, _, times in sent)
+    frame_ages = sorted((t - c) * 1000 for t, _, times in sent for c in times)
+    return {
+        'messages': len(sent),
+        'mean': sum(sizes) / len(sizes),
+        'max': max(sizes),
+        'p50': ages[len(ages) // 2],
+        'p95': ages[min(len(ages) - 1, int(len(ages) * 0.95))],
+        'frame_p95': frame_ages[min(len(frame_ages) - 1, int(len(frame_ages) * 0.95))],
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=6)
+    ap.add_argument('--send-ms', type=float, default=80)
+    args = ap.parse_args()
+
+    _, frames = record(args.seconds)
+    failures = []
+    results = {}
+    print(f'ACC drive, {args.seconds:g} s at {HZ} Hz; messages, frames/message (mean/max), '
+          f'oldest-frame age at the socket ms (p50/p95 of messages), every frame\'s (p95):')
+    for label, delay, stall in (('fast link', 0.0, None), (f'slow link ({args.send_ms:g} ms/send)',
+                                                              args.send_ms / 1000, None),
+                                ('1 s stall', 0.0, args.seconds / 3)):
+        for adaptive in (False, True):
+            sent, batcher = run(frames, delay, adaptive, stall)
+            s = summary(sent)
+            results[(label, adaptive)] = (s, batcher)
+            extra = ''
+            if batcher:
+                st = batcher.stats()
+                extra = f'  age target {st["age_ms"]} ms, flushes {st["flushes"]}'
+            print(f'  {label:<24} {"adaptive" if adaptive else "fixed 50 ms":<11} '
+                  f'{s["messages"]:>5} {s["mean"]:>6.1f}/{s["max"]:<4} '
+                  f'{s["p50"]:>7.0f}/{s["p95"]:<7.0f} {s["frame_p95"]:>6.0f}{extra}')
+
+    fast, _ = results[('fast link', True)]
+    if not 4 <= fast['mean'] <= 9:
+        failures.append('fast link cadence')
+    slow_fixed, _ = results[(f'slow link ({args.send_ms:g} ms/send)', False)]
+    slow, batcher = results[(f'slow link ({args.send_ms:g} ms/send)', True)]
+    if batcher.age_s <= 0.05 or slow['messages'] > slow_fixed['messages']:
+        failures.append('slow link adaptation')
+    stall_fixed, _ = results[('1 s stall', False)]
+    stall, batcher = results[('1 s stall', True)]
+    if stall['max'] > batcher.max_frames:
+        failures.append('stall burst exceeded the frame limit')
+    if batcher.age_s > 1.5 * batcher.min_age_s or stall['frame_p95'] > 1.1 * stall_fixed['frame_p95']:
+        failures.append('age target did not recover after the stall')
+    for (label, adaptive), (s, b) in results.items():
+        if adaptive and sum(b.flushes.values()) != s['messages']:
+            failures.append(f'{label}: flushes counted without a batch')
+
+    print('adaptive batching: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
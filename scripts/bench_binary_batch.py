@@ -0,0 +1,131 @@
+"""
+Binary telemetry_batch format: round trip + throughput benchmark.
+
+Ships captured frames through the real WebSocketClient in 50 ms batches once
+per wire format — named JSON (pre-schema), id-keyed JSON rows, binary rows,
+and the same two again with sample-rate tiers — and reports bytes on the wire
+and encode throughput. Every binary message is decoded with
+capture.binary.decode() using the row formats from the client's own
+`binary_format` message, and must match the JSON batch for the same frames
+(floats up to float32 rounding).
+
+Data: the recorded ACC drive from bench_ext_delta.py plus the AC / LMU /
+iRacing readers from bench_fused_read.py.
+
+Usage:
+    python scripts/bench_binary_batch.py [--seconds 30]
+
+Exit 0 = round trip OK.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_channel_tiers import capture                           # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from bench_fused_read import READERS                              # noqa: E402
+from capture.binary import RowFormat, decode, is_close            # noqa: E402
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from capture.tiers import build_plans                             # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+HZ = 120
+BATCH = 6
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message, opcode=1):
+        self.sent.append(message)
+
+
+def run(times, frames, tiered, features, acked=True):
+    """Ship everything; returns (control messages, batch messages, encode seconds)."""
+    c = WebSocketClient('ws://unused', 'key', tier_plans=build_plans(HZ) if tiered else None)
+    sock = _Socket()
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    if acked:
+        c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                        'features': features}))
+    control = [json.loads(m) for m in sock.sent]
+    sock.sent.clear()
+    start = time.perf_counter()
+    for i in range(0, len(frames), BATCH):
+        c.send_batch(frames[i:i + BATCH], times[i:i + BATCH])
+    return control, sock.sent, time.perf_counter() - start
+
+
+def check(control, binary, plain, tiered):
+    """Decoded binary batches vs the JSON id-keyed batches; returns errors."""
+    fmt_msg = next(m for m in control if m['type'] == 'binary_format')
+    errors = []
+    for payload, msg in zip(binary, plain):
+        msg = json.loads(msg)
+        entry = fmt_msg['layouts'][str(msg['layout'])]
+        specs = entry['tiers'] if tiered else [entry['rows']]
+        fmts = [RowFormat(s['channels']) for s in specs]
+        layout, version, base, blocks = decode(payload, fmts)
+        if (layout, version) != (msg['layout'], msg['schema']):
+            errors.append(f'header {layout}/{version} != {msg["layout"]}/{msg["schema"]}')
+        want = msg['tiers'] if tiered else [{'data': msg['data']}]
+        for got, exp in zip(blocks, want):
+            if len(got['data']) != len(exp['data']):
+                errors.append(f'block rows {len(got["data"])} != {len(exp["data"])}')
+                continue
+            if tiered and [base + o for o in got['t']] != [exp['t0'] + o for o in exp['t']]:
+                errors.append('block timestamps differ')
+            for g, e in zip(got['data'], exp['data']):
+                bad = [(a, b) for a, b in zip(g, e) if not is_close(a, b)]
+                if bad:
+                    errors.append(f'row values differ, e.g. {bad[0]}')
+        if len(errors) > 5:
+            break
+    return errors[:5]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=30)
+    args = ap.parse_args()
+
+    datasets = [('acc drive', *record(args.seconds))]
+    for game, make in READERS:
+        if game != 'acc':
+            datasets.append((game, *capture(make, args.seconds)))
+
+    failed = 0
+    print(f'{args.seconds:g} s at {HZ} Hz, {BATCH}-frame batches (KB on the wire, encode frames/s):')
+    print(f'  {"data":<10} {"named json":>16} {"rows json":>16} {"rows binary":>16} '
+          f'{"tiers json":>16} {"tiers binary":>16}')
+    for label, times, frames in datasets:
+        cells = []
+        _, named, secs = run(times, frames, False, [], acked=False)
+        cells.append((named, secs))
+        for tiered in (False, True):
+            _, plain, secs = run(times, frames, tiered, [])
+            cells.append((plain, secs))
+            control, binary, secs = run(times, frames, tiered, ['binary'])
+            cells.append((binary, secs))
+            errors = check(control, binary, plain, tiered)
+            if errors:
+                failed += 1
+                print(f'  MISMATCH {label} ({"tiers" if tiered else "rows"}):')
+                print('\n'.join(f'    {e}' for e in errors))
+        print(f'  {label:<10} ' + ' '.join(
+            f'{sum(len(m) for m in msgs) / 1024:>6,.0f} {len(frames) / secs / 1000:>6,.0f}k/s'
+            for msgs, secs in cells))
+    print(f'\nround trip: {"OK" if not failed else f"{failed} MISMATCHES"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
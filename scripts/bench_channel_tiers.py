@@ -0,0 +1,141 @@
+"""
+Per-channel sample-rate tiers: round trip + bandwidth/CPU benchmark.
+
+Drives each reader for a simulated stretch of capture at 120 Hz (fast channels
+changing every frame, slow ones too so nothing is deduplicated by accident),
+ships it through the real WebSocketClient send path in 50 ms batches, and:
+  - decodes every tiered batch with capture.tiers.expand() and checks each
+    fast-tier sample against the captured frame, and each slow channel against
+    the frame its tier last sampled (sample-and-hold);
+  - compares bytes on the wire and encode time: named frames (pre-schema),
+    id-keyed rows (schema acked, no tiers), id-keyed tiers.
+
+Usage:
+    python scripts/bench_channel_tiers.py [--seconds 10]
+
+Exit 0 = round trip OK.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_fused_read import READERS                          # noqa: E402
+from capture.schema import SCHEMA_VERSION                     # noqa: E402
+from capture.tiers import build_plans, expand                 # noqa: E402
+from network.websocket_client import WebSocketClient          # noqa: E402
+
+HZ = 120
+BATCH = 6  # frames per 50 ms send at 120 Hz
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def capture(make, seconds):
+    """(times, records) for `seconds` of 120 Hz capture with every slot varying."""
+    reader, rewind = make()
+    rewind()
+    base = reader.read_canonical()
+    varying = [i for i, v in enumerate(base) if type(v) is float]
+    t0 = 1_760_000_000.0
+    times, frames = [], []
+    for n in range(int(seconds * HZ)):
+        vals = list(base)
+        for i in varying:
+            vals[i] = vals[i] + n * 0.01 + i
+        times.append(t0 + n / HZ)
+        frames.append(type(base)(*vals))
+    return times, frames
+
+
+def client(tiered, acked):
+    c = WebSocketClient('ws://unused', 'key', tier_plans=build_plans(HZ) if tiered else None)
+    sock = _Socket()
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    if acked:
+        c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION}))
+    sock.sent.clear()
+    return c, sock
+
+
+def ship(c, times, frames):
+    start = time.perf_counter()
+    for i in range(0, len(frames), BATCH):
+        c.send_batch(frames[i:i + BATCH], times[i:i + BATCH])
+    return time.perf_counter() - start
+
+
+def check(plan, messages, times, frames):
+    """Sample-and-hold reconstruction vs the captured frames; returns error strings."""
+    errors = []
+    fast, slow = plan.tiers[0], plan.tiers[1:]
+    # Which frame each slow tier sampled last, as of frame n.
+    last_sampled = {t.hz: None for t in slow}
+    prev_period = {t.hz: -1 for t in slow}
+    held = {}
+    n = 0
+    for msg in messages:
+        for t_ms, values in expand(plan, json.loads(msg)['tiers'], held):
+            want_t = int(times[n] * 1000)
+            if t_ms != want_t:
+                errors.append(f'frame {n}: time {t_ms} != {want_t}')
+            for tier in slow:
+                period = int(times[n] * tier.hz)
+                if period > prev_period[tier.hz]:
+                    prev_period[tier.hz], last_sampled[tier.hz] = period, n
+            for tier in plan.tiers:
+                src = frames[n if tier is fast else last_sampled[tier.hz]]
+                for slot, cid in zip(tier.slots, tier.channel_ids):
+                    if values.get(cid) != src[slot]:
+                        errors.append(f'frame {n}: channel {cid} {values.get(cid)!r} != {src[slot]!r}')
+            n += 1
+    if n != len(frames):
+        errors.append(f'decoded {n} fast samples for {len(frames)} frames')
+    return errors[:5]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=10)
+    args = ap.parse_args()
+
+    failed = 0
+    plans = build_plans(HZ)
+    print(f'{args.seconds:g} s at {HZ} Hz, {BATCH}-frame batches:')
+    print(f'  {"game":<8} {"named KB":>9} {"id-keyed KB":>12} {"tiered KB":>10} '
+          f'{"named ms":>9} {"id ms":>6} {"tiered ms":>10}  tiers')
+    for game, make in READERS:
+        times, frames = capture(make, args.seconds)
+        results = []
+        for tiered, acked in ((False, False), (False, True), (True, True)):
+            c, sock = client(tiered, acked)
+            secs = ship(c, times, frames)
+            results.append((sum(len(m) for m in sock.sent) / 1024, secs * 1000, sock.sent))
+        plan = plans[frames[0].schema.id]
+        errors = check(plan, results[2][2], times, frames)
+        if errors:
+            failed += 1
+            print(f'  MISMATCH {game}:')
+            print('\n'.join(f'    {e}' for e in errors))
+        tiers = ' '.join(f'{t.hz}Hz:{len(t.slots)}' for t in plan.tiers)
+        (kb_n, ms_n, _), (kb_i, ms_i, _), (kb_t, ms_t, _) = results
+        print(f'  {game:<8} {kb_n:>9.0f} {kb_i:>12.0f} {kb_t:>10.0f} '
+              f'{ms_n:>9.0f} {ms_i:>6.0f} {ms_t:>10.0f}  {tiers}')
+    print(f'\nround trip: {"OK" if not failed else f"{failed} MISMATCHES"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Columnar JSON batches: round trip + size/encode benchmark.
+
+Ships captured frames through the real WebSocketClient in 50 ms batches as
+named JSON (pre-schema), id-keyed JSON rows and telemetry_batch_columnar, each
+with and without sample-rate tiers, and reports bytes and encode throughput.
+Every columnar batch is decoded with capture.columnar.decode() and must give
+exactly the values of the row batch for the same frames (hoisted constants
+included).
+
+Usage:
+    python scripts/bench_columnar_batch.py [--seconds 30]
+
+Exit 0 = round trip OK.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ, run                            # noqa: E402
+from bench_channel_tiers import capture                           # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from bench_fused_read import READERS                              # noqa: E402
+from capture.columnar import decode                               # noqa: E402
+from capture.schema import BY_ID, LAYOUTS                         # noqa: E402
+from capture.tiers import build_plans                             # noqa: E402
+
+
+def check(columnar, plain, tiered, plans):
+    errors = []
+    for cmsg, rmsg in zip(columnar, plain):
+        cmsg, rmsg = json.loads(cmsg), json.loads(rmsg)
+        layout = rmsg['layout']
+        got = decode(cmsg, plans)
+        if tiered:
+            want = []
+            for tier, block in zip(plans[layout].tiers, rmsg['tiers']):
+                names = [BY_ID[c].name for c in tier.channel_ids]
+                want.append([(block['t0'] + off, dict(zip(names, row)))
+                             for off, row in zip(block['t'], block['data'])])
+        else:
+            names = [BY_ID[c].name for c in LAYOUTS[layout]]
+            want = [[dict(zip(names, row)) for row in rmsg['data']]]
+            got = [[values for _, values in block] for block in got]
+        if got != want:
+            errors.append(f'batch differs (layout {layout})')
+            break
+    return errors
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=30)
+    args = ap.parse_args()
+
+    plans = build_plans(HZ)
+    datasets = [('acc drive', *record(args.seconds))]
+    for game, make in READERS:
+        if game != 'acc':
+            datasets.append((game, *capture(make, args.seconds)))
+
+    failed = 0
+    print(f'{args.seconds:g} s at {HZ} Hz, 6-frame batches (KB on the wire, encode frames/s):')
+    print(f'  {"data":<10} {"named json":>16} {"rows json":>16} {"columnar":>16} '
+          f'{"tiers json":>16} {"tiers columnar":>16}')
+    for label, times, frames in datasets:
+        cells = []
+        _, named, secs = run(times, frames, False, [], acked=False)
+        cells.append((named, secs))
+        for tiered in (False, True):
+            _, plain, secs = run(times, frames, tiered, [])
+            cells.append((plain, secs))
+            _, columnar, secs = run(times, frames, tiered, ['columnar'])
+            cells.append((columnar, secs))
+            errors = check(columnar, plain, tiered, plans)
+            if errors:
+                failed += 1
+                print(f'  MISMATCH {label} ({"tiers" if tiered else "rows"}): {errors[0]}')
+        print(f'  {label:<10} ' + ' '.join(
+            f'{sum(len(m) for m in msgs) / 1024:>6,.0f} {len(frames) / secs / 1000:>6,.0f}k/s'
+            for msgs, secs in cells))
+    print(f'\nround trip: {"OK" if not failed else f"{failed} MISMATCHES"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
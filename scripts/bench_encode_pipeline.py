@@ -0,0 +1,148 @@
+"""
+Encode pipeline: ordering, backpressure and sender-thread time.
+
+Ships the recorded ACC drive (bench_ext_delta.py) through the real
+WebSocketClient twice per wire format: inline (send_batch on the sender
+thread, as before) and through network.pipeline.EncodePipeline, one batch
+every --interval-ms (the real sender sends every 50 ms; shorter keeps the run
+quick while leaving the workers time to finish). Reports how long the sender
+thread is busy per batch either way and the pipeline's encode metrics. The
+pipeline must put exactly the same payloads on
+the socket in the same order (compressed ones compared after decompressing,
+since the adaptive level may differ).
+
+A second run uses a slow socket (each send blocks for --send-ms) with a small
+queue depth: in-flight batches must never exceed the depth and the sender
+must have been held back.
+
+Usage:
+    python scripts/bench_encode_pipeline.py [--seconds 20] [--workers 2]
+        [--interval-ms 5] [--send-ms 30]
+
+Exit 0 = order and backpressure OK.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import BATCH, HZ                          # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from capture.tiers import build_plans                             # noqa: E402
+from network.compression import MAGIC, decompress                 # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+from network.zdict import dictionary                              # noqa: E402
+
+
+class _Socket:
+    def __init__(self, delay=0.0):
+        self.sent = []
+        self.delay = delay
+
+    def send(self, message, opcode=1):
+        if self.delay:
+            time.sleep(self.delay)
+        self.sent.append(message)
+
+
+def client(features, sock):
+    c = WebSocketClient('ws://unused', 'key', tier_plans=build_plans(HZ))
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                    'features': features}))
+    sock.sent.clear()
+    return c
+
+
+def plain(messages):
+    out = []
+    for m in messages:
+        if isinstance(m, bytes) and m[:2] == MAGIC:
+            m = decompress(m, {SCHEMA_VERSION: dictionary(SCHEMA_VERSION)})[1]
+        out.append(m.encode() if isinstance(m, str) else m)
+    return out
+
+
+def percentile(samples, q):
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(len(s) * q))] * 1000
+
+
+def paced(send, times, frames, interval):
+    """Call send(frames, times) per batch every `interval` s; busy time per call."""
+    busy = []
+    tick = time.perf_counter()
+    for i in range(0, len(frames), BATCH):
+        start = time.perf_counter()
+        send(frames[i:i + BATCH], times[i:i + BATCH])
+        busy.append(time.perf_counter() - start)
+        tick += interval
+        time.sleep(max(0.0, tick - time.perf_counter()))
+    return busy
+
+
+def inline(times, frames, features, interval):
+    sock = _Socket()
+    c = client(features, sock)
+    busy = paced(c.send_batch, times, frames, interval)
+    return sock.sent, busy
+
+
+def piped(times, frames, features, workers, interval, depth=8, delay=0.0):
+    sock = _Socket(delay)
+    c = client(features, sock)
+    pipe = EncodePipeline(workers, depth)
+    busy = paced(lambda f, t: pipe.submit(c, f, t), times, frames, interval)
+    pipe.flush(60)
+    return sock.sent, busy, pipe.stats()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=20)
+    ap.add_argument('--workers', type=int, default=2)
+    ap.add_argument('--interval-ms', type=float, default=5)
+    ap.add_argument('--send-ms', type=float, default=30)
+    args = ap.parse_args()
+
+    times, frames = record(args.seconds)
+    interval = args.interval_ms / 1000
+    failed = 0
+    print(f'ACC drive, {args.seconds:g} s at {HZ} Hz, {BATCH}-frame batches with tiers, '
+          f'{args.workers} workers; sender-thread ms per batch (p50/p95):')
+    print(f'  {"format":<16} {"inline":>13} {"pipeline":>13} {"encode p50/p95":>16} {"order":>6}')
+    for features in ([], ['ext_delta'], ['zlib'], ['columnar', 'zlib'], ['binary', 'zlib'], ['gorilla']):
+        sent_a, busy_a = inline(times, frames, features, interval)
+        sent_b, busy_b, st = piped(times, frames, features, args.workers, interval)
+        ok = plain(sent_a) == plain(sent_b)
+        failed += not ok
+        enc = st['encode_ms']
+        print(f'  {"+".join(features) or "json rows":<16} '
+              f'{percentile(busy_a, .5):>6.3f}/{percentile(busy_a, .95):<6.3f} '
+              f'{percentile(busy_b, .5):>6.3f}/{percentile(busy_b, .95):<6.3f} '
+              f'{enc["p50"]:>7}/{enc["p95"]:<8} {"OK" if ok else "DIFF":>6}')
+
+    # Slow socket: the stage fills up and must hold the sender back.
+    depth = 4
+    n = min(len(frames), BATCH * 40)
+    sent, busy, st = piped(times[:n], frames[:n], ['zlib'], args.workers, 0.0, depth,
+                           args.send_ms / 1000)
+    bounded = st['max_in_flight'] <= depth and st['blocked_ms'] > 0 and len(sent) == n // BATCH
+    failed += not bounded
+    print(f'\nslow socket ({args.send_ms:g} ms/send, depth {depth}): max in flight '
+          f'{st["max_in_flight"]}, sender blocked {st["blocked_ms"]:,.0f} ms, '
+          f'latency p95 {st["latency_ms"]["p95"]} ms, {len(sent)} batches sent')
+    print(f'order + backpressure: {"OK" if not failed else "FAILED"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
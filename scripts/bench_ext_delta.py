@@ -0,0 +1,167 @@
+"""
+Ext keyframe/delta encoding: round trip + byte reduction on a recorded ACC drive.
+
+Records a deterministic ACC session offline — the synthetic_acc_drive.py drive
+model written into real ACCPhysics/ACCGraphics bytes and read back through the
+unmodified reader's read_canonical() at 120 Hz — then ships it through the
+real WebSocketClient in 50 ms batches, with and without ext deltas, both as
+plain id-keyed rows and as per-tier blocks. Halfway through, the connection
+drops and reconnects (and later the server asks for a resync), so the
+keyframe-on-resync path is exercised too.
+
+Every delta-encoded batch is decoded with capture.ext_delta's reference
+decoder (fresh decoder state per connection, as on the server) and must equal
+the same batch sent without deltas.
+
+Usage:
+    python scripts/bench_ext_delta.py [--seconds 120]
+
+Exit 0 = round trip OK.
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from capture.ext_delta import ExtDeltaStreamsDecoder                            # noqa: E402
+from capture.frame import ACC_SCHEMA                                            # noqa: E402
+from capture.schema import SCHEMA_VERSION                                       # noqa: E402
+from capture.tiers import build_plans                                           # noqa: E402
+from games.acc_structs import ACCGraphics, ACCPhysics                           # noqa: E402
+from network.websocket_client import WebSocketClient                           # noqa: E402
+from synthetic_acc_drive import (SyntheticACCReader, advance_drive,             # noqa: E402
+                                 fill_structs, fresh_state, lap_corner_deltas)
+
+HZ = 120
+BATCH = 6
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def record(seconds):
+    """(times, records) of a synthetic ACC drive through the real reader."""
+    rng = random.Random(42)
+    reader = SyntheticACCReader('ferrari_296_gt3', 'spa')
+    p, g = ACCPhysics(), ACCGraphics()
+    st = fresh_state()
+    deltas = lap_corner_deltas(0, rng)
+    times, frames = [], []
+    t0 = 1_760_000_000.0
+    for n in range(int(seconds * HZ)):
+        if advance_drive(st, 1.0 / HZ, deltas):
+            deltas = lap_corner_deltas(st['laps_done'], rng)
+        fill_structs(p, g, st)
+        reader.push(p, g)
+        frame = reader.read_canonical()
+        if frame:
+            times.append(t0 + n / HZ)
+            frames.append(frame)
+    return times, frames
+
+
+def ack(c, sock, delta):
+    c._on_open(sock)
+    c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                    'features': ['ext_delta'] if delta else []}))
+
+
+def run(times, frames, tiered, delta, acked=True):
+    """Ship the drive; returns (connections: [[batch messages]], total bytes)."""
+    c = WebSocketClient('ws://unused', 'key', tier_plans=build_plans(HZ) if tiered else None)
+    sock = _Socket()
+    c.ws, c.connected = sock, True
+    if acked:
+        ack(c, sock, delta)
+    else:
+        c._on_open(sock)
+    conns, total = [[]], 0
+    starts = range(0, len(frames), BATCH)
+    for k, i in enumerate(starts):
+        if acked and k == len(starts) // 2:
+            c._on_close(sock, 1006, 'dropped')
+            c.connected = True
+            ack(c, sock, delta)
+            conns.append([])
+        if acked and k == (3 * len(starts)) // 4:
+            c._on_message(sock, json.dumps({'type': 'resync'}))
+        sock.sent.clear()
+        c.send_batch(frames[i:i + BATCH], times[i:i + BATCH])
+        for m in sock.sent:
+            total += len(m)
+            conns[-1].append(json.loads(m))
+    return conns, total
+
+
+def decode(conns, plans):
+    """Delta batches -> plain batches (a fresh decoder per connection)."""
+    out = []
+    for conn in conns:
+        dec = ExtDeltaStreamsDecoder()
+        for msg in conn:
+            layout = msg['layout']
+            if 'tiers' in msg:
+                for n, (tier, block) in enumerate(zip(plans[layout].tiers, msg['tiers'])):
+                    block['data'] = dec.rows((layout, n), block['data'], tier.ext_split)
+            else:
+                msg['data'] = dec.rows((layout, None), msg['data'], ACC_SCHEMA.ext_start)
+            out.append(msg)
+    return out
+
+
+def ext_bytes(conns, tiered, plans):
+    """Bytes of the ext part alone, across all batches."""
+    total = 0
+    for conn in conns:
+        for msg in conn:
+            if tiered:
+                for tier, block in zip(plans[msg['layout']].tiers, msg['tiers']):
+                    total += sum(len(json.dumps(r[tier.ext_split:])) for r in block['data'])
+            else:
+                total += sum(len(json.dumps(r[ACC_SCHEMA.ext_start:])) for r in msg['data'])
+    return total
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=120)
+    args = ap.parse_args()
+
+    times, frames = record(args.seconds)
+    plans = build_plans(HZ)
+    print(f'recorded ACC drive: {len(frames):,} frames ({args.seconds:g} s at {HZ} Hz), '
+          f'{len(ACC_SCHEMA.ext_channels)} ext channels, {BATCH}-frame batches')
+
+    _, named = run(times, frames, tiered=False, delta=False, acked=False)
+    print(f'  {"named frames (pre-schema)":<28} {named / 1024:>9,.0f} KB')
+    failed = 0
+    for tiered in (False, True):
+        label = 'tiers' if tiered else 'rows'
+        plain, plain_total = run(times, frames, tiered, delta=False)
+        coded, coded_total = run(times, frames, tiered, delta=True)
+        ext_plain = ext_bytes(plain, tiered, plans)
+        ext_coded = ext_bytes(coded, tiered, plans)
+        plain_flat = [m for conn in plain for m in conn]
+        if decode(coded, plans) != plain_flat:
+            failed += 1
+            print(f'  MISMATCH: {label} + ext delta does not decode to {label}')
+        print(f'  {"id-keyed " + label:<28} {plain_total / 1024:>9,.0f} KB  (ext {ext_plain / 1024:,.0f} KB)')
+        print(f'  {"id-keyed " + label + " + ext delta":<28} {coded_total / 1024:>9,.0f} KB  '
+              f'(ext {ext_coded / 1024:,.0f} KB, {ext_coded / ext_plain - 1:+.0%}; '
+              f'batch {coded_total / plain_total - 1:+.0%})')
+    print(f'\nround trip (incl. reconnect + resync): {"OK" if not failed else f"{failed} MISMATCHES"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Memory per buffered frame: frame dicts vs compact Frame records.
+
+Fills a send buffer (the same bounded deque main.py uses) with 1000 frames per
+reader, once as the old normalize() dicts and once as the Frame records
+read_canonical() now returns, and reports the retained bytes (tracemalloc) per
+1000 frames. Values are varied per frame so float objects aren't shared. Also
+checks that a JSON batch encoded from records is byte-identical to one encoded
+from dicts, and what the conversion costs at encode time.
+
+Usage:
+    python scripts/bench_frame_memory.py [--frames 1000]
+
+Exit 0 = wire output identical.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_fused_read import READERS         # noqa: E402
+from capture.canonical import normalize      # noqa: E402
+from capture.frame import as_dict            # noqa: E402
+
+
+def retained(make_frame, n):
+    """Bytes still allocated after building an n-frame buffer."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    buf = deque(maxlen=2400)
+    for i in range(n):
+        buf.append(make_frame(i))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(s.size_diff for s in after.compare_to(before, 'filename'))
+    return size, buf
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--frames', type=int, default=1000)
+    args = ap.parse_args()
+    n = args.frames
+
+    ok = True
+    print(f'retained memory per {n:,} buffered frames:')
+    print(f'  {"game":<8} {"dict KB":>9} {"record KB":>10} {"saved":>7} {"encode +us/frame":>17}')
+    for game, make in READERS:
+        reader, rewind = make()
+
+        # Fresh float objects per frame, like live data (no shared constants).
+        def as_old(i):
+            rewind()
+            f = normalize(game, reader.read())
+            f['speed_kmh'] = f['speed_kmh'] + i * 1e-3
+            f['steering_input'] = float(i)
+            return f
+
+        def as_new(i):
+            rewind()
+            r = reader.read_canonical()
+            return r._replace(s1=r[1] + i * 1e-3, s6=float(i))
+
+        old_bytes, old_buf = retained(as_old, n)
+        new_bytes, new_buf = retained(as_new, n)
+
+        # Wire output must not change.
+        if json.dumps([as_dict(f) for f in new_buf]) != json.dumps(list(old_buf)):
+            ok = False
+            print(f'  {game}: JSON batch from records differs from dict batch!')
+
+        batch = list(new_buf)[:6]
+        start = time.perf_counter()
+        for _ in range(2000):
+            json.dumps([as_dict(f) for f in batch])
+        t_new = time.perf_counter() - start
+        old_batch = list(old_buf)[:6]
+        start = time.perf_counter()
+        for _ in range(2000):
+            json.dumps(old_batch)
+        t_old = time.perf_counter() - start
+        extra = (t_new - t_old) / (2000 * len(batch)) * 1e6
+
+        print(f'  {game:<8} {old_bytes / 1024:>9.0f} {new_bytes / 1024:>10.0f} '
+              f'{1 - new_bytes / old_bytes:>6.0%} {extra:>17.2f}')
+    print(f'\nwire output: {"identical" if ok else "DIFFERS"}')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Parity check + benchmark for the fused reader -> canonical fast path.
+
+Every reader has read() (the full nested raw dict, for debug/recording) and
+read_canonical() (the capture hot path, filled straight from the structs).
+This feeds real struct bytes through the UNMODIFIED readers — BytesIO / an
+anonymous mmap standing in for the Windows shared maps, as in
+synthetic_acc_drive.py — and asserts read_canonical() == normalize(read())
+(the compact Frame record compared via its wire dict) for AC, ACC, LMU and
+iRacing, then times both paths per frame.
+
+Usage:
+    python scripts/bench_fused_read.py [--frames 50000]
+
+Exit 0 = parity holds.
+"""
+
+import argparse
+import io
+import mmap
+import struct
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from capture.canonical import normalize                                      # noqa: E402
+from capture.frame import as_dict                                            # noqa: E402
+from fake_iracing_windows import (HEADER_SIZE, MAX_BUFS, SESSION_YAML,       # noqa: E402
+                                  ST_CONNECTED, VARS, build_layout)
+from games.ac import ACGraphics, ACPhysics, ACTelemetry                       # noqa: E402
+from games.acc_shared_memory import ACCSharedMemoryReader                     # noqa: E402
+from games.acc_structs import ACCGraphics, ACCPhysics                         # noqa: E402
+from games.iracing import IRacingTelemetry                                   # noqa: E402
+from games.lmu import LMUTelemetry, VehicleTelemetry                          # noqa: E402
+
+
+class _Rewind:
+    """Makes a reader see every read as a fresh packet (its dedupe field reset)."""
+
+    def __init__(self, reader, attr, value):
+        self.reader, self.attr, self.value = reader, attr, value
+
+    def __call__(self):
+        setattr(self.reader, self.attr, self.value)
+
+
+def ac_reader():
+    p, g = ACPhysics(), ACGraphics()
+    p.packetId, p.speedKmh, p.rpms, p.gear, p.gas, p.brake, p.fuel = 9, 212.4, 7350, 5, 0.93, 0.0, 30.5
+    p.drsAvailable = 1
+    for i in range(4):
+        p.tyreCoreTemperature[i] = 81.5 + i
+        p.tyreWear[i] = 0.97
+        p.wheelsPressure[i] = 27.4
+        p.brakeTemp[i] = 410.0 + i
+    g.AC_STATUS, g.completedLaps, g.iCurrentTime, g.iBestTime, g.iLastTime = 2, 3, 45_120, 101_950, 102_300
+    r = ACTelemetry()
+    r.physics_map, r.graphics_map, r.connected = io.BytesIO(bytes(p)), io.BytesIO(bytes(g)), True
+    return r, _Rewind(r, 'last_packet_id', -1)
+
+
+def acc_reader():
+    p, g = ACCPhysics(), ACCGraphics()
+    p.packetId, p.speedKmh, p.rpms, p.gear, p.gas, p.brake, p.fuel = 4, 187.0, 6900, 4, 0.0, 0.82, 41.2
+    for i in range(4):
+        p.tyreCoreTemperature[i] = 78.0 + i
+        p.wheelsPressure[i] = 27.8
+        p.brakeTemp[i] = 520.0 - i
+        p.padLife[i] = 28.4
+    g.status, g.completedLaps, g.iCurrentTime, g.iBestTime, g.isValidLap = 2, 7, 61_004, 118_220, 1
+    g.tyreCompound = 'dry_compound'
+    r = ACCSharedMemoryReader()
+    r.physics_map, r.graphics_map, r.connected = io.BytesIO(bytes(p)), io.BytesIO(bytes(g)), True
+    r.car_name, r.track_name = 'ferrari_296_gt3', 'spa'
+    return r, _Rewind(r, 'last_packet_id', -1)
+
+
+def lmu_reader():
+    v = VehicleTelemetry()
+    v.elapsedTime, v.speed, v.engineRPM, v.gear, v.fuel = 812.5, 61.0, 8120.0, 6, 52.5
+    v.unfilteredThrottle, v.unfilteredSteering = 1.0, -0.12
+    v.curLapTime, v.bestLapTime, v.lastLapTime, v.lapNumber = 33.25, 212.75, 213.5, 4
+    for i in range(4):
+        v.wheels[i].temperature[1] = 350.0 + i
+        v.wheels[i].brakeTemp = 640.0 + i
+        v.wheels[i].pressure = 145.0
+        v.wheels[i].wear = 0.93
+    r = LMUTelemetry()
+    r.shared_memory, r.connected = io.BytesIO(bytes(v)), True
+    return r, _Rewind(r, 'last_update', 0)
+
+
+def iracing_reader():
+    headers, offsets, row_len = build_layout()
+    sess_off = HEADER_SIZE + len(headers)
+    buf0 = sess_off + len(SESSION_YAML)
+    mm = mmap.mmap(-1, buf0 + row_len * MAX_BUFS + 64)
+    h = struct.pack('<10i', 2, ST_CONNECTED, 60, 1, len(SESSION_YAML), sess_off,
+                    len(VARS), HEADER_SIZE, MAX_BUFS, row_len) + b'\x00' * 8
+    for i in range(MAX_BUFS):
+        h += struct.pack('<2i', 5 if i == 1 else 0, buf0 + i * row_len) + b'\x00' * 8
+    mm.seek(0); mm.write(h)
+    mm.seek(HEADER_SIZE); mm.write(headers)
+    mm.seek(sess_off); mm.write(SESSION_YAML)
+    vals = {
+        'SessionTime': 812.5, 'Speed': 58.0, 'Throttle': 0.8, 'Brake': 0.0, 'Clutch': 0.0,
+        'RPM': 7600.0, 'Gear': 4, 'Lap': 3, 'LapDistPct': 0.42, 'LapCurrentLapTime': 51.2,
+        'LapLastLapTime': 138.9, 'LapBestLapTime': 137.4, 'FuelLevel': 44.1,
+        'SteeringWheelAngle': 0.3, 'SteeringWheelAngleMax': 4.5, 'LatAccel': 11.2,
+        'LongAccel': 1.0, 'Lat': 50.44, 'Lon': 5.25, 'Alt': 80.0, 'LFtempCM': 82.0,
+        'RFtempCM': 81.0, 'LRtempCM': 83.0, 'RRtempCM': 82.5, 'TrackTempCrew': 31.0,
+    }
+    for name, (voff, fmt) in offsets.items():
+        mm.seek(buf0 + row_len + voff); mm.write(struct.pack('<' + fmt, vals[name]))
+    r = IRacingTelemetry()
+    r.mm = mm
+    hdr = r._header()
+    r.vars = r._read_var_table(hdr)
+    r._read_session_yaml(hdr)
+    r.connected = True
+    return r, _Rewind(r, 'last_tick', -1)
+
+
+READERS = (('ac', ac_reader), ('acc', acc_reader), ('lmu', lmu_reader), ('iracing', iracing_reader))
+
+
+def bench(fn, rewind, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        rewind()
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--frames', type=int, default=50_000)
+    args = ap.parse_args()
+
+    bad = 0
+    rows = []
+    for game, make in READERS:
+        reader, rewind = make()
+        rewind()
+        want = normalize(game, reader.read())
+        rewind()
+        got = as_dict(reader.read_canonical())
+        if want != got or list(want) != list(got):
+            bad += 1
+            print(f'  MISMATCH {game}:')
+            for k in sorted(set(want) | set(got)):
+                if want.get(k, '<missing>') != got.get(k, '<missing>'):
+                    print(f'    {k}: read+normalize={want.get(k)!r} read_canonical={got.get(k)!r}')
+        two_step = bench(lambda: normalize(game, reader.read()), rewind, args.frames)
+        fused = bench(reader.read_canonical, rewind, args.frames)
+        rows.append((game, two_step, fused))
+
+    print(f'parity: {"OK" if not bad else f"{bad} MISMATCHES"} (AC, ACC, LMU, iRacing)')
+    print(f'\nper-frame read cost incl. shared-memory copy ({args.frames:,} frames each):')
+    print(f'  {"game":<8} {"read+normalize us":>18} {"read_canonical us":>18} {"speedup":>8}')
+    for game, two_step, fused in rows:
+        print(f'  {game:<8} {two_step:>18.2f} {fused:>18.2f} {two_step / fused:>7.2f}x')
+    return 1 if bad else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Gorilla time-series codec: round trip + size/speed benchmark.
+
+Ships captured frames through the real WebSocketClient in 50 ms batches as
+id-keyed JSON rows, JSON rows + zlib (per batch, plain and with the preset
+dictionary), binary rows and Gorilla (capture.gorilla, plain and + zlib),
+without and with sample-rate tiers, and reports bytes on the wire, encode
+throughput and the pure-Python reference decoder's throughput.
+
+Every Gorilla batch is decoded with capture.gorilla.decode() from the
+client's own schema/tier_plan messages and must match the JSON batch for the
+same frames: timestamps, ints, bools and strings exactly, floats exactly
+unless the reader already rounds them to their declared precision
+(schema.QUANTISED), then within half a unit of it. The ACC drive is also
+written to a local recording (RecordingWriter) and read back (read_recording).
+
+iRacing GPS: lon/lat with full double resolution (as the SDK reports them)
+go through the wire, with and without tiers, and a recording; the decoded
+ext.gps_lon/ext.gps_lat must equal the raw values.
+
+Usage:
+    python scripts/bench_gorilla_codec.py [--seconds 30]
+
+Exit 0 = round trip OK.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ, BATCH, run                     # noqa: E402
+from bench_channel_tiers import capture                           # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from bench_fused_read import READERS                              # noqa: E402
+from capture.gorilla import (Catalog, RecordingWriter, decode,    # noqa: E402
+                             read_recording)
+from capture.frame import IRACING_SCHEMA                          # noqa: E402
+from capture.schema import (BY_ID, BY_NAME, LAYOUTS, QUANTISED,   # noqa: E402
+                            SCHEMA_VERSION)
+from capture.tiers import build_plans                             # noqa: E402
+
+
+def expected(msg, times):
+    """[(t0, offsets, rows)] per block of a JSON id-keyed batch."""
+    if 'tiers' in msg:
+        return [(b['t0'], b['t'], b['data']) for b in msg['tiers']]
+    t0 = int(times[0] * 1000)
+    return [(t0, [int(t * 1000) - t0 for t in times], msg['data'])]
+
+
+def close(got, want, channel, rounded):
+    if want is None or got is None or channel.type != 'float':
+        return got == want
+    if channel.precision is None or not rounded:
+        return got == float(want)
+    return abs(got - want) <= 0.5 * 10 ** -channel.precision * (1 + 1e-9)
+
+
+def check(blocks_got, msg, times, plans):
+    layout = msg['layout']
+    if 'tiers' in msg:
+        ids = [t.channel_ids for t in plans[layout].tiers]
+    else:
+        ids = [LAYOUTS[layout]]
+    for (t0, offs, rows), got, cids in zip(expected(msg, times), blocks_got, ids):
+        if [t0 + o for o in offs] != [got['t0'] + o for o in got['t']]:
+            return 'timestamps differ'
+        channels = [(BY_ID[c], c in QUANTISED[layout]) for c in cids]
+        for row_w, row_g in zip(rows, got['data']):
+            for (ch, rounded), w, g in zip(channels, row_w, row_g):
+                if not close(g, w, ch, rounded):
+                    return f'{ch.name}: {g!r} != {w!r}'
+    return None
+
+
+def roundtrip(times, frames, tiered, plans):
+    control, plain, _ = run(times, frames, tiered, [])
+    _, packed, secs = run(times, frames, tiered, ['gorilla'])
+    schema = next(m for m in control if m['type'] == 'schema')
+    tier_plan = next((m['layouts'] for m in control if m['type'] == 'tier_plan'), None)
+    catalog = Catalog(schema, tier_plan)
+    start = time.perf_counter()
+    decoded = [decode(p, catalog) for p in packed]
+    dsecs = time.perf_counter() - start
+    for i, (msg, (_, _, _, blocks)) in enumerate(zip(plain, decoded)):
+        err = check(blocks, json.loads(msg), times[i * BATCH:(i + 1) * BATCH], plans)
+        if err:
+            return plain, packed, secs, dsecs, err
+    return plain, packed, secs, dsecs, None
+
+
+def recording(times, frames, plans):
+    """Write the run's Gorilla batches to a recording; returns (bytes, batches read)."""
+    _, packed, _ = run(times, frames, True, ['gorilla'])
+    fd, path = tempfile.mkstemp(suffix='.mgrc')
+    os.close(fd)
+    try:
+        with RecordingWriter(path, plans) as rec:
+            for message in packed:
+                rec.append(message)
+        size = os.path.getsize(path)
+        n = sum(1 for _ in read_recording(path))
+    finally:
+        os.remove(path)
+    return size, n, len(packed)
+
+
+def gps_roundtrip(times, frames, plans):
+    """iRacing frames with raw SDK-resolution lon/lat through the wire (rows
+    and tiers) and a recording; returns the first mismatch or None."""
+    slots = {BY_NAME[f'ext.{n}'].id: IRACING_SCHEMA.channels.index(n) for n in ('gps_lon', 'gps_lat')}
+    gps = []
+    for n, f in enumerate(frames):
+        vals = list(f)
+        lon, lat = slots.values()
+        vals[lon] = 5.9713456789123 + n * 3.3e-7
+        vals[lat] = 50.4372819283746 - n * 2.1e-7
+        gps.append(type(f)(*vals))
+    # raw value per capture ms, so tiers that keep only some rows still line up
+    raw = {int(t * 1000): f for t, f in zip(times, gps)}
+
+    def compare(batches, tiered, where):
+        layout = IRACING_SCHEMA.id
+        ids = [t.channel_ids for t in plans[layout].tiers] if tiered else [LAYOUTS[layout]]
+        seen = 0
+        for _, _, _, blocks in batches:
+            for block, cids in zip(blocks, ids):
+                for cid, slot in slots.items():
+                    if cid not in cids:
+                        continue
+                    i = cids.index(cid)
+                    for off, row in zip(block['t'], block['data']):
+                        want = raw[block['t0'] + off][slot]
+                        seen += 1
+                        if row[i] != want:
+                            return f'{where}: {BY_ID[cid].name} {row[i]!r} != {want!r}'
+        return None if seen else f'{where}: no gps values decoded'
+
+    for tiered in (False, True):
+        control, packed, _ = run(times, gps, tiered, ['gorilla'])
+        schema = next(m for m in control if m['type'] == 'schema')
+        tier_plan = next((m['layouts'] for m in control if m['type'] == 'tier_plan'), None)
+        catalog = Catalog(schema, tier_plan)
+        err = compare([decode(p, catalog) for p in packed], tiered, 'tiers' if tiered else 'rows')
+        if err:
+            return err
+    fd, path = tempfile.mkstemp(suffix='.mgrc')
+    os.close(fd)
+    try:
+        with RecordingWriter(path, plans) as rec:
+            for message in packed:
+                rec.append(message)
+        return compare(list(read_recording(path)), True, 'recording')
+    finally:
+        os.remove(path)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=30)
+    args = ap.parse_args()
+
+    plans = build_plans(HZ)
+    datasets = [('acc drive', *record(args.seconds))]
+    for game, make in READERS:
+        if game != 'acc':
+            datasets.append((game, *capture(make, args.seconds)))
+
+    failed = 0
+    print(f'{args.seconds:g} s at {HZ} Hz, {BATCH}-frame batches, KB on the wire '
+          f'(gorilla: encode / reference decode frames/s):')
+    print(f'  {"data":<10} {"tiers":<5} {"json":>7} {"+zlib":>7} {"+dict":>7} {"binary":>7} '
+          f'{"gorilla":>8} {"+zlib":>7} {"enc":>8} {"dec":>8}')
+    for label, times, frames in datasets:
+        for tiered in (False, True):
+            plain, packed, secs, dsecs, err = roundtrip(times, frames, tiered, plans)
+            if err:
+                failed += 1
+                print(f'  MISMATCH {label} ({"tiers" if tiered else "rows"}): {err}')
+            _, dict_z, _ = run(times, frames, tiered, ['zlib'])
+            _, binary, _ = run(times, frames, tiered, ['binary'])
+            _, gorilla_z, _ = run(times, frames, tiered, ['gorilla', 'zlib'])
+            sizes = (
+                sum(len(m) for m in plain),
+                sum(len(zlib.compress(m.encode(), 6)) for m in plain),
+                sum(len(m) for m in dict_z),
+                sum(len(m) for m in binary),
+                sum(len(m) for m in packed),
+                sum(len(m) for m in gorilla_z),
+            )
+            print(f'  {label:<10} {"yes" if tiered else "no":<5} '
+                  + ' '.join(f'{s / 1024:>7,.0f}' for s in sizes[:4])
+                  + f' {sizes[4] / 1024:>8,.0f} {sizes[5] / 1024:>7,.0f}'
+                  + f' {len(frames) / secs / 1000:>7,.1f}k {len(frames) / dsecs / 1000:>7,.1f}k')
+
+    label, times, frames = datasets[0]
+    size, n, want = recording(times, frames, plans)
+    print(f'\nrecording ({label}, tiers): {size / 1024:,.0f} KB, {n}/{want} batches read back '
+          f'(schema v{SCHEMA_VERSION} in the file header)')
+    if n != want:
+        failed += 1
+    times, frames = next((t, f) for label, t, f in datasets if label == 'iracing')
+    err = gps_roundtrip(times, frames, plans)
+    print(f'iracing gps lon/lat: {"exact" if not err else f"MISMATCH {err}"}')
+    if err:
+        failed += 1
+    print(f'round trip: {"OK" if not failed else f"{failed} MISMATCHES"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
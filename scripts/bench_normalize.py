@@ -0,0 +1,269 @@
+"""
+Parity check + benchmark for the generated canonical normalizers.
+
+capture/canonical.py compiles one specialised normalizer per reader shape at
+import. This script keeps a frozen copy of the previous hand-written,
+interpreted normalizers (DEFAULTS copy + filter + _finalize) and asserts the
+generated ones produce identical frames for every reader shape — real reader
+output built from zeroed/filled structs, the synthetic AC source, and the edge
+cases (missing blocks, None values, short tyre lists). Then it times both.
+
+Usage:
+    python scripts/bench_normalize.py [--frames 200000]
+
+Exit 0 = parity holds.
+"""
+
+import argparse
+import ctypes
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from capture.canonical import DEFAULTS, GAME_IDS, REQUIRED_FIELDS, normalize  # noqa: E402
+from capture.synthetic import SyntheticACSource                              # noqa: E402
+from games.ac import ACGraphics, ACPhysics, ACTelemetry                       # noqa: E402
+from games.acc_shared_memory import ACCSharedMemoryReader                     # noqa: E402
+from games.acc_structs import ACCGraphics, ACCPhysics                         # noqa: E402
+from games.lmu import LMUTelemetry, VehicleTelemetry                          # noqa: E402
+
+
+# ---------------------------------------------------------------- legacy (frozen)
+
+def _legacy_delta_to_best(current_ms, best_ms):
+    if best_ms and current_ms:
+        return int(current_ms - best_ms)
+    return 0
+
+
+def _legacy_finalize(game_key, fields):
+    frame = dict(DEFAULTS)
+    frame.update({k: v for k, v in fields.items() if v is not None or k not in REQUIRED_FIELDS})
+    frame["game"] = GAME_IDS.get(game_key, game_key)
+    if "delta_to_best_ms" not in fields:
+        frame["delta_to_best_ms"] = _legacy_delta_to_best(
+            frame["current_lap_time_ms"], frame["best_lap_time_ms"]
+        )
+    return frame
+
+
+def _legacy_map_ac_shape(raw):
+    tires = raw.get("tires", [])
+    brake_temps = raw.get("brakes", {}).get("temps", [])
+    lap = raw.get("lap", {})
+    drs = raw.get("drs", {})
+
+    def tyre(i, key):
+        return tires[i].get(key) if i < len(tires) else None
+
+    return {
+        "lap_number": lap.get("current", 0),
+        "speed_kmh": raw.get("speed_kmh", 0.0),
+        "rpm": int(raw.get("rpm", 0)),
+        "gear": int(raw.get("gear", 1)) - 1,
+        "throttle_input": raw.get("throttle", 0.0) * 100.0,
+        "brake_input": raw.get("brake", 0.0) * 100.0,
+        "clutch_input": raw.get("clutch", 0.0) * 100.0,
+        "steering_input": raw.get("steering", 0.0),
+        "current_lap_time_ms": lap.get("current_time_ms", 0),
+        "best_lap_time_ms": lap.get("best_time_ms", 0),
+        "last_lap_time_ms": lap.get("last_time_ms", 0),
+        "is_valid_lap": bool(raw.get("is_valid_lap", True)),
+        "tire_temp_fl": tyre(0, "temp_core"), "tire_temp_fr": tyre(1, "temp_core"),
+        "tire_temp_rl": tyre(2, "temp_core"), "tire_temp_rr": tyre(3, "temp_core"),
+        "tire_wear_fl": tyre(0, "wear"), "tire_wear_fr": tyre(1, "wear"),
+        "tire_wear_rl": tyre(2, "wear"), "tire_wear_rr": tyre(3, "wear"),
+        "tire_pressure_fl": tyre(0, "pressure"), "tire_pressure_fr": tyre(1, "pressure"),
+        "tire_pressure_rl": tyre(2, "pressure"), "tire_pressure_rr": tyre(3, "pressure"),
+        "brake_temp_fl": brake_temps[0] if len(brake_temps) > 0 else None,
+        "brake_temp_fr": brake_temps[1] if len(brake_temps) > 1 else None,
+        "brake_temp_rl": brake_temps[2] if len(brake_temps) > 2 else None,
+        "brake_temp_rr": brake_temps[3] if len(brake_temps) > 3 else None,
+        "fuel_remaining_liters": raw.get("fuel"),
+        "drs_available": bool(drs.get("available", 0)),
+        "drs_enabled": bool(drs.get("enabled", 0)),
+    }
+
+
+def _legacy_lmu(raw):
+    inp = raw.get("input_raw", {})
+    tires = raw.get("tires", [])
+    lap = raw.get("lap", {})
+
+    def tyre(i, key):
+        return tires[i].get(key) if i < len(tires) else None
+
+    def to_ms(seconds):
+        return int((seconds or 0) * 1000)
+
+    return _legacy_finalize("lmu", {
+        "lap_number": lap.get("number", 0),
+        "speed_kmh": raw.get("speed_kmh", 0.0),
+        "rpm": int(raw.get("rpm", 0)),
+        "gear": int(raw.get("gear", 0)),
+        "throttle_input": inp.get("throttle", 0.0) * 100.0,
+        "brake_input": inp.get("brake", 0.0) * 100.0,
+        "clutch_input": inp.get("clutch", 0.0) * 100.0,
+        "steering_input": inp.get("steering", 0.0),
+        "current_lap_time_ms": to_ms(lap.get("current_time")),
+        "best_lap_time_ms": to_ms(lap.get("best_time")),
+        "last_lap_time_ms": to_ms(lap.get("last_time")),
+        "tire_temp_fl": tyre(0, "temp_middle"), "tire_temp_fr": tyre(1, "temp_middle"),
+        "tire_temp_rl": tyre(2, "temp_middle"), "tire_temp_rr": tyre(3, "temp_middle"),
+        "tire_wear_fl": tyre(0, "wear"), "tire_wear_fr": tyre(1, "wear"),
+        "tire_wear_rl": tyre(2, "wear"), "tire_wear_rr": tyre(3, "wear"),
+        "tire_pressure_fl": tyre(0, "pressure"), "tire_pressure_fr": tyre(1, "pressure"),
+        "tire_pressure_rl": tyre(2, "pressure"), "tire_pressure_rr": tyre(3, "pressure"),
+        "brake_temp_fl": tyre(0, "brake_temp"), "brake_temp_fr": tyre(1, "brake_temp"),
+        "brake_temp_rl": tyre(2, "brake_temp"), "brake_temp_rr": tyre(3, "brake_temp"),
+        "fuel_remaining_liters": raw.get("fuel"),
+    })
+
+
+def _legacy_acc(raw):
+    if "throttle" in raw or "tires" in raw:
+        return _legacy_finalize("acc", _legacy_map_ac_shape(raw))
+    return _legacy_finalize("acc", {
+        "lap_number": raw.get("lap_count", 0),
+        "speed_kmh": raw.get("speed_kmh", 0.0),
+        "rpm": int(raw.get("rpm", 0)),
+        "gear": int(raw.get("gear", 0)),
+        "current_lap_time_ms": raw.get("current_lap_time_ms", 0),
+        "best_lap_time_ms": raw.get("best_lap_time_ms", 0),
+        "last_lap_time_ms": raw.get("last_lap_time_ms", 0),
+    })
+
+
+_LEGACY = {
+    "ac": lambda raw: _legacy_finalize("ac", _legacy_map_ac_shape(raw)),
+    "acc": _legacy_acc,
+    "lmu": _legacy_lmu,
+    "iracing": lambda raw: _legacy_finalize("iracing", _legacy_map_ac_shape(raw)),
+}
+
+
+def legacy_normalize(game_key, raw):
+    if not raw:
+        return None
+    fn = _LEGACY.get(game_key)
+    if fn is None:
+        return None
+    frame = fn(raw)
+    if frame is not None and isinstance(raw, dict) and raw.get('ext'):
+        frame['ext'] = raw['ext']
+    return frame
+
+
+# ---------------------------------------------------------------- sample frames
+
+def _ac_raw():
+    p, g = ACPhysics(), ACGraphics()
+    p.speedKmh, p.rpms, p.gear, p.gas, p.brake = 212.4, 7350, 5, 0.93, 0.0
+    for i in range(4):
+        p.tyreCoreTemperature[i] = 81.5 + i
+        p.wheelsPressure[i] = 27.4
+        p.brakeTemp[i] = 410.0 + i
+    g.completedLaps, g.iCurrentTime, g.iBestTime, g.iLastTime = 3, 45_120, 101_950, 102_300
+    return ACTelemetry()._parse_data(p, g)
+
+
+def _acc_raw():
+    p, g = ACCPhysics(), ACCGraphics()
+    p.speedKmh, p.rpms, p.gear, p.gas, p.brake, p.fuel = 187.0, 6900, 4, 0.0, 0.82, 41.2
+    for i in range(4):
+        p.tyreCoreTemperature[i] = 78.0 + i
+        p.wheelsPressure[i] = 27.8
+        p.brakeTemp[i] = 520.0 - i
+        p.padLife[i] = 28.4
+    g.completedLaps, g.iCurrentTime, g.iBestTime, g.isValidLap = 7, 61_004, 2147483647, 1
+    g.tyreCompound = 'dry_compound'
+    return ACCSharedMemoryReader()._parse(p, g)
+
+
+def _lmu_raw():
+    v = VehicleTelemetry()
+    v.speed, v.engineRPM, v.gear, v.fuel = 61.0, 8120.0, 6, 52.5
+    v.unfilteredThrottle, v.unfilteredBrake, v.unfilteredSteering = 1.0, 0.0, -0.12
+    v.curLapTime, v.bestLapTime, v.lastLapTime, v.lapNumber = 33.25, 212.75, 213.5, 4
+    for i in range(4):
+        v.wheels[i].temperature[1] = 350.0 + i
+        v.wheels[i].brakeTemp = 640.0 + i
+        v.wheels[i].pressure = 145.0
+    return LMUTelemetry()._parse_data(v)
+
+
+def _iracing_raw():
+    raw = SyntheticACSource().read()
+    raw.update(game='iracing', car_name='Porsche 911 GT3 R', track_name='Spa')
+    raw['ext'] = {'normalized_position': 0.42, 'accel_lat': 11.8, 'session_time': 812.5}
+    return raw
+
+
+EDGE_CASES = [
+    ('ac', {'speed_kmh': 10.0}),
+    ('ac', {'speed_kmh': None, 'steering': None, 'lap': {'current': None, 'current_time_ms': None}}),
+    ('ac', {'tires': [{'temp_core': 70.0}], 'brakes': {'temps': [300.0, 301.0]}, 'fuel': None}),
+    ('ac', {'lap': {'current_time_ms': 5000, 'best_time_ms': None}, 'is_valid_lap': 0}),
+    ('acc', {'lap_count': 2, 'speed_kmh': 120.0, 'gear': 3, 'current_lap_time_ms': 9000,
+             'best_lap_time_ms': 8000}),
+    ('acc', {'tires': [], 'ext': {}}),
+    ('lmu', {'lap': {'current_time': None, 'best_time': 0.0}, 'input_raw': {'steering': None}}),
+    ('lmu', {'tires': [{'wear': 0.9}, {'wear': 0.8}]}),
+    ('iracing', {'throttle': 1, 'gear': 2, 'ext': {'gps_lon': 1.0}}),
+    ('unknown', {'speed_kmh': 1.0}),
+    ('ac', {}),
+]
+
+
+def samples():
+    out = [('ac', _ac_raw()), ('acc', _acc_raw()), ('lmu', _lmu_raw()), ('iracing', _iracing_raw())]
+    source = SyntheticACSource()
+    out += [('ac', source.read()) for _ in range(50)]
+    return out + EDGE_CASES
+
+
+# ---------------------------------------------------------------- main
+
+def check_parity():
+    bad = 0
+    for game, raw in samples():
+        want, got = legacy_normalize(game, raw), normalize(game, raw)
+        same = want == got and (want is None or list(want) == list(got))
+        if not same:
+            bad += 1
+            print(f'  MISMATCH {game}: {raw!r:.120}')
+            for k in sorted(set(want or {}) | set(got or {})):
+                if (want or {}).get(k, '<missing>') != (got or {}).get(k, '<missing>'):
+                    print(f'    {k}: legacy={(want or {}).get(k)!r} generated={(got or {}).get(k)!r}')
+    return bad
+
+
+def bench(fn, game, raw, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn(game, raw)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--frames', type=int, default=200_000)
+    args = ap.parse_args()
+
+    bad = check_parity()
+    print(f'parity: {"OK" if not bad else f"{bad} MISMATCHES"} ({len(samples())} frames, all reader shapes)')
+
+    print(f'\nper-frame normalize cost ({args.frames:,} frames each):')
+    print(f'  {"game":<8} {"legacy us":>10} {"generated us":>13} {"speedup":>8}')
+    for game, raw in (('ac', _ac_raw()), ('acc', _acc_raw()), ('lmu', _lmu_raw()),
+                      ('iracing', _iracing_raw())):
+        old = bench(legacy_normalize, game, raw, args.frames)
+        new = bench(normalize, game, raw, args.frames)
+        print(f'  {game:<8} {old:>10.2f} {new:>13.2f} {old / new:>7.2f}x')
+    return 1 if bad else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Parity check + benchmark for batch (column-wise) normalisation.
+
+The batch path splits the work: the capture thread only appends raw numeric
+rows (reader.read_row()) and normalize_batch() maps a whole batch onto the
+contract in a few NumPy operations. This asserts every column matches the
+per-frame read_canonical() output for all four readers (plus a randomised AC
+drive covering reverse/neutral gears and null-free edge values), then compares
+the per-frame cost of both paths at several batch sizes.
+
+Usage:
+    python scripts/bench_normalize_batch.py [--frames 20000]
+
+Exit 0 = parity holds.
+"""
+
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_fused_read import READERS                                         # noqa: E402
+from capture.canonical import DEFAULTS, normalize_batch                      # noqa: E402
+from games.ac import ACGraphics, ACPhysics, ACTelemetry                       # noqa: E402
+
+
+def random_ac_frames(n, seed=7):
+    """(rows, frames) for n randomised AC packets through the real reader."""
+    rng = random.Random(seed)
+    reader = ACTelemetry()
+    reader.connected = True
+    rows, frames = [], []
+    for i in range(n):
+        p, g = ACPhysics(), ACGraphics()
+        p.packetId, g.AC_STATUS = i + 1, 2
+        p.speedKmh, p.rpms, p.gear = rng.uniform(0, 300), rng.randint(0, 9000), rng.randint(0, 7)
+        p.gas, p.brake, p.clutch = rng.random(), rng.random(), rng.random()
+        p.steerAngle, p.fuel = rng.uniform(-1, 1), rng.uniform(0, 100)
+        p.drsAvailable, p.drsEnabled = rng.randint(0, 1), rng.randint(0, 1)
+        for w in range(4):
+            p.tyreCoreTemperature[w] = rng.uniform(40, 120)
+            p.tyreWear[w] = rng.random()
+            p.wheelsPressure[w] = rng.uniform(20, 32)
+            p.brakeTemp[w] = rng.uniform(100, 900)
+        g.completedLaps, g.iCurrentTime = rng.randint(0, 40), rng.randint(0, 200_000)
+        g.iBestTime = rng.choice([0, rng.randint(90_000, 120_000)])
+        g.iLastTime = rng.randint(0, 200_000)
+        for target in (rows, frames):
+            reader.physics_map, reader.graphics_map = io.BytesIO(bytes(p)), io.BytesIO(bytes(g))
+            reader.last_packet_id = -1
+            target.append(reader.read_row() if target is rows else reader.read_canonical())
+    return rows, frames
+
+
+def mismatches(game, rows, frames):
+    cols = normalize_batch(game, rows)
+    bad = []
+    for key in DEFAULTS:
+        want = np.array([np.nan if f[key] is None else f[key] for f in frames],
+                        dtype=cols[key].dtype)
+        same = (np.array_equal(want, cols[key], equal_nan=True)
+                if cols[key].dtype.kind == 'f' else np.array_equal(want, cols[key]))
+        if not same:
+            bad.append(f'    {key}: per-frame={want[:4]} batch={cols[key][:4]}')
+    if cols['game'] != frames[0]['game']:
+        bad.append(f"    game: {frames[0]['game']!r} != {cols['game']!r}")
+    return bad
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--frames', type=int, default=20_000)
+    args = ap.parse_args()
+
+    cases = [('ac (randomised)', 'ac', *random_ac_frames(500))]
+    for game, make in READERS:
+        reader, rewind = make()
+        rows, frames = [], []
+        for _ in range(8):
+            rewind(); rows.append(reader.read_row())
+            rewind(); frames.append(reader.read_canonical())
+        cases.append((game, game, rows, frames))
+
+    failed = 0
+    for label, game, rows, frames in cases:
+        bad = mismatches(game, rows, frames)
+        if bad:
+            failed += 1
+            print(f'  MISMATCH {label}:')
+            print('\n'.join(bad))
+    print(f'parity: {"OK" if not failed else f"{failed} MISMATCHES"} '
+          f'({", ".join(label for label, *_ in cases)})')
+
+    print(f'\nper-frame cost incl. shared-memory copy ({args.frames:,} frames each):')
+    print(f'  {"game":<8} {"read_canonical us":>18} ' +
+          ' '.join(f'{f"rows+batch/{b} us":>17}' for b in (6, 60, 240)))
+    for game, make in READERS:
+        reader, rewind = make()
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            rewind()
+            reader.read_canonical()
+        per_frame = (time.perf_counter() - start) / args.frames * 1e6
+        batched = []
+        for size in (6, 60, 240):
+            start = time.perf_counter()
+            done = 0
+            while done < args.frames:
+                rows = []
+                for _ in range(size):
+                    rewind()
+                    rows.append(reader.read_row())
+                normalize_batch(game, rows)
+                done += size
+            batched.append((time.perf_counter() - start) / done * 1e6)
+        print(f'  {game:<8} {per_frame:>18.2f} ' + ' '.join(f'{b:>17.2f}' for b in batched))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
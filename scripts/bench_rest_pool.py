@@ -0,0 +1,138 @@
+"""
+Pooled REST client (network.rest) vs bare requests calls.
+
+Runs a local HTTP/1.1 keep-alive server that counts the TCP connections it
+accepts, and checks that:
+  - N bare requests.post calls open N connections, N rest.post calls one;
+  - prewarm() opens the connection the first real call then reuses;
+  - 503s are retried with backoff for GET/PATCH but a POST is never sent
+    twice (a retried session create could create two sessions);
+  - the per-endpoint timeout applies (a slow endpoint times out on read).
+Reports the mean round trip either way. On loopback the handshake is nearly
+free; against the real API each saved connection is a TCP + TLS handshake
+(typically 1-3 round trips).
+
+Usage:
+    python scripts/bench_rest_pool.py [--calls 50]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import requests                                                   # noqa: E402
+
+from network import rest                                          # noqa: E402
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+    hits = {}
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        hits = self.server.hits
+        hits[(self.command, self.path)] = hits.get((self.command, self.path), 0) + 1
+        status, body = 200, b'{}'
+        if self.path == '/flaky' and hits[(self.command, self.path)] <= 2:
+            status = 503
+        elif self.path == '/slow':
+            time.sleep(1.5)
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_HEAD = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    srv = _Server(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def timed(call, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        call().close()
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--calls', type=int, default=50)
+    args = ap.parse_args()
+    failures = []
+
+    srv = serve()
+    base = f'http://127.0.0.1:{srv.server_port}'
+    bare_ms = timed(lambda: requests.post(f'{base}/sessions', json={'a': 1}, timeout=5), args.calls)
+    bare = srv.connections
+    srv.connections = 0
+    pooled_ms = timed(lambda: rest.post(f'{base}/sessions', 'session_create', json={'a': 1}), args.calls)
+    pooled = srv.connections
+    print(f'{args.calls} POSTs: bare requests {bare} connections, {bare_ms:.2f} ms each; '
+          f'pooled {pooled} connection(s), {pooled_ms:.2f} ms each')
+    if bare != args.calls or pooled != 1:
+        failures.append('pooling')
+
+    srv2 = serve()
+    base2 = f'http://127.0.0.1:{srv2.server_port}'
+    warm = rest.prewarm(base2)
+    rest.post(f'{base2}/sessions', 'session_create', json={}, verify=False).close()
+    print(f'prewarm: answered={warm}, connections after the first real call: {srv2.connections}')
+    if not warm or srv2.connections != 1:
+        failures.append('prewarm')
+
+    start = time.perf_counter()
+    r = rest.get(f'{base}/flaky')
+    took = time.perf_counter() - start
+    p = rest.post(f'{base}/flaky')
+    print(f'503 twice: GET -> {r.status_code} after {srv.hits[("GET", "/flaky")]} tries '
+          f'({took * 1000:,.0f} ms of backoff); POST -> {p.status_code} after '
+          f'{srv.hits[("POST", "/flaky")]} try')
+    if r.status_code != 200 or srv.hits[('POST', '/flaky')] != 1:
+        failures.append('retry policy')
+
+    rest.TIMEOUTS['bench_slow'] = (1, 0.5)
+    start = time.perf_counter()
+    try:
+        rest.post(f'{base}/slow', 'bench_slow')
+        timed_out = False
+    except requests.exceptions.Timeout:
+        timed_out = True
+    took = time.perf_counter() - start
+    print(f'per-endpoint timeout (0.5 s read): timed out={timed_out} after {took:.2f} s')
+    if not timed_out or took > 1.2:
+        failures.append('timeout')
+
+    print('rest pool: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
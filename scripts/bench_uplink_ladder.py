@@ -0,0 +1,210 @@
+"""
+Uplink degradation ladder on a throttled link: network.uplink.UplinkMonitor.
+
+Feeds the recorded ACC drive (bench_ext_delta.py) into a bounded buffer at
+the capture rate from a thread, and runs the sender logic of
+TelemetryCapture (_sender_loop / _send_tick / _watch_uplink) against the real
+WebSocketClient + EncodePipeline + AdaptiveBatcher, on a socket whose sends
+take len(payload) / --kbps while throttled:
+
+  0 .. --free s              link unthrottled
+  then --throttled s         link at --kbps (below what the full stream needs)
+  then the rest              unthrottled again
+
+once with the ladder and once with it disabled (max level 0). Reports the
+transitions, how old frames were when they reached the socket and how many
+the buffer bound dropped while throttled, and what went to the full-rate
+store.
+
+Checks that with the ladder the stream degrades while throttled, is real
+time again (frames reach the socket younger than the congested threshold)
+by the end of the throttled stretch without dropping frames, steps back to full once the link
+is free, never flaps (at most one pass down and up), announces every switch
+as a tier_plan message, and keeps every degraded frame in the full-rate store.
+
+Usage:
+    python scripts/bench_uplink_ladder.py [--kbps 5] [--free 4] [--throttled 16] [--after 30]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ                                 # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from capture.tiers import build_plans                             # noqa: E402
+from network.batcher import AdaptiveBatcher                       # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.uplink import LEVELS, UplinkMonitor                  # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+FEATURES = ['ext_delta', 'zlib', 'replan']
+
+
+class _Socket:
+    """Sends take len / rate while `throttle` says so."""
+
+    def __init__(self, throttle):
+        self.throttle = throttle  # () -> bytes/s, or None for unthrottled
+        self.plans = []  # tier_plan names, in order
+
+    def send(self, message, opcode=1):
+        if isinstance(message, str):
+            msg = json.loads(message)
+            if msg.get('type') == 'tier_plan':
+                self.plans.append(msg.get('name'))
+        rate = self.throttle()
+        if rate:
+            time.sleep(len(message) / rate)
+
+
+def feed(buf, lock, frames, stop, dropped):
+    interval = 1.0 / HZ
+    tick = time.perf_counter()
+    for f in frames:
+        if stop.is_set():
+            return
+        with lock:
+            if len(buf) == buf.maxlen:
+                dropped[0] += 1
+            buf.append((time.time(), f))
+        tick += interval
+        time.sleep(max(0.0, tick - time.perf_counter()))
+
+
+def run(frames, args, max_level):
+    start = time.monotonic()
+    t_on, t_off = args.free, args.free + args.throttled
+
+    def throttle():
+        return args.kbps * 1024 if t_on <= time.monotonic() - start < t_off else None
+
+    sock = _Socket(throttle)
+    uplink = UplinkMonitor(HZ, up_after_s=args.up_after, max_level=max_level)
+    batcher = AdaptiveBatcher()
+
+    def plans():
+        return build_plans(HZ, None, **uplink.plan_args)
+
+    c = WebSocketClient('ws://unused', 'key', tier_plans=plans())
+    c.plan_name = uplink.name
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                    'features': FEATURES}))
+
+    oldest, at_socket = deque(), []  # capture time of each batch's first frame, in order
+
+    def sent(n, nbytes, latency):
+        batcher.observe(n, nbytes, latency)
+        uplink.sent(n, nbytes, latency)
+        at_socket.append((time.monotonic() - start, time.time() - oldest.popleft()))
+
+    pipe = EncodePipeline(2, 8, on_sent=sent)
+    buf, lock, stop, dropped = deque(maxlen=2400), threading.Lock(), threading.Event(), [0]
+    feeder = threading.Thread(target=feed, args=(buf, lock, frames, stop, dropped), daemon=True)
+    feeder.start()
+    log, ages, kept = [], [], [0]
+    last = time.monotonic()
+    while feeder.is_alive() or buf:
+        time.sleep(batcher.tick_s)
+        with lock:
+            n = len(buf)
+            age = time.time() - buf[0][0] if n else 0.0
+        now = time.monotonic()
+        ages.append((now - start, age, dropped[0], uplink.level))
+        msg = uplink.sample(n, age)
+        if msg:
+            log.append((now - start, msg))
+        reason = batcher.due(n, age)
+        take = batcher.limit() if reason else 0
+        if not take and now - last < batcher.age_s:
+            continue
+        last = now
+        if c.plan_name != uplink.name:
+            if pipe.room < 2:
+                continue
+            level = uplink.level
+            if c.set_tier_plans(plans(), uplink.name, send=lambda m: pipe.submit_message(c, m)):
+                uplink.using(level)
+        if not pipe.room or pipe.frames_in_flight >= uplink.frame_budget():
+            continue
+        with lock:
+            batch = [buf.popleft() for _ in range(min(take, len(buf)))]
+        if batch:
+            if reason:
+                batcher.flushed(reason)
+            times, fr = zip(*batch)
+            oldest.append(times[0])
+            pipe.submit(c, list(fr), list(times))
+            if c.plan_name != LEVELS[0][0]:
+                kept[0] += len(batch)
+    pipe.flush(30)
+    stop.set()
+    return {'log': log, 'ages': ages, 'at_socket': at_socket, 'dropped': dropped[0], 'kept': kept[0],
+            'plans': sock.plans, 'uplink': uplink, 'throttled': (t_on, t_off)}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--kbps', type=float, default=5)
+    ap.add_argument('--free', type=float, default=4)
+    ap.add_argument('--throttled', type=float, default=16)
+    ap.add_argument('--after', type=float, default=30)
+    ap.add_argument('--up-after', type=float, default=4)
+    args = ap.parse_args()
+
+    _, frames = record(args.free + args.throttled + args.after)
+    failures = []
+    print(f'ACC drive at {HZ} Hz, features {FEATURES}; link at {args.kbps:g} KB/s from '
+          f'{args.free:g} s to {args.free + args.throttled:g} s')
+    results = {}
+    for label, max_level in (('no ladder', 0), ('ladder', len(LEVELS) - 1)):
+        r = results[label] = run(frames, args, max_level)
+        t_on, t_off = r['throttled']
+        during = [a for t, a in r['at_socket'] if t_on <= t < t_off]
+        tail = [a for t, a in r['at_socket'] if t_off - 2 <= t < t_off]
+        print(f'  {label}: frame age at the socket while throttled max {max(during):.1f} s, '
+              f'in its last 2 s max {max(tail):.2f} s; {r["dropped"]:,} frames dropped; '
+              f'{r["kept"]:,} frames to the full-rate store')
+        for t, msg in r['log']:
+            print(f'    {t:5.1f} s  {msg}')
+        st = r['uplink'].stats()
+        print(f'    need KB/s by level: {st["need_kbps"]}; capacity {st["capacity_kbps"]} KB/s; '
+              f'tier_plan messages: {r["plans"]}')
+        r['tail'] = max(tail)
+
+    r = results['ladder']
+    uplink = r['uplink']
+    worst = max(lvl for _, _, _, lvl in r['ages'])
+    if not worst:
+        failures.append('never degraded')
+    if r['tail'] >= uplink.congested_s or r['dropped']:
+        failures.append('not real time while throttled')
+    if uplink.level != 0:
+        failures.append('did not step back to full')
+    if uplink.steps_down > worst or uplink.steps_up > worst:
+        failures.append('flapping')
+    if r['plans'][1:] != [m['to'] for m in uplink.transitions]:
+        failures.append('tier_plan messages')
+    if not r['kept']:
+        failures.append('full-rate store')
+    if results['no ladder']['tail'] < uplink.congested_s:
+        failures.append(f'{args.kbps:g} KB/s does not congest the full stream')
+
+    print('uplink ladder: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Local stand-in for the backend's HTTPS bulk-upload endpoints
+(network/http_bulk.py), for testing the fallback transport without the real
+API.
+
+  POST .../bulk/open   answers the schema announcement with a schema_ack
+                       listing the `features` it accepts
+  POST .../bulk        takes a chunk, applies the stream's chunks in X-Chunk
+                       order (holding back any that arrive early), and answers
+                       with an ack of the batches it has
+
+HTTP/1.1 keep-alive, one thread per connection. Decodes what it accepts
+(gzip bodies, sequence prefixes, zlib envelopes, JSON rows) and keeps per
+stream: frames per batch seq (so resent copies count once), the chunk order
+it applied, the opens (chunks of an earlier one get 409). `delay_s` holds every chunk response (so parallel
+requests overlap); `fail_chunks` answers those chunk requests (counted from 1
+over the server's lifetime) with 503.
+
+Usage:
+  python scripts/fake_bulk_server.py [--port 8787] [--delay-ms 0]
+  (then point api_url at http://127.0.0.1:8787/api/v1, transport "http")
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from network.compression import decompress                        # noqa: E402
+from network.resend import unwrap                                 # noqa: E402
+from network.zdict import dictionary                              # noqa: E402
+
+
+class _Stream:
+    def __init__(self):
+        self.opens = 0
+        self.open_id = None
+        self.stale = 0      # chunks of an earlier open, refused
+        self.expect = 1
+        self.held = {}      # chunk -> message, arrived ahead of its turn
+        self.frames = {}    # batch seq -> frames
+        self.acked = 0
+        self.applied = 0
+        self.early = 0      # chunks that arrived ahead of their turn
+        self.messages = []  # types, in applied order
+
+
+class BulkServer:
+    """Threaded HTTP server playing the bulk-upload endpoints."""
+
+    def __init__(self, port=0, features=('ack', 'zlib'), delay_s=0.0, fail_chunks=()):
+        self.features = set(features)
+        self.delay_s = delay_s
+        self.fail_chunks = set(fail_chunks)
+        self.lock = threading.Lock()
+        self.streams = {}
+        self.requests = 0
+        self.chunk_requests = 0
+        self.connections = 0
+        self.posting = 0
+        self.max_posting = 0
+        self.gzipped = 0
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+        self.dictionaries = {SCHEMA_VERSION: dictionary(SCHEMA_VERSION)}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                status, reply = server.handle(self.path, self.headers, body)
+                data = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self.port
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stream(self, sid):
+        with self.lock:
+            return self.streams.setdefault(sid, _Stream())
+
+    def handle(self, path, headers, body):
+        with self.lock:
+            self.requests += 1
+        if headers.get('Authorization', '')[:7] != 'Bearer ':
+            return 401, {}
+        st = self.stream(headers.get('X-Stream'))
+        if path.endswith('/open'):
+            ann = json.loads(body)
+            with self.lock:
+                st.opens += 1
+                st.open_id = headers.get('X-Open')
+                st.expect, st.held = 1, {}
+            features = [f for f in ann.get('features', ()) if f in self.features]
+            return 200, {'messages': [{'type': 'schema_ack', 'version': ann['version'],
+                                       'features': features}]}
+        with self.lock:
+            self.chunk_requests += 1
+            n = self.chunk_requests
+            self.posting += 1
+            self.max_posting = max(self.max_posting, self.posting)
+        try:
+            time.sleep(self.delay_s)
+            if n in self.fail_chunks:
+                return 503, {}
+            wire = len(body)
+            if headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            with self.lock:
+                self.wire_bytes += wire
+                self.raw_bytes += len(body)
+                self.gzipped += headers.get('Content-Encoding') == 'gzip'
+            message = body.decode() if headers.get('Content-Type') == 'application/json' else body
+            chunk = int(headers['X-Chunk'])
+            with self.lock:
+                if headers.get('X-Open') != st.open_id:
+                    st.stale += 1
+                    return 409, {}
+                if chunk != st.expect:
+                    st.early += 1
+                st.held[chunk] = message
+                while st.expect in st.held:
+                    self._apply(st, st.held.pop(st.expect))
+                    st.expect += 1
+                acked = sorted(s for s in st.frames if s > st.acked)
+                while acked and acked[0] == st.acked + 1:
+                    st.acked = acked.pop(0)
+                return 200, {'messages': [{'type': 'ack', 'seq': st.acked, 'received': acked}]}
+        finally:
+            with self.lock:
+                self.posting -= 1
+
+    def _apply(self, st, message):
+        st.applied += 1
+        seq = None
+        if isinstance(message, bytes):
+            seq, message = unwrap(message)
+            _, message = decompress(message, self.dictionaries)
+            message = message.decode()
+        msg = json.loads(message)
+        st.messages.append(msg.get('type'))
+        if msg.get('type') == 'telemetry_batch':
+            seq = msg.get('seq', seq)
+            rows = msg.get('data')
+            if rows is None:  # tiered: the fast tier has every frame
+                rows = msg['tiers'][0]['data']
+            if seq is not None:
+                st.frames[seq] = len(rows)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--port', type=int, default=8787)
+    ap.add_argument('--delay-ms', type=float, default=0)
+    args = ap.parse_args()
+    server = BulkServer(args.port, delay_s=args.delay_ms / 1000)
+    server.start()
+    print(f"Bulk-upload stand-in on http://127.0.0.1:{server.port}/api/v1/sessions/<sid>/bulk")
+    try:
+        while True:
+            time.sleep(5)
+            for sid, st in list(server.streams.items()):
+                print(f"  stream {sid}: {st.opens} opens, {st.applied:,} chunks, "
+                      f"{sum(st.frames.values()):,} frames, acked {st.acked}")
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -47,8 +47,8 @@ VARS = [
     ('SteeringWheelAngleMax', 4, 'f'),
     ('LatAccel',              4, 'f'),
     ('LongAccel',             4, 'f'),
-    ('Lat',                   5, 'd'),   # -> pos_z
-    ('Lon',                   5, 'd'),   # -> pos_x
+    ('Lat',                   5, 'd'),   # -> gps_lat
+    ('Lon',                   5, 'd'),   # -> gps_lon
     ('Alt',                   4, 'f'),
     ('LFtempCM',              4, 'f'),
     ('RFtempCM',              4, 'f'),
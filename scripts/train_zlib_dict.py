@@ -0,0 +1,223 @@
+"""
+Train the preset zlib dictionary for the current channel schema version.
+
+Records sessions offline (the ACC drive from bench_ext_delta.py plus the AC /
+LMU / iRacing readers), ships them through the real WebSocketClient in every
+batch format it can negotiate (named, id-keyed rows, ext deltas, tiers,
+columnar, binary), and builds a 32 KB dictionary from the batches with a
+small COVER-style selection: 256-byte segments are picked greedily by how many
+frequent (present in many batches) 8-byte substrings they add, best last
+(zlib reaches the end of the dictionary cheapest).
+
+The first half of the recording trains; the second half is held out to report
+ratio and CPU time per batch at each level, with and without the dictionary.
+If src/network/zdict.py has a dictionary for SCHEMA_VERSION, every recording
+is also shipped through the client with "zlib" negotiated and each message is
+decompressed with network.compression.decompress(), which must give back the
+exact uncompressed batch.
+With --write, the dictionary is stored in src/network/zdict.py under
+SCHEMA_VERSION (an existing entry for that version is never overwritten —
+bump the schema to retrain).
+
+Usage:
+    python scripts/train_zlib_dict.py [--seconds 60] [--write]
+
+Exit 0 = round trip OK (or no dictionary yet).
+"""
+
+import argparse
+import base64
+import heapq
+import re
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import run                                # noqa: E402
+from bench_channel_tiers import capture                           # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from bench_fused_read import READERS                              # noqa: E402
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from network.compression import LEVELS, decompress                # noqa: E402
+from network.zdict import dictionary                              # noqa: E402
+
+DICT_SIZE = 32 * 1024
+K = 8
+SEGMENT = 256
+STRIDE = 64
+SAMPLES_PER_RUN = 60
+
+ZDICT_PY = Path(__file__).resolve().parent.parent / 'src' / 'network' / 'zdict.py'
+
+FORMATS = (
+    # (tiered, features, acked)
+    (False, [], False),
+    (False, [], True),
+    (False, ['ext_delta'], True),
+    (True, [], True),
+    (True, ['ext_delta'], True),
+    (False, ['columnar'], True),
+    (True, ['columnar'], True),
+    (False, ['binary'], True),
+    (True, ['binary'], True),
+)
+
+
+def batches(datasets):
+    """All batch payloads (bytes) for every dataset x format."""
+    out = []
+    for times, frames in datasets:
+        for tiered, features, acked in FORMATS:
+            _, sent, _ = run(times, frames, tiered, features, acked=acked)
+            out.append([m.encode() if isinstance(m, str) else m for m in sent])
+    return out
+
+
+def train(samples, size=DICT_SIZE):
+    freq = Counter()
+    for s in samples:
+        freq.update({s[i:i + K] for i in range(len(s) - K + 1)})
+    candidates = [s[i:i + SEGMENT] for s in samples for i in range(0, max(1, len(s) - SEGMENT + 1), STRIDE)]
+
+    def score(seg):
+        return sum(freq[km] for km in {seg[i:i + K] for i in range(len(seg) - K + 1)})
+
+    heap = [(-score(seg), n) for n, seg in enumerate(candidates)]
+    heapq.heapify(heap)
+    picked, total = [], 0
+    while heap and total < size:
+        neg, n = heapq.heappop(heap)
+        fresh = score(candidates[n])
+        if fresh <= 0:
+            continue
+        if heap and fresh < -heap[0][0]:
+            heapq.heappush(heap, (-fresh, n))  # stale score: re-queue (lazy greedy)
+            continue
+        seg = candidates[n]
+        picked.append(seg)
+        total += len(seg)
+        for i in range(len(seg) - K + 1):
+            freq[seg[i:i + K]] = 0
+    picked.reverse()  # most valuable segments last
+    return b''.join(picked)[-size:]
+
+
+def evaluate(held_out, zdict):
+    rows = []
+    for level in LEVELS:
+        for d in (None, zdict):
+            raw = sent = 0
+            primed = zlib.compressobj(level, zdict=d) if d else zlib.compressobj(level)
+            start = time.thread_time()
+            for payload in held_out:
+                c = primed.copy()  # as network.compression does
+                sent += len(c.compress(payload) + c.flush())
+                raw += len(payload)
+            rows.append((level, d is not None, raw / sent,
+                         (time.thread_time() - start) / len(held_out) * 1e6))
+    return rows
+
+
+def roundtrip(datasets, zdict):
+    """Ratio over all recordings per format; raises on a mismatch."""
+    out = []
+    for features in ([], ['ext_delta'], ['columnar'], ['binary']):
+        raw = sent = 0
+        for times, frames in datasets:
+            _, plain, _ = run(times, frames, False, features)
+            _, packed, _ = run(times, frames, False, features + ['zlib'])
+            for p, z in zip(plain, packed):
+                p = p.encode() if isinstance(p, str) else p
+                _, payload = decompress(z, {SCHEMA_VERSION: zdict})
+                if payload != p:
+                    raise AssertionError(f'round trip differs ({features or "rows"})')
+                raw += len(p)
+                sent += len(z)
+        out.append(('+'.join(features) or 'rows', raw / sent))
+    return out
+
+
+def write(zdict):
+    text = ZDICT_PY.read_text() if ZDICT_PY.exists() else None
+    if text and re.search(rf'^    {SCHEMA_VERSION}: ', text, re.M):
+        print(f'{ZDICT_PY.name} already has a v{SCHEMA_VERSION} dictionary; bump the schema to retrain')
+        return False
+    blob = base64.b64encode(zlib.compress(zdict, 9)).decode()
+    lines = '\n'.join(f'        "{blob[i:i + 76]}"' for i in range(0, len(blob), 76))
+    entry = f'    {SCHEMA_VERSION}: (\n{lines}\n    ),\n'
+    if text is None:
+        text = (
+            '"""\n'
+            'Preset zlib dictionaries for batch compression, keyed by channel schema\n'
+            'version (see network/compression.py). Generated by\n'
+            'scripts/train_zlib_dict.py --write; never edit or replace an entry, the\n'
+            'server decompresses with the same bytes.\n'
+            '"""\n\n'
+            'import base64\n'
+            'import zlib\n\n'
+            '_DICTS = {\n'
+            '}\n\n'
+            '_cache = {}\n\n\n'
+            'def dictionary(version):\n'
+            '    """Dictionary bytes for a schema version (None if there is none)."""\n'
+            '    if version not in _cache:\n'
+            '        blob = _DICTS.get(version)\n'
+            '        _cache[version] = zlib.decompress(base64.b64decode(blob)) if blob else None\n'
+            '    return _cache[version]\n'
+        )
+    text = text.replace('_DICTS = {\n', '_DICTS = {\n' + entry, 1)
+    ZDICT_PY.write_text(text)
+    print(f'wrote v{SCHEMA_VERSION} dictionary ({len(zdict):,} B) to {ZDICT_PY}')
+    return True
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=60)
+    ap.add_argument('--write', action='store_true')
+    args = ap.parse_args()
+
+    datasets = [record(args.seconds)]
+    for game, make in READERS:
+        if game != 'acc':
+            datasets.append(capture(make, args.seconds / 2))
+
+    train_set, held_out = [], []
+    for run_batches in batches(datasets):
+        half = len(run_batches) // 2
+        step = max(1, half // SAMPLES_PER_RUN)
+        train_set.extend(run_batches[:half:step])
+        held_out.extend(run_batches[half::step])
+
+    start = time.perf_counter()
+    zdict = train(train_set)
+    print(f'trained {len(zdict):,} B dictionary from {len(train_set)} batches '
+          f'in {time.perf_counter() - start:.1f} s; held-out: {len(held_out)} batches')
+    print(f'  {"level":>5} {"ratio (no dict)":>16} {"ratio (dict)":>13} {"us/batch":>9} {"us/batch (dict)":>16}')
+    rows = evaluate(held_out, zdict)
+    for i in range(0, len(rows), 2):
+        (level, _, r0, t0), (_, _, r1, t1) = rows[i], rows[i + 1]
+        print(f'  {level:>5} {r0:>16.2f} {r1:>13.2f} {t0:>9.0f} {t1:>16.0f}')
+    if args.write:
+        write(zdict)
+
+    shipped = dictionary(SCHEMA_VERSION)
+    if shipped:
+        try:
+            ratios = roundtrip(datasets, shipped)
+        except AssertionError as e:
+            print(f'\nround trip: {e}')
+            return 1
+        print('\nshipped v%d dictionary through the client: %s' % (
+            SCHEMA_VERSION, ', '.join(f'{name} x{r:.2f}' for name, r in ratios)))
+        print('round trip: OK')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Sequence numbers, server acks and the resend window, against a lossy server.
+
+Runs a local stand-in for the telemetry WebSocket endpoint that acks the
+"ack" feature (plus the given formats), then loses batches the way a flaky
+backend does: it drops some without an ack, holds some back and handles them
+after later ones (out of order), and cuts the first connection off in the
+middle of the run. It acks cumulatively with a "received" list, dedupes on
+(stream, seq) and decodes every batch (JSON rows; Gorilla + zlib with the
+8-byte seq prefix).
+
+The recorded ACC drive (bench_ext_delta.py) goes through the real
+WebSocketClient and EncodePipeline, the way the sender loop does it
+(due_resends() first, then the new batch). Checks that:
+  - every batch reaches the server exactly once after dedupe, with the same
+    frames (floats to their registered precision) under its original seq;
+  - the window is empty at the end (everything acked) and batches were
+    resent both after the reconnect and on ack timeouts;
+  - the window is bounded: past max_batches the oldest are evicted, counted.
+
+Usage:
+    python scripts/verify_acks.py [--seconds 10]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import BATCH                              # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.gorilla import Catalog, decode                       # noqa: E402
+from capture.schema import BY_ID, LAYOUTS, SCHEMA_VERSION         # noqa: E402
+from network.compression import KIND_JSON, MAGIC as ZMAGIC, decompress  # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.resend import ResendWindow, unwrap                   # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+from network.zdict import dictionary                              # noqa: E402
+
+GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def _frame(payload, opcode=1):
+    n = len(payload)
+    if n < 126:
+        head = struct.pack('!BB', 0x80 | opcode, n)
+    elif n < 1 << 16:
+        head = struct.pack('!BBH', 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack('!BBQ', 0x80 | opcode, 127, n)
+    return head + payload
+
+
+def _read_exact(conn, n):
+    buf = b''
+    while len(buf) < n:
+        chunk = conn.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError('closed')
+        buf += chunk
+    return buf
+
+
+def _read_frame(conn):
+    b0, b1 = _read_exact(conn, 2)
+    n = b1 & 0x7F
+    if n == 126:
+        n = struct.unpack('!H', _read_exact(conn, 2))[0]
+    elif n == 127:
+        n = struct.unpack('!Q', _read_exact(conn, 8))[0]
+    mask = _read_exact(conn, 4) if b1 & 0x80 else b'\0\0\0\0'
+    data = bytes(b ^ mask[i % 4] for i, b in enumerate(_read_exact(conn, n)))
+    return b0 & 0x0F, data
+
+
+class StandInServer:
+    """Lossy telemetry endpoint: drops, reorders, cuts the first connection."""
+
+    def __init__(self, features, drop=0.08, hold=0.10, cut_after=60, seed=7):
+        self.features = features
+        self.drop, self.hold, self.cut_after = drop, hold, cut_after
+        self.rng = random.Random(seed)
+        self.batches = {}  # (stream, seq) -> rows
+        self.duplicates = self.dropped = self.reordered = 0
+        self.connections = 0
+        self._acked = {}  # stream -> highest contiguous seq
+        self._lock = threading.Lock()
+        self._srv = socket.socket()
+        self._srv.bind(('127.0.0.1', 0))
+        self._srv.listen()
+        self._srv.settimeout(0.2)
+        self.port = self._srv.getsockname()[1]
+        self._stop = threading.Event()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _accept(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._srv.accept()
+            except socket.timeout:
+                continue
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn, self.connections), daemon=True).start()
+        self._srv.close()
+
+    def _handle(self, conn, number):
+        req = b''
+        while b'\r\n\r\n' not in req:
+            req += conn.recv(4096)
+        key = next(line.split(':', 1)[1].strip() for line in req.decode().split('\r\n')
+                   if line.lower().startswith('sec-websocket-key'))
+        accept = base64.b64encode(hashlib.sha1((key + GUID).encode()).digest()).decode()
+        conn.sendall(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                      f'Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n').encode())
+        stream, catalog, held, seen = None, None, None, 0
+        try:
+            while not self._stop.is_set():
+                opcode, data = _read_frame(conn)
+                if opcode == 8:
+                    return
+                if opcode == 1:
+                    msg = json.loads(data)
+                    if msg['type'] == 'schema':
+                        stream, catalog = msg['stream'], Catalog(msg, None)
+                        conn.sendall(_frame(json.dumps({
+                            'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                            'features': self.features}).encode()))
+                        continue
+                    if msg['type'] != 'telemetry_batch':
+                        continue
+                elif opcode != 2:
+                    continue
+                seen += 1
+                if number == 1 and seen == self.cut_after:
+                    conn.close()  # link lost mid-session
+                    return
+                if self.rng.random() < self.drop:
+                    self.dropped += 1
+                    continue
+                if held is None and self.rng.random() < self.hold:
+                    held = (opcode, data)
+                    continue
+                self._batch(stream, catalog, opcode, data)
+                if held is not None:
+                    self._batch(stream, catalog, *held)
+                    held = None
+                    self.reordered += 1
+                conn.sendall(_frame(json.dumps(self._ack(stream)).encode()))
+        except (ConnectionError, OSError):
+            return
+
+    def _batch(self, stream, catalog, opcode, data):
+        if opcode == 1:
+            msg = json.loads(data)
+            seq, rows = msg['seq'], msg['data']
+        else:
+            seq, payload = unwrap(data)
+            kind = None
+            if payload[:2] == ZMAGIC:
+                kind, payload = decompress(payload, {SCHEMA_VERSION: dictionary(SCHEMA_VERSION)})
+            if kind == KIND_JSON:
+                rows = json.loads(payload)['data']
+            else:
+                rows = [r for b in decode(payload, catalog)[3] for r in b['data']]
+        with self._lock:
+            if (stream, seq) in self.batches:
+                self.duplicates += 1
+            else:
+                self.batches[(stream, seq)] = rows
+        return seq
+
+    def _ack(self, stream):
+        with self._lock:
+            top = self._acked.get(stream, 0)
+            while (stream, top + 1) in self.batches:
+                top += 1
+            self._acked[stream] = top
+            above = sorted(s for st, s in self.batches if st == stream and s > top)
+        return {'type': 'ack', 'seq': top, 'received': above}
+
+
+def same(a, b, channel):
+    if a is None or b is None or channel.type != 'float' or channel.precision is None:
+        return a == b
+    return abs(a - b) <= 0.5 * 10 ** -channel.precision * (1 + 1e-9)
+
+
+def run(times, frames, features):
+    server = StandInServer(features)
+    c = WebSocketClient(f'ws://127.0.0.1:{server.port}/', 'key', resend_window=600, ack_timeout=0.5)
+    c.reconnect_delay = 0.2
+    if not c.connect(timeout=5):
+        return 'no connection', None, server
+    deadline = time.monotonic() + 5
+    while not c.acked and time.monotonic() < deadline:
+        time.sleep(0.01)
+    pipe = EncodePipeline(2, 8)
+    sent = {}
+    for i in range(0, len(frames), BATCH):
+        for seq, f, t in c.due_resends(pipe.depth):
+            pipe.submit(c, f, t, seq)
+        f, t = frames[i:i + BATCH], times[i:i + BATCH]
+        while not c.is_connected:
+            time.sleep(0.01)  # the capture buffer would hold these meanwhile
+        seq = c.window.next_seq
+        if pipe.submit(c, f, t):
+            sent[seq] = f
+        time.sleep(0.005)
+    deadline = time.monotonic() + 30
+    while len(c.window) and time.monotonic() < deadline:
+        for seq, f, t in c.due_resends(pipe.depth):
+            pipe.submit(c, f, t, seq)
+        time.sleep(0.02)
+    pipe.flush(5)
+    c.disconnect()
+    server.stop()
+
+    got = {seq: rows for (stream, seq), rows in server.batches.items() if stream == c.stream}
+    if sorted(got) != sorted(sent):
+        missing = sorted(set(sent) - set(got))
+        return f'{len(missing)} batches missing, e.g. {missing[:5]}', c, server
+    for seq, want in sent.items():
+        channels = [BY_ID[ch] for ch in LAYOUTS[want[0].schema.id]]
+        for row_g, row_w in zip(got[seq], want):
+            if not all(same(g, w, ch) for g, w, ch in zip(row_g, row_w, channels)):
+                return f'batch {seq} differs', c, server
+    return None, c, server
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=10)
+    args = ap.parse_args()
+
+    times, frames = record(args.seconds)
+    failures = []
+    for features in (['ack'], ['ack', 'gorilla', 'zlib']):
+        label = '+'.join(features)
+        err, c, server = run(times, frames, features)
+        st = c.window.stats() if c else {}
+        print(f'{label}: {len(server.batches):,} batches kept, {server.dropped} dropped, '
+              f'{server.reordered} reordered, {server.duplicates} duplicates deduped, '
+              f'{server.connections} connections; client resent {st.get("resent", 0)}, '
+              f'{st.get("unacked", "?")} unacked -> {err or "OK"}')
+        if err or st['unacked'] or server.connections < 2 or not server.dropped or not st['resent']:
+            failures.append(label)
+
+    w = ResendWindow(max_batches=5)
+    for n in range(8):
+        w.add([n], [n])
+    w.ack(4)
+    bounded = w.evicted == 3 and len(w) == 4 and w.stats()['acked'] == 1
+    print(f'bounded window: 8 added, cap 5 -> evicted {w.evicted}, ack 4 left {len(w)} '
+          f'-> {"OK" if bounded else "FAILED"}')
+    if not bounded:
+        failures.append('window bound')
+
+    print('acks: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
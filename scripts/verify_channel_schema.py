@@ -0,0 +1,173 @@
+"""
+Verify the channel schema registry and the id-keyed batch path.
+
+Checks that:
+  - every slot of every frame layout maps to a registry channel, ids are unique
+    and the table for this SCHEMA_VERSION hasn't changed since it was pinned
+    below (any change must bump the version and add a new pin);
+  - the values the real readers produce match each channel's registered type,
+    and iRacing's ext values land on the channels registered for their SDK
+    variable (GPS degrees, m/s2, track temperature), not on ACC's;
+  - an id-keyed batch decodes (capture.schema.decode_rows) back to exactly the
+    named frames the backend received before;
+  - the WebSocket client stays name-keyed until the server acks the schema,
+    then sends id-keyed rows, and falls back again on reconnect;
+  - the ack's tier plan and binary format go out before the client switches
+    to id-keyed batches (the sender prepares them on another thread).
+Also prints the batch size named vs id-keyed.
+
+Usage:
+    python scripts/verify_channel_schema.py
+
+Exit 0 = registry and round trip OK.
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_fused_read import READERS                                        # noqa: E402
+from capture.frame import SCHEMAS, as_dict                                  # noqa: E402
+from capture.schema import (BY_ID, CHANNELS, LAYOUTS, SCHEMA_VERSION,       # noqa: E402
+                            announcement, decode_rows)
+from capture.tiers import build_plans                                       # noqa: E402
+from network.websocket_client import WebSocketClient                        # noqa: E402
+
+# sha256 of the announced table per released version. Never edit an entry:
+# changing the registry means bumping SCHEMA_VERSION and pinning the new one.
+PINNED = {
+    1: '1b1180380b1efd87bb79cfd93d6e54a229310af247884098524133072cd23a9a',
+    2: 'c6d3fa1c88d164271d8bc5826d0395e0dc8aa90f1bfaf573a5da58ddc01f3310',
+}
+
+# SDK variable -> (value bench_fused_read's iRacing reader holds, unit it is in)
+IRACING_EXT = {'Lon': (5.25, 'deg'), 'Lat': (50.44, 'deg'), 'Alt': (80.0, 'm'),
+               'LatAccel': (11.2, 'm/s2'), 'LongAccel': (1.0, 'm/s2'), 'TrackTempCrew': (31.0, 'C')}
+
+TYPES = {'int': (int,), 'float': (float, int), 'bool': (bool,), 'str': (str,)}
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+class _Watching(_Socket):
+    """Notes whether the client was already id-keyed at each send."""
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+        self.keyed = []
+
+    def send(self, message, opcode=1):
+        super().send(message)
+        self.keyed.append(self.client.schema_version is not None)
+
+
+def check_ack_order(errors):
+    client = WebSocketClient('ws://unused', 'key', tier_plans=build_plans(120))
+    sock = _Watching(client)
+    client.ws, client.connected = sock, True
+    client._on_open(sock)
+    client._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                         'features': ['binary', 'ack', 'zlib']}))
+    early = [m['type'] for m, keyed in zip(sock.sent, sock.keyed) if keyed]
+    if early or client.schema_version is None:
+        errors.append(f'id-keyed before the ack was set up: {early} sent after')
+    else:
+        print(f'  schema ack: {", ".join(m["type"] for m in sock.sent[1:])} sent before going id-keyed')
+
+
+def check_iracing_ext(frame, errors):
+    by_source = {BY_ID[cid].sources.get('iracing'): (BY_ID[cid], v)
+                 for cid, v in zip(LAYOUTS[frame.schema.id], frame)}
+    for var, (want, unit) in IRACING_EXT.items():
+        ch, got = by_source.get(var, (None, None))
+        if ch is None or ch.unit != unit or got is None or abs(got - want) > 1e-3:
+            errors.append(f'iracing: {var} ({want} {unit}) read as '
+                          + (f'{ch.name} = {got!r} {ch.unit}' if ch else 'no channel'))
+        elif 'acc' in ch.sources:
+            errors.append(f'iracing: {var} shares ACC\'s {ch.name}')
+
+
+def fingerprint():
+    table = {k: v for k, v in announcement().items() if k not in ('type', 'features')}
+    return hashlib.sha256(json.dumps(table, sort_keys=True).encode()).hexdigest()
+
+
+def main():
+    errors = []
+
+    ids = [ch.id for ch in CHANNELS]
+    if len(set(ids)) != len(ids) or len({ch.name for ch in CHANNELS}) != len(ids):
+        errors.append('duplicate channel id or name')
+    for fs in SCHEMAS.values():
+        if len(LAYOUTS[fs.id]) != len(fs.channels):
+            errors.append(f'layout {fs.id}: {len(LAYOUTS[fs.id])} ids for {len(fs.channels)} slots')
+
+    fp = fingerprint()
+    pinned = PINNED.get(SCHEMA_VERSION)
+    if pinned is None:
+        print(f'schema v{SCHEMA_VERSION} not pinned yet: {fp}')
+    elif pinned != fp:
+        errors.append(f'schema v{SCHEMA_VERSION} table changed without a version bump ({fp})')
+
+    for game, make in READERS:
+        reader, rewind = make()
+        rewind()
+        rec = reader.read_canonical()
+        if game == 'iracing':
+            check_iracing_ext(rec, errors)
+        for cid, value in zip(LAYOUTS[rec.schema.id], rec):
+            ch = BY_ID[cid]
+            # bool is an int subclass: an int channel must not carry bools.
+            bad_bool = ch.type in ('int', 'float') and isinstance(value, bool)
+            if value is not None and (bad_bool or not isinstance(value, TYPES[ch.type])):
+                errors.append(f'{game}: {ch.name} is {ch.type} but got {value!r}')
+
+        frames = []
+        for _ in range(6):
+            rewind()
+            frames.append(reader.read_canonical())
+        if decode_rows(frames[0].schema.id, json.loads(json.dumps(frames))) != \
+                json.loads(json.dumps([as_dict(f) for f in frames])):
+            errors.append(f'{game}: id-keyed rows do not decode to the named frames')
+
+        client = WebSocketClient('ws://unused', 'key')
+        sock = _Socket()
+        client.ws, client.connected = sock, True
+        client._on_open(sock)
+        client.send_batch(frames)
+        client._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION}))
+        client.send_batch(frames)
+        client._on_close(sock, 1000, '')
+        client.connected = True
+        client.send_batch(frames)
+        kinds = [m['type'] + (':ids' if 'layout' in m else '') for m in sock.sent]
+        if kinds != ['schema', 'telemetry_batch', 'telemetry_batch:ids', 'telemetry_batch']:
+            errors.append(f'{game}: unexpected message sequence {kinds}')
+        else:
+            named, keyed = (len(json.dumps(m)) for m in sock.sent[1:3])
+            print(f'  {game:<8} 6-frame batch: named {named:>6} B  id-keyed {keyed:>6} B '
+                  f'({1 - keyed / named:.0%} smaller)')
+
+    check_ack_order(errors)
+    print(f'announcement: {len(json.dumps(announcement())):,} B once per session, '
+          f'{len(CHANNELS)} channels, layouts ' +
+          ', '.join(f'{k}={len(v)}' for k, v in LAYOUTS.items()))
+    for e in errors:
+        print(f'  FAIL {e}')
+    print('OK' if not errors else f'{len(errors)} FAILURES')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
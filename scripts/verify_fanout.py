@@ -0,0 +1,270 @@
+"""
+Local fan-out server (network.fanout): filters, rate caps, slow subscribers.
+
+Starts a FanoutServer on the network loop (ephemeral ports) and publishes the
+recorded ACC drive (bench_ext_delta.py) from a thread at the capture rate,
+the way TelemetryCapture._capture_loop does, to four subscribers at once:
+
+  A  WebSocket, filter + cap in the URL (?channels=speed_kmh,rpm&hz=30)
+  B  WebSocket, everything at first, then {"type": "subscribe"} to ext.* at 10 Hz
+  C  WebSocket that handshakes and then never reads (a hung overlay)
+  D  UDP, {"type": "subscribe", "channels": ["gear", "tire_temp_*"], "hz": 20}
+
+Checks that each gets exactly its channels at its rate (within 10%), that C
+is disconnected as too slow while A, B and D keep receiving, and that
+publish() costs the capture thread next to nothing (p99 of its CPU time per
+call; wall time, also reported, includes waiting for the GIL behind this
+script's own reader threads). Then:
+
+  E  raw WebSocket clients: a frame header announcing 1 TB is refused (close
+     1009) before the server reads it; a telemetry client's schema
+     announcement (~18 KB) is taken, and a masked 3 KB subscribe after it
+     still unmasks to the right channels
+
+Usage:
+    python scripts/verify_fanout.py [--seconds 4]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import base64
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import websocket                                                  # noqa: E402
+
+from bench_binary_batch import HZ                                 # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from network.fanout import FanoutServer                           # noqa: E402
+from network.loop import NetworkLoop                              # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+
+def ws_reader(url, out, stop, subscribe=None, after=0.0):
+    ws = websocket.create_connection(url, timeout=2)
+    out['hello'] = json.loads(ws.recv())
+    start = time.monotonic()
+    while not stop.is_set():
+        if subscribe and time.monotonic() - start >= after:
+            ws.send(json.dumps(subscribe))
+            subscribe = None
+        try:
+            msg = json.loads(ws.recv())
+        except websocket.WebSocketTimeoutException:
+            continue
+        except websocket.WebSocketConnectionClosedException:
+            break
+        if msg['type'] == 'subscribed':
+            out['subscribed_at'] = len(out['frames'])
+        elif msg['type'] == 'frame':
+            out['frames'].append((time.monotonic(), msg))
+    ws.close()
+
+
+def hung_client(port):
+    s = socket.socket()
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    s.connect(('127.0.0.1', port))
+    key = base64.b64encode(os.urandom(16)).decode()
+    s.sendall(f'GET / HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+              f'Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n'.encode())
+    return s  # never read from again
+
+
+def raw_client(port):
+    """Handshaken socket, hello frame read."""
+    s = hung_client(port)
+    s.settimeout(2)
+    buf = b''
+    while b'\r\n\r\n' not in buf:
+        buf += s.recv(4096)
+    buf = buf.split(b'\r\n\r\n', 1)[1]
+    _, buf = read_frame(s, buf)
+    return s, buf
+
+
+def read_frame(s, buf):
+    """(opcode, payload) of the next unmasked server frame, rest of buf."""
+    def need(n):
+        nonlocal buf
+        while len(buf) < n:
+            chunk = s.recv(65536)
+            if not chunk:
+                raise ConnectionError('closed')
+            buf += chunk
+    need(2)
+    opcode, n, head = buf[0] & 0x0F, buf[1] & 0x7F, 2
+    if n == 126:
+        need(4)
+        n, head = struct.unpack('!H', buf[2:4])[0], 4
+    elif n == 127:
+        need(10)
+        n, head = struct.unpack('!Q', buf[2:10])[0], 10
+    need(head + n)
+    return (opcode, buf[head:head + n]), buf[head + n:]
+
+
+def masked(payload, opcode=0x1):
+    mask = os.urandom(4)
+    n = len(payload)
+    head = struct.pack('!BB', 0x80 | opcode, 0x80 | 126) + struct.pack('!H', n) if n > 125 else \
+        struct.pack('!BB', 0x80 | opcode, 0x80 | n)
+    return head + mask + bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+
+def check_limits(port, failures):
+    s, buf = raw_client(port)
+    start = time.monotonic()
+    s.sendall(struct.pack('!BBQ', 0x81, 0x80 | 127, 1 << 40) + os.urandom(4))
+    try:
+        while True:
+            (opcode, data), buf = read_frame(s, buf)
+            if opcode == 0x8:
+                break
+        code = struct.unpack('!H', data[:2])[0]
+    except (ConnectionError, socket.timeout):
+        code = None
+    took = time.monotonic() - start
+    s.close()
+    print(f'  E 1 TB frame header: close {code} after {took * 1000:.0f} ms')
+    if code != 1009 or took > 1:
+        failures.append('oversized frame not refused')
+
+    s, buf = raw_client(port)
+    announcement = json.dumps(WebSocketClient('ws://unused', 'key')._announcement()).encode()
+    names = ['speed_kmh', 'rpm'] + [f'ext.no_such_channel_{i:04d}' for i in range(100)]
+    sub = json.dumps({'type': 'subscribe', 'channels': names, 'hz': 5}).encode()
+    s.sendall(masked(announcement) + masked(sub))
+    try:
+        while True:
+            (opcode, data), buf = read_frame(s, buf)
+            msg = json.loads(data) if opcode == 0x1 else {}
+            if msg.get('type') == 'subscribed':
+                break
+    except (ConnectionError, socket.timeout):
+        msg = {}
+    s.close()
+    print(f'  E masked {len(sub):,} B subscribe after a {len(announcement):,} B schema announcement: '
+          f'{msg.get("type")}, {len(msg.get("channels", ()))} channels, {msg.get("rate")} Hz')
+    if msg.get('channels') != names or msg.get('rate') != 5:
+        failures.append('masked subscribe')
+
+
+def udp_reader(port, out, stop, subscribe):
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.settimeout(0.2)
+    s.sendto(json.dumps(subscribe).encode(), ('127.0.0.1', port))
+    while not stop.is_set():
+        try:
+            data, _ = s.recvfrom(65536)
+        except socket.timeout:
+            continue
+        msg = json.loads(data)
+        if msg['type'] == 'frame':
+            out['frames'].append((time.monotonic(), msg))
+    s.close()
+
+
+def check(label, frames, patterns, hz, seconds, failures):
+    keys = set()
+    for _, msg in frames:
+        keys.update(msg['data'])
+    rate = len(frames) / seconds
+    ok_keys = bool(keys) and all(any(fnmatchcase(k, p) for p in patterns) for k in keys)
+    ok_rate = abs(rate - hz) <= hz * 0.1
+    print(f'  {label}: {len(frames):,} frames, {rate:.1f}/s (want {hz:g}), '
+          f'{len(keys)} channels e.g. {sorted(keys)[:3]} -> '
+          f'{"OK" if ok_keys and ok_rate else "MISMATCH"}')
+    if not (ok_keys and ok_rate):
+        failures.append(label)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=4)
+    args = ap.parse_args()
+
+    _, frames = record(args.seconds + 1)
+    net = NetworkLoop()
+    fan = FanoutServer('127.0.0.1', 0, 0, hz=HZ, queue_frames=120)
+    ws_port, udp_port = net.spawn(fan.start()).result(5)
+    failures = []
+
+    stop = threading.Event()
+    a, b, d = ({'frames': []} for _ in range(3))
+    readers = [
+        threading.Thread(target=ws_reader, args=(f'ws://127.0.0.1:{ws_port}/?channels=speed_kmh,rpm&hz=30',
+                                                 a, stop), daemon=True),
+        threading.Thread(target=ws_reader, args=(f'ws://127.0.0.1:{ws_port}/', b, stop,
+                                                 {'type': 'subscribe', 'channels': ['ext.*'], 'hz': 10},
+                                                 1.0), daemon=True),
+        threading.Thread(target=udp_reader, args=(udp_port, d, stop,
+                                                  {'type': 'subscribe', 'channels': ['gear', 'tire_temp_*'],
+                                                   'hz': 20}), daemon=True),
+    ]
+    for r in readers:
+        r.start()
+    hung = hung_client(ws_port)
+    while fan.subscribers < 4:
+        time.sleep(0.01)
+
+    calls = []
+    interval = 1.0 / HZ
+    tick = time.perf_counter()
+    begin = time.monotonic()
+    for f in frames[:int(args.seconds * HZ)]:
+        start, cpu = time.perf_counter(), time.thread_time()
+        fan.publish(time.time(), f)
+        calls.append((time.thread_time() - cpu, time.perf_counter() - start))
+        tick += interval
+        time.sleep(max(0.0, tick - time.perf_counter()))
+    end = time.monotonic()
+    time.sleep(0.3)
+    stop.set()
+    for r in readers:
+        r.join(3)
+    hung.close()
+
+    print(f'{args.seconds:g} s of ACC frames at {HZ} Hz to 4 subscribers '
+          f'(ws :{ws_port}, udp :{udp_port}):')
+    check('A ws ?channels=speed_kmh,rpm&hz=30', a['frames'], ['speed_kmh', 'rpm'], 30,
+          args.seconds, failures)
+    full = b['frames'][:b.get('subscribed_at', 0)]
+    later = [(t, m) for t, m in b['frames'][b.get('subscribed_at', 0):] if t > begin + 1.5]
+    full_keys = set(full[-1][1]['data']) if full else set()
+    print(f'  B ws before subscribe: {len(full):,} frames with {len(full_keys)} channels')
+    if len(full_keys) < 100:
+        failures.append('B unfiltered')
+    check('B ws after subscribe ext.* hz 10', later, ['ext.*'], 10, end - max(begin + 1.5, later[0][0] if later else end), failures)
+    check('D udp gear,tire_temp_* hz 20', d['frames'], ['gear', 'tire_temp_*'], 20, args.seconds, failures)
+    st = fan.stats()
+    print(f'  C hung client: dropped as too slow {st["dropped_slow"]} time(s); '
+          f'subscribers left {st["subscribers"]}')
+    if st['dropped_slow'] != 1:
+        failures.append('slow subscriber not dropped')
+    cpu = sorted(c for c, _ in calls)[int(len(calls) * 0.99)]
+    wall = sorted(w for _, w in calls)[int(len(calls) * 0.99)]
+    print(f'  publish() on the capture thread: p99 {cpu * 1e6:.0f} us CPU, {wall * 1e6:.0f} us wall')
+    if cpu > 0.0005:
+        failures.append('publish blocked')
+    check_limits(ws_port, failures)
+
+    net.spawn(fan.stop()).result(5)
+    net.stop()
+    print('fan-out: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+HTTPS bulk-upload fallback (network/http_bulk.py) against a local stand-in.
+
+Runs fake_bulk_server.py's BulkServer (chunk responses held --delay-ms, so
+parallel requests overlap; one chunk answered 503) and gives the session a
+WebSocket URL nothing listens on. Checks that:
+  - open_stream() with transport "auto" falls back to HttpBulkClient, and
+    with "websocket" gives up;
+  - the recorded ACC drive (bench_ext_delta.py), streamed through the
+    sender's path (EncodePipeline, an outage spool and the resend window, as
+    TelemetryCapture._send_tick does), arrives complete and exactly once,
+    including the batches lost with the failed chunk, after the client
+    reopens;
+  - more than one chunk (at most --in-flight) is out at once, over a few
+    keep-alive connections, and the server applies them in chunk order;
+  - text chunks go gzipped.
+
+Usage:
+    python scripts/verify_http_fallback.py [--seconds 6] [--in-flight 4] [--delay-ms 40]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ                                 # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.tiers import build_plans                             # noqa: E402
+from fake_bulk_server import BulkServer                           # noqa: E402
+from network.http_bulk import HttpBulkClient, open_stream         # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(('127.0.0.1', 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def feed(buf, lock, frames):
+    interval = 1.0 / HZ
+    tick = time.perf_counter()
+    for f in frames:
+        with lock:
+            buf.append((time.time(), f))
+        tick += interval
+        time.sleep(max(0.0, tick - time.perf_counter()))
+
+
+def stream(client, frames, deadline_s):
+    """The sender's tick, every 50 ms, until everything is acked."""
+    spool = deque()
+    pipe = EncodePipeline(2, 8, on_failed=lambda c, f, t: spool.append((f, t)))
+    buf, lock = deque(), threading.Lock()
+    feeder = threading.Thread(target=feed, args=(buf, lock, frames), daemon=True)
+    feeder.start()
+    offline = 0
+    deadline = None
+    while True:
+        time.sleep(0.05)
+        if not feeder.is_alive() and not buf and not spool and not pipe.in_flight and not len(client.window):
+            return True, offline
+        if deadline is None and not feeder.is_alive():
+            deadline = time.monotonic() + deadline_s
+        if deadline is not None and time.monotonic() > deadline:
+            return False, offline
+        live = client.is_connected
+        if live:
+            for seq, f, t in client.due_resends(pipe.room - 1):
+                pipe.submit(client, f, t, seq)
+            while spool and pipe.room:
+                pipe.submit(client, *spool.popleft())
+            if spool or not pipe.room:
+                continue
+        elif pipe.in_flight:
+            continue  # batches in flight fail into the spool first
+        with lock:
+            batch = [buf.popleft() for _ in range(len(buf))]
+        if batch:
+            times, fr = zip(*batch)
+            if live:
+                pipe.submit(client, list(fr), list(times))
+            else:
+                spool.append((list(fr), list(times)))
+                offline += len(batch)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=6)
+    ap.add_argument('--in-flight', type=int, default=4)
+    ap.add_argument('--delay-ms', type=float, default=40)
+    args = ap.parse_args()
+
+    _, frames = record(args.seconds)
+    server = BulkServer(delay_s=args.delay_ms / 1000, fail_chunks={40})
+    port = server.start()
+    dead = free_port()
+    failures = []
+    log = []
+
+    def make_ws():
+        return WebSocketClient(f'ws://127.0.0.1:{dead}/api/v1/ws/session/7?key=k', 'key',
+                               tier_plans=build_plans(HZ))
+
+    def make_bulk():
+        c = HttpBulkClient(f'http://127.0.0.1:{port}/api/v1/sessions/7/bulk', 'key',
+                           tier_plans=build_plans(HZ), in_flight=args.in_flight)
+        c.reconnect_delay = 0.2
+        return c
+
+    if open_stream(make_ws, make_bulk, 'websocket', log.append) is not None:
+        failures.append('transport "websocket" fell back')
+    start = time.monotonic()
+    client = open_stream(make_ws, make_bulk, 'auto', log.append)
+    chosen_s = time.monotonic() - start
+    if not isinstance(client, HttpBulkClient):
+        print('no fallback: ' + '; '.join(log))
+        return 1
+    done, offline = stream(client, frames, 30)
+    client.disconnect()
+    server.stop()
+
+    st = server.streams[client.stream]
+    delivered = sum(st.frames.values())
+    ts = client.transport_stats()
+    acks = client.window.stats()
+    print(f'{args.seconds:g} s of ACC frames at {HZ} Hz, WebSocket port closed, '
+          f'{args.delay_ms:g} ms per chunk, chunk 40 answered 503:')
+    print(f'  auto: fell back to the bulk upload in {chosen_s * 1000:.0f} ms ({"; ".join(log)})')
+    print(f'  delivered {delivered:,} / {len(frames):,} frames in {len(st.frames):,} batches; '
+          f'{acks["resent"]:,} resent, {offline:,} frames spooled while closed, {st.opens} opens')
+    print(f'  chunks: {ts["chunks"]:,} posted ({ts["failures"]} failed), up to {server.max_posting} '
+          f'at once (limit {args.in_flight}), {server.connections} TCP connections, '
+          f'{st.early:,} arrived ahead of their turn, {st.stale} stale refused')
+    print(f'  gzipped text chunks: {server.gzipped:,}, {server.raw_bytes / 1024:,.0f} KB -> '
+          f'{server.wire_bytes / 1024:,.0f} KB on the wire')
+
+    if not done:
+        failures.append('not everything acked in time')
+    if delivered != len(frames):
+        failures.append('frames lost or duplicated')
+    if st.opens < 2 or not ts['failures']:
+        failures.append('no reopen after the failed chunk')
+    if not 1 < server.max_posting <= args.in_flight:
+        failures.append('in-flight limit')
+    if server.connections > 2 * args.in_flight + 2:
+        failures.append('keep-alive')
+    if not server.gzipped:
+        failures.append('gzip')
+    print('http fallback: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
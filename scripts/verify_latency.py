@@ -0,0 +1,161 @@
+"""
+Live-stream latency instrumentation: network.latency.LatencyTracker.
+
+Checks that:
+  - WebSocketClient.ping() round trips are measured (against a local RFC 6455
+    endpoint, network.fanout's server, which echoes ping frames like any
+    WebSocket server), one RTT sample per ping;
+  - EncodePipeline times every batch capture -> enqueued -> encoded -> sent:
+    the recorded ACC drive (bench_ext_delta.py) fed at the capture rate, cut
+    every --cut-ms, on a socket whose sends take --send-ms, shows the cut in
+    capture->enqueue and the send in encoded->sent, with the stages adding up
+    to capture->sent;
+  - the session histograms' p50/p95/p99 match exact percentiles within 3%.
+
+Usage:
+    python scripts/verify_latency.py [--seconds 3] [--cut-ms 50] [--send-ms 20]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ                                 # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.schema import SCHEMA_VERSION                         # noqa: E402
+from network.fanout import FanoutServer                           # noqa: E402
+from network.latency import STAGES, LatencyTracker, _Histogram    # noqa: E402
+from network.loop import NetworkLoop                              # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+
+class _Socket:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def send(self, message, opcode=1):
+        time.sleep(self.delay)
+
+
+def check_rtt(failures):
+    net = NetworkLoop()
+    fan = FanoutServer('127.0.0.1', 0, None)
+    port, _ = net.spawn(fan.start()).result(5)
+    tracker = LatencyTracker()
+    c = WebSocketClient(f'ws://127.0.0.1:{port}/', 'key')
+    c.on_rtt = tracker.rtt
+    if not c.connect(5):
+        failures.append('rtt: no connection')
+        return
+    for _ in range(5):
+        c.ping()
+        time.sleep(0.1)
+    c.disconnect()
+    net.spawn(fan.stop()).result(5)
+    net.stop()
+    st = tracker.session_stats()
+    print(f'  RTT: {st["rtt_samples"]} samples from 5 pings, p50 {st["rtt"]["p50"]} ms, '
+          f'last {c.rtt_s * 1000 if c.rtt_s else None:.2f} ms')
+    if st['rtt_samples'] != 5 or not st['rtt']['p99'] or st['rtt']['p99'] > 100:
+        failures.append('rtt')
+
+
+def check_stages(args, failures):
+    _, frames = record(args.seconds)
+    sock = _Socket(args.send_ms / 1000)
+    c = WebSocketClient('ws://unused', 'key')
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                    'features': ['zlib']}))
+    tracker = LatencyTracker(window=10_000)
+    pipe = EncodePipeline(2, 8, latency=tracker)
+    buf, lock = deque(), threading.Lock()
+
+    def feed():
+        interval = 1.0 / HZ
+        tick = time.perf_counter()
+        for f in frames:
+            with lock:
+                buf.append((time.time(), f))
+            tick += interval
+            time.sleep(max(0.0, tick - time.perf_counter()))
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    while feeder.is_alive() or buf:
+        time.sleep(args.cut_ms / 1000)
+        with lock:
+            batch = [buf.popleft() for _ in range(len(buf))]
+        if batch:
+            times, fr = zip(*batch)
+            pipe.submit(c, list(fr), list(times))
+    pipe.flush(10)
+
+    st = tracker.session_stats()
+    print(f'  {st["batches"]} batches, cut every {args.cut_ms:g} ms, sends take {args.send_ms:g} ms; '
+          f'ms p50/p95/p99:')
+    for stage in STAGES:
+        p = st[stage]
+        print(f'    {stage:<16} {p["p50"]:>6} / {p["p95"]:>6} / {p["p99"]:>6}')
+    parts = sum(st[s]['p50'] for s in STAGES[:3])
+    total = st['capture_sent']['p50']
+    print(f'    stage p50s add up to {parts:.1f} ms, capture->sent p50 {total} ms; '
+          f'rolling window p95 {tracker.stats()["capture_sent"]["p95"]} ms')
+    if not args.cut_ms * 0.8 <= st['capture_enqueue']['p95'] <= args.cut_ms * 1.6:
+        failures.append('capture->enqueue')
+    if st['encoded_sent']['p50'] < args.send_ms * 0.9:
+        failures.append('encoded->sent')
+    if abs(parts - total) > max(5.0, total * 0.15):
+        failures.append('stages do not add up')
+    if any(not st[s]['p50'] <= st[s]['p95'] <= st[s]['p99'] for s in STAGES):
+        failures.append('percentile order')
+    if st['batches'] < args.seconds * 1000 / args.cut_ms * 0.8:
+        failures.append('batches not all timed')
+
+
+def check_histogram(failures):
+    rnd = random.Random(7)
+    samples = [rnd.lognormvariate(-3, 1) for _ in range(50_000)]
+    h = _Histogram()
+    for s in samples:
+        h.add(s)
+    exact = sorted(samples)
+    worst = 0.0
+    for q in (0.5, 0.95, 0.99):
+        e = exact[int(len(exact) * q)]
+        worst = max(worst, abs(h.percentile(q) - e) / e)
+    print(f'  histogram vs exact percentiles (50k lognormal samples): worst error {worst * 100:.1f}%')
+    if worst > 0.03:
+        failures.append('histogram accuracy')
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=3)
+    ap.add_argument('--cut-ms', type=float, default=50)
+    ap.add_argument('--send-ms', type=float, default=20)
+    args = ap.parse_args()
+
+    failures = []
+    print('latency instrumentation:')
+    check_rtt(failures)
+    check_stages(args, failures)
+    check_histogram(failures)
+    print('latency: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Send timeouts on a stuck uplink: EncodePipeline's writer + watchdog.
+
+Streams the recorded ACC drive (bench_ext_delta.py) through the sender's path
+(EncodePipeline, an outage spool, AdaptiveBatcher, UplinkMonitor, as
+TelemetryCapture._sender_loop does) to a local WebSocket endpoint that stops
+reading after the handshake, so the socket buffer fills and a send blocks.
+Checks that:
+  - the sender's ticks never block (submit only with room, ping skipped while
+    a batch is on the socket): every tick under 50 ms;
+  - the stuck send is seen while it lasts (pipeline.stalled()): the batcher's
+    age target and the uplink monitor go congested before it returns;
+  - after --timeout s the watchdog aborts the connection once, the stuck
+    batch and the ones queued behind it land in the spool, and the client
+    reconnects (the endpoint reads normally the second time) and replays it;
+  - with no send timeout the same writer is still stuck at the end.
+
+Usage:
+    python scripts/verify_send_timeout.py [--seconds 5] [--timeout 1.5] [--send-buffer-kb 64]
+
+Exit 0 = all checks passed.
+"""
+
+import argparse
+import base64
+import hashlib
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import HZ                                 # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from network.batcher import AdaptiveBatcher                       # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.uplink import UplinkMonitor                          # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class StuckServer:
+    """WebSocket endpoint: the first connection is never read after the
+    handshake (a dead uplink), later ones are read and discarded."""
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16 << 10)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+        self.connections = 0
+        self.read_bytes = 0
+        self._held = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(conn, self.connections), daemon=True).start()
+
+    def _serve(self, conn, n):
+        head = b''
+        while b'\r\n\r\n' not in head:
+            head += conn.recv(4096)
+        key = next(line.split(b':', 1)[1].strip() for line in head.split(b'\r\n')
+                   if line.lower().startswith(b'sec-websocket-key'))
+        accept = base64.b64encode(hashlib.sha1(key + GUID).digest())
+        conn.sendall(b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                     b'Connection: Upgrade\r\nSec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+        if n == 1:
+            self._held.append(conn)  # never read again
+            return
+        try:
+            while True:
+                data = conn.recv(1 << 16)
+                if not data:
+                    return
+                self.read_bytes += len(data)
+        except OSError:
+            pass
+
+    def stop(self):
+        self.sock.close()
+        for c in self._held:
+            c.close()
+
+
+def run(frames, seconds, timeout, send_buffer):
+    """The sender's loop for `seconds`; returns what it saw."""
+    server = StuckServer()
+    client = WebSocketClient(f'ws://127.0.0.1:{server.port}/', 'key', send_buffer=send_buffer)
+    client.reconnect_delay = 0.2
+    client.connect(5)
+    spool = deque()
+    batcher = AdaptiveBatcher()
+    uplink = UplinkMonitor(HZ, congested_s=0.5, down_after_s=0.5)
+    out = {'sent': 0, 'spooled': 0, 'max_tick': 0.0, 'congested_at': None, 'age_at': None,
+           'aborted_at': None, 'stuck_at': None, 'pings': 0}
+
+    def sent(n, nbytes, latency):
+        out['sent'] += n
+        batcher.observe(n, nbytes, latency)
+        uplink.sent(n, nbytes, latency)
+
+    def failed(c, f, t):
+        out['spooled'] += len(f)
+        spool.append((f, t))
+
+    pipe = EncodePipeline(2, 4, on_failed=failed, on_sent=sent, send_timeout_s=timeout)
+    start = time.monotonic()
+    fed = 0
+    next_ping = start
+    while time.monotonic() - start < seconds:
+        time.sleep(0.01)
+        tick = time.monotonic()
+        stalled = pipe.stalled()
+        if stalled:
+            batcher.congested(stalled)
+        if stalled > 0.2 and out['stuck_at'] is None:
+            out['stuck_at'] = tick - stalled
+        if uplink.sample(0, 0.0, stalled_s=stalled) or uplink.state == 'congested':
+            out['congested_at'] = out['congested_at'] or tick
+        if batcher.age_s >= batcher.max_age_s and out['age_at'] is None:
+            out['age_at'] = tick
+        if pipe.timeouts and out['aborted_at'] is None:
+            out['aborted_at'] = tick
+        if tick >= next_ping and client.is_connected:
+            out['pings'] += client.ping()
+            next_ping = tick + 0.25
+        due = min(len(frames), int((tick - start) * HZ))
+        if client.is_connected:
+            while spool and pipe.room:
+                pipe.submit(client, *spool.popleft())
+            reason = batcher.due(due - fed, tick - start - fed / HZ)
+            if not spool and pipe.room and reason:
+                batcher.flushed(reason)
+                n = min(batcher.limit(), due - fed)
+                pipe.submit(client, frames[fed:fed + n])
+                fed += n
+        elif not pipe.in_flight and due > fed:
+            spool.append((frames[fed:due], None))
+            fed = due
+        out['max_tick'] = max(out['max_tick'], time.monotonic() - tick)
+    out.update(fed=fed, stalled_end=pipe.stalled(), timeouts=pipe.timeouts, pending=len(spool),
+               connections=server.connections, read_kb=server.read_bytes / 1024,
+               send_ms=pipe.stats()['send_ms'], start=start)
+    client.disconnect()
+    server.stop()
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--seconds', type=float, default=5)
+    ap.add_argument('--timeout', type=float, default=1.5)
+    ap.add_argument('--send-buffer-kb', type=int, default=64)
+    args = ap.parse_args()
+
+    _, frames = record(args.seconds + 1)
+    failures = []
+    print(f'{args.seconds:g} s of ACC frames at {HZ} Hz to an endpoint that stops reading, '
+          f'send buffer {args.send_buffer_kb} KB:')
+    r = run(frames, args.seconds, args.timeout, args.send_buffer_kb << 10)
+    rel = lambda t: '-' if t is None else f'{t - r["start"]:.2f} s'  # noqa: E731
+    print(f'  send timeout {args.timeout:g} s: stuck from {rel(r["stuck_at"])}, uplink congested at '
+          f'{rel(r["congested_at"])}, batch age at max at {rel(r["age_at"])}, aborted at '
+          f'{rel(r["aborted_at"])} ({r["timeouts"]} timeouts)')
+    print(f'  {r["fed"]:,} frames fed, {r["spooled"]:,} spooled and replayed ({r["pending"]} batches '
+          f'still queued), {r["connections"]} connections, {r["read_kb"]:,.0f} KB read on the second; '
+          f'{r["pings"]} pings; slowest sender tick {r["max_tick"] * 1000:.1f} ms; '
+          f'send ms p50/p95/max {r["send_ms"]["p50"]}/{r["send_ms"]["p95"]}/{r["send_ms"]["max"]}')
+    if r['max_tick'] > 0.05:
+        failures.append('sender tick blocked')
+    if r['stuck_at'] is None or r['aborted_at'] is None or r['timeouts'] != 1:
+        failures.append('stuck send not aborted')
+    elif not args.timeout <= r['aborted_at'] - r['stuck_at'] <= args.timeout + 0.5:
+        failures.append('abort not at the timeout')
+    if r['congested_at'] is None or r['aborted_at'] is None or r['congested_at'] > r['aborted_at']:
+        failures.append('uplink not congested during the stall')
+    if r['age_at'] is None or r['aborted_at'] is None or r['age_at'] > r['aborted_at']:
+        failures.append('batch age target not raised during the stall')
+    if not r['spooled'] or r['pending'] or r['connections'] < 2 or not r['read_kb']:
+        failures.append('no spool + reconnect + replay')
+
+    n = run(frames, min(args.seconds, args.timeout + 1.5), None, args.send_buffer_kb << 10)
+    print(f'  no send timeout: writer still stuck after {n["stalled_end"]:.1f} s, '
+          f'{n["connections"]} connection, slowest sender tick {n["max_tick"] * 1000:.1f} ms')
+    if n['stalled_end'] < args.timeout or n['timeouts'] or n['max_tick'] > 0.05:
+        failures.append('control run')
+    print('send timeout: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+Outage spool: ordering, crash recovery, size cap and replay through the
+encode pipeline.
+
+Uses the recorded ACC drive (bench_ext_delta.py) and a temporary spool
+directory with small segments, and checks that:
+  - everything appended comes back from peek()/consume() in order, across
+    segment boundaries, with capture times to the millisecond and values to
+    their registered precision;
+  - after a "crash" (cursor on disk, a torn record at the end of the last
+    segment) a reopened spool replays exactly what was not consumed yet;
+  - past max_bytes the oldest segments are dropped and counted, and the rest
+    still replays in order;
+  - Spool.scan() finds leftover sessions, and a drained spool removes itself;
+  - with a socket that fails for a while, batches failing in the encode
+    pipeline land in the spool, live batches queue behind it, and the server
+    ends up with every frame exactly once, in capture order;
+  - with ext deltas negotiated, the batches sent after one that failed
+    (link still up) decode right: the ones prepared on its delta state are
+    spooled too, and the next one restarts from keyframes;
+  - through a SpoolWriter on a slow disk, appends return at once and the
+    spool is pending from the first one, and a peek() queued behind them
+    reads them all back in order.
+
+Usage:
+    python scripts/verify_spool.py
+
+Exit 0 = all checks passed.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_binary_batch import BATCH                              # noqa: E402
+from bench_ext_delta import record                                # noqa: E402
+from capture.ext_delta import ExtDeltaStreamsDecoder             # noqa: E402
+from capture.schema import BY_ID, LAYOUTS, SCHEMA_VERSION         # noqa: E402
+from network.pipeline import EncodePipeline                       # noqa: E402
+from network.spool import Spool, SpoolWriter                      # noqa: E402
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+
+def same(a, b, channel):
+    if a is None or b is None or channel.type != 'float' or channel.precision is None:
+        return a == b
+    return abs(a - b) <= 0.5 * 10 ** -channel.precision * (1 + 1e-9)
+
+
+def same_frames(got, want):
+    if len(got) != len(want):
+        return False
+    channels = [BY_ID[c] for c in LAYOUTS[want[0].schema.id]]
+    return all(same(g, w, ch) for fg, fw in zip(got, want) for g, w, ch in zip(fg, fw, channels))
+
+
+def batches(times, frames, n):
+    return [(frames[i:i + BATCH], times[i:i + BATCH]) for i in range(0, n * BATCH, BATCH)]
+
+
+def drain(spool, budget=60):
+    out = []
+    while spool.pending:
+        got = spool.peek(budget)
+        out.extend(got)
+        spool.consume(len(got))
+    return out
+
+
+def check_batches(got, want):
+    if len(got) != len(want):
+        return f'{len(got)} batches back, {len(want)} spooled'
+    for (gf, gt), (wf, wt) in zip(got, want):
+        if [int(t * 1000) for t in wt] != [round(t * 1000) for t in gt]:
+            return 'capture times differ'
+        if not same_frames(gf, wf):
+            return 'values differ'
+    return None
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+        self.fail = False
+
+    def send(self, message, opcode=1):
+        if self.fail:
+            raise ConnectionError('link down')
+        self.sent.append(message)
+
+
+class _SlowSpool(Spool):
+    """A spool on a disk that takes 20 ms per append."""
+
+    def append(self, frames, times):
+        time.sleep(0.02)
+        super().append(frames, times)
+
+
+def lost_batches(data, queued):
+    """Every 17th batch fails on the socket, the link stays up; returns
+    (what the server decodes, what it should have: all but the spooled)."""
+    sock = _Socket()
+    c = WebSocketClient('ws://unused', 'key')
+    c.ws, c.connected = sock, True
+    c._on_open(sock)
+    c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                    'features': ['ext_delta']}))
+    sock.sent.clear()
+    spooled = set()
+    pipe = EncodePipeline(2, 4, on_failed=lambda client, f, t: spooled.add(id(f)))
+    bad = range(30, len(data), 17)
+    for n, (f, t) in enumerate(data):
+        sock.fail = n in bad
+        pipe.submit(c, f, t)
+        if not queued or n in bad:
+            pipe.flush(5)
+    pipe.flush(5)
+    dec = ExtDeltaStreamsDecoder()
+    ext_start = data[0][0][0].schema.ext_start
+    rows = []
+    for m in sock.sent:
+        msg = json.loads(m)
+        rows.extend(tuple(r) for r in dec.rows((msg['layout'], None), msg['data'], ext_start))
+    return rows, [f for fs, _ in data if id(fs) not in spooled for f in fs]
+
+
+def main():
+    times, frames = record(20)
+    root = Path(tempfile.mkdtemp())
+    failures = []
+    try:
+        data = batches(times, frames, 300)
+
+        # 1. order across segments
+        spool = Spool(root / 's1', segment_bytes=40 << 10)
+        for f, t in data:
+            spool.append(f, t)
+        segments = len(list((root / 's1').glob('*.mgrc')))
+        err = check_batches(drain(spool), data)
+        print(f'in order: {len(data)} batches over {segments} segments -> {err or "OK"}')
+        if err or segments < 3:
+            failures.append('order')
+        spool.close()
+        if (root / 's1').exists():
+            failures.append('drained spool not removed')
+
+        # 2. crash recovery: consume part, torn tail, reopen
+        spool = Spool(root / 's2', segment_bytes=40 << 10)
+        for f, t in data:
+            spool.append(f, t)
+        first = spool.peek(100 * BATCH)
+        spool.consume(len(first))
+        spool.close()  # flushes and saves the cursor
+        last = sorted((root / 's2').glob('*.mgrc'))[-1]
+        with open(last, 'ab') as fh:
+            fh.write(b'\x90\x03' + b'\x00' * 17)  # a record cut short by the crash
+        leftover = Spool.scan(root)
+        spool = Spool(root / 's2', segment_bytes=40 << 10)
+        rest = drain(spool)
+        err = check_batches(first + rest, data)
+        print(f'crash recovery: scan -> {leftover}, {len(first)} consumed before, '
+              f'{len(rest)} replayed after -> {err or "OK"}')
+        if err or leftover != ['s2']:
+            failures.append('recovery')
+        spool.close()
+
+        # 3. size cap drops the oldest, keeps order
+        spool = Spool(root / 's3', segment_bytes=40 << 10, max_bytes=100 << 10)
+        for f, t in data:
+            spool.append(f, t)
+        kept = drain(spool)
+        err = check_batches(kept, data[len(data) - len(kept):])
+        print(f'cap 100 KB: kept {len(kept)} newest batches, dropped {spool.dropped:,} frames '
+              f'-> {err or "OK"}')
+        if err or not spool.dropped or spool.dropped + sum(len(f) for f, _ in kept) != len(data) * BATCH:
+            failures.append('cap')
+        spool.close()
+
+        # 4. outage during a live session, through the encode pipeline
+        sock = _Socket()
+        c = WebSocketClient('ws://unused', 'key')
+        c.ws, c.connected = sock, True
+        c._on_open(sock)
+        c._on_message(sock, json.dumps({'type': 'schema_ack', 'version': SCHEMA_VERSION,
+                                        'features': []}))
+        sock.sent.clear()
+        spool = Spool(root / 's4')
+        pipe = EncodePipeline(2, 4, on_failed=lambda client, f, t: spool.append(f, t))
+        for n, (f, t) in enumerate(data[:200]):
+            down = 40 <= n < 90
+            if sock.fail and not down:
+                pipe.flush(5)  # the outage's batches in flight fail before the link is back
+            sock.fail = down
+            if spool.pending and not sock.fail:
+                pipe.flush(1)  # in-flight failures reach the spool first
+                spool.append(f, t)  # live batches queue behind the backlog
+            else:
+                pipe.submit(c, f, t)
+            if spool.pending and not sock.fail:
+                replay = spool.peek(3 * BATCH)
+                for rf, rt in replay:
+                    pipe.submit(c, rf, rt)
+                spool.consume(len(replay))
+        pipe.flush(5)
+        while spool.pending:
+            replay = spool.peek(3 * BATCH)
+            for rf, rt in replay:
+                pipe.submit(c, rf, rt)
+            spool.consume(len(replay))
+            pipe.flush(5)
+        rows = [row for m in sock.sent for row in json.loads(m)['data']]
+        want = [f for f, _ in data[:200] for f in f]
+        ok = same_frames([tuple(r) for r in rows], want)
+        print(f'outage (50 batches failed): {len(rows):,}/{len(want):,} frames delivered, '
+              f'{spool.replayed:,} via the spool -> {"OK" if ok else "MISMATCH"}')
+        if not ok or not spool.replayed:
+            failures.append('outage replay')
+        spool.close()
+
+        # 5. single lost batches with ext deltas
+        for queued in (False, True):
+            rows, want = lost_batches(data[:200], queued)
+            ok = same_frames(rows, want)
+            print(f'lost batches with ext deltas ({"queued behind" if queued else "one at a time"}): '
+                  f'{len(rows):,} frames decoded, {len(data[:200]) * BATCH - len(want):,} spooled '
+                  f'-> {"OK" if ok else "MISMATCH"}')
+            if not ok:
+                failures.append('ext deltas after a lost batch')
+
+        # 6. appends through the spool writer
+        spool = _SlowSpool(root / 's6')
+        writer = SpoolWriter()
+        start = time.perf_counter()
+        for f, t in data[:40]:
+            writer.append(spool, f, t)
+        queued_ms = (time.perf_counter() - start) * 1000
+        pending = spool.pending
+        got = writer.call(spool.peek, 40 * BATCH).result(5)
+        writer.call(spool.consume, len(got)).result(5)
+        err = check_batches(got, data[:40])
+        print(f'spool writer (20 ms/append): 40 appends queued in {queued_ms:.1f} ms, pending at once: '
+              f'{pending}, read back behind them: {err or "OK"}')
+        if err or not pending or queued_ms > 100 or spool.pending or not writer.flush(1):
+            failures.append('spool writer')
+        spool.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print('spool: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+WebSocketClient.connect(): waits for the handshake, not a fixed sleep.
+
+Runs a minimal local WebSocket endpoint (just the HTTP upgrade, then it holds
+the socket open) and checks that:
+  - connect() returns True as soon as the handshake completes, also when the
+    server answers slowly (well past the old fixed 2 s wait);
+  - a refused connection fails fast, without waiting out the timeout;
+  - a server that never answers fails after `timeout`, and the client stops
+    its reconnect loop;
+  - the first batch fires on_first_send with first_send_at set.
+
+Usage:
+    python scripts/verify_ws_connect.py
+
+Exit 0 = all checks passed.
+"""
+
+import base64
+import hashlib
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from network.websocket_client import WebSocketClient              # noqa: E402
+
+GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def serve(delay=0.0, answer=True):
+    """Listen on a free port; returns (port, stop event)."""
+    srv = socket.socket()
+    srv.bind(('127.0.0.1', 0))
+    srv.listen()
+    srv.settimeout(0.2)
+    stop = threading.Event()
+
+    def handle(conn):
+        req = b''
+        while b'\r\n\r\n' not in req:
+            chunk = conn.recv(4096)
+            if not chunk:
+                return
+            req += chunk
+        if not answer:
+            stop.wait()
+            return
+        time.sleep(delay)
+        key = next(line.split(':', 1)[1].strip() for line in req.decode().split('\r\n')
+                   if line.lower().startswith('sec-websocket-key'))
+        accept = base64.b64encode(hashlib.sha1((key + GUID).encode()).digest()).decode()
+        conn.sendall(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                      f'Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n').encode())
+        conn.settimeout(0.2)
+        while not stop.is_set():
+            try:
+                if not conn.recv(65536):
+                    return
+            except socket.timeout:
+                pass
+            except OSError:
+                return
+
+    def loop():
+        while not stop.is_set():
+            try:
+                conn, _ = srv.accept()
+            except socket.timeout:
+                continue
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+        srv.close()
+
+    threading.Thread(target=loop, daemon=True).start()
+    return srv.getsockname()[1], stop
+
+
+def attempt(url, timeout):
+    c = WebSocketClient(url, 'key')
+    start = time.monotonic()
+    ok = c.connect(timeout=timeout)
+    return c, ok, time.monotonic() - start
+
+
+def main():
+    failures = []
+
+    for delay in (0.0, 2.5):
+        port, stop = serve(delay)
+        c, ok, took = attempt(f'ws://127.0.0.1:{port}/', timeout=5)
+        fired = []
+        c.on_first_send = lambda: fired.append(c.first_send_at)
+        sent = ok and c.send_encoded('{"type": "telemetry_batch", "data": []}', False)
+        print(f'handshake after {delay:g} s: connected={ok} in {took * 1000:,.0f} ms, '
+              f'first send fired={bool(fired)}')
+        if not ok or took > delay + 1.0 or not sent or not fired:
+            failures.append(f'handshake after {delay:g} s')
+        c.disconnect()
+        stop.set()
+
+    port, stop = serve()
+    stop.set()
+    time.sleep(0.5)  # listener closed: connection refused
+    c, ok, took = attempt(f'ws://127.0.0.1:{port}/', timeout=5)
+    print(f'refused: connected={ok} in {took * 1000:,.0f} ms')
+    if ok or took > 1.0:
+        failures.append('refused connection not fast')
+
+    port, stop = serve(answer=False)
+    c, ok, took = attempt(f'ws://127.0.0.1:{port}/', timeout=1)
+    print(f'no answer: connected={ok} in {took * 1000:,.0f} ms, reconnect loop running={c.running}')
+    if ok or not 0.9 < took < 2.0 or c.running:
+        failures.append('silent server')
+    stop.set()
+
+    print('connect: ' + ('OK' if not failures else 'FAILED: ' + ', '.join(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Binary `telemetry_batch` wire format.
+
+JSON spends most of the sender's CPU turning floats into strings, and even
+id-keyed rows are several hundred bytes per ACC frame. When the server's
+schema ack lists the "binary" feature, batches go out as binary WebSocket
+messages instead (JSON stays the fallback for everything else):
+
+    header   <2sBBHqB   magic b"MT", format version, layout id (capture.frame
+                        schema id), schema version, base timestamp (epoch ms),
+                        block count
+    block    <H         row count, then that many rows:
+    row      <I + codes time offset from the base (ms), then one fixed-width
+                        little-endian field per channel
+    strings  <B + n*(<B + utf-8)   string table the str fields index into
+
+A batch without tiers is one block carrying every channel of the layout; with
+tiers (capture.tiers) there is one block per tier, in tier_plan order. Each
+block's row format is derived from the channel registry and sent once, after
+the ack, as a `binary_format` message; decode() is the reference decoder.
+
+Field codes by registry type:
+  int    i  (int32; None = -2**31)
+  float  f  (float32; None = NaN) — d (float64) for the channels in F64
+  bool   B  (0/1; None = 255)
+  str    B  (index into the string table; None = 255)
+
+float32 keeps ~7 significant digits, enough for every channel's registered
+precision except world/GPS position and session clocks, which go as float64.
+Ext keyframe/delta encoding (capture.ext_delta) doesn't apply: rows are fixed
+width by design.
+"""
+
+import math
+import struct
+
+from capture.schema import BY_ID, LAYOUTS
+
+MAGIC = b"MT"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<2sBBHqB")
+COUNT = struct.Struct("<H")
+
+INT_NONE = -2 ** 31
+BYTE_NONE = 255
+
+F64 = frozenset((
+    "ext.pos_x", "ext.pos_y", "ext.pos_z", "ext.gps_lon", "ext.gps_lat",
+    "ext.normalized_position", "ext.session_time", "ext.session_time_left_ms",
+))
+
+_NAN = float("nan")
+
+
+def _code(channel):
+    if channel.type == "float":
+        return "d" if channel.name in F64 else "f"
+    return "i" if channel.type == "int" else "B"
+
+
+class RowFormat:
+    """Packed row layout for one block: a time offset plus the given channels."""
+
+    def __init__(self, channel_ids):
+        self.channel_ids = tuple(channel_ids)
+        channels = [BY_ID[cid] for cid in self.channel_ids]
+        self.codes = "".join(_code(ch) for ch in channels)
+        self.struct = struct.Struct("<I" + self.codes)
+        self.str_fields = tuple(i for i, ch in enumerate(channels) if ch.type == "str")
+        self.types = tuple(ch.type for ch in channels)
+        self.nulls = tuple(_NAN if t == "float" else INT_NONE if t == "int" else BYTE_NONE
+                           for t in self.types)
+
+    def describe(self):
+        return {"format": self.struct.format, "channels": list(self.channel_ids)}
+
+    def pack_into(self, out, offset, row, strings):
+        """Append one row; `strings` is the batch's {str: index} table."""
+        vals = list(row)
+        for i in self.str_fields:
+            s = vals[i]
+            vals[i] = BYTE_NONE if s is None else strings.setdefault(s, len(strings))
+        if None in vals:
+            nulls = self.nulls
+            vals = [nulls[i] if v is None else v for i, v in enumerate(vals)]
+        try:
+            out += self.struct.pack(offset, *vals)
+        except struct.error:
+            out += self.struct.pack(offset, *self._sanitize(vals))
+
+    def _sanitize(self, vals):
+        # Slow path: a value of the wrong Python type for its field.
+        fixed = []
+        for v, t in zip(vals, self.types):
+            if t == "float":
+                fixed.append(_NAN if v is None else float(v))
+            elif t == "int":
+                fixed.append(INT_NONE if v is None else int(v))
+            elif t == "bool":
+                fixed.append(BYTE_NONE if v is None else int(bool(v)))
+            else:
+                fixed.append(v)
+        return fixed
+
+    def unpack(self, buf, pos, strings):
+        """(offset ms, values) of the row at `pos`."""
+        offset, *vals = self.struct.unpack_from(buf, pos)
+        for i, (v, t) in enumerate(zip(vals, self.types)):
+            if t == "float":
+                if v != v:
+                    vals[i] = None
+            elif t == "int":
+                if v == INT_NONE:
+                    vals[i] = None
+            elif t == "bool":
+                vals[i] = None if v == BYTE_NONE else bool(v)
+            else:
+                vals[i] = None if v == BYTE_NONE else strings[v]
+        return offset, vals
+
+
+class BinaryBatchEncoder:
+    """Encodes id-keyed batch blocks (the JSON `tiers` blocks, or one block of
+    whole rows) into the binary message. One per connection."""
+
+    def __init__(self, tier_plans=None):
+        self.tier_plans = tier_plans
+        self._formats = {}
+
+    def formats(self, layout_id, tiered):
+        key = (layout_id, tiered)
+        fmts = self._formats.get(key)
+        if fmts is None:
+            if tiered:
+                fmts = [RowFormat(t.channel_ids) for t in self.tier_plans[layout_id].tiers]
+            else:
+                fmts = [RowFormat(LAYOUTS[layout_id])]
+            self._formats[key] = fmts
+        return fmts
+
+    def describe(self):
+        """Body of the `binary_format` message."""
+        out = {}
+        for layout_id in LAYOUTS:
+            entry = {"rows": self.formats(layout_id, False)[0].describe()}
+            if self.tier_plans:
+                entry["tiers"] = [f.describe() for f in self.formats(layout_id, True)]
+            out[str(layout_id)] = entry
+        return out
+
+    def encode(self, layout_id, schema_version, blocks, tiered):
+        """`blocks` are [{"t0": ms, "t": [ms offsets], "data": [rows]}, ...]."""
+        fmts = self.formats(layout_id, tiered)
+        base = min((b["t0"] for b in blocks if b["t"]), default=0)
+        out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, layout_id, schema_version,
+                                    base, len(blocks)))
+        strings = {}
+        for fmt, block in zip(fmts, blocks):
+            out += COUNT.pack(len(block["t"]))
+            shift = (block["t0"] or base) - base
+            pack = fmt.pack_into
+            for off, row in zip(block["t"], block["data"]):
+                pack(out, shift + off, row, strings)
+        out.append(len(strings))
+        for s in strings:
+            raw = s.encode("utf-8")[:255]
+            out.append(len(raw))
+            out += raw
+        return bytes(out)
+
+
+def decode(payload, formats):
+    """Reference decoder.
+
+    `formats` is the list of RowFormats for the message's blocks (from the
+    `binary_format` message). Returns (layout id, schema version, base ms,
+    [{"t0": base, "t": [offsets], "data": [rows]}, ...]).
+    """
+    magic, version, layout_id, schema_version, base, n_blocks = HEADER.unpack_from(payload, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a v{FORMAT_VERSION} telemetry batch")
+    if n_blocks != len(formats):
+        raise ValueError(f"{n_blocks} blocks but {len(formats)} row formats")
+
+    # The string table sits after the rows: walk the block sizes to find it.
+    pos = HEADER.size
+    spans = []
+    for fmt in formats:
+        (count,) = COUNT.unpack_from(payload, pos)
+        pos += COUNT.size
+        spans.append((fmt, pos, count))
+        pos += count * fmt.struct.size
+    strings = []
+    n_strings = payload[pos]
+    pos += 1
+    for _ in range(n_strings):
+        n = payload[pos]
+        strings.append(payload[pos + 1:pos + 1 + n].decode("utf-8"))
+        pos += 1 + n
+
+    blocks = []
+    for fmt, start, count in spans:
+        ts, rows = [], []
+        for k in range(count):
+            off, vals = fmt.unpack(payload, start + k * fmt.struct.size, strings)
+            ts.append(off)
+            rows.append(vals)
+        blocks.append({"t0": base, "t": ts, "data": rows})
+    return layout_id, schema_version, base, blocks
+
+
+def is_close(a, b):
+    """Equality up to the float32 rounding of the wire (for checks/benchmarks)."""
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-6)
+    return a == b
@@ -19,6 +19,11 @@ Unit conventions (the backend/viewer already assume these):
 them (it owns the session id from the WS URL).
 """
 
+try:
+    import numpy as np
+except ImportError:  # optional: only the batch path (normalize_batch) needs it
+    np = None
+
 # Fields the client must supply for the backend insert. The NOT NULL columns
 # come first; the rest are nullable enrichment. Defaults guarantee a complete
 # row even when a sim doesn't expose a given channel.
@@ -61,107 +66,237 @@ GAME_IDS = {
 }
 
 
-def _delta_to_best(current_ms, best_ms):
-    """Gap of the current lap time to the session best, in ms (0 if no best yet)."""
-    if best_ms and current_ms:
-        return int(current_ms - best_ms)
-    return 0
+# ---------------------------------------------------------------------------
+# Per-game mapping specs.
+#
+# Each spec is a prelude (statements that pull the reader's nested blocks into
+# locals) plus one source expression per contract field, optionally paired with
+# a unit transform (`(expr, PCT)`). They are compiled once, at import, into a
+# specialised function per game (see compile_normalizer) that builds the frame
+# as a single dict literal: every slot is written exactly once, fields a sim
+# doesn't expose are folded in as constants, and there is no per-frame DEFAULTS
+# copy, filter pass or GAME_IDS lookup. The same spec also compiles to a raw
+# numeric row reader (compile_row_reader) whose transforms are applied per
+# batch instead (normalize_batch).
+#
+# Locals available to the expressions: `raw`, `get` (= raw.get) and whatever
+# the prelude binds. `_EMPTY` is a shared read-only empty mapping.
+# ---------------------------------------------------------------------------
+
+# Unit transforms: (scalar template inlined by compile_normalizer, vectorised
+# form applied by normalize_batch). NaN plays None in the vectorised forms.
+PCT = "pct"                  # 0..1 pedal -> 0..100 percent
+GEAR_AC = "gear_ac"          # AC raw gear 0=R, 1=N, 2=1st -> -1/0/1
+INT = "int"
+BOOL = "bool"
+FLAG = "flag"                # sim int flag, 1 = set
+S_TO_MS = "s_to_ms"          # seconds (None = 0) -> integer ms
+MPS_TO_KMH = "mps_to_kmh"    # m/s (None = 0) -> km/h
+
+_TRANSFORMS = {
+    PCT: ("{} * 100.0", lambda c: c * 100.0),
+    GEAR_AC: ("int({}) - 1", lambda c: np.trunc(c) - 1),
+    INT: ("int({})", lambda c: np.trunc(c)),
+    BOOL: ("bool({})", lambda c: c),  # cast to bool after the default fill
+    FLAG: ("{} == 1", lambda c: (c == 1).astype(np.float64)),
+    S_TO_MS: ("int(({} or 0) * 1000)", lambda c: np.trunc(np.nan_to_num(c) * 1000)),
+    MPS_TO_KMH: ("({} or 0.0) * 3.6", lambda c: np.nan_to_num(c) * 3.6),
+}
 
+# AC, the ACC shared-memory reader and iRacing all emit the games/ac.py shape.
+_AC_SHAPE_PRELUDE = (
+    'tires = get("tires", ())',
+    'n_tires = len(tires)',
+    't0 = tires[0] if n_tires > 0 else _EMPTY',
+    't1 = tires[1] if n_tires > 1 else _EMPTY',
+    't2 = tires[2] if n_tires > 2 else _EMPTY',
+    't3 = tires[3] if n_tires > 3 else _EMPTY',
+    'brake_temps = get("brakes", _EMPTY).get("temps", ())',
+    'n_brakes = len(brake_temps)',
+    'lap = get("lap", _EMPTY)',
+    'drs = get("drs", _EMPTY)',
+)
 
-def _finalize(game_key, fields):
-    """Merge a reader's mapped fields onto the canonical defaults."""
-    frame = dict(DEFAULTS)
-    frame.update({k: v for k, v in fields.items() if v is not None or k not in REQUIRED_FIELDS})
-    frame["game"] = GAME_IDS.get(game_key, game_key)
-    if "delta_to_best_ms" not in fields:
-        frame["delta_to_best_ms"] = _delta_to_best(
-            frame["current_lap_time_ms"], frame["best_lap_time_ms"]
-        )
-    return frame
+_AC_SHAPE_FIELDS = {
+    "lap_number": 'lap.get("current", 0)',
+    "speed_kmh": 'get("speed_kmh", 0.0)',
+    "rpm": ('get("rpm", 0)', INT),
+    "gear": ('get("gear", 1)', GEAR_AC),  # AC: 0=R, 1=N, 2=1st -> -1/0/1
+    "throttle_input": ('get("throttle", 0.0)', PCT),
+    "brake_input": ('get("brake", 0.0)', PCT),
+    "clutch_input": ('get("clutch", 0.0)', PCT),
+    "steering_input": 'get("steering", 0.0)',
+    "current_lap_time_ms": 'lap.get("current_time_ms", 0)',
+    "best_lap_time_ms": 'lap.get("best_time_ms", 0)',
+    "last_lap_time_ms": 'lap.get("last_time_ms", 0)',
+    "is_valid_lap": ('get("is_valid_lap", True)', BOOL),
+    "tire_temp_fl": 't0.get("temp_core")', "tire_temp_fr": 't1.get("temp_core")',
+    "tire_temp_rl": 't2.get("temp_core")', "tire_temp_rr": 't3.get("temp_core")',
+    "tire_wear_fl": 't0.get("wear")', "tire_wear_fr": 't1.get("wear")',
+    "tire_wear_rl": 't2.get("wear")', "tire_wear_rr": 't3.get("wear")',
+    "tire_pressure_fl": 't0.get("pressure")', "tire_pressure_fr": 't1.get("pressure")',
+    "tire_pressure_rl": 't2.get("pressure")', "tire_pressure_rr": 't3.get("pressure")',
+    "brake_temp_fl": 'brake_temps[0] if n_brakes > 0 else None',
+    "brake_temp_fr": 'brake_temps[1] if n_brakes > 1 else None',
+    "brake_temp_rl": 'brake_temps[2] if n_brakes > 2 else None',
+    "brake_temp_rr": 'brake_temps[3] if n_brakes > 3 else None',
+    "fuel_remaining_liters": 'get("fuel")',
+    "drs_available": ('drs.get("available", 0)', BOOL),
+    "drs_enabled": ('drs.get("enabled", 0)', BOOL),
+}
 
+_LMU_PRELUDE = (
+    'inp = get("input_raw", _EMPTY)',
+    'tires = get("tires", ())',
+    'n_tires = len(tires)',
+    't0 = tires[0] if n_tires > 0 else _EMPTY',
+    't1 = tires[1] if n_tires > 1 else _EMPTY',
+    't2 = tires[2] if n_tires > 2 else _EMPTY',
+    't3 = tires[3] if n_tires > 3 else _EMPTY',
+    'lap = get("lap", _EMPTY)',
+)
 
-def _map_ac_shape(raw):
-    """Map an AC/ACC shared-memory frame (games/ac.py shape) to contract fields.
+_LMU_FIELDS = {
+    "lap_number": 'lap.get("number", 0)',
+    "speed_kmh": 'get("speed_kmh", 0.0)',
+    "rpm": ('get("rpm", 0)', INT),
+    "gear": ('get("gear", 0)', INT),  # rF2: -1=R, 0=N, 1=1st (already canonical)
+    "throttle_input": ('inp.get("throttle", 0.0)', PCT),
+    "brake_input": ('inp.get("brake", 0.0)', PCT),
+    "clutch_input": ('inp.get("clutch", 0.0)', PCT),
+    "steering_input": 'inp.get("steering", 0.0)',
+    # LMU lap times are doubles in seconds; the contract is integer ms.
+    "current_lap_time_ms": ('lap.get("current_time")', S_TO_MS),
+    "best_lap_time_ms": ('lap.get("best_time")', S_TO_MS),
+    "last_lap_time_ms": ('lap.get("last_time")', S_TO_MS),
+    "tire_temp_fl": 't0.get("temp_middle")', "tire_temp_fr": 't1.get("temp_middle")',
+    "tire_temp_rl": 't2.get("temp_middle")', "tire_temp_rr": 't3.get("temp_middle")',
+    "tire_wear_fl": 't0.get("wear")', "tire_wear_fr": 't1.get("wear")',
+    "tire_wear_rl": 't2.get("wear")', "tire_wear_rr": 't3.get("wear")',
+    "tire_pressure_fl": 't0.get("pressure")', "tire_pressure_fr": 't1.get("pressure")',
+    "tire_pressure_rl": 't2.get("pressure")', "tire_pressure_rr": 't3.get("pressure")',
+    "brake_temp_fl": 't0.get("brake_temp")', "brake_temp_fr": 't1.get("brake_temp")',
+    "brake_temp_rl": 't2.get("brake_temp")', "brake_temp_rr": 't3.get("brake_temp")',
+    "fuel_remaining_liters": 'get("fuel")',
+}
 
-    Shared by AC and the ACC shared-memory reader, which emit the same shape.
-    """
-    tires = raw.get("tires", [])
-    brake_temps = raw.get("brakes", {}).get("temps", [])
-    lap = raw.get("lap", {})
-    drs = raw.get("drs", {})
-
-    def tyre(i, key):
-        return tires[i].get(key) if i < len(tires) else None
-
-    return {
-        "lap_number": lap.get("current", 0),
-        "speed_kmh": raw.get("speed_kmh", 0.0),
-        "rpm": int(raw.get("rpm", 0)),
-        "gear": int(raw.get("gear", 1)) - 1,  # AC: 0=R, 1=N, 2=1st -> -1/0/1
-        "throttle_input": raw.get("throttle", 0.0) * 100.0,
-        "brake_input": raw.get("brake", 0.0) * 100.0,
-        "clutch_input": raw.get("clutch", 0.0) * 100.0,
-        "steering_input": raw.get("steering", 0.0),
-        "current_lap_time_ms": lap.get("current_time_ms", 0),
-        "best_lap_time_ms": lap.get("best_time_ms", 0),
-        "last_lap_time_ms": lap.get("last_time_ms", 0),
-        "is_valid_lap": bool(raw.get("is_valid_lap", True)),
-        "tire_temp_fl": tyre(0, "temp_core"), "tire_temp_fr": tyre(1, "temp_core"),
-        "tire_temp_rl": tyre(2, "temp_core"), "tire_temp_rr": tyre(3, "temp_core"),
-        "tire_wear_fl": tyre(0, "wear"), "tire_wear_fr": tyre(1, "wear"),
-        "tire_wear_rl": tyre(2, "wear"), "tire_wear_rr": tyre(3, "wear"),
-        "tire_pressure_fl": tyre(0, "pressure"), "tire_pressure_fr": tyre(1, "pressure"),
-        "tire_pressure_rl": tyre(2, "pressure"), "tire_pressure_rr": tyre(3, "pressure"),
-        "brake_temp_fl": brake_temps[0] if len(brake_temps) > 0 else None,
-        "brake_temp_fr": brake_temps[1] if len(brake_temps) > 1 else None,
-        "brake_temp_rl": brake_temps[2] if len(brake_temps) > 2 else None,
-        "brake_temp_rr": brake_temps[3] if len(brake_temps) > 3 else None,
-        "fuel_remaining_liters": raw.get("fuel"),
-        "drs_available": bool(drs.get("available", 0)),
-        "drs_enabled": bool(drs.get("enabled", 0)),
-    }
-
-
-def normalize_ac(raw):
-    """Map Assetto Corsa shared-memory output (games/ac.py) onto the contract."""
-    return _finalize("ac", _map_ac_shape(raw))
-
-
-def normalize_lmu(raw):
-    """Map Le Mans Ultimate shared-memory output (games/lmu.py) onto the contract."""
-    inp = raw.get("input_raw", {})
-    tires = raw.get("tires", [])
-    lap = raw.get("lap", {})
-
-    def tyre(i, key):
-        return tires[i].get(key) if i < len(tires) else None
+# Legacy ACC UDP broadcasting feed (games/acc.py): timing/leaderboard only.
+_ACC_UDP_FIELDS = {
+    "lap_number": 'get("lap_count", 0)',
+    "speed_kmh": 'get("speed_kmh", 0.0)',
+    "rpm": ('get("rpm", 0)', INT),
+    "gear": ('get("gear", 0)', INT),  # acc.py already applied the -1 offset
+    "current_lap_time_ms": 'get("current_lap_time_ms", 0)',
+    "best_lap_time_ms": 'get("best_lap_time_ms", 0)',
+    "last_lap_time_ms": 'get("last_lap_time_ms", 0)',
+}
 
-    # LMU lap times are doubles in seconds; the contract is integer ms.
-    def to_ms(seconds):
-        return int((seconds or 0) * 1000)
-
-    return _finalize("lmu", {
-        "lap_number": lap.get("number", 0),
-        "speed_kmh": raw.get("speed_kmh", 0.0),
-        "rpm": int(raw.get("rpm", 0)),
-        "gear": int(raw.get("gear", 0)),  # rF2: -1=R, 0=N, 1=1st (already canonical)
-        "throttle_input": inp.get("throttle", 0.0) * 100.0,
-        "brake_input": inp.get("brake", 0.0) * 100.0,
-        "clutch_input": inp.get("clutch", 0.0) * 100.0,
-        "steering_input": inp.get("steering", 0.0),
-        "current_lap_time_ms": to_ms(lap.get("current_time")),
-        "best_lap_time_ms": to_ms(lap.get("best_time")),
-        "last_lap_time_ms": to_ms(lap.get("last_time")),
-        "tire_temp_fl": tyre(0, "temp_middle"), "tire_temp_fr": tyre(1, "temp_middle"),
-        "tire_temp_rl": tyre(2, "temp_middle"), "tire_temp_rr": tyre(3, "temp_middle"),
-        "tire_wear_fl": tyre(0, "wear"), "tire_wear_fr": tyre(1, "wear"),
-        "tire_wear_rl": tyre(2, "wear"), "tire_wear_rr": tyre(3, "wear"),
-        "tire_pressure_fl": tyre(0, "pressure"), "tire_pressure_fr": tyre(1, "pressure"),
-        "tire_pressure_rl": tyre(2, "pressure"), "tire_pressure_rr": tyre(3, "pressure"),
-        "brake_temp_fl": tyre(0, "brake_temp"), "brake_temp_fr": tyre(1, "brake_temp"),
-        "brake_temp_rl": tyre(2, "brake_temp"), "brake_temp_rr": tyre(3, "brake_temp"),
-        "fuel_remaining_liters": raw.get("fuel"),
-    })
+_EMPTY = {}
+
+# Generated source per compiled normalizer, kept for debugging/inspection.
+GENERATED_SOURCE = {}
+
+
+def _split(spec):
+    """A field spec is either a bare expression or an (expression, transform) pair."""
+    return spec if isinstance(spec, tuple) else (spec, None)
+
+
+def compile_normalizer(name, game_key, prelude, fields, args=("raw",), ext="get('ext')",
+                       nullable=True, schema=None):
+    """Generate and compile a specialised normalizer for one reader shape.
+
+    By default the function takes a reader's raw dict. Readers with a fused
+    fast path (read_canonical) pass their own `args` (e.g. the ctypes structs)
+    and field expressions over those, so the frame is filled straight from the
+    struct fields without building the nested raw dict first.
+
+    Required (NOT NULL) fields fall back to their default when an untransformed
+    expression yields None (skipped with nullable=False, for struct fields that
+    can't be None); nullable fields pass None through. delta_to_best_ms is derived from
+    the current/best lap times unless the spec maps it explicitly. `ext` is the
+    expression for the rich-channel blob carried through for server-side JSON
+    storage (None = the shape has none).
+
+    With a `schema` (capture/frame.py) the function returns a compact Frame
+    record in that schema's slot order instead of a dict; the ext dict is
+    unpacked into the schema's ext slots.
+    """
+    unknown = set(fields) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"{name}: not contract fields: {sorted(unknown)}")
+    if schema is not None and bool(ext) != bool(schema.ext_channels):
+        raise ValueError(f"{name}: ext expression and schema {schema.id} ext channels disagree")
+
+    def value(key):
+        if key not in fields:
+            return repr(DEFAULTS[key])
+        expr, transform = _split(fields[key])
+        if transform:
+            return f"({_TRANSFORMS[transform][0].format(expr)})"
+        if key in REQUIRED_FIELDS and nullable:
+            return f"(_v if (_v := {expr}) is not None else {DEFAULTS[key]!r})"
+        return f"({expr})"
+
+    lines = [f"def {name}({', '.join(args)}):"]
+    if "raw" in args:
+        lines.append("    get = raw.get")
+    lines += [f"    {stmt}" for stmt in prelude]
+    derive_delta = "delta_to_best_ms" not in fields
+    if derive_delta:
+        lines.append(f"    cur_ms = {value('current_lap_time_ms')}")
+        lines.append(f"    best_ms = {value('best_lap_time_ms')}")
+    if schema is not None and ext:
+        lines.append(f"    ext = {ext}")
+    lines.append("    frame = {" if schema is None else "    return _new(_Frame, (")
+    for key in DEFAULTS:
+        if derive_delta and key == "current_lap_time_ms":
+            expr = "cur_ms"
+        elif derive_delta and key == "best_lap_time_ms":
+            expr = "best_ms"
+        elif derive_delta and key == "delta_to_best_ms":
+            expr = "int(cur_ms - best_ms) if best_ms and cur_ms else 0"
+        else:
+            expr = value(key)
+        lines.append(f"        {key!r}: {expr}," if schema is None else f"        {expr},")
+    game = GAME_IDS.get(game_key, game_key)
+    if schema is not None:
+        lines.append(f"        {game!r},")
+        if ext:
+            lines.append("        *map(ext.get, _EXT_CHANNELS),")
+        lines.append("    ))")
+    else:
+        lines.append(f"        'game': {game!r},")
+        lines.append("    }")
+        if ext:
+            lines += [
+                f"    ext = {ext}",
+                "    if ext:",
+                "        frame['ext'] = ext",
+            ]
+        lines.append("    return frame")
+    source = "\n".join(lines) + "\n"
+    namespace = {"_EMPTY": _EMPTY}
+    if schema is not None:
+        namespace.update(_new=tuple.__new__, _Frame=schema.frame_type,
+                         _EXT_CHANNELS=schema.ext_channels)
+    exec(compile(source, f"<canonical:{name}>", "exec"), namespace)
+    GENERATED_SOURCE[name] = source
+    return namespace[name]
+
+
+normalize_ac = compile_normalizer("normalize_ac", "ac", _AC_SHAPE_PRELUDE, _AC_SHAPE_FIELDS)
+normalize_ac.__doc__ = "Map Assetto Corsa shared-memory output (games/ac.py) onto the contract."
+
+normalize_lmu = compile_normalizer("normalize_lmu", "lmu", _LMU_PRELUDE, _LMU_FIELDS)
+normalize_lmu.__doc__ = "Map Le Mans Ultimate shared-memory output (games/lmu.py) onto the contract."
+
+_normalize_acc_shm = compile_normalizer("_normalize_acc_shm", "acc", _AC_SHAPE_PRELUDE, _AC_SHAPE_FIELDS)
+_normalize_acc_udp = compile_normalizer("_normalize_acc_udp", "acc", (), _ACC_UDP_FIELDS)
+
+normalize_iracing = compile_normalizer("normalize_iracing", "iracing", _AC_SHAPE_PRELUDE, _AC_SHAPE_FIELDS)
+normalize_iracing.__doc__ = """iRacing's SDK reader emits the same shape as AC/ACC (full inputs, tyres,
+    lap block and an `ext` blob), so it goes through the shared AC mapping."""
 
 
 def normalize_acc(raw):
@@ -173,23 +308,8 @@ def normalize_acc(raw):
     — no inputs or tyre data — so those fields stay at their defaults.
     """
     if "throttle" in raw or "tires" in raw:
-        return _finalize("acc", _map_ac_shape(raw))
-
-    return _finalize("acc", {
-        "lap_number": raw.get("lap_count", 0),
-        "speed_kmh": raw.get("speed_kmh", 0.0),
-        "rpm": int(raw.get("rpm", 0)),
-        "gear": int(raw.get("gear", 0)),  # ac.py already applied the -1 offset
-        "current_lap_time_ms": raw.get("current_lap_time_ms", 0),
-        "best_lap_time_ms": raw.get("best_lap_time_ms", 0),
-        "last_lap_time_ms": raw.get("last_lap_time_ms", 0),
-    })
-
-
-def normalize_iracing(raw):
-    """iRacing's SDK reader emits the same shape as AC/ACC (full inputs, tyres,
-    lap block and an `ext` blob), so it goes through the shared AC mapping."""
-    return _finalize("iracing", _map_ac_shape(raw))
+        return _normalize_acc_shm(raw)
+    return _normalize_acc_udp(raw)
 
 
 _NORMALIZERS = {
@@ -203,16 +323,121 @@ _NORMALIZERS = {
 def normalize(game_key, raw):
     """Map a reader's raw frame onto the canonical contract.
 
-    game_key is the active-game key used in main.py ('ac' | 'acc' | 'lmu').
-    Returns None if the game is unknown or there's nothing to send.
+    game_key is the active-game key used in main.py ('ac' | 'acc' | 'lmu' | 'iracing').
+    Returns None if the game is unknown or there's nothing to send. The rich-
+    channel blob (ACC `ext`) is carried through for server-side JSON storage.
     """
     if not raw:
         return None
     fn = _NORMALIZERS.get(game_key)
     if fn is None:
         return None
-    frame = fn(raw)
-    # Carry the rich-channel blob (ACC `ext`) through for server-side JSON storage.
-    if frame is not None and isinstance(raw, dict) and raw.get('ext'):
-        frame['ext'] = raw['ext']
-    return frame
+    return fn(raw)
+
+
+# ---------------------------------------------------------------------------
+# Batch path.
+#
+# A reader's row function (compile_row_reader) returns the mapped fields as a
+# flat tuple of raw numbers in sim units — no unit conversion, no defaults, no
+# dict. The capture thread only appends those; normalize_batch() then maps a
+# whole batch onto the contract in a handful of NumPy operations and returns
+# one array per canonical column.
+# ---------------------------------------------------------------------------
+
+# Column dtype follows the contract default: bool, int (int64) or float (float64,
+# NaN = null).
+_DTYPES = {
+    key: bool if isinstance(v, bool) else "int64" if isinstance(v, int) else "float64"
+    for key, v in DEFAULTS.items()
+}
+
+
+class _RowLayout:
+    """Column order and transforms of one game's raw rows."""
+
+    def __init__(self, fields):
+        self.columns = tuple(key for key in DEFAULTS if key in fields)
+        self.transforms = tuple(_split(fields[key])[1] for key in self.columns)
+        self.derive_delta = "delta_to_best_ms" not in fields
+        self._plan = None
+
+    def plan(self):
+        """Per-transform row indices + the default-fill vector (built on first use)."""
+        if self._plan is None:
+            by_transform = {}
+            for i, t in enumerate(self.transforms):
+                if t:
+                    by_transform.setdefault(t, []).append(i)
+            fill = np.array(
+                [np.nan if DEFAULTS[k] is None else float(DEFAULTS[k]) for k in self.columns]
+            )[:, None]
+            self._plan = ([(t, np.array(idx)) for t, idx in by_transform.items()], fill)
+        return self._plan
+
+
+_ROW_LAYOUTS = {}
+
+
+def compile_row_reader(name, game_key, prelude, fields, args=("raw",)):
+    """Compile a spec into a raw-row function and register its batch layout.
+
+    The function returns the source expressions of the mapped fields (DEFAULTS
+    order) as a tuple; normalize_batch(game_key, rows) applies the spec's
+    transforms and defaults per batch.
+    """
+    layout = _RowLayout(fields)
+    lines = [f"def {name}({', '.join(args)}):"]
+    if "raw" in args:
+        lines.append("    get = raw.get")
+    lines += [f"    {stmt}" for stmt in prelude]
+    lines.append("    return (")
+    lines += [f"        {_split(fields[key])[0]}," for key in layout.columns]
+    lines.append("    )")
+    source = "\n".join(lines) + "\n"
+    namespace = {"_EMPTY": _EMPTY}
+    exec(compile(source, f"<canonical:{name}>", "exec"), namespace)
+    GENERATED_SOURCE[name] = source
+    _ROW_LAYOUTS[game_key] = layout
+    return namespace[name]
+
+
+def normalize_batch(game_key, raws):
+    """Map a batch of raw rows (a reader's read_row()) onto the contract, column-wise.
+
+    Returns {field: ndarray} for every canonical field (DEFAULTS order) plus the
+    constant 'game' id, or None if the game has no registered row layout or the
+    batch is empty. Float columns carry NaN for null.
+    """
+    if np is None:
+        raise RuntimeError("normalize_batch needs numpy (pip install numpy)")
+    layout = _ROW_LAYOUTS.get(game_key)
+    if layout is None or not len(raws):
+        return None
+    # (columns, frames), C-contiguous so every column slice is a contiguous array.
+    cols = np.ascontiguousarray(np.asarray(raws, dtype=np.float64).T)
+    if cols.shape[0] != len(layout.columns):
+        raise ValueError(f"{game_key}: rows have {cols.shape[0]} values, "
+                         f"layout has {len(layout.columns)}")
+    by_transform, fill = layout.plan()
+    for transform, idx in by_transform:
+        cols[idx] = _TRANSFORMS[transform][1](cols[idx])
+    cols = np.where(np.isnan(cols), fill, cols)
+
+    n = cols.shape[1]
+    index = {key: i for i, key in enumerate(layout.columns)}
+    out = {}
+    for key, default in DEFAULTS.items():
+        i = index.get(key)
+        dtype = _DTYPES[key]
+        if i is None:
+            out[key] = np.full(n, np.nan if default is None else default, dtype=dtype)
+        elif dtype is bool:
+            out[key] = cols[i] != 0
+        else:
+            out[key] = cols[i].astype(dtype, copy=False)
+    if layout.derive_delta:
+        cur, best = out["current_lap_time_ms"], out["best_lap_time_ms"]
+        out["delta_to_best_ms"] = np.where((cur != 0) & (best != 0), cur - best, 0)
+    out["game"] = GAME_IDS.get(game_key, game_key)
+    return out
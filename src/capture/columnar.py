@@ -0,0 +1,93 @@
+"""
+Columnar JSON batch layout (`telemetry_batch_columnar`).
+
+For consumers that stay on JSON: instead of one object (or row) per frame, a
+batch carries one array per channel on a shared timestamp base, and any
+channel that holds a single value for the whole batch — `game`, the session's
+car/track, and in practice most settings/weather/ext channels over 50 ms — is
+hoisted into the header once:
+
+    {"type": "telemetry_batch_columnar", "schema": N, "layout": L,
+     "header": {"game": "acc", "track": "spa", "car": "...", <constants>},
+     "blocks": [{"hz": 120, "t0": <epoch ms>, "t": [ms offsets],
+                 "columns": {"speed_kmh": [...], "ext.g_lat": [...], ...}}]}
+
+Columns are keyed by registry channel name (capture.schema), so a consumer
+needs no id table. Without sample-rate tiers there is one block; with tiers,
+one per tier (each on its own timebase). decode() rebuilds per-frame rows.
+"""
+
+from capture.schema import BY_ID, LAYOUTS
+
+
+class ColumnarEncoder:
+    """Builds columnar batches for one connection."""
+
+    def __init__(self, tier_plans=None):
+        self.tier_plans = tier_plans
+        self._names = {}
+
+    def _block_names(self, layout_id, tiered):
+        key = (layout_id, tiered)
+        names = self._names.get(key)
+        if names is None:
+            if tiered:
+                names = [(t.hz, [BY_ID[cid].name for cid in t.channel_ids])
+                         for t in self.tier_plans[layout_id].tiers]
+            else:
+                names = [(None, [BY_ID[cid].name for cid in LAYOUTS[layout_id]])]
+            self._names[key] = names
+        return names
+
+    def encode(self, layout_id, schema_version, blocks, tiered, meta=None):
+        """`blocks` are [{"t0": ms, "t": [ms offsets], "data": [rows]}, ...];
+        `meta` (e.g. track/car) goes straight into the header."""
+        header = dict(meta or ())
+        out = []
+        for (hz, names), block in zip(self._block_names(layout_id, tiered), blocks):
+            columns = {}
+            n = len(block["t"])
+            if n:
+                for name, col in zip(names, zip(*block["data"])):
+                    first = col[0]
+                    if n == 1 or col.count(first) == n:
+                        header[name] = first
+                    else:
+                        columns[name] = col
+            entry = {"t0": block["t0"], "t": block["t"], "columns": columns}
+            if hz is not None:
+                entry["hz"] = hz
+            out.append(entry)
+        return {
+            "type": "telemetry_batch_columnar",
+            "schema": schema_version,
+            "layout": layout_id,
+            "header": header,
+            "blocks": out,
+        }
+
+
+def decode(message, tier_plans=None):
+    """Reference decoder: per block, [(epoch ms, {channel name: value}), ...].
+
+    A hoisted constant is filled into every row of the block that carries
+    that channel (the layout/tier plan says which); `meta` keys such as
+    track/car stay in the message header.
+    """
+    layout_id = message["layout"]
+    header = message["header"]
+    blocks = message["blocks"]
+    if len(blocks) > 1 or "hz" in blocks[0]:
+        name_sets = [[BY_ID[cid].name for cid in t.channel_ids]
+                     for t in tier_plans[layout_id].tiers]
+    else:
+        name_sets = [[BY_ID[cid].name for cid in LAYOUTS[layout_id]]]
+    decoded = []
+    for names, block in zip(name_sets, blocks):
+        cols = block["columns"]
+        rows = []
+        for k, off in enumerate(block["t"]):
+            rows.append((block["t0"] + off,
+                         {name: cols[name][k] if name in cols else header[name] for name in names}))
+        decoded.append(rows)
+    return decoded
@@ -0,0 +1,106 @@
+"""
+Keyframe + delta encoding for the rich `ext` channels.
+
+Most of ACC's ~80 ext channels don't move between consecutive samples (setup
+and aids, compound, pit window, weather, session constants), yet every row
+repeated all of them. Once negotiated, the ext part of an id-keyed row is sent
+as either:
+
+  - a keyframe: the full list of ext values (a JSON array), or
+  - a delta: only the values that changed since the previous row of the same
+    stream, as {"<position in the ext part>": value} (a JSON object).
+
+A row is `[core values..., ext]`, so the decoder tells the two apart by type.
+A stream is one row sequence with a fixed layout (a layout, or one tier of a
+layout); each has its own encoder/decoder state. Rows within a stream arrive
+in order (one WebSocket), so decoding is deterministic: apply each delta to
+the previous row's values.
+
+Keyframes are sent on the first row of a stream, every `keyframe_every` rows
+after that, and after any resync: on (re)connect both ends start empty, and
+the server can ask for one with {"type": "resync"}. A delta arriving with no
+keyframe for its stream is an error, never a guess.
+"""
+
+KEYFRAME_SECONDS = 2  # keyframe at least this often per stream (at its rate)
+
+
+class ExtDeltaEncoder:
+    """Encoder state for one stream."""
+
+    __slots__ = ("keyframe_every", "_prev", "_since")
+
+    def __init__(self, keyframe_every):
+        self.keyframe_every = max(1, int(keyframe_every))
+        self._prev = None
+        self._since = 0
+
+    def encode(self, values):
+        prev = self._prev
+        self._prev = values
+        if prev is None or self._since >= self.keyframe_every:
+            self._since = 1
+            return list(values)
+        self._since += 1
+        return {str(i): v for i, (v, p) in enumerate(zip(values, prev)) if v != p}
+
+
+class ExtDeltaDecoder:
+    """Decoder state for one stream (reference implementation for the backend)."""
+
+    __slots__ = ("_prev",)
+
+    def __init__(self):
+        self._prev = None
+
+    def decode(self, enc):
+        if isinstance(enc, list):
+            self._prev = enc
+            return list(enc)
+        if self._prev is None:
+            raise ValueError("ext delta before any keyframe on this stream")
+        values = list(self._prev)
+        for i, v in enc.items():
+            values[int(i)] = v
+        self._prev = values
+        return list(values)
+
+
+class ExtDeltaStreams:
+    """Encoders for every stream of a connection; reset() forces keyframes."""
+
+    def __init__(self):
+        self._streams = {}
+
+    def reset(self):
+        self._streams.clear()
+
+    def rows(self, key, rows, split, hz=None):
+        """Rows with their ext part (values from `split` on) delta-encoded.
+
+        `key` names the stream; `hz` is its row rate (sets the keyframe
+        interval; None = treat as 120 Hz).
+        """
+        if not rows or split >= len(rows[0]):
+            return rows
+        enc = self._streams.get(key)
+        if enc is None:
+            enc = self._streams[key] = ExtDeltaEncoder((hz or 120) * KEYFRAME_SECONDS)
+        encode = enc.encode
+        return [list(row[:split]) + [encode(row[split:])] for row in rows]
+
+
+class ExtDeltaStreamsDecoder:
+    """Inverse of ExtDeltaStreams: full rows back from keyframe/delta rows."""
+
+    def __init__(self):
+        self._streams = {}
+
+    def reset(self):
+        self._streams.clear()
+
+    def rows(self, key, rows, split):
+        if not rows or split >= len(rows[0]):
+            return rows
+        dec = self._streams.setdefault(key, ExtDeltaDecoder())
+        return [list(row[:split]) + dec.decode(row[split]) for row in rows]
@@ -0,0 +1,125 @@
+"""
+Compact fixed-layout frame records.
+
+A canonical frame used to be a dict of 38 contract keys (plus, for ACC, a
+~80-key `ext` dict). With a couple of thousand frames sitting in the send
+buffer that is mostly dict overhead: a hash table and a key pointer per value,
+per frame. A Frame is instead a tuple subclass whose layout is fixed by a
+schema: slot i always holds channel `schema.channels[i]`, so the names live
+once on the class rather than once per frame.
+
+Schema ids:
+  1  core contract only (AC, LMU, legacy ACC UDP)
+  2  core + ACC shared-memory rich channels
+  3  core + iRacing rich channels
+
+Records read like the old dicts where the pipeline needs it (`frame['rpm']`,
+`frame.get('gear')`, `frame.ext`), and `to_dict()` rebuilds the exact wire
+dict the backend has always received.
+"""
+
+from collections import namedtuple
+
+from capture.canonical import DEFAULTS
+
+# Contract columns in wire order, then the friendly game id.
+CORE_CHANNELS = tuple(DEFAULTS) + ("game",)
+
+WHEELS = ("fl", "fr", "rl", "rr")
+
+# Rich channels per reader, in the order the readers emit them (see the
+# readers' _ext()). A name missing here is simply not carried.
+ACC_EXT_CHANNELS = ("pos_x", "pos_y", "pos_z") + tuple(
+    f"{name}_{w}"
+    for w in WHEELS
+    for name in (
+        "slip_ratio", "slip_angle", "tyre_force_fx", "tyre_force_fy", "tyre_force_mz",
+        "brake_pressure", "pad_life", "disc_life", "suspension_damage",
+        "suspension_travel", "wheel_slip",
+    )
+) + (
+    "water_temp", "current_max_rpm", "tc_active", "abs_active", "air_temp", "road_temp",
+    "g_lat", "g_lon", "g_vert", "turbo_boost", "normalized_position", "surface_grip",
+    "wind_speed", "wind_direction", "predictive_delta_ms", "is_valid_lap", "fuel_per_lap",
+    "track_grip_status", "rain_intensity", "current_sector", "brake_bias", "tc_setting",
+    "tc_cut", "abs_setting", "engine_map", "tyre_compound", "fuel_est_laps",
+    "session_time_left_ms", "pit_window_start", "pit_window_end", "rain_10min", "rain_30min",
+)
+
+IRACING_EXT_CHANNELS = (
+    "normalized_position", "gps_lon", "gps_lat", "alt", "accel_lat", "accel_lon",
+    "track_temp", "fuel_remaining_liters", "session_time",
+)
+
+
+class FrameSchema:
+    """Slot layout of one frame type: core contract channels + a reader's ext channels."""
+
+    def __init__(self, schema_id, name, ext_channels=()):
+        self.id = schema_id
+        self.name = name
+        self.ext_channels = tuple(ext_channels)
+        self.channels = CORE_CHANNELS + self.ext_channels
+        self.index = {ch: i for i, ch in enumerate(CORE_CHANNELS)}
+        self.ext_start = len(CORE_CHANNELS)
+        self.frame_type = _frame_type(self)
+
+
+def _frame_type(schema):
+    # Ext channel names can repeat core names (ACC's is_valid_lap), so the
+    # tuple base gets positional field names and the channel names resolve
+    # through schema.index.
+    base = namedtuple(f"_Frame{schema.id}", [f"s{i}" for i in range(len(schema.channels))])
+
+    class Frame(base):
+        __slots__ = ()
+
+        def __getitem__(self, key):
+            if key.__class__ is str:
+                return tuple.__getitem__(self, schema.index[key])
+            return tuple.__getitem__(self, key)
+
+        def get(self, key, default=None):
+            i = schema.index.get(key)
+            return default if i is None else tuple.__getitem__(self, i)
+
+        @property
+        def ext(self):
+            """The rich channels as a dict (None for a core-only schema)."""
+            if not schema.ext_channels:
+                return None
+            return dict(zip(schema.ext_channels, self[schema.ext_start:]))
+
+        def to_dict(self):
+            """The wire dict — same shape normalize() has always produced."""
+            frame = dict(zip(CORE_CHANNELS, self))
+            if schema.ext_channels:
+                frame["ext"] = dict(zip(schema.ext_channels, self[schema.ext_start:]))
+            return frame
+
+        def __repr__(self):
+            return f"Frame(schema={schema.id}, game={self.get('game')!r})"
+
+    Frame.schema = schema
+    Frame.__qualname__ = Frame.__name__ = f"Frame{schema.id}"
+    return Frame
+
+
+SCHEMAS = {
+    s.id: s for s in (
+        FrameSchema(1, "core"),
+        FrameSchema(2, "acc", ACC_EXT_CHANNELS),
+        FrameSchema(3, "iracing", IRACING_EXT_CHANNELS),
+    )
+}
+CORE_SCHEMA, ACC_SCHEMA, IRACING_SCHEMA = SCHEMAS[1], SCHEMAS[2], SCHEMAS[3]
+
+
+def is_frame(obj):
+    """True for a compact record (as opposed to a plain frame dict)."""
+    return getattr(obj, "schema", None).__class__ is FrameSchema
+
+
+def as_dict(frame):
+    """Wire dict for either representation (the raw-dict normalize path still yields dicts)."""
+    return frame.to_dict() if is_frame(frame) else frame
@@ -0,0 +1,461 @@
+"""
+Gorilla-style time-series codec for telemetry batches and local recordings.
+
+Most channels are slowly varying floats sampled on an almost perfectly regular
+clock, which neither JSON nor the fixed-width binary rows (capture.binary)
+exploit. This codec stores each block column by column:
+
+  timestamps  zigzag varints: first offset, first delta, then delta-of-deltas
+              (0 for a steady clock, so one byte per row)
+  float       quantised to the channel's declared precision where the game's
+              reader already rounds to it (schema.QUANTISED; mantissa bits
+              below half a unit are rounded away), then XOR-with-previous
+              bit packing as in Facebook's Gorilla: 1 bit for a repeat, else
+              the meaningful XOR bits inside the previous leading/trailing
+              zero window or a new one (5-bit leading, 6-bit length); the
+              first value is XORed with 0.0
+  int         zigzag varints: first value, first delta, then delta-of-deltas
+  bool        one bit each
+  str         varint index into the message's string table
+
+Every column starts with a null flag (0 = none, 1 = all None, 2 = bitmap of
+present values follows); only present values are coded. Floats that are not
+quantised are kept exactly; quantised ones decode within half a unit of the
+precision, which is what the reader had already rounded them to.
+
+Wire message (binary WebSocket frame, once the ack lists "gorilla"):
+
+    header   <2sBBHqBB  magic b"MG", format version, layout id, schema
+                        version, base timestamp (epoch ms), block count,
+                        flags (1 = tiered)
+    strings  varint count, then (varint length + utf-8) each
+    block    varint rows, varint t0 - base, timestamps, one column per
+             channel (layout order, or the tier's channels)
+
+Blocks are the same as in the JSON/binary batches: one of whole rows, or one
+per tier in tier_plan order. A decoder needs only what the server already
+received: the schema announcement and the tier_plan (Catalog).
+
+A recording (RecordingWriter / read_recording) is a file header carrying both
+of those messages followed by length-prefixed batch messages, so it decodes
+without the client's registry.
+"""
+
+import json
+import math
+import os
+import struct
+
+from capture.schema import QUANTISED, announcement
+
+MAGIC = b"MG"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<2sBBHqBB")
+TIERED = 1
+
+NO_NULLS, ALL_NULL, BITMAP = 0, 1, 2
+
+RECORDING_MAGIC = b"MGRC"
+
+_LOG2_10 = math.log2(10)
+
+
+def quantise(value, precision):
+    """`value` with the mantissa bits below half a unit of `precision` decimal
+    places rounded away (the XOR of two nearby values then has long zero runs)."""
+    m, e = math.frexp(value)
+    keep = math.ceil(e + precision * _LOG2_10)
+    if keep >= 53 or not math.isfinite(value):
+        return value
+    return math.ldexp(round(math.ldexp(m, keep)), e - keep)
+
+
+# --- byte / bit primitives ---------------------------------------------------
+
+def _put_varint(out, u):
+    while u >= 0x80:
+        out.append(u & 0x7F | 0x80)
+        u >>= 7
+    out.append(u)
+
+
+def _get_varint(buf, pos):
+    u = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        u |= (b & 0x7F) << shift
+        if b < 0x80:
+            return u, pos
+        shift += 7
+
+
+def _zig(v):
+    return v << 1 if v >= 0 else (-v << 1) - 1
+
+
+def _unzig(u):
+    return u >> 1 if not u & 1 else -((u + 1) >> 1)
+
+
+def _put_dod(out, values):
+    """First value, first delta, then delta-of-deltas, as zigzag varints."""
+    prev = prev_d = 0
+    for n, v in enumerate(values):
+        if n == 0:
+            _put_varint(out, _zig(v))
+        else:
+            d = v - prev
+            _put_varint(out, _zig(d if n == 1 else d - prev_d))
+            prev_d = d
+        prev = v
+
+
+def _get_dod(buf, pos, count):
+    vals = []
+    prev = prev_d = 0
+    for n in range(count):
+        u, pos = _get_varint(buf, pos)
+        dd = _unzig(u)
+        if n == 0:
+            v = dd
+        else:
+            prev_d = dd if n == 1 else prev_d + dd
+            v = prev + prev_d
+        vals.append(v)
+        prev = v
+    return vals, pos
+
+
+class _BitWriter:
+    __slots__ = ("acc", "n")
+
+    def __init__(self):
+        self.acc = 0
+        self.n = 0
+
+    def write(self, value, nbits):
+        self.acc = (self.acc << nbits) | value
+        self.n += nbits
+
+    def flush(self, out):
+        """Append the bits, zero-padded to a whole byte, length-prefixed."""
+        pad = -self.n % 8
+        size = (self.n + pad) // 8
+        _put_varint(out, size)
+        out += (self.acc << pad).to_bytes(size, "big")
+
+
+class _BitReader:
+    __slots__ = ("value", "left", "end")
+
+    def __init__(self, buf, pos):
+        size, pos = _get_varint(buf, pos)
+        self.value = int.from_bytes(buf[pos:pos + size], "big")
+        self.left = size * 8
+        self.end = pos + size
+
+    def read(self, nbits):
+        self.left -= nbits
+        return (self.value >> self.left) & ((1 << nbits) - 1)
+
+
+# --- columns -----------------------------------------------------------------
+
+def _put_floats(w, values):
+    words = struct.unpack(f"<{len(values)}Q", struct.pack(f"<{len(values)}d", *values))
+    # The first value is XORed with 0.0 like any other: blocks are short, and
+    # a quantised value is mostly trailing zeros, so this beats 64 raw bits.
+    prev = 0
+    lead_p = trail_p = -1
+    for word in words:
+        x = word ^ prev
+        prev = word
+        if not x:
+            w.write(0, 1)
+            continue
+        lead = 64 - x.bit_length()
+        if lead > 31:
+            lead = 31
+        trail = (x & -x).bit_length() - 1
+        if lead_p >= 0 and lead >= lead_p and trail >= trail_p:
+            size = 64 - lead_p - trail_p
+            w.write((0b10 << size) | (x >> trail_p), 2 + size)
+        else:
+            size = 64 - lead - trail
+            w.write((((0b11 << 5 | lead) << 6 | size - 1) << size) | (x >> trail), 13 + size)
+            lead_p, trail_p = lead, trail
+
+
+def _get_floats(r, count):
+    prev = lead_p = trail_p = 0
+    words = []
+    for _ in range(count):
+        if r.read(1):
+            if r.read(1):
+                lead_p = r.read(5)
+                size = r.read(6) + 1
+                trail_p = 64 - lead_p - size
+            else:
+                size = 64 - lead_p - trail_p
+            prev ^= r.read(size) << trail_p
+        words.append(prev)
+    return list(struct.unpack(f"<{count}d", struct.pack(f"<{count}Q", *words)))
+
+
+class _Column:
+    """Codec for one channel: its registry type and declared precision."""
+
+    __slots__ = ("type", "precision")
+
+    def __init__(self, type_, precision):
+        self.type = type_
+        self.precision = precision if type_ == "float" else None
+
+    def encode(self, out, col, strings):
+        present = [v for v in col if v is not None]
+        if not present:
+            out.append(ALL_NULL)
+            return
+        if len(present) == len(col):
+            out.append(NO_NULLS)
+        else:
+            out.append(BITMAP)
+            w = _BitWriter()
+            for v in col:
+                w.write(v is not None, 1)
+            w.flush(out)
+        t = self.type
+        if t == "float":
+            p = self.precision
+            if p is None:
+                vals = [float(v) for v in present]
+            else:
+                vals = [quantise(float(v), p) for v in present]
+            w = _BitWriter()
+            _put_floats(w, vals)
+            w.flush(out)
+        elif t == "int":
+            _put_dod(out, [v if type(v) is int else int(v) for v in present])
+        elif t == "bool":
+            w = _BitWriter()
+            for v in present:
+                w.write(1 if v else 0, 1)
+            w.flush(out)
+        else:
+            for v in present:
+                _put_varint(out, strings.setdefault(v, len(strings)))
+
+    def decode(self, buf, pos, count, strings):
+        flag = buf[pos]
+        pos += 1
+        if flag == ALL_NULL:
+            return [None] * count, pos
+        mask = None
+        present = count
+        if flag == BITMAP:
+            r = _BitReader(buf, pos)
+            mask = [r.read(1) for _ in range(count)]
+            pos = r.end
+            present = sum(mask)
+        t = self.type
+        if t == "float":
+            r = _BitReader(buf, pos)
+            vals = _get_floats(r, present)
+            pos = r.end
+        elif t == "int":
+            vals, pos = _get_dod(buf, pos, present)
+        elif t == "bool":
+            r = _BitReader(buf, pos)
+            vals = [bool(r.read(1)) for _ in range(present)]
+            pos = r.end
+        else:
+            vals = []
+            for _ in range(present):
+                k, pos = _get_varint(buf, pos)
+                vals.append(strings[k])
+        if mask is None:
+            return vals, pos
+        it = iter(vals)
+        return [next(it) if m else None for m in mask], pos
+
+
+class Catalog:
+    """Column codecs per block, from the schema announcement and tier_plan
+    messages (what the server receives, or a recording's header).
+
+    `quantised` ({layout id: channel ids}, the encoder's schema.QUANTISED)
+    limits rounding to the channels listed for each layout; the others are
+    coded exactly. Decoding never needs it.
+    """
+
+    def __init__(self, schema, tier_plan=None, quantised=None):
+        self.schema = schema
+        self.tier_plan = tier_plan or {}
+        columns = {c["id"]: _Column(c["type"], c["precision"]) for c in schema["channels"]}
+        exact = {c["id"]: _Column(c["type"], None) for c in schema["channels"]}
+
+        def pick(layout, ids):
+            if quantised is None:
+                return [columns[cid] for cid in ids]
+            keep = quantised.get(layout, ())
+            return [columns[cid] if cid in keep else exact[cid] for cid in ids]
+
+        self._rows = {int(k): [pick(int(k), ids)] for k, ids in schema["layouts"].items()}
+        self._tiers = {int(k): [pick(int(k), t["channels"]) for t in tiers]
+                       for k, tiers in self.tier_plan.items()}
+
+    def columns(self, layout_id, tiered):
+        return self._tiers[layout_id] if tiered else self._rows[layout_id]
+
+
+class GorillaBatchEncoder:
+    """Encodes id-keyed batch blocks (as for capture.binary) into the Gorilla
+    message. One per connection or recording."""
+
+    def __init__(self, tier_plans=None):
+        self.tier_plans = tier_plans
+        tier_plan = {str(k): p.describe() for k, p in tier_plans.items()} if tier_plans else None
+        self.catalog = Catalog(announcement(), tier_plan, QUANTISED)
+
+    def encode(self, layout_id, schema_version, blocks, tiered):
+        """`blocks` are [{"t0": ms, "t": [ms offsets], "data": [rows]}, ...]."""
+        base = min((b["t0"] for b in blocks if b["t"]), default=0)
+        strings = {}
+        body = bytearray()
+        for cols, block in zip(self.catalog.columns(layout_id, tiered), blocks):
+            offsets = block["t"]
+            _put_varint(body, len(offsets))
+            if not offsets:
+                continue
+            _put_varint(body, block["t0"] - base)
+            _put_dod(body, offsets)
+            for codec, col in zip(cols, zip(*block["data"])):
+                codec.encode(body, col, strings)
+        out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, layout_id, schema_version,
+                                    base, len(blocks), TIERED if tiered else 0))
+        _put_varint(out, len(strings))
+        for s in strings:
+            raw = s.encode("utf-8")
+            _put_varint(out, len(raw))
+            out += raw
+        out += body
+        return bytes(out)
+
+
+def decode(payload, catalog):
+    """Reference decoder (pure Python).
+
+    Returns (layout id, schema version, base ms,
+    [{"t0": ms, "t": [offsets], "data": [rows]}, ...]), like capture.binary.
+    """
+    magic, version, layout_id, schema_version, base, n_blocks, flags = HEADER.unpack_from(payload, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a v{FORMAT_VERSION} gorilla batch")
+    block_columns = catalog.columns(layout_id, bool(flags & TIERED))
+    if n_blocks != len(block_columns):
+        raise ValueError(f"{n_blocks} blocks but {len(block_columns)} column sets")
+
+    pos = HEADER.size
+    n_strings, pos = _get_varint(payload, pos)
+    strings = []
+    for _ in range(n_strings):
+        n, pos = _get_varint(payload, pos)
+        strings.append(payload[pos:pos + n].decode("utf-8"))
+        pos += n
+
+    blocks = []
+    for cols in block_columns:
+        count, pos = _get_varint(payload, pos)
+        if not count:
+            blocks.append({"t0": base, "t": [], "data": []})
+            continue
+        shift, pos = _get_varint(payload, pos)
+        offsets, pos = _get_dod(payload, pos, count)
+        columns = []
+        for codec in cols:
+            col, pos = codec.decode(payload, pos, count, strings)
+            columns.append(col)
+        blocks.append({"t0": base + shift, "t": offsets, "data": [list(r) for r in zip(*columns)]})
+    return layout_id, schema_version, base, blocks
+
+
+# --- local recordings --------------------------------------------------------
+
+class RecordingWriter:
+    """Appends Gorilla batches to a self-describing recording file:
+
+        b"MGRC", format version, varint length + JSON {"schema": announcement,
+        "tier_plan": ...}, then varint length + batch message, repeated.
+
+    A crash can only leave a torn last record, which readers skip.
+    """
+
+    def __init__(self, path, tier_plans=None):
+        self.encoder = GorillaBatchEncoder(tier_plans)
+        self.file = open(path, "wb")
+        head = json.dumps({"schema": self.encoder.catalog.schema,
+                           "tier_plan": self.encoder.catalog.tier_plan}).encode()
+        out = bytearray(RECORDING_MAGIC)
+        out.append(FORMAT_VERSION)
+        _put_varint(out, len(head))
+        out += head
+        self.file.write(out)
+
+    def write(self, layout_id, schema_version, blocks, tiered):
+        self.append(self.encoder.encode(layout_id, schema_version, blocks, tiered))
+
+    def append(self, message):
+        """Store an already-encoded batch (e.g. the one just sent)."""
+        out = bytearray()
+        _put_varint(out, len(message))
+        out += message
+        self.file.write(out)
+
+    def tell(self):
+        return self.file.tell()
+
+    def flush(self, sync=False):
+        """Hand buffered records to the OS; `sync` also forces them to disk."""
+        self.file.flush()
+        if sync:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def scan_recording(data):
+    """(Catalog, [(start, end) of each complete batch message]) of a recording's bytes."""
+    if data[:4] != RECORDING_MAGIC or len(data) < 5 or data[4] != FORMAT_VERSION:
+        raise ValueError(f"not a v{FORMAT_VERSION} telemetry recording")
+    n, pos = _get_varint(data, 5)
+    head = json.loads(data[pos:pos + n])
+    pos += n
+    spans = []
+    while pos < len(data):
+        try:
+            n, start = _get_varint(data, pos)
+        except IndexError:
+            break  # torn length prefix
+        if start + n > len(data):
+            break  # torn last record
+        spans.append((start, start + n))
+        pos = start + n
+    return Catalog(head["schema"], head["tier_plan"]), spans
+
+
+def read_recording(path):
+    """Yields each batch of a recording, decoded (see decode())."""
+    with open(path, "rb") as f:
+        data = f.read()
+    catalog, spans = scan_recording(data)
+    for start, end in spans:
+        yield decode(data[start:end], catalog)
@@ -0,0 +1,269 @@
+"""
+Versioned channel schema registry.
+
+The wire contract used to live only implicitly in canonical.REQUIRED_FIELDS /
+DEFAULTS and in the key names each reader writes into `ext`, and every frame
+repeated every channel name as a JSON key. This registry makes it explicit:
+each channel has a stable small integer id, a type, a unit, a display
+precision and, per game, the raw source it is read from.
+
+Rules for changing it (the backend keeps a copy per version):
+  - ids are never reused or renumbered; new channels get the next free id;
+  - any change (new channel, new layout) bumps SCHEMA_VERSION;
+  - a removed channel keeps its id reserved.
+
+The client announces the version (and the full table, so a backend that has
+not seen it yet can learn it) once per WebSocket session. Once the server acks
+the version, telemetry batches refer to channels by id: a batch names a frame
+layout (capture.frame schema id) whose channel-id list was announced, and each
+frame is a plain positional row.
+
+Ext channels live in their own namespace (`ext.<name>`) since some reuse a
+contract name (ACC's ext `is_valid_lap`, iRacing's ext `fuel_remaining_liters`).
+"""
+
+from capture.frame import CORE_CHANNELS, SCHEMAS, WHEELS
+
+SCHEMA_VERSION = 2
+
+
+class Channel:
+    """One registry entry. `precision` is decimal places worth keeping (None = exact);
+    `rounded` names the games whose reader already rounds the value to it."""
+
+    __slots__ = ("id", "name", "type", "unit", "precision", "sources", "rounded")
+
+    def __init__(self, channel_id, name, type_, unit, precision, sources):
+        self.id = channel_id
+        self.name = name
+        self.type = type_
+        self.unit = unit
+        self.precision = precision
+        self.sources = sources
+        self.rounded = set()
+
+    def describe(self):
+        return {
+            "id": self.id, "name": self.name, "type": self.type, "unit": self.unit,
+            "precision": self.precision, "sources": self.sources,
+        }
+
+
+# Raw source per game for the contract channels. AC and ACC read the same
+# shared-memory shape; LMU is the rF2 vehicle telemetry block; iRacing the SDK
+# variable names. A unit in brackets is the sim's own, passed through as-is.
+_CORNERS = ("LF", "RF", "LR", "RR")
+
+_CORE = (
+    # name, type, unit, precision, {game: source}
+    ("lap_number", "int", "lap", None,
+     {"ac": "graphics.completedLaps", "acc": "graphics.completedLaps",
+      "lmu": "lapNumber", "iracing": "Lap"}),
+    ("speed_kmh", "float", "km/h", 1,
+     {"ac": "physics.speedKmh", "acc": "physics.speedKmh",
+      "lmu": "speed (m/s)", "iracing": "Speed (m/s)"}),
+    ("rpm", "int", "rpm", None,
+     {"ac": "physics.rpms", "acc": "physics.rpms", "lmu": "engineRPM", "iracing": "RPM"}),
+    ("gear", "int", "", None,
+     {"ac": "physics.gear", "acc": "physics.gear", "lmu": "gear", "iracing": "Gear"}),
+    ("throttle_input", "float", "%", 1,
+     {"ac": "physics.gas", "acc": "physics.gas",
+      "lmu": "unfilteredThrottle", "iracing": "Throttle"}),
+    ("brake_input", "float", "%", 1,
+     {"ac": "physics.brake", "acc": "physics.brake",
+      "lmu": "unfilteredBrake", "iracing": "Brake"}),
+    ("steering_input", "float", "", 4,
+     {"ac": "physics.steerAngle", "acc": "physics.steerAngle",
+      "lmu": "unfilteredSteering", "iracing": "SteeringWheelAngle / SteeringWheelAngleMax"}),
+    ("current_lap_time_ms", "int", "ms", None,
+     {"ac": "graphics.iCurrentTime", "acc": "graphics.iCurrentTime",
+      "lmu": "curLapTime (s)", "iracing": "LapCurrentLapTime (s)"}),
+    ("delta_to_best_ms", "int", "ms", None,
+     {"ac": "derived", "acc": "derived", "lmu": "derived", "iracing": "derived"}),
+    ("clutch_input", "float", "%", 1,
+     {"ac": "physics.clutch", "acc": "physics.clutch",
+      "lmu": "unfilteredClutch", "iracing": "Clutch"}),
+    ("best_lap_time_ms", "int", "ms", None,
+     {"ac": "graphics.iBestTime", "acc": "graphics.iBestTime",
+      "lmu": "bestLapTime (s)", "iracing": "LapBestLapTime (s)"}),
+    ("last_lap_time_ms", "int", "ms", None,
+     {"ac": "graphics.iLastTime", "acc": "graphics.iLastTime",
+      "lmu": "lastLapTime (s)", "iracing": "LapLastLapTime (s)"}),
+    ("is_valid_lap", "bool", "", None, {"acc": "graphics.isValidLap"}),
+) + tuple(
+    (f"tire_temp_{w}", "float", "C", 1,
+     {"ac": f"physics.tyreCoreTemperature[{i}]", "acc": f"physics.tyreCoreTemperature[{i}]",
+      "lmu": f"wheels[{i}].temperature[1] (K)", "iracing": f"{_CORNERS[i]}tempCM"})
+    for i, w in enumerate(WHEELS)
+) + tuple(
+    (f"tire_wear_{w}", "float", "", 3,
+     {"ac": f"physics.tyreWear[{i}]", "lmu": f"wheels[{i}].wear",
+      "iracing": f"{_CORNERS[i]}wearM"})
+    for i, w in enumerate(WHEELS)
+) + tuple(
+    (f"tire_pressure_{w}", "float", "psi", 2,
+     {"ac": f"physics.wheelsPressure[{i}]", "acc": f"physics.wheelsPressure[{i}]",
+      "lmu": f"wheels[{i}].pressure (kPa)", "iracing": f"{_CORNERS[i]}coldPressure (kPa)"})
+    for i, w in enumerate(WHEELS)
+) + tuple(
+    (f"brake_temp_{w}", "float", "C", 1,
+     {"ac": f"physics.brakeTemp[{i}]", "acc": f"physics.brakeTemp[{i}]",
+      "lmu": f"wheels[{i}].brakeTemp (K)", "iracing": f"{_CORNERS[i]}brakeLinePress"})
+    for i, w in enumerate(WHEELS)
+) + (
+    ("fuel_remaining_liters", "float", "L", 2,
+     {"ac": "physics.fuel", "acc": "physics.fuel", "lmu": "fuel", "iracing": "FuelLevel"}),
+    ("drs_available", "bool", "", None, {"ac": "physics.drsAvailable"}),
+    ("drs_enabled", "bool", "", None, {"ac": "physics.drsEnabled"}),
+    ("game", "str", "", None, {"ac": "reader", "acc": "reader", "lmu": "reader", "iracing": "reader"}),
+)
+
+# ACC shared-memory rich channels (games/acc_shared_memory.py _ext), grouped
+# the way they are emitted. Precision mirrors the rounding done there.
+_ACC_WHEEL_EXT = (
+    # name, type, unit, precision, physics field
+    ("slip_ratio", "float", "", 4, "slipRatio"),
+    ("slip_angle", "float", "rad", 4, "slipAngle"),
+    ("tyre_force_fx", "float", "N", 1, "fx"),
+    ("tyre_force_fy", "float", "N", 1, "fy"),
+    ("tyre_force_mz", "float", "Nm", 2, "mz"),
+    ("brake_pressure", "float", "", 4, "brakePressure"),
+    ("pad_life", "float", "mm", 2, "padLife"),
+    ("disc_life", "float", "mm", 2, "discLife"),
+    ("suspension_damage", "float", "", 3, "suspensionDamage"),
+    ("suspension_travel", "float", "m", 4, "suspensionTravel"),
+    ("wheel_slip", "float", "", 3, "wheelSlip"),
+)
+
+_ACC_EXT = (
+    ("pos_x", "float", "m", 2, "graphics.carCoordinates[player][0]"),
+    ("pos_y", "float", "m", 2, "graphics.carCoordinates[player][1]"),
+    ("pos_z", "float", "m", 2, "graphics.carCoordinates[player][2]"),
+) + tuple(
+    (f"{name}_{w}", type_, unit, precision, f"physics.{field}[{i}]")
+    for i, w in enumerate(WHEELS)
+    for name, type_, unit, precision, field in _ACC_WHEEL_EXT
+) + (
+    ("water_temp", "float", "C", 1, "physics.waterTemp"),
+    ("current_max_rpm", "int", "rpm", None, "physics.currentMaxRpm"),
+    ("tc_active", "float", "", 3, "physics.tc"),
+    ("abs_active", "float", "", 3, "physics.abs"),
+    ("air_temp", "float", "C", 1, "physics.airTemp"),
+    ("road_temp", "float", "C", 1, "physics.roadTemp"),
+    ("g_lat", "float", "g", 3, "physics.accG[0]"),
+    ("g_lon", "float", "g", 3, "physics.accG[1]"),
+    ("g_vert", "float", "g", 3, "physics.accG[2]"),
+    ("turbo_boost", "float", "", 3, "physics.turboBoost"),
+    ("normalized_position", "float", "", 5, "graphics.normalizedCarPosition"),
+    ("surface_grip", "float", "", 4, "graphics.surfaceGrip"),
+    ("wind_speed", "float", "m/s", 2, "graphics.windSpeed"),
+    ("wind_direction", "float", "rad", 2, "graphics.windDirection"),
+    ("predictive_delta_ms", "int", "ms", None, "graphics.iDeltaLapTime"),
+    ("is_valid_lap", "int", "", None, "graphics.isValidLap"),
+    ("fuel_per_lap", "float", "L", 3, "graphics.fuelXLap"),
+    # float since v1 (iRacing's track temperature used to ride on it)
+    ("track_grip_status", "float", "", None, "graphics.trackGripStatus"),
+    ("rain_intensity", "int", "", None, "graphics.rainIntensity"),
+    ("current_sector", "int", "", None, "graphics.currentSectorIndex"),
+    ("brake_bias", "float", "", 4, "physics.brakeBias"),
+    ("tc_setting", "int", "", None, "graphics.TC"),
+    ("tc_cut", "int", "", None, "graphics.TCCut"),
+    ("abs_setting", "int", "", None, "graphics.ABS"),
+    ("engine_map", "int", "", None, "graphics.EngineMap"),
+    ("tyre_compound", "str", "", None, "graphics.tyreCompound"),
+    ("fuel_est_laps", "float", "lap", 2, "graphics.fuelEstimatedLaps"),
+    ("session_time_left_ms", "float", "ms", 0, "graphics.sessionTimeLeft"),
+    ("pit_window_start", "int", "", None, "static.PitWindowStart"),
+    ("pit_window_end", "int", "", None, "static.PitWindowEnd"),
+    ("rain_10min", "int", "", None, "graphics.rainIntensityIn10min"),
+    ("rain_30min", "int", "", None, "graphics.rainIntensityIn30min"),
+)
+
+# iRacing rich channels (games/iracing.py _ext). A name ACC already defines
+# keeps ACC's id, type and unit, so only the ones that mean the same thing
+# share it; iRacing's GPS position, accelerations in m/s2 and track
+# temperature have channels of their own (v2; v1 put them on ACC's pos_x/z,
+# g_lat/lon and track_grip_status), listed last so they get the next ids.
+# 7 decimals of a degree is about a cm.
+_IRACING_EXT = (
+    ("normalized_position", "float", "", 5, "LapDistPct"),
+    ("fuel_remaining_liters", "float", "L", 2, "FuelLevel"),
+    ("session_time", "float", "s", 3, "SessionTime"),
+    ("gps_lon", "float", "deg", 7, "Lon"),
+    ("gps_lat", "float", "deg", 7, "Lat"),
+    ("alt", "float", "m", 2, "Alt"),
+    ("accel_lat", "float", "m/s2", 3, "LatAccel"),
+    ("accel_lon", "float", "m/s2", 3, "LongAccel"),
+    ("track_temp", "float", "C", 1, "TrackTempCrew"),
+)
+
+
+def _build():
+    channels, by_name = [], {}
+
+    def add(name, type_, unit, precision, sources, rounded=False):
+        ch = by_name.get(name)
+        if ch is not None and (ch.type, ch.unit) != (type_, unit):
+            raise ValueError(f"channel {name}: conflicting type/unit across games")
+        if ch is None:
+            ch = by_name[name] = Channel(len(channels) + 1, name, type_, unit, precision, {})
+            channels.append(ch)
+        ch.sources.update(sources)
+        if rounded:
+            ch.rounded.update(sources)
+
+    for name, type_, unit, precision, sources in _CORE:
+        add(name, type_, unit, precision, sources)
+    for name, type_, unit, precision, source in _ACC_EXT:
+        add(f"ext.{name}", type_, unit, precision, {"acc": source}, rounded=True)
+    for name, type_, unit, precision, source in _IRACING_EXT:
+        add(f"ext.{name}", type_, unit, precision, {"iracing": source})
+    return tuple(channels), by_name
+
+
+CHANNELS, BY_NAME = _build()
+BY_ID = {ch.id: ch for ch in CHANNELS}
+
+# Frame layout (capture.frame schema id) -> channel id per record slot.
+LAYOUTS = {
+    fs.id: tuple(
+        BY_NAME[name].id for name in CORE_CHANNELS
+    ) + tuple(BY_NAME[f"ext.{name}"].id for name in fs.ext_channels)
+    for fs in SCHEMAS.values()
+}
+
+# Frame layout -> channel ids whose values already come rounded to their
+# precision, so capture.gorilla may quantise them without losing anything.
+# Everything else (the core channels, iRacing's ext) is passed through as
+# read and must be coded exactly.
+QUANTISED = {
+    fs.id: frozenset(cid for cid in LAYOUTS[fs.id] if fs.name in BY_ID[cid].rounded)
+    for fs in SCHEMAS.values()
+}
+
+
+def announcement():
+    """The once-per-session schema message (sent on WebSocket open)."""
+    return {
+        "type": "schema",
+        "version": SCHEMA_VERSION,
+        "channels": [ch.describe() for ch in CHANNELS],
+        "layouts": {str(k): list(v) for k, v in LAYOUTS.items()},
+    }
+
+
+def decode_rows(layout_id, rows):
+    """Reference decoder: id-keyed rows (one layout) back to the named wire dicts."""
+    names = [BY_ID[cid].name for cid in LAYOUTS[layout_id]]
+    frames = []
+    for row in rows:
+        frame, ext = {}, {}
+        for name, value in zip(names, row):
+            if name.startswith("ext."):
+                ext[name[4:]] = value
+            else:
+                frame[name] = value
+        if ext:
+            frame["ext"] = ext
+        frames.append(frame)
+    return frames
@@ -14,6 +14,8 @@ advances so lap_number, current/last/best lap times all populate.
 import math
 import time
 
+from capture.canonical import normalize_ac
+
 
 class SyntheticACSource:
     """Produces a continuous stream of AC-shaped telemetry frames."""
@@ -86,3 +88,7 @@ class SyntheticACSource:
             },
             "drs": {"available": 1 if corner > 0.8 else 0, "enabled": 0, "level": 0},
         }
+
+    def read_canonical(self) -> dict:
+        """Same interface as the sim readers' capture hot path."""
+        return normalize_ac(self.read())
@@ -0,0 +1,217 @@
+"""
+Per-channel sample-rate tiers.
+
+Pedals and steering move every physics tick; tyre core temps, pad life, the
+weather forecast or the pit window change a few times per second at most, yet
+every channel used to ship at update_rate_hz. Each registry channel (see
+capture.schema) is assigned a tier: the fast tier (the capture rate) or a
+slower one such as 10 Hz or 1 Hz. The reader's shared-memory copy is one
+struct read either way, so sampling happens per tier on the captured frames:
+a slow tier takes the first frame of each of its periods, on a cadence that
+carries across batches.
+
+On the wire (once the schema is acked) a batch carries one block per tier,
+each on its own timebase:
+
+    {"type": "telemetry_batch", "schema": N, "layout": L,
+     "tiers": [{"t0": <epoch ms>, "t": [ms offsets], "data": [rows]}, ...]}
+
+in the order of the `tier_plan` message sent after the schema ack, which lists
+each tier's rate and channel ids per layout.
+
+Assignment is by channel name pattern (fnmatch). User overrides come from the
+`channel_tiers` config setting ({"ext.pad_life_*": 1, ...}) and win over the
+defaults; a channel matching nothing (or a tier at/above the capture rate) is
+in the fast tier.
+
+On a congested uplink the plans are rebuilt degraded (network/uplink.py):
+without the ext channels, with slower slow tiers, and with the fast tier
+itself decimated below the capture rate.
+"""
+
+from fnmatch import fnmatchcase
+
+from capture.frame import SCHEMAS
+from capture.schema import BY_ID, LAYOUTS
+
+DEFAULT_TIERS = {
+    # 10 Hz: thermal / pressure / fuel state — slow physics, still worth a trace
+    "tire_temp_*": 10,
+    "tire_pressure_*": 10,
+    "brake_temp_*": 10,
+    "fuel_remaining_liters": 10,
+    "ext.water_temp": 10,
+    "ext.brake_bias": 10,
+    "ext.turbo_boost": 10,
+    "ext.surface_grip": 10,
+    "ext.fuel_remaining_liters": 10,
+    # 1 Hz: wear, session/strategy state, settings, weather
+    "tire_wear_*": 1,
+    "best_lap_time_ms": 1,
+    "last_lap_time_ms": 1,
+    "drs_available": 1,
+    "game": 1,
+    "ext.pad_life_*": 1,
+    "ext.disc_life_*": 1,
+    "ext.suspension_damage_*": 1,
+    "ext.current_max_rpm": 1,
+    "ext.air_temp": 1,
+    "ext.road_temp": 1,
+    "ext.wind_*": 1,
+    "ext.fuel_per_lap": 1,
+    "ext.fuel_est_laps": 1,
+    "ext.track_grip_status": 1,
+    "ext.track_temp": 1,
+    "ext.rain_*": 1,
+    "ext.tc_setting": 1,
+    "ext.tc_cut": 1,
+    "ext.abs_setting": 1,
+    "ext.engine_map": 1,
+    "ext.tyre_compound": 1,
+    "ext.session_time_left_ms": 1,
+    "ext.pit_window_*": 1,
+}
+
+
+class Tier:
+    """One rate within a layout: the record slots it carries and their channel ids.
+
+    Slots are ascending, so the tier's contract channels come first and its ext
+    channels start at `ext_split`.
+    """
+
+    __slots__ = ("hz", "slots", "channel_ids", "ext_split")
+
+    def __init__(self, hz, slots, channel_ids, ext_start=None):
+        self.hz = hz
+        self.slots = tuple(slots)
+        self.channel_ids = tuple(channel_ids)
+        self.ext_split = sum(1 for s in self.slots if ext_start is None or s < ext_start)
+
+    def pick(self, rec):
+        return [rec[i] for i in self.slots]
+
+
+class TierPlan:
+    """Tiers for one frame layout, fastest first (tiers[0] runs at the capture
+    rate, or below it when decimated)."""
+
+    def __init__(self, layout_id, tiers, capture_hz=None):
+        self.layout_id = layout_id
+        self.tiers = tiers
+        self.capture_hz = capture_hz if capture_hz is not None else tiers[0].hz
+
+    def describe(self):
+        return [{"hz": t.hz, "channels": list(t.channel_ids)} for t in self.tiers]
+
+
+def tier_of(name, base_hz, overrides=None):
+    """Rate for one registry channel name; the last matching pattern wins."""
+    hz = base_hz
+    for table in (DEFAULT_TIERS, overrides or {}):
+        for pattern, rate in table.items():
+            if fnmatchcase(name, pattern):
+                hz = rate
+    return base_hz if hz >= base_hz else hz
+
+
+def _rate(hz):
+    return int(hz) if hz == int(hz) else round(hz, 3)
+
+
+def build_plans(base_hz, overrides=None, drop_ext=False, slow_scale=1, fast_div=1):
+    """TierPlan per frame layout for the given capture rate + config overrides.
+
+    The other arguments degrade the plan for a slow uplink: leave the ext
+    channels out, run every slow tier at `slow_scale` x its rate, and the
+    fast tier at 1/`fast_div` of the capture rate.
+    """
+    fast_hz = _rate(base_hz / max(1, fast_div))
+    plans = {}
+    for layout_id in SCHEMAS:
+        ext_start = SCHEMAS[layout_id].ext_start
+        by_rate = {}
+        for slot, cid in enumerate(LAYOUTS[layout_id]):
+            if drop_ext and ext_start is not None and slot >= ext_start:
+                continue
+            hz = tier_of(BY_ID[cid].name, base_hz, overrides)
+            hz = fast_hz if hz == base_hz else min(fast_hz, _rate(hz * slow_scale))
+            by_rate.setdefault(hz, []).append((slot, cid))
+        tiers = [Tier(hz, [s for s, _ in members], [c for _, c in members], ext_start)
+                 for hz, members in sorted(by_rate.items(), reverse=True)]
+        if not tiers or tiers[0].hz != fast_hz:
+            # Every channel assigned to a slow tier: keep an empty fast tier so
+            # tiers[0] is always the fast timebase.
+            tiers.insert(0, Tier(fast_hz, (), ()))
+        plans[layout_id] = TierPlan(layout_id, tiers, base_hz)
+    return plans
+
+
+class TierSampler:
+    """Splits captured frames into per-tier blocks, keeping each slow tier's
+    cadence across batches. One per connection (reset() on reconnect)."""
+
+    def __init__(self, plans):
+        self.plans = plans
+        self._last = {}  # (layout, hz) -> last sampled period number
+
+    def reset(self):
+        self._last.clear()
+
+    def describe(self):
+        """Body of the `tier_plan` message."""
+        return {str(k): p.describe() for k, p in self.plans.items()}
+
+    def encode(self, layout_id, frames, times):
+        """Per-tier blocks for one batch of same-layout records.
+
+        `times` are capture times in seconds (time.time()), one per frame.
+        """
+        blocks = []
+        last = self._last
+        plan = self.plans[layout_id]
+        for n, tier in enumerate(plan.tiers):
+            if n == 0 and tier.hz >= plan.capture_hz:
+                sel = range(len(frames))
+            else:
+                key = (layout_id, tier.hz)
+                prev = last.get(key, -1)
+                sel = []
+                for i, t in enumerate(times):
+                    period = int(t * tier.hz)
+                    if period > prev:
+                        sel.append(i)
+                        prev = period
+                last[key] = prev
+            if sel:
+                t0 = int(times[sel[0]] * 1000)
+                blocks.append({
+                    "t0": t0,
+                    "t": [int(times[i] * 1000) - t0 for i in sel],
+                    "data": [tier.pick(frames[i]) for i in sel],
+                })
+            else:
+                blocks.append({"t0": None, "t": [], "data": []})
+        return blocks
+
+
+def expand(plan, blocks, held=None):
+    """Reference decoder: per-tier blocks -> (ms time, {channel id: value}) per
+    fast-tier sample, holding each slow channel at its latest sample. Pass the
+    same `held` dict for every batch of a session (slow samples span batches).
+    """
+    fast, slow = plan.tiers[0], plan.tiers[1:]
+    held = {} if held is None else held
+    cursors = [0] * len(slow)
+    out = []
+    for off, row in zip(blocks[0]["t"], blocks[0]["data"]):
+        t = blocks[0]["t0"] + off
+        for k, tier in enumerate(slow):
+            block = blocks[k + 1]
+            while cursors[k] < len(block["t"]) and block["t0"] + block["t"][cursors[k]] <= t:
+                held.update(zip(tier.channel_ids, block["data"][cursors[k]]))
+                cursors[k] += 1
+        values = dict(held)
+        values.update(zip(fast.channel_ids, row))
+        out.append((t, values))
+    return out
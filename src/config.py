@@ -19,6 +19,75 @@ class Config:
         'ws_url': 'wss://myracingdata.com/api/v1/ws',
         'api_key': '',
         'update_rate_hz': 120,
+        # Per-channel sample-rate overrides, {channel name pattern: Hz}, on top
+        # of capture.tiers.DEFAULT_TIERS (e.g. {"ext.pad_life_*": 10}).
+        'channel_tiers': {},
+        # Batch encode stage (network/pipeline.py): worker threads, and how
+        # many batches may be in flight before the sender holds frames back.
+        'encode_workers': 2,
+        'encode_queue_depth': 8,
+        # A send still on the socket after send_timeout_s seconds drops the
+        # connection: its batches go to the spool and the stream reconnects
+        # (0 = wait forever). ws_send_buffer_kb bounds the WebSocket's kernel
+        # send buffer so a slow uplink shows up as send time (0 = OS default).
+        'send_timeout_s': 10,
+        'ws_send_buffer_kb': 256,
+        # Adaptive batching (network/batcher.py): a batch is cut when its
+        # oldest frame is batch_age_ms old (tuned between min and max from
+        # send latency), or at batch_max_frames / ~batch_max_kb encoded.
+        'batch_age_ms': 50,
+        'batch_min_age_ms': 40,
+        'batch_max_age_ms': 250,
+        'batch_max_frames': 120,
+        'batch_max_kb': 64,
+        # Outage spool (network/spool.py): undeliverable batches go to disk
+        # (default ~/.myracingdata/spool) and are replayed at up to
+        # `spool_catchup` x the capture rate once the connection is back.
+        'spool_dir': '',
+        'spool_max_mb': 512,
+        'spool_catchup': 3.0,
+        # Unacked batches kept for resending (network/resend.py), and how
+        # long to wait for the server's ack before sending one again.
+        'resend_window': 600,
+        'ack_timeout': 3.0,
+        # Live stream transport: 'auto' tries the WebSocket and falls back to
+        # HTTPS bulk-upload POSTs (network/http_bulk.py) when it can't
+        # connect; 'websocket' / 'http' use only that one. bulk_in_flight
+        # chunks are posted at once.
+        'transport': 'auto',
+        'bulk_in_flight': 4,
+        # Seconds between RTT pings on the live stream (0 = off); the
+        # latency summary (network/latency.py) is logged per session.
+        'rtt_interval_s': 2.0,
+        # When a session ends (or the app stops), up to drain_s seconds to
+        # send the frames it captured and wait for them to be acked.
+        'drain_s': 5,
+        # Frames kept while a session is being set up (seconds of capture),
+        # sent as its first batches.
+        'pre_session_seconds': 30,
+        # Uplink degradation ladder (network/uplink.py): when the stream
+        # can't keep up (oldest unsent frame older than uplink_congested_ms
+        # for uplink_down_after_s) it drops ext channels, then slows the
+        # tiers, then decimates the core channels, up to uplink_max_level;
+        # it steps back up after uplink_up_after_s under uplink_clear_ms.
+        # Full-rate frames of degraded stretches are kept under
+        # full_rate_dir (default ~/.myracingdata/full_rate).
+        'uplink_degrade': True,
+        'uplink_max_level': 4,
+        'uplink_congested_ms': 1000,
+        'uplink_clear_ms': 300,
+        'uplink_down_after_s': 2,
+        'uplink_up_after_s': 15,
+        'full_rate_dir': '',
+        'full_rate_max_mb': 1024,
+        # Local fan-out of the captured frames (network/fanout.py) for
+        # overlays and dashboards: WebSocket + UDP on fanout_host; a
+        # WebSocket subscriber fanout_queue_frames behind is disconnected.
+        'fanout_enabled': True,
+        'fanout_host': '127.0.0.1',
+        'fanout_port': 47100,
+        'fanout_udp_port': 47101,
+        'fanout_queue_frames': 240,
         'buffer_size': 1000,
         'auto_start': True,
         'minimize_to_tray': True,
@@ -8,6 +8,9 @@ import struct
 import ctypes
 from typing import Optional, Dict, Any
 
+from capture.canonical import BOOL, GEAR_AC, PCT, compile_normalizer, compile_row_reader
+from capture.frame import CORE_SCHEMA
+
 class ACPhysics(ctypes.Structure):
     """Assetto Corsa Physics shared memory structure"""
     _fields_ = [
@@ -108,6 +111,45 @@ class ACGraphics(ctypes.Structure):
         ('windDirection', ctypes.c_float),
     ]
 
+# Canonical mapping straight from the structs: compiled into the fused frame
+# builder (read_canonical) and the raw batch row (read_row). Mirrors the AC-shape
+# mapping in capture/canonical.py field for field.
+_PRELUDE = (
+    "tyre_temp = p.tyreCoreTemperature",
+    "tyre_wear = p.tyreWear",
+    "tyre_pressure = p.wheelsPressure",
+    "brake_temp = p.brakeTemp",
+)
+_FIELDS = {
+    "lap_number": "g.completedLaps",
+    "speed_kmh": "p.speedKmh",
+    "rpm": "p.rpms",
+    "gear": ("p.gear", GEAR_AC),  # AC: 0=R, 1=N, 2=1st -> -1/0/1
+    "throttle_input": ("p.gas", PCT),
+    "brake_input": ("p.brake", PCT),
+    "clutch_input": ("p.clutch", PCT),
+    "steering_input": "p.steerAngle",
+    "current_lap_time_ms": "g.iCurrentTime",
+    "best_lap_time_ms": "g.iBestTime",
+    "last_lap_time_ms": "g.iLastTime",
+    "tire_temp_fl": "tyre_temp[0]", "tire_temp_fr": "tyre_temp[1]",
+    "tire_temp_rl": "tyre_temp[2]", "tire_temp_rr": "tyre_temp[3]",
+    "tire_wear_fl": "tyre_wear[0]", "tire_wear_fr": "tyre_wear[1]",
+    "tire_wear_rl": "tyre_wear[2]", "tire_wear_rr": "tyre_wear[3]",
+    "tire_pressure_fl": "tyre_pressure[0]", "tire_pressure_fr": "tyre_pressure[1]",
+    "tire_pressure_rl": "tyre_pressure[2]", "tire_pressure_rr": "tyre_pressure[3]",
+    "brake_temp_fl": "brake_temp[0]", "brake_temp_fr": "brake_temp[1]",
+    "brake_temp_rl": "brake_temp[2]", "brake_temp_rr": "brake_temp[3]",
+    "fuel_remaining_liters": "p.fuel",
+    "drs_available": ("p.drsAvailable", BOOL),
+    "drs_enabled": ("p.drsEnabled", BOOL),
+}
+_canonical_frame = compile_normalizer(
+    "_ac_canonical_frame", "ac", _PRELUDE, _FIELDS, args=("p", "g"), ext=None, nullable=False,
+    schema=CORE_SCHEMA,
+)
+_raw_row = compile_row_reader("_ac_raw_row", "ac", _PRELUDE, _FIELDS, args=("p", "g"))
+
 class ACTelemetry:
     """Assetto Corsa telemetry reader"""
     
@@ -145,8 +187,8 @@ class ACTelemetry:
             self.graphics_map.close()
         self.connected = False
     
-    def read(self) -> Optional[Dict[str, Any]]:
-        """Read telemetry data from shared memory"""
+    def _fetch(self):
+        """Snapshot (physics, graphics), or None if no new packet / not live."""
         if not self.connected:
             return None
         
@@ -171,14 +213,31 @@ class ACTelemetry:
                 return None
             
             self.last_packet_id = physics.packetId
-            
-            # Parse into structured format
-            return self._parse_data(physics, graphics)
+            return physics, graphics
             
         except Exception as e:
             print(f"Error reading AC telemetry: {e}")
             self.connected = False
             return None
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """Read the full nested telemetry frame (debug/recording consumers)."""
+        structs = self._fetch()
+        return self._parse_data(*structs) if structs else None
+
+    def read_canonical(self) -> Optional[tuple]:
+        """Read straight into a canonical frame, skipping the nested raw dict.
+
+        Returns a compact Frame record (capture/frame.py) holding the same
+        values as normalize('ac', read()) — this is the capture hot path.
+        """
+        structs = self._fetch()
+        return _canonical_frame(*structs) if structs else None
+
+    def read_row(self) -> Optional[tuple]:
+        """Read one raw numeric row for the batch path (normalize_batch('ac', rows))."""
+        structs = self._fetch()
+        return _raw_row(*structs) if structs else None
     
     def _parse_data(self, physics: ACPhysics, graphics: ACGraphics) -> Dict[str, Any]:
         """Parse AC data into MyRacingData format"""
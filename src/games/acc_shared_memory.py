@@ -17,10 +17,42 @@ import ctypes
 import mmap
 import time
 
+from capture.canonical import FLAG, GEAR_AC, PCT, compile_normalizer, compile_row_reader
+from capture.frame import ACC_SCHEMA
 from games.acc_structs import ACCPhysics, ACCGraphics, ACCStatic
 
 WHEELS = ['fl', 'fr', 'rl', 'rr']
 
+# Canonical mapping straight from the structs: compiled into the fused frame
+# builder (read_canonical) and the raw batch row (read_row). Mirrors what
+# normalize_acc makes of _parse() below, field for field.
+_PRELUDE = (
+    "tyre_temp = p.tyreCoreTemperature",
+    "tyre_pressure = p.wheelsPressure",
+    "brake_temp = p.brakeTemp",
+)
+_FIELDS = {
+    "lap_number": "g.completedLaps",
+    "speed_kmh": "p.speedKmh",
+    "rpm": "p.rpms",
+    "gear": ("p.gear", GEAR_AC),  # AC shape: 0=R, 1=N, 2=1st -> -1/0/1
+    "throttle_input": ("p.gas", PCT),
+    "brake_input": ("p.brake", PCT),
+    "clutch_input": ("p.clutch", PCT),
+    "steering_input": "p.steerAngle",
+    "current_lap_time_ms": "g.iCurrentTime",
+    "best_lap_time_ms": "g.iBestTime",
+    "last_lap_time_ms": "g.iLastTime",
+    "is_valid_lap": ("g.isValidLap", FLAG),
+    "tire_temp_fl": "tyre_temp[0]", "tire_temp_fr": "tyre_temp[1]",
+    "tire_temp_rl": "tyre_temp[2]", "tire_temp_rr": "tyre_temp[3]",
+    "tire_pressure_fl": "tyre_pressure[0]", "tire_pressure_fr": "tyre_pressure[1]",
+    "tire_pressure_rl": "tyre_pressure[2]", "tire_pressure_rr": "tyre_pressure[3]",
+    "brake_temp_fl": "brake_temp[0]", "brake_temp_fr": "brake_temp[1]",
+    "brake_temp_rl": "brake_temp[2]", "brake_temp_rr": "brake_temp[3]",
+    "fuel_remaining_liters": "p.fuel",
+}
+
 
 class ACCSharedMemoryReader:
     """Reads ACC telemetry from shared memory (full physics + graphics + static)."""
@@ -81,8 +113,8 @@ class ACCSharedMemoryReader:
         self.physics_map = self.graphics_map = self.static_map = None
         self.connected = False
 
-    def read(self):
-        """Read one frame (None if no new physics packet yet)."""
+    def _fetch(self):
+        """Snapshot (physics, graphics), or None if no new packet / not live."""
         if not self.connected:
             return None
         try:
@@ -100,12 +132,38 @@ class ACCSharedMemoryReader:
             if phys.packetId == self.last_packet_id:
                 return None
             self.last_packet_id = phys.packetId
-            return self._parse(phys, gfx)
+            return phys, gfx
         except Exception as e:
             print(f"Error reading ACC telemetry: {e}")
             self.connected = False
             return None
 
+    def read(self):
+        """Read one full AC-shaped frame (None if no new physics packet yet).
+
+        Builds the nested raw dict — for debug/recording consumers; capture
+        uses read_canonical().
+        """
+        structs = self._fetch()
+        return self._parse(*structs) if structs else None
+
+    def read_canonical(self):
+        """Read one frame straight into the canonical contract (+ `ext`).
+
+        A compact Frame record (capture/frame.py) holding the same values as
+        normalize('acc', read()), without the intermediate tires/lap/brakes dicts.
+        """
+        structs = self._fetch()
+        return self._canonical(*structs) if structs else None
+
+    def read_row(self):
+        """Read one raw numeric row for the batch path (normalize_batch('acc', rows)).
+
+        Core channels only; the `ext` blob stays on the per-frame paths.
+        """
+        structs = self._fetch()
+        return self._raw_row(*structs) if structs else None
+
     def current_ids(self):
         """Live (track, car) re-read from the static page.
 
@@ -124,6 +182,13 @@ class ACCSharedMemoryReader:
             pass
         return (self.track_name, self.car_name)
 
+    # Canonical frame / raw batch row straight from the structs (see below).
+    _canonical = compile_normalizer(
+        "_canonical", "acc", _PRELUDE, _FIELDS,
+        args=("self", "p", "g"), ext="self._ext(p, g)", nullable=False, schema=ACC_SCHEMA,
+    )
+    _raw_row = compile_row_reader("_raw_row", "acc", _PRELUDE, _FIELDS, args=("self", "p", "g"))
+
     def _parse(self, p, g):
         """AC-shaped core (for normalize_acc) + an `ext` dict of rich channels."""
         return {
@@ -18,6 +18,11 @@ import re
 import struct
 import time
 
+from capture.canonical import (
+    INT, MPS_TO_KMH, PCT, S_TO_MS, compile_normalizer, compile_row_reader,
+)
+from capture.frame import IRACING_SCHEMA
+
 MEM_MAP_NAME = 'Local\\IRSDKMemMapFileName'
 
 MAX_BUFS = 4
@@ -28,6 +33,40 @@ VARBUF_SIZE = 16
 VARHEADER_SIZE = 144
 ST_CONNECTED = 1
 
+# Canonical mapping straight from the SDK variables: compiled into the fused
+# frame builder (read_canonical) and the raw batch row (read_row). Mirrors what
+# normalize_iracing makes of _parse(), field for field.
+_PRELUDE = (
+    'v = self._value',
+    'arr = self._arr',
+)
+_FIELDS = {
+    'lap_number': "v(off, 'Lap', 0)",
+    'speed_kmh': ("v(off, 'Speed', 0.0)", MPS_TO_KMH),
+    'rpm': ("v(off, 'RPM', 0.0)", INT),
+    'gear': ("v(off, 'Gear', 0)", INT),  # already -1=R, 0=N, 1=1st
+    'throttle_input': ("v(off, 'Throttle', 0.0)", PCT),
+    'brake_input': ("v(off, 'Brake', 0.0)", PCT),
+    'clutch_input': ("v(off, 'Clutch', 0.0)", PCT),
+    'steering_input': 'self._steering_norm(off)',
+    'current_lap_time_ms': ("v(off, 'LapCurrentLapTime', 0.0)", S_TO_MS),
+    'best_lap_time_ms': ("v(off, 'LapBestLapTime', 0.0)", S_TO_MS),
+    'last_lap_time_ms': ("v(off, 'LapLastLapTime', 0.0)", S_TO_MS),
+    'tire_temp_fl': "arr(off, 'LFtempCM', 1)", 'tire_temp_fr': "arr(off, 'RFtempCM', 1)",
+    'tire_temp_rl': "arr(off, 'LRtempCM', 1)", 'tire_temp_rr': "arr(off, 'RRtempCM', 1)",
+    'tire_wear_fl': "arr(off, 'LFwearM', 1)", 'tire_wear_fr': "arr(off, 'RFwearM', 1)",
+    'tire_wear_rl': "arr(off, 'LRwearM', 1)", 'tire_wear_rr': "arr(off, 'RRwearM', 1)",
+    'tire_pressure_fl': "v(off, 'LFcoldPressure', 0.0)",
+    'tire_pressure_fr': "v(off, 'RFcoldPressure', 0.0)",
+    'tire_pressure_rl': "v(off, 'LRcoldPressure', 0.0)",
+    'tire_pressure_rr': "v(off, 'RRcoldPressure', 0.0)",
+    'brake_temp_fl': "v(off, 'LFbrakeLinePress', 0.0)",
+    'brake_temp_fr': "v(off, 'RFbrakeLinePress', 0.0)",
+    'brake_temp_rl': "v(off, 'LRbrakeLinePress', 0.0)",
+    'brake_temp_rr': "v(off, 'RRbrakeLinePress', 0.0)",
+    'fuel_remaining_liters': "v(off, 'FuelLevel', 0.0)",
+}
+
 # irsdk_VarType -> (struct format, size in bytes)
 VAR_TYPES = {
     0: ('c', 1),   # char
@@ -190,8 +229,8 @@ class IRacingTelemetry:
             return v[idx] if idx < len(v) else default
         return v if v is not None else default
 
-    def read(self):
-        """One frame, or None when nothing new / the sim left."""
+    def _fetch(self):
+        """Offset of the newest telemetry buffer, or None when nothing new / the sim left."""
         if not self.connected:
             return None
         try:
@@ -211,12 +250,38 @@ class IRacingTelemetry:
             if hdr['session_info_update'] != self._session_update:
                 self._read_session_yaml(hdr)
 
-            return self._parse(off)
+            return off
         except Exception as e:
             print(f'Error reading iRacing telemetry: {e}')
             self.connected = False
             return None
 
+    def read(self):
+        """One full AC-shaped frame, or None when nothing new / the sim left.
+
+        Builds the nested raw dict — for debug/recording consumers; capture
+        uses read_canonical().
+        """
+        off = self._fetch()
+        return self._parse(off) if off is not None else None
+
+    def read_canonical(self):
+        """One frame straight into the canonical contract (+ `ext`).
+
+        A compact Frame record (capture/frame.py) holding the same values as
+        normalize('iracing', read()), without the intermediate tires/lap/brakes dicts.
+        """
+        off = self._fetch()
+        return self._canonical(off) if off is not None else None
+
+    def read_row(self):
+        """One raw numeric row for the batch path (normalize_batch('iracing', rows)).
+
+        Core channels only; the `ext` blob stays on the per-frame paths.
+        """
+        off = self._fetch()
+        return self._raw_row(off) if off is not None else None
+
     def current_ids(self):
         """Live (track, car) — lets the session monitor catch an in-place switch."""
         if self.connected and self.mm:
@@ -241,7 +306,6 @@ class IRacingTelemetry:
 
         speed_ms = g('Speed', 0.0) or 0.0
         gear = g('Gear', 0)
-        lap_pct = g('LapDistPct', 0.0) or 0.0
 
         return {
             'game': 'iracing',
@@ -280,18 +344,30 @@ class IRacingTelemetry:
                 'is_valid_lap': True,
             },
             'drs': {'available': False, 'enabled': False},
-            'ext': {
-                # Position axis for corner detection / lap compare (0..1).
-                'normalized_position': lap_pct,
-                # iRacing exposes GPS lat/lon rather than world x/z — good enough
-                # for the top-down track map (scaled the same way).
-                'pos_x': g('Lon', 0.0),
-                'pos_y': g('Alt', 0.0),
-                'pos_z': g('Lat', 0.0),
-                'g_lat': g('LatAccel', 0.0),
-                'g_lon': g('LongAccel', 0.0),
-                'track_grip_status': g('TrackTempCrew', 0.0),
-                'fuel_remaining_liters': g('FuelLevel', 0.0),
-                'session_time': g('SessionTime', 0.0),
-            },
+            'ext': self._ext(off),
+        }
+
+    def _ext(self, off):
+        """Rich channels beyond the contract, stored server-side as JSON."""
+        g = lambda n, d=0: self._value(off, n, d)  # noqa: E731
+        return {
+            # Position axis for corner detection / lap compare (0..1).
+            'normalized_position': g('LapDistPct', 0.0) or 0.0,
+            # iRacing exposes GPS lat/lon (degrees) rather than world x/z;
+            # the track map projects them itself.
+            'gps_lon': g('Lon', 0.0),
+            'gps_lat': g('Lat', 0.0),
+            'alt': g('Alt', 0.0),
+            'accel_lat': g('LatAccel', 0.0),  # m/s2, not g
+            'accel_lon': g('LongAccel', 0.0),
+            'track_temp': g('TrackTempCrew', 0.0),
+            'fuel_remaining_liters': g('FuelLevel', 0.0),
+            'session_time': g('SessionTime', 0.0),
         }
+
+    # Canonical frame / raw batch row straight from the SDK variables.
+    _canonical = compile_normalizer(
+        '_canonical', 'iracing', _PRELUDE, _FIELDS, args=('self', 'off'), ext='self._ext(off)',
+        schema=IRACING_SCHEMA,
+    )
+    _raw_row = compile_row_reader('_raw_row', 'iracing', _PRELUDE, _FIELDS, args=('self', 'off'))
@@ -7,6 +7,11 @@ import mmap
 import ctypes
 from typing import Optional, Dict, Any
 
+from capture.canonical import (
+    INT, MPS_TO_KMH, PCT, S_TO_MS, compile_normalizer, compile_row_reader,
+)
+from capture.frame import CORE_SCHEMA
+
 # rFactor 2 / LMU Telemetry Structures
 
 class Vec3(ctypes.Structure):
@@ -151,6 +156,39 @@ class VehicleTelemetry(ctypes.Structure):
         ('rearDownforce', ctypes.c_double),
     ]
 
+# Canonical mapping straight from the struct: compiled into the fused frame
+# builder (read_canonical) and the raw batch row (read_row). Mirrors
+# normalize_lmu in capture/canonical.py field for field.
+_PRELUDE = ("w0, w1, w2, w3 = v.wheels",)
+_FIELDS = {
+    "lap_number": "v.lapNumber",
+    "speed_kmh": ("v.speed", MPS_TO_KMH),
+    "rpm": ("v.engineRPM", INT),
+    "gear": "v.gear",  # rF2: -1=R, 0=N, 1=1st (already canonical)
+    "throttle_input": ("v.unfilteredThrottle", PCT),
+    "brake_input": ("v.unfilteredBrake", PCT),
+    "clutch_input": ("v.unfilteredClutch", PCT),
+    "steering_input": "v.unfilteredSteering",
+    # LMU lap times are doubles in seconds; the contract is integer ms.
+    "current_lap_time_ms": ("v.curLapTime", S_TO_MS),
+    "best_lap_time_ms": ("v.bestLapTime", S_TO_MS),
+    "last_lap_time_ms": ("v.lastLapTime", S_TO_MS),
+    "tire_temp_fl": "w0.temperature[1]", "tire_temp_fr": "w1.temperature[1]",
+    "tire_temp_rl": "w2.temperature[1]", "tire_temp_rr": "w3.temperature[1]",
+    "tire_wear_fl": "w0.wear", "tire_wear_fr": "w1.wear",
+    "tire_wear_rl": "w2.wear", "tire_wear_rr": "w3.wear",
+    "tire_pressure_fl": "w0.pressure", "tire_pressure_fr": "w1.pressure",
+    "tire_pressure_rl": "w2.pressure", "tire_pressure_rr": "w3.pressure",
+    "brake_temp_fl": "w0.brakeTemp", "brake_temp_fr": "w1.brakeTemp",
+    "brake_temp_rl": "w2.brakeTemp", "brake_temp_rr": "w3.brakeTemp",
+    "fuel_remaining_liters": "v.fuel",
+}
+_canonical_frame = compile_normalizer(
+    "_lmu_canonical_frame", "lmu", _PRELUDE, _FIELDS, args=("v",), ext=None, nullable=False,
+    schema=CORE_SCHEMA,
+)
+_raw_row = compile_row_reader("_lmu_raw_row", "lmu", _PRELUDE, _FIELDS, args=("v",))
+
 class LMUTelemetry:
     """Le Mans Ultimate telemetry reader"""
     
@@ -195,8 +233,8 @@ class LMUTelemetry:
             self.shared_memory.close()
         self.connected = False
     
-    def read(self) -> Optional[Dict[str, Any]]:
-        """Read telemetry data from shared memory"""
+    def _fetch(self):
+        """Snapshot the vehicle struct, or None if nothing new since last read."""
         if not self.connected or not self.shared_memory:
             return None
         
@@ -211,14 +249,31 @@ class LMUTelemetry:
                 return None
             
             self.last_update = vehicle.elapsedTime
-            
-            # Parse into structured format
-            return self._parse_data(vehicle)
+            return vehicle
             
         except Exception as e:
             print(f"Error reading LMU telemetry: {e}")
             self.connected = False
             return None
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """Read the full nested telemetry frame (debug/recording consumers)."""
+        vehicle = self._fetch()
+        return self._parse_data(vehicle) if vehicle is not None else None
+
+    def read_canonical(self) -> Optional[tuple]:
+        """Read straight into a canonical frame, skipping the nested raw dict.
+
+        Returns a compact Frame record (capture/frame.py) holding the same
+        values as normalize('lmu', read()) — this is the capture hot path.
+        """
+        vehicle = self._fetch()
+        return _canonical_frame(vehicle) if vehicle is not None else None
+
+    def read_row(self) -> Optional[tuple]:
+        """Read one raw numeric row for the batch path (normalize_batch('lmu', rows))."""
+        vehicle = self._fetch()
+        return _raw_row(vehicle) if vehicle is not None else None
     
     def _parse_data(self, vehicle: VehicleTelemetry) -> Dict[str, Any]:
         """Parse LMU data into MyRacingData format"""
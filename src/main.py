@@ -3,6 +3,7 @@ MyRacingData Telemetry Capture
 Main application entry point
 """
 
+import asyncio
 import sys
 import time
 import threading
@@ -42,12 +43,21 @@ def _setup_logging():
 
 _setup_logging()
 
+from capture.tiers import build_plans
 from config import Config
-from capture.canonical import normalize
 from games.ac import ACTelemetry
 from games.acc_shared_memory import ACCSharedMemoryReader
 from games.iracing import IRacingTelemetry
 from games.lmu import LMUTelemetry
+from network.loop import NetworkLoop
+from network import rest
+from network.batcher import AdaptiveBatcher
+from network.fanout import FanoutServer
+from network.http_bulk import HttpBulkClient, open_stream
+from network.latency import LatencyTracker
+from network.pipeline import EncodePipeline
+from network.spool import Spool, SpoolWriter
+from network.uplink import LEVELS, UplinkMonitor
 from network.websocket_client import WebSocketClient
 from ui.system_tray import SystemTrayApp
 
@@ -64,21 +74,91 @@ class TelemetryCapture:
         self.active_game = None
         self.running = False
         self.capture_thread = None
-        self.sender_thread = None
-        self.monitor_thread = None
+        # Session monitor, session start/end, spool recovery and the batch
+        # sender run as coroutines on one asyncio loop (network/loop.py),
+        # created on first start.
+        self.net = None
+        self.sender_task = None
+        self.monitor_task = None
         self.data_count = 0
         self.last_status_update = 0
         self.session_id = None
-        self.last_frame = None  # most recent normalized frame, for the UI readout
+        # Session creation + WS handshake run as their own task so the
+        # monitor never waits on the network (see _start_session).
+        self._session_starter = None
+        self.last_frame = None  # most recent canonical Frame record, for the UI readout
         self.log_callback = None  # Store callback for use in capture loop
 
         # Decouple capture from network: the reader thread samples shared memory
         # at the configured Hz into this buffer; the sender thread drains it in
         # batches. Keeps sample timing steady at 120Hz (a blocking WS send in the
         # read loop would jitter/drop frames). Bounded so it can't grow forever
-        # if the network stalls.
+        # if the network stalls. Holds (capture time, Frame record) pairs — the
+        # compact records of capture/frame.py, not dicts, so a full buffer is a
+        # few MB instead of tens; the time gives each sample-rate tier its
+        # timebase on the wire (capture/tiers.py).
         self._send_buf = deque(maxlen=2400)
         self._buf_lock = threading.Lock()
+        self._send_dropped = 0  # frames the buffer's bound pushed out
+        self._drops_logged = 0
+        self._drops_logged_at = 0
+        # Frames the sender took with nowhere to put them (no connection,
+        # spool or game): not in data_count, logged like the drops above.
+        self._send_discarded = 0
+        self._discards_logged = 0
+        self._discards_logged_at = 0
+        # Frames captured between sim detection and the session being ready
+        # (REST call + WS handshake): held here, oldest dropped past the bound
+        # and counted, then sent as the session's first batches. Only touched
+        # on the network loop (sender + session setup), so no lock.
+        self._pre_buf = deque(maxlen=max(1, int(self.config.get('pre_session_seconds', 30)
+                                               * self.config.update_rate_hz)))
+        self._pre_lost = 0
+        # Session wind-down (_close_session): while `_draining` the sender
+        # stands aside; `_stopping` asks the monitor to close before stop().
+        self._draining = False
+        self._stopping = False
+        # Encode/compress stage between the sender and the socket (created on
+        # first start, idle threads otherwise).
+        self.pipeline = None
+        # When the sender cuts a batch: age / frame count / encoded size,
+        # tuned from the pipeline's send latency (network/batcher.py).
+        self.batcher = AdaptiveBatcher(
+            age_s=self.config.get('batch_age_ms', 50) / 1000,
+            min_age_s=self.config.get('batch_min_age_ms', 40) / 1000,
+            max_age_s=self.config.get('batch_max_age_ms', 250) / 1000,
+            max_frames=self.config.get('batch_max_frames', 120),
+            max_bytes=int(self.config.get('batch_max_kb', 64) * 1024),
+        )
+        # On-disk outage spool of the current session (network/spool.py), and
+        # the background replay of spools left by earlier sessions/runs. Its
+        # writes (and the full-rate store's) and the live replay's reads run
+        # on the spool writer thread, in order, never on the network loop;
+        # `_spool_read` is the replay read the sender is waiting for, and
+        # `_replay_due` the frames the catch-up rate allows for the next one.
+        self.spool = None
+        self.spool_writer = None
+        self._spool_read = None
+        self._replay_due = 0.0
+        self._recovery = None
+        # Uplink throughput + degradation ladder of the live stream
+        # (network/uplink.py). While degraded, the full-rate frames of what
+        # goes out live are kept in `full_rate` (a Spool under full_rate_dir).
+        self.uplink = UplinkMonitor(
+            self.config.update_rate_hz,
+            congested_s=self.config.get('uplink_congested_ms', 1000) / 1000,
+            clear_s=self.config.get('uplink_clear_ms', 300) / 1000,
+            down_after_s=float(self.config.get('uplink_down_after_s', 2)),
+            up_after_s=float(self.config.get('uplink_up_after_s', 15)),
+            max_level=self.config.get('uplink_max_level', 4) if self.config.get('uplink_degrade', True) else 0,
+        )
+        self.full_rate = None
+        # Capture -> enqueue -> encode -> send time of every batch, and the
+        # link's RTT from the client's pings (network/latency.py).
+        self.latency = LatencyTracker()
+        # Local WebSocket/UDP endpoint serving the captured frames to overlays
+        # and dashboards (network/fanout.py), started on the network loop.
+        self.fanout = None
 
         print(f"🏁 MyRacingData Telemetry Capture v{Config.VERSION}")
         print("=" * 60)
@@ -88,7 +168,6 @@ class TelemetryCapture:
     
     def start(self, log_callback=None):
         """Start telemetry capture"""
-        import requests
         import json as json_module
 
         # Store callback for use in capture loop
@@ -128,18 +207,45 @@ class TelemetryCapture:
         self.session_car = None
         self.ws_client = None
 
+        if self.pipeline is None:
+            self.pipeline = EncodePipeline(self.config.get('encode_workers', 2),
+                                           self.config.get('encode_queue_depth', 8),
+                                           on_failed=self._spool_failed,
+                                           on_sent=self._batch_sent,
+                                           latency=self.latency,
+                                           send_timeout_s=float(self.config.get('send_timeout_s', 10)) or None)
+        if self.spool_writer is None:
+            self.spool_writer = SpoolWriter()
+        if self.net is None:
+            self.net = NetworkLoop()
+        if self.fanout is None and self.config.get('fanout_enabled', True):
+            self.fanout = FanoutServer(self.config.get('fanout_host', '127.0.0.1'),
+                                       self.config.get('fanout_port', 47100),
+                                       self.config.get('fanout_udp_port', 47101),
+                                       hz=self.config.update_rate_hz,
+                                       queue_frames=self.config.get('fanout_queue_frames', 240))
+            self.net.spawn(self._start_fanout())
+
         self.running = True
         self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.capture_thread.start()
-        self.sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
-        self.sender_thread.start()
-        self.monitor_thread = threading.Thread(target=self._session_monitor, daemon=True)
-        self.monitor_thread.start()
+        self.sender_task = self.net.spawn(self._sender_loop())
+        self.monitor_task = self.net.spawn(self._session_monitor())
+        self.net.spawn(self.net.call(rest.prewarm, self.config.api_url))
+
+        self._start_recovery()
 
         log("✓ Capture started — waiting for a sim session…")
         return True
 
-    def _session_monitor(self):
+    async def _start_fanout(self):
+        try:
+            ws_port, udp_port = await self.fanout.start()
+            self._log(f"📡 Local fan-out: ws://{self.fanout.host}:{ws_port}/ and udp {self.fanout.host}:{udp_port}")
+        except OSError as e:
+            self._log(f"⚠ Local fan-out unavailable: {e}")
+
+    async def _session_monitor(self):
         """Create/end a backend session as the sim enters/leaves a live session.
 
         active_game is set by the reader when a sim session is live and cleared
@@ -147,12 +253,18 @@ class TelemetryCapture:
         session per on-track session.
         """
         while self.running:
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
             try:
+                if self._session_starter and not self._session_starter.done():
+                    continue  # a session is still being set up
+                if self._stopping:
+                    if self.session_id:
+                        await self._close_session('stopped')
+                    continue
                 if self.active_game and not self.session_id:
-                    self._begin_session()
+                    self._start_session()
                 elif not self.active_game and self.session_id:
-                    self._end_session('sim session ended')
+                    await self._close_session('sim session ended')
                 elif self.active_game and self.session_id:
                     # Already recording — watch for an in-place track/car switch
                     # (server/session change that never dropped to the menu, so
@@ -165,25 +277,37 @@ class TelemetryCapture:
                         real = bool(track) and str(track).lower() not in ('unknown', '')
                         if real and (track, car) != (self.session_track, self.session_car):
                             self._log(f"↻ Track/car changed live ({self.session_track} -> {track}) — new session")
-                            self._end_session('track/car changed')
-                            self._begin_session()
+                            await self._close_session('track/car changed')
+                            self._start_session()
+                else:
+                    self._pre_buf.clear()  # sim gone before a session started
+                    self._pre_lost = 0
+                    # Waiting for the sim: keep a warm pooled connection to the
+                    # API so the session create doesn't pay for DNS/TCP/TLS.
+                    self.net.spawn(self.net.call(rest.prewarm, self.config.api_url, max_age_s=30))
             except Exception as e:
                 self._log(f"⚠ Session monitor error: {e}")
 
-    def _begin_session(self):
+    def _start_session(self):
+        """Run _begin_session in the background; capture keeps buffering meanwhile."""
+        self._session_starter = self.net.spawn(self._begin_session())
+
+    async def _begin_session(self):
         """Create a backend session for the currently-detected sim + connect WS."""
-        import requests
         reader = {'ac': self.ac, 'acc': self.acc, 'lmu': self.lmu, 'iracing': self.iracing}.get(self.active_game)
         track = getattr(reader, 'track_name', None) or 'Unknown'
         car = getattr(reader, 'car_name', None) or 'Unknown'
         game = self.active_game
+        started = time.monotonic()
+        sid = ws = None
 
         try:
-            resp = requests.post(
-                f"{self.config.api_url}/sessions",
+            resp = await self.net.call(
+                rest.post,
+                f"{self.config.api_url}/sessions", 'session_create',
                 headers={'Authorization': f'Bearer {self.config.api_key}', 'Content-Type': 'application/json'},
                 json={'track_name': track, 'car_name': car, 'game': game},
-                verify=False, timeout=10,
+                verify=False,
             )
             if resp.status_code != 201:
                 self._log(f"❌ Failed to create session: {resp.status_code}")
@@ -192,64 +316,390 @@ class TelemetryCapture:
             sid = data.get('session', {}).get('id') or data.get('id')
             if not sid:
                 return
+            created_ms = (time.monotonic() - started) * 1000
 
-            # Identify on the WS itself (?key=) — the server authenticates the
-            # connection against the session owner before accepting telemetry.
-            from urllib.parse import quote
-            ws = WebSocketClient(
-                f"{self.config.ws_url}/session/{sid}?key={quote(self.config.api_key or '')}",
-                self.config.api_key,
-            )
-            if not ws.connect():
-                self._log("❌ WebSocket connection failed")
+            ws = await self.net.call(self._connect_session, sid)
+            if ws is None:
+                # Don't leave it open: the monitor tries again with a new one.
+                self._log("❌ Streaming connection failed")
+                await self.net.call(self._end_backend_session, sid)
+                return
+            ws.batch_meta = {'track': track, 'car': car}
+            ws.on_rtt = self.latency.rtt
+            ws.on_first_send = lambda: self._log(
+                f"⏱ First batch sent {(ws.first_send_at - started) * 1000:,.0f} ms after session start "
+                f"(session {created_ms:,.0f} ms, handshake {ws.connect_time_s * 1000:,.0f} ms)")
+            if not self.running:
+                ws.disconnect()  # stopped while we were connecting
+                await self.net.call(self._end_backend_session, sid)
                 return
 
-            with self._buf_lock:
-                self._send_buf.clear()  # drop any pre-session frames
+            spool = await self.net.call(Spool, self._spool_root() / str(sid),
+                                        max_bytes=int(self.config.get('spool_max_mb', 512)) << 20)
+            held = self._take_pre_session(spool)
+            self.spool = spool
             self.session_id = sid
             self.session_track = track
             self.session_car = car
             self.ws_client = ws
-            self.data_count = 0
+            self.latency.new_session()
+            self.data_count = held  # queued in the spool ahead of the live frames
             self.last_status_update = 0
-            self._log(f"🏁 Session started — {track} · {car}")
+            self._log(f"🏁 Session started — {track} · {car}"
+                      + (" over HTTPS bulk upload" if isinstance(ws, HttpBulkClient) else "")
+                      + (f" ({held:,} frames from before it queued first)" if held else ""))
         except Exception as e:
             self._log(f"❌ Session start failed: {e}")
+            if sid and self.session_id != sid:
+                if ws:
+                    ws.disconnect()
+                await self.net.call(self._end_backend_session, sid)
+
+    def _hold_pre_session(self, batch):
+        """Keep frames captured before the session is ready (bounded)."""
+        over = len(self._pre_buf) + len(batch) - self._pre_buf.maxlen
+        if over > 0:
+            self._pre_lost += over
+        self._pre_buf.extend(batch)
+
+    def _take_pre_session(self, spool):
+        """Queue the pre-session frames as the new session's first batches.
+
+        They go into the session's spool (queued for the spool writer), so
+        the sender replays them at the catch-up rate ahead of anything newer,
+        like an outage backlog. Returns how many were queued.
+        """
+        held = list(self._pre_buf)
+        self._pre_buf.clear()
+        lost, self._pre_lost = self._pre_lost, 0
+        if lost:
+            start = time.strftime('%H:%M:%S', time.localtime(held[0][0])) if held else '?'
+            self._log(f"⚠ Pre-session buffer overflowed: {lost:,} frames "
+                      f"(~{lost / self.config.update_rate_hz:,.1f} s) before {start} were dropped")
+        step = max(1, round(self.config.update_rate_hz * 0.05))  # one sender batch
+        for i in range(0, len(held), step):
+            times, frames = zip(*held[i:i + step])
+            self.spool_writer.append(spool, list(frames), list(times))
+        return len(held)
+
+    def _session_client(self, sid, http=False):
+        """WebSocketClient for a backend session (or its HTTPS bulk-upload
+        stand-in, network/http_bulk.py)."""
+        kwargs = dict(tier_plans=self._tier_plans(),
+                      resend_window=int(self.config.get('resend_window', 600)),
+                      ack_timeout=float(self.config.get('ack_timeout', 3.0)))
+        if http:
+            ws = HttpBulkClient(f"{self.config.api_url}/sessions/{sid}/bulk", self.config.api_key,
+                                in_flight=int(self.config.get('bulk_in_flight', 4)), **kwargs)
+        else:
+            # Identify on the WS itself (?key=) — the server authenticates the
+            # connection against the session owner before accepting telemetry.
+            from urllib.parse import quote
+            ws = WebSocketClient(
+                f"{self.config.ws_url}/session/{sid}?key={quote(self.config.api_key or '')}",
+                self.config.api_key, send_buffer=int(self.config.get('ws_send_buffer_kb', 256)) * 1024 or None,
+                **kwargs)
+        ws.plan_name = self.uplink.name  # sessions start at the current uplink level
+        self.uplink.using(self.uplink.level)
+        return ws
+
+    def _connect_session(self, sid):
+        """Connected client for a backend session, or None (blocking: run it
+        through net.call). The WebSocket, or the HTTPS bulk upload when the
+        WebSocket can't get through, per the `transport` setting."""
+        return open_stream(lambda: self._session_client(sid),
+                           lambda: self._session_client(sid, http=True),
+                           self.config.get('transport', 'auto'), self._log)
+
+    def _tier_plans(self):
+        """Tier plans for the uplink's current degradation level."""
+        return build_plans(self.config.update_rate_hz, self.config.get('channel_tiers'),
+                           **self.uplink.plan_args)
+
+    def _spool_root(self):
+        return Path(self.config.get('spool_dir') or (self.config.config_dir / 'spool'))
+
+    def _batch_sent(self, frames, nbytes, latency_s):
+        """Encode pipeline callback: a batch is on the socket."""
+        self.batcher.observe(frames, nbytes, latency_s)
+        self.uplink.sent(frames, nbytes, latency_s)
+
+    def _watch_uplink(self, buffered, age, stalled=0.0):
+        """Feed the uplink monitor (sender, every tick) and log what it sees."""
+        ws, spool = self.ws_client, self.spool
+        if ws and ws.is_connected and not (spool and spool.pending):
+            msg = self.uplink.sample(buffered, age, stalled_s=stalled)
+            if msg:
+                self._log(msg)
+        else:
+            self.uplink.idle()
+        dropped = self._send_dropped
+        if dropped > self._drops_logged and time.time() - self._drops_logged_at > 5:
+            self._log(f"⚠ Send buffer full: {dropped - self._drops_logged:,} frames dropped "
+                      f"(uplink: {self.uplink.sent_bps / 1024:,.1f} KB/s, stream {self.uplink.name})")
+            self._drops_logged, self._drops_logged_at = dropped, time.time()
+        discarded = self._send_discarded
+        if discarded > self._discards_logged and time.time() - self._discards_logged_at > 5:
+            self._log(f"⚠ No session to send to: {discarded - self._discards_logged:,} frames "
+                      f"discarded")
+            self._discards_logged, self._discards_logged_at = discarded, time.time()
+
+    def _keep_full_rate(self, frames, times):
+        """Store frames that went out degraded, at full rate, for the session
+        (on the spool writer)."""
+        if self.session_id:
+            self.spool_writer.call(self._store_full_rate, self.session_id, frames, times)
+
+    def _store_full_rate(self, sid, frames, times):
+        """Spool writer: append to the session's full-rate store, opened on
+        first use."""
+        store = self.full_rate
+        if store is None:
+            if sid != self.session_id:
+                return  # the session ended meanwhile
+            root = Path(self.config.get('full_rate_dir') or (self.config.config_dir / 'full_rate'))
+            store = self.full_rate = Spool(root / str(sid),
+                                           max_bytes=int(self.config.get('full_rate_max_mb', 1024)) << 20)
+        store.append(frames, times)
+
+    def _spool_failed(self, client, frames, times):
+        """Encode pipeline callback: a batch of the live session didn't go out."""
+        spool = self.spool
+        if spool is not None and client is self.ws_client:
+            self.spool_writer.append(spool, frames, times)
+
+    def _replayed(self, spool, count):
+        """Spool writer: the first `count` batches of the last peek() are
+        handed to the encode stage."""
+        spool.consume(count)
+        if count and not spool.pending:
+            self._log(f"✓ Spool drained — {spool.replayed:,} frames replayed")
+
+    def _start_recovery(self):
+        """Replay spools left by earlier sessions (or a crash) in the background."""
+        if self._recovery is None or self._recovery.done():
+            self._recovery = self.net.spawn(self._recover_spools())
+
+    async def _recover_spools(self):
+        try:
+            for sid in await self.net.call(Spool.scan, self._spool_root()):
+                if not self.running:
+                    return
+                if sid == str(self.session_id):
+                    continue
+                spool = await self.net.call(Spool, self._spool_root() / sid,
+                                            max_bytes=int(self.config.get('spool_max_mb', 512)) << 20)
+                try:
+                    if spool.pending:
+                        self._log(f"↺ Replaying {spool.pending_frames:,} spooled frames "
+                                  f"of session {sid}")
+                        ws = await self.net.call(self._connect_session, sid)
+                        if ws is None:
+                            self._log(f"⚠ Spool replay for session {sid}: connection failed, "
+                                      f"keeping it for later")
+                            continue
+                        try:
+                            await self._replay(spool, ws)
+                        finally:
+                            ws.disconnect()
+                    if not spool.pending:
+                        # Delivered: now the session can be closed on the backend.
+                        await self.net.call(self._end_backend_session, sid)
+                        self._log(f"✓ Spooled session {sid} delivered")
+                finally:
+                    await self.net.call(spool.close)
+        except Exception as e:
+            self._log(f"⚠ Spool recovery error: {e}")
+
+    async def _replay(self, spool, ws):
+        """Send a recovered spool over its own connection at the catch-up rate."""
+        rate = float(self.config.get('spool_catchup', 3.0)) * self.config.update_rate_hz
+        interval = 0.05
+        while spool.pending and self.running and ws.is_connected:
+            start = time.monotonic()
+            if not await self.net.call(self._replay_step, spool, ws, rate * interval):
+                return
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+    @staticmethod
+    def _replay_step(spool, ws, max_frames):
+        """Send the next batches of a recovered spool (blocking: run it
+        through net.call). False once a send fails."""
+        batches = spool.peek(max_frames)
+        sent = 0
+        for frames, times in batches:
+            if not ws.send_batch(frames, times):
+                break
+            sent += 1
+        spool.consume(sent)
+        return sent == len(batches)
+
+    async def _close_session(self, reason):
+        """Drain the session (see _drain_session), then end it."""
+        self._draining = True
+        try:
+            try:
+                sent, spooled, lost, in_flight, unacked, spent = await self._drain_session()
+                if sent or spooled or lost or in_flight or unacked:
+                    self._log(f"⏬ Drained in {spent * 1000:,.0f} ms: {sent:,} frames sent, "
+                              f"{spooled:,} spooled for replay, {lost:,} lost"
+                              + (f", {in_flight:,} still in flight at the deadline" if in_flight else "")
+                              + (f", {unacked:,} sent but not acked" if unacked else ""))
+            except Exception as e:
+                self._log(f"⚠ Session drain error: {e}")
+            await self.net.call(self._end_session, reason)
+        finally:
+            self._draining = False
+
+    async def _drain_session(self):
+        """Send what the session captured before it ends, within `drain_s`.
+
+        Runs on the network loop while the sender stands aside. Frames in
+        the send buffer up to now go out as batches (into the spool if the
+        connection is down or the spool is still replaying); then it waits
+        for the encode stage to empty and, when the server acks, for the
+        acks (resending what times out). Frames captured after the cut stay
+        in the buffer for the next session. Returns frame counts (sent,
+        spooled, lost: nowhere to go, in flight: still in the encode stage
+        at the deadline, unacked) and the seconds it took.
+        """
+        start = time.monotonic()
+        deadline = start + float(self.config.get('drain_s', 5))
+        ws, spool, pipe = self.ws_client, self.spool, self.pipeline
+        cut = time.time()
+        with self._buf_lock:
+            buf = self._send_buf
+            tail = []
+            while buf and buf[0][0] <= cut:
+                tail.append(buf.popleft())
+        step = self.batcher.max_frames
+        sent = spooled = lost = 0
+        i = 0
+        while i < len(tail) and time.monotonic() < deadline:
+            if not (ws and ws.is_connected) or (spool and spool.pending):
+                break
+            if not pipe.room:
+                await asyncio.sleep(0.01)
+                continue
+            times, frames = zip(*tail[i:i + step])
+            self._submit_live(ws, list(frames), list(times))
+            sent += len(frames)
+            i += step
+        for j in range(i, len(tail), step):
+            if spool is None:
+                lost += len(tail) - j
+                break
+            times, frames = zip(*tail[j:j + step])
+            self.spool_writer.append(spool, list(frames), list(times))
+            spooled += len(frames)
+        self.data_count += sent + spooled
+
+        def busy():
+            return pipe.in_flight or (ws and ws.acked and len(ws.window))
+        while busy() and time.monotonic() < deadline:
+            if ws and ws.is_connected and pipe.room > 1:
+                for seq, f, t in ws.due_resends(pipe.room - 1):
+                    pipe.submit(ws, f, t, seq)
+            await asyncio.sleep(0.02)
+        unacked = ws.window.pending_frames() if ws and ws.acked else 0
+        return sent, spooled, lost, pipe.frames_in_flight, unacked, time.monotonic() - start
 
     def _end_session(self, reason=''):
         """End the current backend session and close its WebSocket."""
-        import requests
         sid = self.session_id
         ws = self.ws_client
+        spool = self.spool
+        if ws:
+            # Let the batches already handed to the encode stage go out first
+            # (failures still land in this session's spool). One stuck on a
+            # full socket won't: drop the connection under it instead.
+            if not self.pipeline.flush(1.0) and self.pipeline.stalled():
+                ws.abort("session ending with a send stuck")
+                self.pipeline.flush(1.0)
+        # Spool and full-rate writes still queued land before the files close.
+        if self.spool_writer is not None:
+            self.spool_writer.flush(10.0)
+        full_rate = self.full_rate
         self.session_id = None
         self.ws_client = None
+        self.spool = None
+        self._spool_read = None
+        self._replay_due = 0.0
+        self.full_rate = None
+        if full_rate is not None:
+            full_rate.close()
+            self._log(f"💾 Full-rate data of the degraded stretches kept locally: "
+                      f"{full_rate.pending_frames:,} frames in {full_rate.dir}")
         if ws:
             try:
                 ws.disconnect()
             except Exception:
                 pass
+            stats = ws.compression_stats()
+            if stats and stats['batches']:
+                self._log(f"🗜 Compression: {stats['raw_bytes'] / 1024:,.0f} KB -> "
+                          f"{stats['sent_bytes'] / 1024:,.0f} KB (x{stats['ratio']}), "
+                          f"{stats['cpu_ms']:,.0f} ms CPU over {stats['batches']:,} batches, "
+                          f"level {stats['level']}")
+            if isinstance(ws, HttpBulkClient):
+                st = ws.transport_stats()
+                self._log(f"📮 HTTPS bulk upload: {st['chunks']:,} chunks, {st['sent_kb']:,.0f} KB, "
+                          f"up to {st['max_in_flight']} in flight, {st['failures']:,} failed")
+            lat = self.latency.session_stats()
+            if lat['batches']:
+                def pct(stage):
+                    p = lat[stage]
+                    return f"{p['p50']}/{p['p95']}/{p['p99']}"
+                self._log(f"⏱ Latency ms p50/p95/p99 over {lat['batches']:,} batches: capture→sent "
+                          f"{pct('capture_sent')} (enqueue {pct('capture_enqueue')}, encode "
+                          f"{pct('enqueue_encoded')}, send {pct('encoded_sent')})"
+                          + (f"; RTT {pct('rtt')} ({lat['rtt_samples']:,} samples)" if lat['rtt_samples'] else "")
+                          + f"; frames ~{lat['staleness_ms']} ms old at the server")
+            acks = ws.window.stats()
+            if acks['resent'] or acks['evicted'] or acks['unacked']:
+                self._log(f"↺ Acks: {acks['resent']:,} batches resent, {acks['evicted']:,} "
+                          f"dropped from the resend window, {acks['unacked']:,} unacked at the end")
+        if spool is not None:
+            spool.close()
+            if spool.pending:
+                # Not delivered yet: the recovery replay ends the backend
+                # session once it has sent everything.
+                self._log(f"⏹ Session ended ({reason}) — {spool.pending_frames:,} frames "
+                          f"spooled for replay")
+                self._start_recovery()
+                return
         if sid:
-            try:
-                requests.patch(
-                    f"{self.config.api_url}/sessions/{sid}/end",
-                    headers={'Authorization': f'Bearer {self.config.api_key}'},
-                    verify=False, timeout=5,
-                )
-            except Exception:
-                pass
+            self._end_backend_session(sid)
             self._log(f"⏹ Session ended ({reason}) — {self.data_count:,} samples")
 
+    def _end_backend_session(self, sid):
+        """Close a session on the backend (blocking: run it through net.call)."""
+        try:
+            rest.patch(
+                f"{self.config.api_url}/sessions/{sid}/end", 'session_end',
+                headers={'Authorization': f'Bearer {self.config.api_key}'},
+                verify=False,
+            )
+        except Exception:
+            pass
+
     def stop(self):
         """Stop telemetry capture"""
-        import requests
 
         if not self.running:
             return
 
         print("⏹ Stopping telemetry capture...")
+        if self.session_id and self.net is not None:
+            # The session monitor drains and ends the session (_close_session).
+            self._stopping = True
+            wait = time.monotonic() + float(self.config.get('drain_s', 5)) + 2
+            while self.session_id and time.monotonic() < wait:
+                time.sleep(0.05)
         self.running = False
+        self._stopping = False
 
-        # End the active backend session (if any)
+        # End the active backend session (if the monitor didn't get to it)
         if self.session_id:
             self._end_session('stopped')
 
@@ -269,51 +719,178 @@ class TelemetryCapture:
     def _capture_loop(self):
         """Reader: sample shared memory at the configured Hz into the buffer.
 
-        Only reads + normalizes (cheap); the network send happens on the sender
-        thread so a blocking WS write can't disturb the sample timing at 120Hz.
+        Only reads (cheap — readers fill the canonical frame straight from the
+        structs); the network send happens on the sender thread so a blocking WS
+        write can't disturb the sample timing at 120Hz.
         """
         update_interval = 1.0 / self.config.update_rate_hz
 
         while self.running:
             loop_start = time.time()
 
-            raw = self._read_telemetry()
-            frame = normalize(self.active_game, raw)
+            frame = self._read_telemetry()
             if frame:
                 self.last_frame = frame
+                if self.fanout:
+                    self.fanout.publish(loop_start, frame)
                 with self._buf_lock:
-                    self._send_buf.append(frame)
+                    if len(self._send_buf) == self._send_buf.maxlen:
+                        self._send_dropped += 1
+                    self._send_buf.append((loop_start, frame))
 
             elapsed = time.time() - loop_start
             time.sleep(max(0, update_interval - elapsed))
 
-    def _sender_loop(self):
-        """Sender: drain the buffer and ship it as telemetry batches (~20/s)."""
-        SEND_INTERVAL = 0.05  # seconds between batches
+    async def _sender_loop(self):
+        """Sender: cut the buffer into batches and hand them to the encode stage.
 
-        while self.running:
-            time.sleep(SEND_INTERVAL)
+        AdaptiveBatcher (network/batcher.py) says when: the oldest frame's
+        age, the frame count or the estimated encoded size, whichever is first.
 
-            with self._buf_lock:
-                if not self._send_buf:
-                    continue
-                batch = list(self._send_buf)
-                self._send_buf.clear()
+        Encoding, compression and the socket write happen on the pipeline's
+        threads (network/pipeline.py); this task only does the stateful,
+        in-order part (WebSocketClient.prepare_batch), and only while the
+        pipeline has room. Spool and full-rate writes and the spool's replay
+        reads are queued for the spool writer thread (network/spool.py), so
+        a tick does no socket or disk I/O: what it costs the loop is
+        prepare_batch's tier sampling and ext deltas for the batches it
+        hands on. A send stuck on a full socket is measured every tick
+        (pipeline.stalled()) and slows the batching and the uplink level
+        down while it lasts; past `send_timeout_s` the pipeline drops the
+        connection.
+
+        While the connection is down the batches go to the session's disk
+        spool instead (network/spool.py). Once it is back, the spool is
+        replayed at `spool_catchup` x the capture rate and new batches queue
+        behind it, so the server still gets them in capture order.
+        """
+        batcher = self.batcher
+        catchup = float(self.config.get('spool_catchup', 3.0)) * self.config.update_rate_hz
+        ping_every = float(self.config.get('rtt_interval_s', 2.0))
+        last = next_ping = time.monotonic()
 
-            # Snapshot the client — the monitor thread may swap/clear it between
-            # sessions. If there's no active session, the batch is simply dropped.
+        while self.running:
+            await asyncio.sleep(batcher.tick_s)
+            if self._draining:
+                continue  # _drain_session has the session's last frames
+            with self._buf_lock:
+                buffered = len(self._send_buf)
+                age = time.time() - self._send_buf[0][0] if buffered else 0.0
+            stalled = self.pipeline.stalled()
+            if stalled:
+                batcher.congested(stalled)
+            self._watch_uplink(buffered, age, stalled)
+            reason = batcher.due(buffered, age)
+            take = batcher.limit() if reason else 0
+            now = time.monotonic()
             ws = self.ws_client
-            if ws and ws.is_connected:
-                ws.send_batch(batch)
+            if ping_every and now >= next_ping and ws and ws.is_connected:
+                ws.ping()
+                next_ping = now + ping_every
+            if not take and now - last < batcher.age_s:
+                continue  # resends / spool replay still run at the age cadence
+            try:
+                self._send_tick(catchup * (now - last), take, reason)
+            except Exception as e:
+                self._log(f"⚠ Sender error: {e}")
+            last = now
+
+    def _send_tick(self, replay_frames, take, reason=None):
+        """One sender tick: resends, up to `take` new frames as one batch
+        (flushed for `reason`, batcher.due()), then some of the spool."""
+        # Snapshot the client/spool — the monitor may swap/clear them between
+        # sessions. With no session and no game to hold it for, the batch is
+        # dropped (counted in _send_discarded, not data_count).
+        ws = self.ws_client
+        spool = self.spool
+        pipe = self.pipeline
+        live = bool(ws and ws.is_connected)
+        if live:
+            # Uplink level changed: switch the stream's tier plans, the new
+            # plan queued behind the batches encoded against the old one. New
+            # batches wait until there is room for it (two: binary format too).
+            if ws.plan_name != self.uplink.name and ws.can_replan:
+                if pipe.room < 2:
+                    return
+                level = self.uplink.level
+                if ws.set_tier_plans(self._tier_plans(), self.uplink.name,
+                                     send=lambda m: pipe.submit_message(ws, m)):
+                    self.uplink.using(level)
+            # Unacked batches lost with the last connection, or timed out.
+            for seq, f, t in ws.due_resends(pipe.room - 1):
+                pipe.submit(ws, f, t, seq)
+            # Backpressure: while the encode stage is full (or holds as many
+            # frames as the link sends in a moment), frames stay in the buffer
+            # (whose bound drops the oldest) rather than piling up as work.
+            if not pipe.room or pipe.frames_in_flight >= self.uplink.frame_budget():
+                return
+        elif spool is not None and pipe.in_flight:
+            return  # batches in flight fail into the spool first, then this one
+
+        with self._buf_lock:
+            buf = self._send_buf
+            batch = [buf.popleft() for _ in range(min(take, len(buf)))]
+
+        if batch:
+            if reason:
+                self.batcher.flushed(reason)
+            times, frames = zip(*batch)
+            if live and not (spool and spool.pending):
+                self._submit_live(ws, list(frames), list(times))
                 self.data_count += len(batch)
+            elif spool is not None:
+                self.spool_writer.append(spool, list(frames), list(times))
+                self.data_count += len(batch)
+            elif self.active_game:
+                # Session still being set up: counted when it takes them
+                # (_start_session), as data_count restarts there.
+                self._hold_pre_session(batch)
+            else:
+                self._send_discarded += len(batch)
+
+        if live and spool and spool.pending:
+            # The spool is read on the spool writer, behind the appends queued
+            # before the read: what one tick asks for, a later one sends, and
+            # the ticks in between add to what the next read asks for.
+            self._replay_due += replay_frames
+            read = self._spool_read
+            if read is not None and (read[0] is not spool or read[1].done()):
+                self._spool_read = None
+                if read[0] is spool:
+                    replay = read[1].result()[:pipe.room]
+                    for f, t in replay:
+                        self._submit_live(ws, f, t)
+                    self.spool_writer.call(self._replayed, spool, len(replay))
+            if self._spool_read is None:
+                self._spool_read = (spool, self.spool_writer.call(spool.peek, self._replay_due))
+                self._replay_due = 0.0
 
-                if time.time() - self.last_status_update > 5:
-                    last = batch[-1]
-                    self._log(f"📊 Capturing: {last['game']} | "
-                              f"Speed: {last.get('speed_kmh', 0):.1f} km/h | "
-                              f"Packets sent: {self.data_count}")
-                    self.last_status_update = time.time()
+        if batch and spool is not None:
+            if time.time() - self.last_status_update > 5:
+                last = frames[-1]
+                st = pipe.stats()
+                lat = self.latency.stats()
+                self._log(f"📊 Capturing: {last['game']} | "
+                          f"Speed: {last.get('speed_kmh', 0):.1f} km/h | "
+                          f"Packets sent: {self.data_count} | "
+                          f"Encode p95: {st['encode_ms']['p95']} ms, "
+                          f"in flight {st['in_flight']}/{st['depth']}, "
+                          f"send p95 {st['send_ms']['p95']} ms"
+                          + (f", {st['timeouts']} timed out" if st['timeouts'] else "") + " | "
+                          f"Batches: {self.batcher.stats()['frames_per_batch']} frames "
+                          f"/ {self.batcher.age_s * 1000:.0f} ms | "
+                          f"Uplink: {self.uplink.sent_bps / 1024:,.1f} KB/s, {self.uplink.name} | "
+                          f"Latency p95: {lat['capture_sent']['p95']} ms, RTT {lat['rtt']['p50']} ms"
+                          + (f" | Spooled: {spool.pending_frames:,}" if spool.pending else "")
+                          + (f" | Dropped: {self._send_dropped:,}" if self._send_dropped else ""))
+                self.last_status_update = time.time()
 
+    def _submit_live(self, ws, frames, times):
+        """Hand a batch to the encode stage; keep it at full rate locally too
+        while the live stream is degraded."""
+        self.pipeline.submit(ws, frames, times)
+        if ws.plan_name != LEVELS[0][0]:
+            self._keep_full_rate(frames, times)
 
     def _log(self, msg):
         """Helper to log to both console and GUI"""
@@ -322,9 +899,9 @@ class TelemetryCapture:
             self.log_callback(msg)
 
     def _read_telemetry(self):
-        """Try to read telemetry from games"""
+        """Try to read a canonical frame from the active game (or detect one)"""
 
-        # If we have an active game, keep reading from it. read() returning None
+        # If we have an active game, keep reading from it. A None frame
         # just means "no new frame this tick" — the sim hasn't advanced its
         # packet id yet (e.g. car in the menu/garage). That is NOT a disconnect,
         # so we keep polling. A reader only flips is_connected to False on an
@@ -335,7 +912,7 @@ class TelemetryCapture:
         if self.active_game in readers:
             reader = readers[self.active_game]
             if reader.is_connected:
-                return reader.read()
+                return reader.read_canonical()
             self._log(f"⚠ {labels[self.active_game]} disconnected")
             self.active_game = None
             return None
@@ -392,6 +969,10 @@ class TelemetryCapture:
             'connected': bool(self.ws_client and self.ws_client.is_connected),
             'data_count': self.data_count,
             'session_id': self.session_id,
+            'batching': self.batcher.stats(),
+            'uplink': self.uplink.stats(),
+            'latency': self.latency.stats(),
+            'fanout': self.fanout.stats() if self.fanout else None,
             'hz': self.config.update_rate_hz,
             'has_key': bool(self.config.api_key),
             'version': Config.VERSION,
@@ -0,0 +1,133 @@
+"""
+Adaptive batch sizing for the sender.
+
+The sender used to wake every 50 ms and send whatever had accumulated: tiny
+batches when little came in, huge ones after a stall. AdaptiveBatcher
+decides when the buffered frames make a batch instead, flushing on whichever
+comes first:
+
+  age     the oldest buffered frame is `age_s` old
+  frames  `max_frames` frames are buffered
+  bytes   the buffered frames would encode to about `max_bytes` (estimated
+          from the bytes per frame of recent batches)
+
+and a batch never takes more than the frame/byte limit; the rest waits for
+the next one.
+
+The age target tunes itself from the measured send latency (submit to on
+the socket, network.pipeline): while batches take longer to go out than the
+target, sending more, smaller messages only queues them up, so the target
+grows (x1.25, up to `max_age_s`); once latency is well under it (a quarter),
+it shrinks back towards `min_age_s` (x0.9) for fresher data. A send stuck on
+a full socket only reports its latency once it returns, so congested() takes
+how long the current one has been going (every sender tick) and holds the
+target at least that high meanwhile.
+
+Both steps look at the single batch's latency as well as the average: the
+batches that queued behind a stall all come back late, and the average stays
+up for a while after the link has recovered, so growing on the average alone
+kept raising the target long after the stall was over.
+
+observe() is fed by the encode pipeline's writer thread; stats() reports the
+current targets and what triggered each flush (flushed(), once the sender
+has actually taken the batch).
+"""
+
+import threading
+
+REASONS = ('age', 'frames', 'bytes')
+
+
+class AdaptiveBatcher:
+    """Flush policy for the sender: batch age, frame count or encoded size."""
+
+    def __init__(self, age_s=0.05, min_age_s=0.04, max_age_s=0.25, max_frames=120,
+                 max_bytes=64 << 10, alpha=0.2):
+        self.min_age_s = min_age_s
+        self.max_age_s = max(max_age_s, min_age_s)
+        self.age_s = min(max(age_s, self.min_age_s), self.max_age_s)
+        self.max_frames = max(1, int(max_frames))
+        self.max_bytes = max_bytes
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self.latency_s = None
+        self.bytes_per_frame = None
+        self.batches = 0
+        self.frames = 0
+        self.flushes = dict.fromkeys(REASONS, 0)
+
+    @property
+    def tick_s(self):
+        """How often the sender should check: a fraction of the age target."""
+        return max(0.005, self.min_age_s / 4)
+
+    def limit(self):
+        """Most frames one batch may take (frame cap, or the byte cap)."""
+        bpf = self.bytes_per_frame
+        if not bpf:
+            return self.max_frames
+        return max(1, min(self.max_frames, int(self.max_bytes / bpf)))
+
+    def due(self, buffered, age_s):
+        """Flush reason if `buffered` frames, the oldest `age_s` old, make a
+        batch now; None to keep waiting."""
+        if not buffered:
+            return None
+        if buffered >= self.max_frames:
+            reason = 'frames'
+        elif buffered >= self.limit():
+            reason = 'bytes'
+        elif age_s >= self.age_s:
+            reason = 'age'
+        else:
+            return None
+        return reason
+
+    def flushed(self, reason):
+        """The sender took a batch for `reason` (what due() said): counted
+        here, not in due(), since a due tick may still send nothing."""
+        with self._lock:
+            self.flushes[reason] += 1
+
+    def observe(self, frames, nbytes, latency_s):
+        """A batch of `frames` frames went out as `nbytes` bytes, `latency_s`
+        after it was submitted."""
+        a = self.alpha
+        with self._lock:
+            self.batches += 1
+            self.frames += frames
+            if frames:
+                bpf = nbytes / frames
+                self.bytes_per_frame = bpf if self.bytes_per_frame is None else (
+                    (1 - a) * self.bytes_per_frame + a * bpf)
+            lat = latency_s if self.latency_s is None else (1 - a) * self.latency_s + a * latency_s
+            self.latency_s = lat
+            if lat > self.age_s and latency_s > self.age_s:
+                self.age_s = min(self.max_age_s, self.age_s * 1.25)
+            elif latency_s < self.age_s / 4:
+                self.age_s = max(self.min_age_s, self.age_s * 0.9)
+
+    def congested(self, stalled_s):
+        """The send on the socket has been going `stalled_s` so far: its
+        latency is at least that."""
+        with self._lock:
+            if self.latency_s is None or stalled_s > self.latency_s:
+                self.latency_s = stalled_s
+            if stalled_s > self.age_s:
+                self.age_s = min(self.max_age_s, stalled_s)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'age_ms': round(self.age_s * 1000, 1),
+                'min_age_ms': round(self.min_age_s * 1000, 1),
+                'max_age_ms': round(self.max_age_s * 1000, 1),
+                'max_frames': self.max_frames,
+                'max_kb': round(self.max_bytes / 1024, 1),
+                'frame_limit': self.limit(),
+                'latency_ms': None if self.latency_s is None else round(self.latency_s * 1000, 2),
+                'bytes_per_frame': None if self.bytes_per_frame is None else round(self.bytes_per_frame, 1),
+                'batches': self.batches,
+                'frames_per_batch': round(self.frames / self.batches, 1) if self.batches else None,
+                'flushes': dict(self.flushes),
+            }
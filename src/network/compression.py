@@ -0,0 +1,127 @@
+"""
+Dictionary-primed per-batch zlib compression for outgoing telemetry.
+
+Batches are small (50 ms of frames) and independent, so on their own they
+compress poorly: most of their redundancy is against *other* batches (the
+same keys, layouts, constants). A preset dictionary trained from recorded
+sessions (scripts/train_zlib_dict.py -> network/zdict.py) gives every batch
+that shared history up front, while each batch still decompresses on its own.
+Dictionaries are versioned with the channel schema: dictionary N is the one
+trained for SCHEMA_VERSION N.
+
+Once the server's schema ack lists "zlib", each batch (JSON text or binary
+payload) is sent as a binary WebSocket message:
+
+    <2sBH   magic b"MZ", payload kind (0 = JSON text, 1 = binary batch,
+            2 = gorilla batch), dictionary version
+    ...     zlib stream (compressobj with zdict=dictionary)
+
+The compression level adapts to CPU headroom: the wall time spent
+compressing (which also grows when the sim starves us of CPU) is measured
+against the sender's batch budget, and the level steps down when it eats more
+than its share and back up when there is room. Ratio and CPU time (thread
+time) are kept per session (stats()).
+"""
+
+import struct
+import threading
+import time
+import zlib
+
+MAGIC = b"MZ"
+KIND_JSON = 0
+KIND_BINARY = 1
+KIND_GORILLA = 2
+
+ENVELOPE = struct.Struct("<2sBH")
+
+LEVELS = (1, 3, 6, 9)
+
+
+class BatchCompressor:
+    """Compresses one connection's batches; adapts its level to CPU headroom."""
+
+    def __init__(self, zdict, dict_version, budget_s=0.05, share=0.10, window=40):
+        self.zdict = zdict
+        self.dict_version = dict_version
+        # CPU headroom: compressing may use at most `share` of the sender's
+        # per-batch budget (averaged over `window` batches).
+        self.limit_s = budget_s * share
+        self.window = window
+        self.level_index = LEVELS.index(6)
+        self._win_time = 0.0
+        self._win_n = 0
+        self.batches = 0
+        self.raw_bytes = 0
+        self.sent_bytes = 0
+        self.cpu_s = 0.0
+        self.level_changes = 0
+        # Loading a 32 KB dictionary costs more than compressing a batch, so
+        # each level keeps one primed compressor and every batch works on a copy.
+        self._primed = {}
+        # Batches may be compressed on several encode workers at once
+        # (network.pipeline): the zlib work runs unlocked, bookkeeping doesn't.
+        self._lock = threading.Lock()
+
+    @property
+    def level(self):
+        return LEVELS[self.level_index]
+
+    def compress(self, payload, kind):
+        """Envelope + zlib stream for one batch payload (bytes)."""
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        with self._lock:
+            level = self.level
+            primed = self._primed.get(level)
+            if primed is None:
+                primed = self._primed[level] = zlib.compressobj(level, zdict=self.zdict)
+            c = primed.copy()
+        body = c.compress(payload) + c.flush()
+        spent = time.perf_counter() - start
+
+        out = ENVELOPE.pack(MAGIC, kind, self.dict_version) + body
+        with self._lock:
+            self.batches += 1
+            self.raw_bytes += len(payload)
+            self.sent_bytes += len(out)
+            self.cpu_s += time.thread_time() - cpu_start
+            self._adapt(spent)
+        return out
+
+    def _adapt(self, spent):
+        self._win_time += spent
+        self._win_n += 1
+        if self._win_n < self.window:
+            return
+        avg = self._win_time / self._win_n
+        self._win_time, self._win_n = 0.0, 0
+        if avg > self.limit_s and self.level_index > 0:
+            self.level_index -= 1
+            self.level_changes += 1
+        elif avg < self.limit_s / 4 and self.level_index < len(LEVELS) - 1:
+            self.level_index += 1
+            self.level_changes += 1
+
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'raw_bytes': self.raw_bytes,
+            'sent_bytes': self.sent_bytes,
+            'ratio': round(self.raw_bytes / self.sent_bytes, 2) if self.sent_bytes else None,
+            'cpu_ms': round(self.cpu_s * 1000, 1),
+            'level': self.level,
+            'level_changes': self.level_changes,
+        }
+
+
+def decompress(message, dictionaries):
+    """Reference decoder: (kind, payload bytes) from an "MZ" message.
+
+    `dictionaries` maps dictionary version -> bytes.
+    """
+    magic, kind, version = ENVELOPE.unpack_from(message, 0)
+    if magic != MAGIC:
+        raise ValueError("not a compressed telemetry batch")
+    d = zlib.decompressobj(zdict=dictionaries[version])
+    payload = d.decompress(message[ENVELOPE.size:]) + d.flush()
+    return kind, payload
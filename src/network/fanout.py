@@ -0,0 +1,358 @@
+"""
+Local fan-out of the captured frames to overlays, dashboards and loggers.
+
+Every local tool that wants live telemetry used to need its own shared-memory
+reader. FanoutServer publishes the frames this process already captures, on
+the network loop (network/loop.py), to any number of local subscribers:
+
+  WebSocket  ws://127.0.0.1:<fanout_port>/   text frames (RFC 6455, minimal:
+             no extensions, unfragmented client messages)
+  UDP        127.0.0.1:<fanout_udp_port>     one JSON datagram per frame
+
+A subscriber picks what it gets:
+
+  {"type": "subscribe", "channels": ["speed_kmh", "rpm", "ext.tyre_*"], "hz": 30}
+
+`channels` are registry channel names or fnmatch patterns (capture.schema;
+the same names as the `channel_tiers` setting), default every channel; `hz`
+caps the rate (default the capture rate), on the same period rule as the
+slow tiers (capture.tiers). A WebSocket client may instead put them in the
+URL (ws://127.0.0.1:47100/?channels=speed_kmh,rpm&hz=30) and can resubscribe
+at any time; the server greets it with {"type": "hello", ...}. A UDP
+subscriber registers the address it sends from and must repeat its subscribe
+at least every `udp_ttl_s` or it expires; {"type": "unsubscribe"} ends it
+early. Each frame goes out as
+
+  {"type": "frame", "t": <capture epoch ms>, "layout": L, "data": {name: value}}
+
+publish() runs on the capture thread and never waits: it queues the frame for
+the loop, waking it only if it isn't already due to drain (nothing at all
+with no subscribers). Each WebSocket
+subscriber has a queue of `queue_frames` (behind a small socket buffer); one
+that falls that far behind is disconnected (close 1008) rather than slowing
+anyone else down. UDP sends
+never block; a datagram the OS can't take is lost. Client messages are small
+(subscribes, or a telemetry client's ~18 KB schema announcement): a frame
+over MAX_MESSAGE bytes, or a control frame over 125, closes the connection
+(1009 / 1002) before anything is read.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import socket
+import struct
+import time
+from collections import deque
+from fnmatch import fnmatchcase
+from urllib.parse import parse_qs, urlsplit
+
+from capture.frame import is_frame
+from capture.schema import BY_ID, LAYOUTS, SCHEMA_VERSION
+
+GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+SEND_BUFFER = 64 * 1024  # per WebSocket subscriber, kernel + transport; the queue is the real bound
+MAX_MESSAGE = 64 * 1024  # largest client frame read (a schema announcement fits)
+OP_TEXT, OP_CLOSE, OP_PING, OP_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def _ws_frame(payload, opcode=OP_TEXT):
+    n = len(payload)
+    if n < 126:
+        head = struct.pack('!BB', 0x80 | opcode, n)
+    elif n < 1 << 16:
+        head = struct.pack('!BBH', 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack('!BBQ', 0x80 | opcode, 127, n)
+    return head + payload
+
+
+def _unmask(data, mask):
+    """Client payloads are XOR-masked with a repeating 4-byte key."""
+    n = len(data)
+    if not n:
+        return data
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(key, 'big')).to_bytes(n, 'big')
+
+
+class _Subscriber:
+    """One consumer: its channel filter, rate cap and (WebSocket) send queue."""
+
+    def __init__(self, name, channels=None, hz=None, queue_frames=0):
+        self.name = name
+        self.queue = asyncio.Queue(queue_frames) if queue_frames else None
+        self.sent = 0
+        self.set_filter(channels, hz)
+
+    def set_filter(self, channels=None, hz=None):
+        if isinstance(channels, str):
+            channels = [c for c in channels.split(',') if c]
+        self.channels = tuple(channels) if channels else None
+        self.hz = float(hz) if hz else None
+        self.key = self.channels  # subscribers with the same filter share one encoding
+        self._slots = {}  # layout -> [(slot, name)] the filter keeps
+        self._period = -1
+
+    def due(self, t):
+        """Rate cap: the first frame of each 1/hz period."""
+        if not self.hz:
+            return True
+        period = int(t * self.hz)
+        if period <= self._period:
+            return False
+        self._period = period
+        return True
+
+    def slots(self, layout):
+        picked = self._slots.get(layout)
+        if picked is None:
+            names = [(slot, BY_ID[cid].name) for slot, cid in enumerate(LAYOUTS[layout])]
+            if self.channels:
+                names = [(s, n) for s, n in names if any(fnmatchcase(n, p) for p in self.channels)]
+            picked = self._slots[layout] = names
+        return picked
+
+
+class _Udp(asyncio.DatagramProtocol):
+    def __init__(self, server):
+        self.server = server
+
+    def connection_made(self, transport):
+        self.server._udp = transport
+
+    def datagram_received(self, data, addr):
+        self.server._udp_message(data, addr)
+
+
+class FanoutServer:
+    """Publishes captured frames to local WebSocket / UDP subscribers."""
+
+    def __init__(self, host='127.0.0.1', port=47100, udp_port=47101, hz=120,
+                 queue_frames=240, udp_ttl_s=10.0):
+        self.host = host
+        self.port = port
+        self.udp_port = udp_port
+        self.hz = hz
+        self.queue_frames = max(1, int(queue_frames))
+        self.udp_ttl_s = udp_ttl_s
+        self.loop = None
+        self._server = None
+        self._udp = None
+        self._ws = {}   # _Subscriber -> StreamWriter
+        self._udp_subs = {}  # addr -> (_Subscriber, expiry monotonic)
+        self._pending = deque()  # (t, frame) from the capture thread
+        self._woken = False
+        self.published = 0
+        self.dropped_slow = 0
+
+    async def start(self):
+        """Open the endpoints (on the running loop). A port of None leaves
+        that endpoint off, 0 picks a free one; returns the ports bound."""
+        self.loop = asyncio.get_running_loop()
+        if self.port is not None:
+            self._server = await asyncio.start_server(self._accept, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        if self.udp_port is not None:
+            await self.loop.create_datagram_endpoint(lambda: _Udp(self),
+                                                     local_addr=(self.host, self.udp_port))
+            self.udp_port = self._udp.get_extra_info('sockname')[1]
+        return self.port, self.udp_port
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._ws.values()):
+            writer.close()
+        self._ws.clear()
+        if self._udp is not None:
+            self._udp.close()
+        self._udp_subs.clear()
+
+    @property
+    def subscribers(self):
+        return len(self._ws) + len(self._udp_subs)
+
+    # --- publishing (capture thread) ------------------------------------------
+
+    def publish(self, t, frame):
+        """Hand one captured frame (capture time in s, Frame record) to the
+        subscribers. Thread-safe, never blocks."""
+        if self.loop is None or not (self._ws or self._udp_subs) or not is_frame(frame):
+            return
+        self._pending.append((t, frame))
+        if self._woken:
+            return  # the loop hasn't drained the last wake-up yet
+        self._woken = True
+        try:
+            self.loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            pass  # loop closed
+
+    def _drain(self):
+        self._woken = False
+        while self._pending:
+            self._dispatch(*self._pending.popleft())
+
+    def _dispatch(self, t, frame):
+        self.published += 1
+        layout = frame.schema.id
+        t_ms = int(t * 1000)
+        encoded = {}
+
+        def payload(sub):
+            body = encoded.get(sub.key)
+            if body is None:
+                data = {name: frame[slot] for slot, name in sub.slots(layout)}
+                body = encoded[sub.key] = json.dumps(
+                    {'type': 'frame', 't': t_ms, 'layout': layout, 'data': data}).encode()
+            return body
+
+        for sub, writer in list(self._ws.items()):
+            if not sub.due(t):
+                continue
+            try:
+                sub.queue.put_nowait(_ws_frame(payload(sub)))
+            except asyncio.QueueFull:
+                self.dropped_slow += 1
+                print(f"⚠ Fan-out: dropped {sub.name} — {self.queue_frames} frames behind")
+                self._drop(sub, writer, 1008, b'too slow')
+
+        if self._udp_subs:
+            now = time.monotonic()
+            for addr, (sub, expiry) in list(self._udp_subs.items()):
+                if now > expiry:
+                    del self._udp_subs[addr]
+                elif sub.due(t):
+                    self._udp.sendto(payload(sub), addr)
+                    sub.sent += 1
+
+    # --- WebSocket --------------------------------------------------------------
+
+    async def _accept(self, reader, writer):
+        peer = writer.get_extra_info('peername')
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            # Loopback send buffers autotune to megabytes: a hung reader would
+            # soak up seconds of stream before its queue ever filled.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+        writer.transport.set_write_buffer_limits(SEND_BUFFER)
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        lines = head.decode('latin-1').split('\r\n')
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                k, v = line.split(':', 1)
+                headers[k.strip().lower()] = v.strip()
+        key = headers.get('sec-websocket-key')
+        if not key or 'websocket' not in headers.get('upgrade', '').lower():
+            writer.write(b'HTTP/1.1 426 Upgrade Required\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+            writer.close()
+            return
+        accept = base64.b64encode(hashlib.sha1(key.encode() + GUID).digest())
+        writer.write(b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                     b'Connection: Upgrade\r\nSec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+
+        query = parse_qs(urlsplit(lines[0].split(' ')[1] if ' ' in lines[0] else '/').query)
+        sub = _Subscriber(f"ws {peer[0]}:{peer[1]}" if peer else 'ws', (query.get('channels') or [None])[0],
+                          (query.get('hz') or [None])[0], self.queue_frames)
+        writer.write(_ws_frame(json.dumps(self._hello(sub)).encode()))
+        self._ws[sub] = writer
+        sender = asyncio.ensure_future(self._send_loop(sub, writer))
+        try:
+            await self._read_loop(sub, reader, writer)
+        finally:
+            sender.cancel()
+            self._drop(sub, writer)
+
+    async def _send_loop(self, sub, writer):
+        try:
+            while True:
+                writer.write(await sub.queue.get())
+                sub.sent += 1
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    async def _read_loop(self, sub, reader, writer):
+        try:
+            while True:
+                b1, b2 = await reader.readexactly(2)
+                opcode, n = b1 & 0x0F, b2 & 0x7F
+                if n == 126:
+                    n = struct.unpack('!H', await reader.readexactly(2))[0]
+                elif n == 127:
+                    n = struct.unpack('!Q', await reader.readexactly(8))[0]
+                if n > MAX_MESSAGE or (opcode & 0x8 and n > 125):
+                    self._drop(sub, writer, 1009 if n > MAX_MESSAGE else 1002, b'frame too big')
+                    return
+                mask = await reader.readexactly(4) if b2 & 0x80 else b'\0\0\0\0'
+                data = _unmask(await reader.readexactly(n), mask)
+                if opcode == OP_CLOSE:
+                    writer.write(_ws_frame(data[:2], OP_CLOSE))
+                    return
+                if opcode == OP_PING:
+                    writer.write(_ws_frame(data, OP_PONG))
+                elif opcode == OP_TEXT:
+                    msg = self._message(sub, data)
+                    if msg is not None:
+                        writer.write(_ws_frame(json.dumps(msg).encode()))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+
+    def _drop(self, sub, writer, code=None, reason=b''):
+        if self._ws.pop(sub, None) is None:
+            return
+        try:
+            if code is not None:
+                writer.write(_ws_frame(struct.pack('!H', code) + reason, OP_CLOSE))
+            writer.close()
+        except Exception:
+            pass
+
+    # --- messages -----------------------------------------------------------------
+
+    def _hello(self, sub):
+        return {'type': 'hello', 'schema': SCHEMA_VERSION, 'hz': self.hz,
+                'channels': list(sub.channels or ('*',)), 'rate': sub.hz or self.hz}
+
+    def _message(self, sub, data):
+        """A subscriber's JSON message; returns the reply, if any."""
+        try:
+            msg = json.loads(data)
+        except ValueError:
+            return {'type': 'error', 'error': 'not JSON'}
+        if msg.get('type') == 'subscribe':
+            sub.set_filter(msg.get('channels'), msg.get('hz'))
+            return dict(self._hello(sub), type='subscribed')
+        return None
+
+    def _udp_message(self, data, addr):
+        try:
+            msg = json.loads(data)
+        except ValueError:
+            return
+        kind = msg.get('type')
+        if kind == 'unsubscribe':
+            self._udp_subs.pop(addr, None)
+        elif kind == 'subscribe':
+            entry = self._udp_subs.get(addr)
+            sub = entry[0] if entry else _Subscriber(f"udp {addr[0]}:{addr[1]}")
+            sub.set_filter(msg.get('channels'), msg.get('hz'))
+            self._udp_subs[addr] = (sub, time.monotonic() + self.udp_ttl_s)
+            if not entry:
+                self._udp.sendto(json.dumps(dict(self._hello(sub), type='subscribed')).encode(), addr)
+
+    def stats(self):
+        return {
+            'ws': self.port,
+            'udp': self.udp_port,
+            'subscribers': self.subscribers,
+            'published': self.published,
+            'dropped_slow': self.dropped_slow,
+        }
@@ -0,0 +1,248 @@
+"""
+HTTPS bulk-upload fallback for the live stream.
+
+Some networks (corporate proxies, captive portals) never let the WebSocket
+upgrade through, and the session used to stream nothing at all. HttpBulkClient
+is a WebSocketClient whose "socket" is a run of POSTs to the REST API instead,
+so everything above the socket stays the same: tier plans, negotiated
+encodings and compression, sequence numbers, acks and resends, the encode
+pipeline and the outage spool.
+
+  POST {api_url}/sessions/{sid}/bulk/open   the schema announcement (JSON,
+                                            as sent on a new WebSocket)
+  POST {api_url}/sessions/{sid}/bulk        one chunk: exactly one message
+                                            the WebSocket would have carried
+
+Every request has the API key (Authorization: Bearer), the stream id
+(X-Stream) and the open it belongs to (X-Open, counting from 1); every chunk
+has its number within that open (X-Chunk, from 1), and the server drops
+chunks of an earlier open.
+Text messages are gzipped (Content-Encoding: gzip); binary ones (binary,
+Gorilla or zlib envelopes, with their sequence prefix) go as they are. Up to
+`in_flight` chunks are posted at once over the pooled keep-alive session
+(network/rest.py), so the server applies them in X-Chunk order, not arrival
+order. A response is {"messages": [...]}: what the server would have sent on
+the WebSocket (the schema ack to the open, acks to chunks), handled the same
+way. Each chunk's round trip (server time included) is the RTT sample:
+ping() sends nothing here.
+
+A failed chunk closes the upload like a dropped WebSocket: queued batches go
+to the spool, and the client reopens with the same backoff as the WebSocket's
+reconnect loop. So does abort() (the encode pipeline's send timeout): a send
+waiting for a slot gives up once the upload is closed. A new open restarts
+the chunk numbering (the server forgets chunks it held back for a gap), and
+the resend window sends again whatever wasn't acked.
+
+open_stream() picks the transport for a session: the WebSocket first, this
+when it can't connect (`transport` "auto").
+"""
+
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+import websocket
+
+from network import rest
+from network.websocket_client import WebSocketClient
+
+
+class HttpBulkClient(WebSocketClient):
+    """WebSocketClient's streaming API over pooled HTTPS POSTs."""
+
+    def __init__(self, url: str, api_key: str, tier_plans: Optional[dict] = None,
+                 resend_window: int = 600, ack_timeout: float = 3.0, in_flight: int = 4,
+                 verify=False):
+        super().__init__(url, api_key, tier_plans, resend_window, ack_timeout)
+        self.in_flight = max(1, int(in_flight))
+        self.verify = verify
+        self._slots = threading.BoundedSemaphore(self.in_flight)
+        self._pool = ThreadPoolExecutor(max_workers=self.in_flight, thread_name_prefix='bulk')
+        self._lock = threading.Lock()
+        self._chunk = 0   # last chunk number since the open
+        self._opened = 0  # opens so far: failures of an older one don't count
+        self._posting = 0
+        self.chunks = 0
+        self.failures = 0
+        self.bytes_sent = 0
+        self.max_posting = 0
+
+    def connect(self, timeout: float = 10):
+        """Open the upload (the announcement POST, up to `timeout` s)."""
+        print(f"DEBUG HTTP: Opening bulk upload: {self.url}")
+        start = time.monotonic()
+        self.running = True
+        ok = self._open(timeout)
+        self.connect_time_s = time.monotonic() - start
+        print(f"DEBUG HTTP: Connection status: {ok} ({self.connect_time_s * 1000:.0f} ms)")
+        if not ok:
+            self.running = False
+        return ok
+
+    def disconnect(self, timeout: float = 2.0):
+        """Stop; chunks already posted get up to `timeout` s to finish."""
+        self.running = False
+        self.flush(timeout)
+        self.connected = False
+        self._pool.shutdown(wait=False)
+
+    def flush(self, timeout: float = 1.0):
+        """Wait (up to `timeout` s) until no chunk is in flight."""
+        deadline = time.monotonic() + timeout
+        taken = 0
+        try:
+            while taken < self.in_flight and self._slots.acquire(timeout=max(0, deadline - time.monotonic())):
+                taken += 1
+        finally:
+            for _ in range(taken):
+                self._slots.release()
+        return taken == self.in_flight
+
+    def send(self, message, opcode=websocket.ABNF.OPCODE_TEXT):
+        """Post one message as the stream's next chunk (the WebSocket's
+        send()). Blocks while `in_flight` chunks are out."""
+        if not self.connected:
+            raise ConnectionError("HTTP bulk upload is closed")
+        while not self._slots.acquire(timeout=0.1):
+            if not self.connected:
+                raise ConnectionError("HTTP bulk upload is closed")
+        with self._lock:
+            self._chunk += 1
+            chunk, opened = self._chunk, self._opened
+        binary = opcode == websocket.ABNF.OPCODE_BINARY
+        self._pool.submit(self._post, chunk, opened, message, binary)
+
+    def abort(self, reason):
+        """Close the upload now (chunks stuck in flight): reopen like a
+        failed chunk."""
+        self._lost(self._opened, reason)
+
+    def ping(self):
+        """Every chunk's request is timed instead."""
+        return False
+
+    def _headers(self, content_type, opened):
+        return {'Authorization': f'Bearer {self.api_key}', 'Content-Type': content_type,
+                'X-Stream': self.stream, 'X-Open': str(opened)}
+
+    def _open(self, timeout=None):
+        self._reset_stream()
+        opening = self._opened + 1
+        kwargs = {'timeout': (min(3.05, timeout), timeout)} if timeout else {}
+        try:
+            resp = rest.post(f"{self.url}/open", 'bulk_open', data=json.dumps(self._announcement()),
+                             headers=self._headers('application/json', opening), verify=self.verify,
+                             **kwargs)
+        except requests.exceptions.RequestException as e:
+            print(f"HTTP bulk upload unreachable: {e}")
+            return False
+        if resp.status_code != 200:
+            print(f"HTTP bulk upload refused: {resp.status_code}")
+            return False
+        with self._lock:
+            self._chunk = 0
+            self._opened = opening
+        self.ws = self
+        self.connected = True
+        self.reconnect_attempts = 0
+        print("✓ HTTP bulk upload open")
+        self._replies(resp)
+        if self.on_connected:
+            self.on_connected()
+        return True
+
+    def _post(self, chunk, opened, message, binary):
+        with self._lock:
+            self._posting += 1
+            self.max_posting = max(self.max_posting, self._posting)
+        try:
+            if binary:
+                body, headers = message, self._headers('application/octet-stream', opened)
+            else:
+                body, headers = gzip.compress(message.encode(), 1), self._headers('application/json', opened)
+                headers['Content-Encoding'] = 'gzip'
+            headers['X-Chunk'] = str(chunk)
+            start = time.monotonic()
+            resp = rest.post(self.url, 'bulk', data=body, headers=headers, verify=self.verify)
+            if resp.status_code != 200:
+                raise ConnectionError(f"chunk {chunk}: HTTP {resp.status_code}")
+            self._rtt(time.monotonic() - start)
+            with self._lock:
+                self.chunks += 1
+                self.bytes_sent += len(body)
+            self._replies(resp)
+        except Exception as e:
+            self._lost(opened, e)
+        finally:
+            with self._lock:
+                self._posting -= 1
+            self._slots.release()
+
+    def _replies(self, resp):
+        """Server messages in a response, handled as WebSocket messages."""
+        try:
+            messages = resp.json().get('messages') or ()
+        except ValueError:
+            return
+        for msg in messages:
+            self._on_message(self, json.dumps(msg))
+
+    def _lost(self, opened, error):
+        """A chunk failed: close the upload (once per open) and reopen."""
+        with self._lock:
+            self.failures += 1
+            if opened != self._opened or not self.connected:
+                return
+            self.connected = False
+        print(f"HTTP bulk upload lost: {error}")
+        self.schema_version = None
+        self.compress = False
+        self.acked = False
+        self.replan = False
+        if self.on_disconnected:
+            self.on_disconnected()
+        if self.running:
+            threading.Thread(target=self._reopen, daemon=True).start()
+
+    def _reopen(self):
+        """The WebSocket's reconnect loop, for the upload."""
+        while self.running and self.reconnect_attempts < self.max_reconnect_attempts:
+            self.reconnect_attempts += 1
+            print(f"Reconnecting... (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})")
+            time.sleep(self.reconnect_delay * self.reconnect_attempts)
+            if self.running and self._open():
+                return
+
+    def transport_stats(self):
+        with self._lock:
+            return {
+                'chunks': self.chunks,
+                'failures': self.failures,
+                'sent_kb': round(self.bytes_sent / 1024, 1),
+                'max_in_flight': self.max_posting,
+            }
+
+
+def open_stream(make_ws, make_bulk, transport='auto', log=print):
+    """Connected client for a session, or None.
+
+    `transport` "websocket" or "http" uses only that one; "auto" tries the
+    WebSocket first and falls back to the bulk upload if it can't connect.
+    `make_ws` / `make_bulk` build the (unconnected) clients.
+    """
+    if transport != 'http':
+        ws = make_ws()
+        if ws.connect():
+            return ws
+        if transport == 'websocket':
+            return None
+        log("↯ WebSocket unreachable — falling back to HTTPS bulk upload")
+    bulk = make_bulk()
+    if bulk.connect():
+        return bulk
+    bulk.disconnect(0)
+    return None
@@ -0,0 +1,124 @@
+"""
+Per-batch latency of the live stream and the link's round-trip time.
+
+How stale is what the pit wall sees? Every batch that goes out is timed at
+four points, on the wall clock the capture loop stamps frames with
+(network/pipeline.py):
+
+  captured   its oldest frame was read
+  enqueued   the sender handed it to the encode stage
+  encoded    a worker finished serialising + compressing it
+  sent       the writer put it on the socket
+
+which gives the stages capture→enqueue (batching and any buffer backlog),
+enqueue→encoded (waiting for a worker, then encode), encoded→sent (waiting
+for its turn, then the socket write) and capture→sent overall. RTT samples
+come from the client's own probes: WebSocket ping frames carrying their send
+time (any RFC 6455 server echoes them), or on the HTTPS bulk upload each
+chunk's request, server time included. capture→sent + RTT/2 estimates how old
+a frame is by the time the server has it.
+
+Two views: a rolling window of the latest samples (UI state, status line),
+and histograms for the whole session (log-spaced bins, 4% wide, so no samples
+are kept) for the percentiles logged when it ends.
+"""
+
+import math
+import threading
+from collections import deque
+
+STAGES = ('capture_enqueue', 'enqueue_encoded', 'encoded_sent', 'capture_sent')
+
+
+class _Histogram:
+    """Log-spaced bins from 0.1 ms up: percentiles to within ~2%."""
+
+    BASE = 1e-4
+    STEP = math.log(1.04)
+
+    def __init__(self):
+        self.counts = {}
+        self.n = 0
+        self.max = 0.0
+
+    def add(self, s):
+        b = int(math.log(max(s, self.BASE) / self.BASE) / self.STEP)
+        self.counts[b] = self.counts.get(b, 0) + 1
+        self.n += 1
+        self.max = max(self.max, s)
+
+    def percentile(self, q):
+        if not self.n:
+            return None
+        seen, rank = 0, q * self.n
+        for b in sorted(self.counts):
+            seen += self.counts[b]
+            if seen >= rank:
+                return min(self.max, self.BASE * math.exp((b + 0.5) * self.STEP))
+        return self.max
+
+
+def _ms(s):
+    return None if s is None else round(s * 1000, 1)
+
+
+def _sorted_pct(samples):
+    if not samples:
+        return {'p50': None, 'p95': None, 'p99': None}
+    s = sorted(samples)
+    return {q: _ms(s[min(len(s) - 1, int(len(s) * f))])
+            for q, f in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))}
+
+
+def _hist_pct(h):
+    return {q: _ms(h.percentile(f)) for q, f in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))}
+
+
+class LatencyTracker:
+    """Stage latencies per batch + RTT: rolling window and session totals."""
+
+    def __init__(self, window=500):
+        self._lock = threading.Lock()
+        self._recent = {s: deque(maxlen=window) for s in STAGES + ('rtt',)}
+        self._session = {s: _Histogram() for s in STAGES + ('rtt',)}
+
+    def batch(self, captured, enqueued, encoded, sent):
+        """A batch went out (encode pipeline's writer thread); wall-clock s."""
+        values = (enqueued - captured, encoded - enqueued, sent - encoded, sent - captured)
+        with self._lock:
+            for stage, v in zip(STAGES, values):
+                v = max(0.0, v)
+                self._recent[stage].append(v)
+                self._session[stage].add(v)
+
+    def rtt(self, seconds):
+        """A round-trip sample (client callback)."""
+        with self._lock:
+            self._recent['rtt'].append(seconds)
+            self._session['rtt'].add(seconds)
+
+    def new_session(self):
+        """Start the session totals over (the rolling window carries on)."""
+        with self._lock:
+            self._session = {s: _Histogram() for s in STAGES + ('rtt',)}
+
+    @staticmethod
+    def _staleness(out):
+        total, rtt = out['capture_sent']['p50'], out['rtt']['p50']
+        return None if total is None else round(total + (rtt or 0) / 2, 1)
+
+    def stats(self):
+        """Latest window, ms: {stage: {p50, p95, p99}}, RTT, staleness estimate."""
+        with self._lock:
+            out = {s: _sorted_pct(self._recent[s]) for s in self._recent}
+        out['staleness_ms'] = self._staleness(out)
+        return out
+
+    def session_stats(self):
+        """The same over the whole session so far, plus sample counts."""
+        with self._lock:
+            out = {s: _hist_pct(h) for s, h in self._session.items()}
+            out['batches'] = self._session['capture_sent'].n
+            out['rtt_samples'] = self._session['rtt'].n
+        out['staleness_ms'] = self._staleness(out)
+        return out
@@ -0,0 +1,59 @@
+"""
+One asyncio event loop for the network side of the app.
+
+Session monitoring, session start/end (REST), WebSocket handshakes, outage
+spool replay and the ~20 Hz batch sender used to be a thread each (or a
+thread per session start / recovery run), all polling with time.sleep().
+NetworkLoop runs them as coroutines on a single thread instead; capture still
+hands frames over through its lock-protected buffer (TelemetryCapture._send_buf).
+
+Blocking library calls (requests, websocket-client's handshake) go through
+call(), which runs them on a small executor so they never stall the loop (two
+threads by default, so a slow handshake doesn't hold up a REST call). The
+WebSocket read side stays websocket-client's own run_forever() thread per
+connection, and encoding/sending stays on the encode pipeline
+(network/pipeline.py); the loop only decides what goes out when, which is
+where flow control belongs.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class NetworkLoop:
+    """An asyncio loop on its own thread, plus an executor for blocking calls."""
+
+    def __init__(self, io_workers=2):
+        self._io = ThreadPoolExecutor(max_workers=max(1, int(io_workers)), thread_name_prefix='net-io')
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(self._io)
+        self._thread = threading.Thread(target=self._run, name='network', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def spawn(self, coro):
+        """Schedule a coroutine on the loop from any thread; returns a
+        concurrent.futures.Future (done() / result())."""
+        return asyncio.run_coroutine_threadsafe(self._guard(coro), self.loop)
+
+    @staticmethod
+    async def _guard(coro):
+        try:
+            return await coro
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠ Network task error: {e}")
+
+    async def call(self, fn, *args, **kwargs):
+        """Run a blocking function on the I/O executor and await its result."""
+        return await self.loop.run_in_executor(self._io, lambda: fn(*args, **kwargs))
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2)
+        self._io.shutdown(wait=False)
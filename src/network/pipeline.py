@@ -0,0 +1,271 @@
+"""
+Off-critical-path encode stage for outgoing telemetry batches.
+
+The sender thread used to drain the buffer, serialise the batch (json.dumps,
+binary or Gorilla, then zlib) and ws.send it all on one thread, so encode
+time directly delayed the next send. EncodePipeline splits that in three:
+
+  sender thread   WebSocketClient.prepare_batch(): tier sampling and ext
+                  deltas carry state from batch to batch, so they stay serial
+  worker pool     WebSocketClient.encode_batch(): serialise + compress,
+                  several batches at a time
+  writer thread   WebSocketClient.send_encoded(), strictly in submit order
+
+At most `depth` batches are in flight (prepared, encoding or waiting for
+their turn on the socket). submit() blocks while the stage is full, which
+holds frames back in the capture buffer (whose bound drops the oldest)
+instead of queueing work without limit.
+
+Only the writer thread touches the socket, so only it blocks when the socket
+buffer is full; stalled() says for how long the current send has been at it
+(the sender feeds that to the batcher and the uplink ladder before the send
+returns). With `send_timeout_s`, a watchdog thread aborts the client's
+connection once a send has taken longer than that (client.abort()): the send
+fails, the batches queued behind it go to the spool as below, and the client
+reconnects.
+
+Workers are threads, not processes: Frame record classes are generated at
+import and don't pickle, and each connection's encoders (tier plans, the
+compressor with its adaptive level and session stats) would have to be
+mirrored into every process. zlib releases the GIL while it compresses;
+json.dumps and the pure-Python codecs don't, so the win is mainly taking
+encode time off the sender's path rather than parallel CPU.
+
+Each batch that goes out is reported to `on_sent(frames, bytes, latency_s)`
+(the adaptive batcher, network/batcher.py). A batch that fails to encode or
+send is handed to `on_failed(client, frames, times)` (the outage spool,
+network/spool.py), in order, and leaves the client's resend window
+(network/resend.py). So is everything already queued behind it, even if the
+link comes back meanwhile: otherwise those batches would overtake the ones
+waiting in the spool. The client is told (forget()), since the ext deltas and
+tier cadences of later batches were built on the lost one's rows: those
+prepared before it heard go the same way (stale()), the next one prepared
+starts from keyframes.
+
+With a `latency` tracker (network/latency.py), every batch that goes out is
+also timed capture -> enqueued -> encoded -> sent on the wall clock.
+
+submit_message() queues a ready text message (a new tier plan, say) in the
+same order, so it reaches the server between the batches it belongs between.
+
+stats() reports encode time per batch, time on the socket per send, time
+from submit to sent, time the sender spent blocked on a full stage, in-flight
+depth and send timeouts.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+def _percentiles(samples):
+    if not samples:
+        return {'p50': None, 'p95': None, 'max': None}
+    s = sorted(samples)
+    return {
+        'p50': round(s[len(s) // 2] * 1000, 2),
+        'p95': round(s[min(len(s) - 1, int(len(s) * 0.95))] * 1000, 2),
+        'max': round(s[-1] * 1000, 2),
+    }
+
+
+class EncodePipeline:
+    """Encodes batches on a worker pool and sends them in order."""
+
+    def __init__(self, workers=2, depth=8, window=1000, on_failed=None, on_sent=None, latency=None,
+                 send_timeout_s=None):
+        self.workers = max(1, int(workers))
+        self.depth = max(1, int(depth))
+        self.on_failed = on_failed
+        self.on_sent = on_sent
+        self.latency = latency
+        self.send_timeout_s = send_timeout_s
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='encode')
+        self._slots = threading.BoundedSemaphore(self.depth)
+        self._order = queue.Queue()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.frames_in_flight = 0
+        self.max_in_flight = 0
+        self.batches = 0
+        self.failed = 0
+        self.timeouts = 0
+        self._failing = False
+        self._sending = None  # (client, perf_counter at start) of the send on the socket
+        self._encode_s = deque(maxlen=window)
+        self._send_s = deque(maxlen=window)
+        self._latency_s = deque(maxlen=window)
+        self._blocked_s = 0.0
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        if send_timeout_s:
+            threading.Thread(target=self._watch_loop, daemon=True).start()
+
+    def wait_for_room(self, timeout):
+        """True once a batch can be submitted without blocking (one submitter)."""
+        if not self._slots.acquire(timeout=timeout):
+            return False
+        self._slots.release()
+        return True
+
+    @property
+    def room(self):
+        """Batches that can be submitted right now without blocking."""
+        with self._lock:
+            return self.depth - self.in_flight
+
+    def submit(self, client, frames, times=None, seq=None):
+        """Prepare a batch now and queue it for encoding; blocks while full.
+        `seq` resends a batch from the client's window.
+
+        Returns False if the client had nothing to send.
+        """
+        start = time.perf_counter()
+        self._slots.acquire()
+        waited = time.perf_counter() - start
+        job = client.prepare_batch(frames, times, seq)
+        if job is None:
+            self._slots.release()
+            return False
+        epoch = client.epoch
+        with self._lock:
+            self._blocked_s += waited
+            self.in_flight += 1
+            self.frames_in_flight += len(frames)
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        future = self._pool.submit(self._encode, client.encode_batch, job)
+        self._order.put((client, future, time.perf_counter(), time.time(), frames, times, epoch))
+        return True
+
+    def submit_message(self, client, message):
+        """Queue a text message (e.g. a new tier plan) to go out in order with
+        the batches around it; blocks while full like submit()."""
+        self._slots.acquire()
+        with self._lock:
+            self.in_flight += 1
+        future = Future()
+        future.set_result((message, False, None, 0.0, None))
+        self._order.put((client, future, time.perf_counter(), time.time(), (), None, None))
+
+    def stalled(self):
+        """Seconds the send now on the socket has been going (0 between sends)."""
+        sending = self._sending
+        return time.perf_counter() - sending[1] if sending else 0.0
+
+    @staticmethod
+    def _encode(encode_batch, job):
+        start = time.perf_counter()
+        payload, binary, seq = encode_batch(job)
+        return payload, binary, seq, time.perf_counter() - start, time.time()
+
+    def _write_loop(self):
+        while True:
+            client, future, submitted, enqueued, frames, times, epoch = self._order.get()
+            seq = None
+            try:
+                payload, binary, seq, spent, encoded = future.result()
+                sent = (not (self._failing and self.on_failed) and not client.stale(epoch)
+                        and self._send(client, payload, binary))
+            except Exception as e:
+                print(f"Error encoding telemetry batch: {e}")
+                spent, sent = None, False
+            if not frames:
+                # A control message: lost with the link if it fails, and the
+                # client re-announces its state on reconnect.
+                with self._lock:
+                    self.in_flight -= 1
+                    self._failing = self._failing and self.in_flight > 0
+                self._slots.release()
+                continue
+            if not sent:
+                try:
+                    # Without a spool it stays in the resend window.
+                    client.forget(seq if self.on_failed else None, epoch)
+                    if self.on_failed:
+                        self.on_failed(client, frames, times)
+                except Exception as e:
+                    print(f"Error spooling telemetry batch: {e}")
+            latency = time.perf_counter() - submitted
+            if sent and self.on_sent:
+                try:
+                    self.on_sent(len(frames), len(payload), latency)
+                except Exception as e:
+                    print(f"Error in on_sent: {e}")
+            if sent and self.latency is not None and times:
+                self.latency.batch(times[0], enqueued, encoded, time.time())
+            with self._lock:
+                self.in_flight -= 1
+                self.frames_in_flight -= len(frames)
+                # Keep failing until the queue behind the failure has drained.
+                self._failing = not sent and self.in_flight > 0
+                if sent:
+                    self.batches += 1
+                    self._latency_s.append(latency)
+                else:
+                    self.failed += 1
+                if spent is not None:
+                    self._encode_s.append(spent)
+            self._slots.release()
+
+    def _send(self, client, payload, binary):
+        sending = self._sending = (client, time.perf_counter())
+        try:
+            return client.send_encoded(payload, binary)
+        finally:
+            self._sending = None
+            with self._lock:
+                self._send_s.append(time.perf_counter() - sending[1])
+
+    def _watch_loop(self):
+        """Abort the connection under a send that takes longer than
+        `send_timeout_s` (once per send)."""
+        timeout = self.send_timeout_s
+        aborted = None
+        while True:
+            time.sleep(min(0.1, timeout / 4))
+            sending = self._sending
+            if sending is None or sending is aborted:
+                continue
+            stalled = time.perf_counter() - sending[1]
+            if stalled < timeout:
+                continue
+            aborted = sending
+            with self._lock:
+                self.timeouts += 1
+            print(f"⚠ Send blocked for {stalled:.1f} s — dropping the connection")
+            try:
+                sending[0].abort(f"send blocked for {stalled:.1f} s")
+            except Exception as e:
+                print(f"Error aborting the connection: {e}")
+
+    def flush(self, timeout=1.0):
+        """Wait (up to `timeout` s) until every submitted batch has been sent."""
+        deadline = time.monotonic() + timeout
+        taken = 0
+        try:
+            while taken < self.depth and self._slots.acquire(timeout=max(0, deadline - time.monotonic())):
+                taken += 1
+        finally:
+            for _ in range(taken):
+                self._slots.release()
+        return taken == self.depth
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'depth': self.depth,
+                'in_flight': self.in_flight,
+                'frames_in_flight': self.frames_in_flight,
+                'max_in_flight': self.max_in_flight,
+                'batches': self.batches,
+                'failed': self.failed,
+                'encode_ms': _percentiles(self._encode_s),
+                'send_ms': _percentiles(self._send_s),
+                'latency_ms': _percentiles(self._latency_s),
+                'blocked_ms': round(self._blocked_s * 1000, 1),
+                'stalled_ms': round(self.stalled() * 1000, 1),
+                'timeouts': self.timeouts,
+            }
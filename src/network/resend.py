@@ -0,0 +1,143 @@
+"""
+Batch sequence numbers, server acks and the at-least-once resend window.
+
+Once the server's schema ack lists "ack", every telemetry batch carries a
+sequence number, increasing by one per batch for the lifetime of the
+WebSocketClient (across reconnects). Together with the client's `stream` id,
+sent in the schema announcement, (stream, seq) is the batch's dedupe key: a
+resent batch keeps its seq, so the server can drop copies it already has.
+
+  text frames    a "seq" field in the JSON message
+  binary frames  an 8-byte prefix in front of the payload (which may itself
+                 be a zlib envelope, a binary or a Gorilla batch):
+
+                     <2sQ   magic b"MS", seq
+
+The server acks cumulatively, {"type": "ack", "seq": N} meaning every batch
+up to N has arrived, whatever order they came in; an optional "received"
+list names batches past N that arrived too (so a gap doesn't hold back
+everything behind it). Unacked batches stay in a
+bounded in-memory window as the captured frames, not the wire payload: the
+payload's encoding depends on per-connection state (tier cadence, ext deltas,
+negotiated formats). Batches go out again
+
+  - after a reconnect, once the new connection's schema is acked, and
+  - when they have gone `ack_timeout` seconds without an ack,
+
+re-encoded standalone (whole rows, no tier sampling or deltas, with their
+capture times) so they decode on their own whatever arrived before them.
+Past `max_batches` the oldest unacked batch leaves the window and is counted
+in `evicted`; a batch whose send fails leaves it too (the outage spool,
+network/spool.py, takes it over).
+"""
+
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+MAGIC = b"MS"
+ENVELOPE = struct.Struct("<2sQ")
+
+
+def wrap(seq, payload):
+    """Binary frame for `payload` with its sequence number in front."""
+    return ENVELOPE.pack(MAGIC, seq) + payload
+
+
+def unwrap(message):
+    """(seq, payload) of a binary frame; seq is None if it has no prefix."""
+    if message[:2] != MAGIC:
+        return None, message
+    _, seq = ENVELOPE.unpack_from(message)
+    return seq, message[ENVELOPE.size:]
+
+
+class ResendWindow:
+    """Unacked batches of one client, oldest first."""
+
+    def __init__(self, max_batches=600, ack_timeout=3.0):
+        self.max_batches = max_batches
+        self.ack_timeout = ack_timeout
+        self._lock = threading.Lock()
+        self._unacked = OrderedDict()  # seq -> [frames, times, sent at]
+        self.next_seq = 1
+        self.acked_seq = 0
+        self.acked = 0
+        self.resent = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._unacked)
+
+    def add(self, frames, times, seq=None):
+        """Track a batch about to go out; returns its seq (a new one unless
+        `seq` is given, for a resend)."""
+        with self._lock:
+            if seq is not None:
+                entry = self._unacked.get(seq)
+                if entry is not None:  # else acked or dropped meanwhile
+                    entry[2] = time.monotonic()
+                    self.resent += 1
+                return seq
+            seq = self.next_seq
+            self.next_seq += 1
+            self._unacked[seq] = [frames, times, time.monotonic()]
+            while len(self._unacked) > self.max_batches:
+                self._unacked.popitem(last=False)
+                self.evicted += 1
+            return seq
+
+    def pending_frames(self):
+        """Frames in the unacked batches."""
+        with self._lock:
+            return sum(len(entry[0]) for entry in self._unacked.values())
+
+    def forget(self, seq):
+        """Stop tracking a batch that never made it onto the socket."""
+        with self._lock:
+            self._unacked.pop(seq, None)
+
+    def ack(self, seq, received=()):
+        """Everything up to `seq` has arrived, plus the seqs in `received`."""
+        with self._lock:
+            if seq > self.acked_seq:
+                self.acked_seq = seq
+                while self._unacked:
+                    first = next(iter(self._unacked))
+                    if first > seq:
+                        break
+                    del self._unacked[first]
+                    self.acked += 1
+            for s in received:
+                if self._unacked.pop(s, None) is not None:
+                    self.acked += 1
+
+    def rewind(self):
+        """New connection: everything unacked is due again right away."""
+        with self._lock:
+            for entry in self._unacked.values():
+                entry[2] = 0.0
+
+    def due(self, limit):
+        """Up to `limit` (seq, frames, times) to send again, oldest first."""
+        out = []
+        with self._lock:
+            deadline = time.monotonic() - self.ack_timeout
+            for seq, entry in self._unacked.items():
+                if len(out) >= limit:
+                    break
+                if entry[2] <= deadline:
+                    entry[2] = time.monotonic()  # not picked again before it's resent
+                    out.append((seq, entry[0], entry[1]))
+        return out
+
+    def stats(self):
+        with self._lock:
+            return {
+                'unacked': len(self._unacked),
+                'acked': self.acked,
+                'resent': self.resent,
+                'evicted': self.evicted,
+                'next_seq': self.next_seq,
+            }
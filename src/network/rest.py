@@ -0,0 +1,107 @@
+"""
+Process-wide pooled HTTP client for the REST API (and the update check).
+
+Every REST call used to be a bare requests.get/post, so each one paid for a
+fresh TCP + TLS handshake. All of them now go through one requests.Session:
+
+  - keep-alive connection pool per host, shared by every thread;
+  - retries with exponential backoff on connection errors (for any method:
+    the request never reached the server), and on 502/503/504 and read
+    timeouts for idempotent methods only, so a slow session create is never
+    sent twice;
+  - per-endpoint (connect, read) timeouts from TIMEOUTS, instead of one
+    number picked at every call site.
+
+prewarm(url) resolves DNS and opens (TLS included) a pooled connection in the
+background, so the first real call — the session create when the sim goes
+live — reuses it.
+
+TLS verification stays the caller's choice (verify=...), as before.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds per endpoint.
+TIMEOUTS = {
+    'default': (3.05, 10),
+    'session_create': (3.05, 10),
+    'session_end': (3.05, 5),
+    'auth': (3.05, 10),
+    'update_check': (3.05, 8),
+    'update_download': (5, 180),
+    'prewarm': (3.05, 5),
+    'bulk_open': (3.05, 10),
+    'bulk': (3.05, 15),
+}
+
+_session = None
+_lock = threading.Lock()
+_warmed = {}  # url -> time of the last prewarm
+
+
+def _retry():
+    return Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status=2,
+        backoff_factor=0.25,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'PATCH'},
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def session():
+    """The shared requests.Session (created on first use)."""
+    global _session
+    with _lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry())
+            s.mount('https://', adapter)
+            s.mount('http://', adapter)
+            _session = s
+        return _session
+
+
+def request(method, url, endpoint='default', **kwargs):
+    """requests.request through the shared session, with the endpoint's timeout."""
+    kwargs.setdefault('timeout', TIMEOUTS.get(endpoint, TIMEOUTS['default']))
+    return session().request(method, url, **kwargs)
+
+
+def get(url, endpoint='default', **kwargs):
+    return request('GET', url, endpoint, **kwargs)
+
+
+def post(url, endpoint='default', **kwargs):
+    return request('POST', url, endpoint, **kwargs)
+
+
+def patch(url, endpoint='default', **kwargs):
+    return request('PATCH', url, endpoint, **kwargs)
+
+
+def prewarm(url, verify=False, max_age_s=0):
+    """Open a pooled connection to `url`'s host (DNS + TCP + TLS) now.
+
+    `verify` must match the calls that should reuse the connection: pools are
+    keyed by TLS settings. Skipped if the same url was warmed less than
+    `max_age_s` ago. Never raises; returns True if the server answered at all.
+    """
+    now = time.monotonic()
+    if max_age_s and now - _warmed.get(url, -max_age_s) < max_age_s:
+        return True
+    _warmed[url] = now
+    try:
+        request('HEAD', url, 'prewarm', verify=verify, allow_redirects=False)
+        return True
+    except requests.exceptions.RequestException:
+        return False
@@ -0,0 +1,336 @@
+"""
+Durable on-disk spool for telemetry the WebSocket could not deliver.
+
+While the connection is down, or when a send fails, the captured batch
+(capture times + Frame records) is appended here instead of being dropped.
+Once the connection is back the spool is replayed in order, at a capped
+catch-up rate, through the normal send path, so the new connection encodes it
+with whatever it negotiated (tiers, deltas, binary...). New batches queue
+behind the backlog until it is drained, so the server sees capture order.
+
+One directory per backend session (spool_dir/<session id>/) holds
+append-only segments 00000001.mgrc, 00000002.mgrc, ... Each is a Gorilla
+recording (capture.gorilla): self-describing, with millisecond capture
+times and floats kept to their registered precision. A crash leaves at worst
+a torn last record, which is skipped. A new segment starts every
+`segment_bytes`; past `max_bytes` the oldest segment is dropped. `cursor`
+holds how far replay got and is rewritten atomically at most once a second,
+so a crash replays at most a second twice instead of losing anything.
+
+Spool.scan(root) is the startup crash-recovery scan: sessions with spooled
+data left over from an earlier run.
+
+The live session's spool is written from the network loop (the sender) and
+the encode pipeline's writer thread, and an append encodes, writes and every
+second fsyncs. SpoolWriter does that disk work on a thread of its own, in
+the order it was queued: append() only counts the batch as queued on its
+spool (so `pending` holds from then on, and new batches keep queueing
+behind it) and returns, and call() runs anything else that has to come
+after the appends queued so far (the replay's peek()/consume(), opening a
+spool) and returns a Future.
+"""
+
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import Future, wait
+from pathlib import Path
+
+from capture.frame import SCHEMAS, is_frame
+from capture.gorilla import RecordingWriter, decode, scan_recording
+from capture.schema import SCHEMA_VERSION
+
+SUFFIX = ".mgrc"
+CURSOR = "cursor"
+
+
+class Spool:
+    """Append-only segmented on-disk queue of captured batches for one session."""
+
+    def __init__(self, directory, segment_bytes=4 << 20, max_bytes=512 << 20):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._writer = None
+        self._writer_seq = None
+        self._segments = sorted(int(p.stem) for p in self.dir.glob("*" + SUFFIX) if p.stem.isdigit())
+        self._cursor = self._load_cursor()
+        self._cache = None  # (seq, size, data, catalog, spans) of the segment being read
+        self._peeked = []
+        self._last_sync = self._last_cursor_save = time.monotonic()
+        self.bytes = sum(self._path(s).stat().st_size for s in self._segments)
+        self.appended = 0
+        self.replayed = 0
+        self.dropped = 0
+        self.queued = 0  # batches waiting on a SpoolWriter
+        for seq in [s for s in self._segments if s < self._cursor[0]]:
+            self._remove(seq)  # replayed before a crash, not yet deleted
+        # Leftovers from an earlier run: count what the cursor hasn't passed.
+        self.pending_batches = self.pending_frames = 0
+        for seq in self._segments:
+            for frames, _ in self._unread(seq):
+                self.pending_batches += 1
+                self.pending_frames += len(frames)
+
+    @property
+    def pending(self):
+        return self.pending_batches > 0 or self.queued > 0
+
+    def _path(self, seq):
+        return self.dir / f"{seq:08d}{SUFFIX}"
+
+    # --- cursor --------------------------------------------------------------
+
+    def _load_cursor(self):
+        try:
+            c = json.loads((self.dir / CURSOR).read_text())
+            return c["segment"], c["offset"]
+        except (OSError, ValueError, KeyError):
+            return (self._segments[0] if self._segments else 1), 0
+
+    def _save_cursor(self):
+        tmp = self.dir / (CURSOR + ".tmp")
+        seq, offset = self._cursor
+        tmp.write_text(json.dumps({"segment": seq, "offset": offset}))
+        os.replace(tmp, self.dir / CURSOR)
+        self._last_cursor_save = time.monotonic()
+
+    # --- writing -------------------------------------------------------------
+
+    def append(self, frames, times):
+        """Spool one captured batch (Frame records; anything else is dropped)."""
+        with self._lock:
+            runs = []
+            for t, f in zip(times, frames):
+                if not is_frame(f):
+                    self.dropped += 1
+                    continue
+                if runs and runs[-1][0] == f.schema.id:
+                    runs[-1][1].append(f)
+                    runs[-1][2].append(t)
+                else:
+                    runs.append((f.schema.id, [f], [t]))
+            if not runs:
+                return
+            w = self._segment_writer()
+            before = w.tell()
+            for layout, fr, ts in runs:
+                t0 = int(ts[0] * 1000)
+                w.write(layout, SCHEMA_VERSION,
+                        [{"t0": t0, "t": [int(t * 1000) - t0 for t in ts], "data": fr}], False)
+                self.pending_batches += 1
+                self.pending_frames += len(fr)
+                self.appended += len(fr)
+            now = time.monotonic()
+            w.flush(sync=now - self._last_sync >= 1.0)
+            if now - self._last_sync >= 1.0:
+                self._last_sync = now
+            self.bytes += w.tell() - before
+            self._enforce_cap()
+
+    def _segment_writer(self):
+        w = self._writer
+        if w is not None and w.tell() < self.segment_bytes:
+            return w
+        if w is not None:
+            w.flush(sync=True)
+            w.close()
+        seq = (self._segments[-1] + 1) if self._segments else 1
+        self._writer = RecordingWriter(self._path(seq))
+        self._writer_seq = seq
+        self._segments.append(seq)
+        self.bytes += self._writer.tell()
+        return self._writer
+
+    def _enforce_cap(self):
+        while self.bytes > self.max_bytes and len(self._segments) > 1:
+            seq = self._segments[0]
+            lost = list(self._unread(seq))
+            self.pending_batches -= len(lost)
+            frames = sum(len(f) for f, _ in lost)
+            self.pending_frames -= frames
+            self.dropped += frames
+            self._remove(seq)
+            print(f"⚠ Spool full: dropped {frames:,} oldest frames")
+
+    def _remove(self, seq):
+        path = self._path(seq)
+        try:
+            self.bytes -= path.stat().st_size
+            path.unlink()
+        except OSError:
+            pass
+        self._segments.remove(seq)
+        if self._cache and self._cache[0] == seq:
+            self._cache = None
+        if self._cursor[0] == seq:
+            self._cursor = (self._segments[0] if self._segments else seq + 1), 0
+            self._save_cursor()
+
+    # --- reading -------------------------------------------------------------
+
+    def _load(self, seq):
+        if seq == self._writer_seq:
+            self._writer.flush()
+        path = self._path(seq)
+        size = path.stat().st_size
+        if self._cache and self._cache[0] == seq and self._cache[1] == size:
+            return self._cache[2:]
+        data = path.read_bytes()
+        try:
+            catalog, spans = scan_recording(data)
+        except (ValueError, IndexError):
+            catalog, spans = None, []  # unreadable header: nothing to replay
+        self._cache = (seq, size, data, catalog, spans)
+        return data, catalog, spans
+
+    def _unread(self, seq):
+        """(frames, times) of the records of segment `seq` past the cursor."""
+        if seq < self._cursor[0]:
+            return
+        offset = self._cursor[1] if seq == self._cursor[0] else 0
+        data, catalog, spans = self._load(seq)
+        for start, end in spans:
+            if start > offset:
+                yield self._batch(data[start:end], catalog)
+
+    @staticmethod
+    def _batch(message, catalog):
+        layout, _, _, blocks = decode(message, catalog)
+        make = SCHEMAS[layout].frame_type
+        block = blocks[0]
+        frames = [make(*row) for row in block["data"]]
+        times = [(block["t0"] + off) / 1000 for off in block["t"]]
+        return frames, times
+
+    def peek(self, max_frames):
+        """Oldest unsent batches, at least one and up to about `max_frames`
+        frames, without removing them; consume() them once handed on."""
+        with self._lock:
+            out, positions = [], []
+            budget = max_frames
+            for seq in list(self._segments):
+                if budget <= 0:
+                    break
+                offset = self._cursor[1] if seq == self._cursor[0] else 0
+                data, catalog, spans = self._load(seq)
+                for start, end in spans:
+                    if seq < self._cursor[0] or start <= offset:
+                        continue
+                    if budget <= 0:
+                        break
+                    frames, times = self._batch(data[start:end], catalog)
+                    out.append((frames, times))
+                    positions.append((seq, end, len(frames)))
+                    budget -= len(frames)
+            self._peeked = positions
+            return out
+
+    def consume(self, count):
+        """Drop the first `count` batches of the last peek() from the spool."""
+        with self._lock:
+            if not count:
+                return
+            for seq, end, n in self._peeked[:count]:
+                self.pending_batches -= 1
+                self.pending_frames -= n
+                self.replayed += n
+                # Segments the cursor has moved past are done.
+                while self._segments and self._segments[0] < seq:
+                    self._remove(self._segments[0])
+                self._cursor = (seq, end)
+            self._peeked = self._peeked[count:]
+            if not self.pending_batches:
+                # Caught up: everything written so far is sent; keep only the
+                # segment being written to.
+                for s in [s for s in self._segments if s != self._writer_seq]:
+                    self._remove(s)
+            if time.monotonic() - self._last_cursor_save >= 1.0:
+                self._save_cursor()
+
+    def close(self):
+        """Flush to disk; the directory goes away if nothing is left to replay."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush(sync=True)
+                self._writer.close()
+                self._writer = self._writer_seq = None
+            if self.pending_batches:
+                self._save_cursor()
+            else:
+                shutil.rmtree(self.dir, ignore_errors=True)
+
+    @staticmethod
+    def scan(root, max_age_s=7 * 86400):
+        """Session ids with spooled data under `root`; drops spools older than
+        `max_age_s` (their sessions are long gone)."""
+        root = Path(root)
+        found = []
+        if not root.is_dir():
+            return found
+        for d in sorted(root.iterdir()):
+            if not d.is_dir():
+                continue
+            segments = list(d.glob("*" + SUFFIX))
+            if not segments:
+                shutil.rmtree(d, ignore_errors=True)
+            elif time.time() - max(p.stat().st_mtime for p in segments) > max_age_s:
+                print(f"⚠ Discarding spool older than {max_age_s // 86400} days: {d.name}")
+                shutil.rmtree(d, ignore_errors=True)
+            else:
+                found.append(d.name)
+        return found
+
+
+class SpoolWriter:
+    """One thread doing spool disk work in the order it was queued."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        # Not the spool's own lock: peek() holds that while it decodes.
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='spool-writer', daemon=True)
+        self._thread.start()
+
+    def append(self, spool, frames, times):
+        """Queue Spool.append(frames, times); the spool is pending from now on."""
+        with self._lock:
+            spool.queued += 1
+        self._queue.put((self._appended, (spool, frames, times), None))
+
+    def _appended(self, spool, frames, times):
+        try:
+            spool.append(frames, times)
+        finally:
+            with self._lock:
+                spool.queued -= 1
+
+    def call(self, fn, *args):
+        """Run fn(*args) after everything queued so far; a Future of its result."""
+        future = Future()
+        self._queue.put((fn, args, future))
+        return future
+
+    def flush(self, timeout=None):
+        """Wait (up to `timeout` s) until everything queued so far is done."""
+        done, _ = wait([self.call(lambda: None)], timeout)
+        return bool(done)
+
+    def _run(self):
+        while True:
+            fn, args, future = self._queue.get()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if future is None:
+                    print(f"Error writing spool: {e}")
+                else:
+                    future.set_exception(e)
+                continue
+            if future is not None:
+                future.set_result(result)
@@ -0,0 +1,234 @@
+"""
+Uplink throughput estimate and the live stream's degradation ladder.
+
+On a slow or shared uplink each send takes longer, the capture buffer fills
+and its bound starts dropping the oldest frames, without a word. UplinkMonitor
+watches two things:
+
+  sends    every batch the encode pipeline puts on the socket (its on_sent
+           hook, network/pipeline.py): bytes, and time from submit to sent.
+           Over a sliding window that is the rate the link delivered, which
+           is its throughput whenever there is a backlog.
+  backlog  once per sender tick: frames waiting in the capture buffer and the
+           age of the oldest one, so it can tell a growing backlog from a
+           steady one; and how long the send now on the socket has been
+           going (a stuck one counts before it returns).
+
+and moves the live stream down and up a ladder of tier plans (LEVELS, built by
+capture.tiers.build_plans):
+
+  0  full          everything, as configured
+  1  no_ext        without the ext.* channels
+  2  slow_tiers    ... and the slow tiers at a fifth of their rate
+  3  core_half     ... and the fast tier at half the capture rate
+  4  core_quarter  ... at a quarter
+
+With hysteresis: one step down once the link has been congested (oldest frame
+older than `congested_s`, or sends taking that long, or an aged backlog still
+growing — but not while the backlog is shrinking: this level keeps up) for
+`down_after_s`; one step up after it has been clear (oldest frame
+and sends under `clear_s`) for `up_after_s`, unless the throughput measured
+while congested (within the last two waits) shows the level above won't fit
+with `headroom` to spare. Between the two thresholds nothing moves. A step up
+that has to come back down within the wait doubles the next wait (up to
+`max_up_after_s`). Every transition is returned as a log line with the
+numbers behind it.
+
+The level only says what the live stream should carry; TelemetryCapture
+switches the connection's plans between batches (and reports it with
+using(), so bytes per frame are booked to the level actually sent) and keeps
+the full-rate frames in local storage while degraded.
+"""
+
+import threading
+import time
+from collections import deque
+
+# (name, capture.tiers.build_plans arguments), full stream first.
+LEVELS = (
+    ('full', {}),
+    ('no_ext', {'drop_ext': True}),
+    ('slow_tiers', {'drop_ext': True, 'slow_scale': 0.2}),
+    ('core_half', {'drop_ext': True, 'slow_scale': 0.2, 'fast_div': 2}),
+    ('core_quarter', {'drop_ext': True, 'slow_scale': 0.2, 'fast_div': 4}),
+)
+
+
+class UplinkMonitor:
+    """Throughput estimate + degradation level of the live stream."""
+
+    def __init__(self, hz, window_s=2.0, congested_s=1.0, clear_s=0.3, down_after_s=2.0,
+                 up_after_s=15.0, max_up_after_s=300.0, headroom=1.3, max_level=len(LEVELS) - 1,
+                 in_flight_s=0.5, alpha=0.3):
+        self.hz = hz
+        self.in_flight_s = in_flight_s
+        self.window_s = window_s
+        self.congested_s = congested_s
+        self.clear_s = min(clear_s, congested_s)
+        self.down_after_s = down_after_s
+        self.up_after_s = up_after_s
+        self.max_up_after_s = max(max_up_after_s, up_after_s)
+        self.headroom = headroom
+        self.max_level = min(max(0, int(max_level)), len(LEVELS) - 1)
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._sends = deque()    # (monotonic, frames, bytes, latency_s)
+        self._backlog = deque()  # (monotonic, frames buffered)
+        self._bpf = {}           # level -> EWMA encoded bytes per frame
+        self.level = 0
+        self._sending = 0        # level the stream is actually at
+        self.state = 'idle'
+        self.sent_bps = 0.0
+        self.sent_fps = 0.0
+        self.capacity_bps = None
+        self._capacity_at = None
+        self._bad_since = None
+        self._good_since = None
+        self._up_wait = up_after_s
+        self._last_up = None
+        self.steps_down = 0
+        self.steps_up = 0
+        self.transitions = deque(maxlen=20)
+
+    @property
+    def name(self):
+        return LEVELS[self.level][0]
+
+    @property
+    def plan_args(self):
+        """build_plans() arguments for the current level."""
+        return LEVELS[self.level][1]
+
+    def sent(self, frames, nbytes, latency_s):
+        """A batch went out (encode pipeline's writer thread)."""
+        now = time.monotonic()
+        with self._lock:
+            self._sends.append((now, frames, nbytes, latency_s))
+            if frames:
+                bpf = nbytes / frames
+                old = self._bpf.get(self._sending)
+                self._bpf[self._sending] = bpf if old is None else (1 - self.alpha) * old + self.alpha * bpf
+
+    def frame_budget(self):
+        """Most frames worth having in the encode stage at once: about
+        `in_flight_s` of what the link delivers (of capture, at least).
+        Anything more waits in the capture buffer, where a lower level still
+        applies to it, instead of queueing encoded at the old one."""
+        return max(self.hz, self.sent_fps) * self.in_flight_s
+
+    def using(self, level):
+        """The live stream now carries `level`'s plans."""
+        with self._lock:
+            self._sending = level
+
+    def need_bps(self, level):
+        """Bytes/s the stream takes at `level` (None until it has run there)."""
+        bpf = self._bpf.get(level)
+        return None if bpf is None else bpf * self.hz
+
+    def idle(self):
+        """Not streaming live (link down, or replaying the spool): no verdict,
+        and the congested/clear timers start over."""
+        with self._lock:
+            self._backlog.clear()
+        self._bad_since = self._good_since = None
+        self.state = 'idle'
+
+    def sample(self, backlog, oldest_age_s, now=None, stalled_s=0.0):
+        """One look at the capture buffer (sender, every tick); `stalled_s`
+        is how long the send on the socket has been going. Returns a log line
+        if the level changed, else None."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            horizon = now - self.window_s
+            while self._sends and self._sends[0][0] < horizon:
+                self._sends.popleft()
+            while self._backlog and self._backlog[0][0] < horizon:
+                self._backlog.popleft()
+            self._backlog.append((now, backlog))
+            span = now - self._backlog[0][0]
+            # Backlog trend: mean of the window's newer half minus the older
+            # half's (single samples jump with every batch cut).
+            mid = now - self.window_s / 2
+            older = [b for t, b in self._backlog if t < mid]
+            newer = [b for t, b in self._backlog if t >= mid]
+            trend = sum(newer) / len(newer) - sum(older) / len(older) if older else 0.0
+            sent = sum(b for _, _, b, _ in self._sends)
+            frames = sum(f for _, f, _, _ in self._sends)
+            latency = (sum(l for _, _, _, l in self._sends) / len(self._sends)) if self._sends else None
+        if stalled_s and (latency is None or stalled_s > latency):
+            latency = stalled_s
+        self.sent_bps = sent / self.window_s
+        self.sent_fps = frames / self.window_s
+
+        growing = trend > self.hz * 0.1
+        draining = trend < -self.hz * 0.1
+        slow = latency is not None and latency >= self.congested_s
+        if not draining and (oldest_age_s >= self.congested_s or slow
+                             or (growing and oldest_age_s >= self.clear_s)):
+            self.state = 'congested'
+            self._good_since = None
+            if backlog and span >= self.window_s / 2:
+                # Backlogged: what got through is what the link can do.
+                a = self.alpha
+                self.capacity_bps = self.sent_bps if self.capacity_bps is None else (
+                    (1 - a) * self.capacity_bps + a * self.sent_bps)
+                self._capacity_at = now
+            if self._bad_since is None:
+                self._bad_since = now
+            if now - self._bad_since >= self.down_after_s and self.level < self.max_level:
+                self._bad_since = now
+                why = (f"oldest frame {oldest_age_s:.1f} s, sends "
+                       f"{'-' if latency is None else f'{latency * 1000:,.0f} ms'}, "
+                       f"{self.sent_bps / 1024:,.1f} KB/s delivered")
+                return self._step(self.level + 1, now, why)
+        elif oldest_age_s < self.clear_s and (latency is None or latency < self.clear_s):
+            self.state = 'clear'
+            self._bad_since = None
+            if self._good_since is None:
+                self._good_since = now
+            if self.level and now - self._good_since >= self._up_wait:
+                self._good_since = now
+                need = self.need_bps(self.level - 1)
+                fresh = self._capacity_at is not None and now - self._capacity_at < 2 * self._up_wait
+                if fresh and need and self.capacity_bps < need * self.headroom:
+                    return None  # the last measurement says it won't fit; wait again
+                return self._step(self.level - 1, now, f"clear for {self._up_wait:,.0f} s")
+        else:
+            self.state = 'marginal'
+            self._bad_since = self._good_since = None
+        return None
+
+    def _step(self, level, now, why):
+        old = self.level
+        if level > old:
+            self.steps_down += 1
+            if self._last_up is not None and now - self._last_up < self._up_wait:
+                self._up_wait = min(self.max_up_after_s, self._up_wait * 2)  # probe failed
+            else:
+                self._up_wait = self.up_after_s
+        else:
+            self.steps_up += 1
+            self._last_up = now
+        self.level = level
+        self.transitions.append({'at': time.time(), 'from': LEVELS[old][0], 'to': self.name,
+                                 'reason': why})
+        verb = 'degraded' if level > old else 'restored'
+        return (f"📶 Uplink: live stream {verb} {LEVELS[old][0]} -> {self.name} "
+                f"(level {level}/{self.max_level}) — {why}")
+
+    def stats(self):
+        with self._lock:
+            needs = {LEVELS[lvl][0]: round(self.need_bps(lvl) / 1024, 1) for lvl in sorted(self._bpf)}
+        return {
+            'level': self.level,
+            'name': self.name,
+            'state': self.state,
+            'sent_kbps': round(self.sent_bps / 1024, 1),
+            'capacity_kbps': None if self.capacity_bps is None else round(self.capacity_bps / 1024, 1),
+            'need_kbps': needs,
+            'up_wait_s': self._up_wait,
+            'steps_down': self.steps_down,
+            'steps_up': self.steps_up,
+            'transitions': list(self.transitions),
+        }
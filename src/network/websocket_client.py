@@ -3,15 +3,32 @@ WebSocket client for real-time telemetry streaming
 """
 
 import json
+import select
+import socket
+import struct
 import time
 import threading
+import uuid
 from typing import Optional, Callable
 import websocket
 
+from capture.binary import FORMAT_VERSION, BinaryBatchEncoder
+from capture.columnar import ColumnarEncoder
+from capture.ext_delta import ExtDeltaStreams
+from capture.frame import as_dict, is_frame
+from capture.gorilla import GorillaBatchEncoder
+from capture.schema import SCHEMA_VERSION, announcement
+from capture.tiers import TierSampler
+from network.compression import KIND_BINARY, KIND_GORILLA, KIND_JSON, BatchCompressor
+from network.resend import ResendWindow, wrap
+from network.zdict import dictionary
+
 class WebSocketClient:
     """WebSocket client for MyRacingData platform"""
     
-    def __init__(self, url: str, api_key: str):
+    def __init__(self, url: str, api_key: str, tier_plans: Optional[dict] = None,
+                 resend_window: int = 600, ack_timeout: float = 3.0,
+                 send_buffer: Optional[int] = None):
         self.url = url
         self.api_key = api_key
         self.ws = None
@@ -23,9 +40,70 @@ class WebSocketClient:
         self.on_connected = None
         self.on_disconnected = None
         self.thread = None
-    
-    def connect(self):
-        """Connect to WebSocket server"""
+        # Set by on_open / on_error / on_close: connect() waits on it instead
+        # of sleeping for a fixed time.
+        self._settled = threading.Event()
+        self.connect_time_s = None
+        # Time of the first batch on the socket; on_first_send() fires then.
+        self.first_send_at = None
+        self.on_first_send = None
+        # Round trip of the last ping() (s); on_rtt(seconds) gets every one.
+        self.rtt_s = None
+        self.on_rtt = None
+        # Kernel send buffer of the socket (bytes, None = OS default). The
+        # default autotunes up to megabytes, which hides a congested uplink
+        # as buffered data; a bounded one makes it show as send time.
+        self.send_buffer = send_buffer
+        # monotonic() when the batch now on the socket started going out (None
+        # between sends): a send blocks while the socket buffer is full.
+        self.sending_since = None
+        # Channel schema version the server acked this session (None = not
+        # negotiated yet: batches go out with named keys).
+        self.schema_version = None
+        # Per-channel sample-rate tiers (capture.tiers); only used id-keyed.
+        # `plan_name` labels the plans in use (the uplink ladder level); the
+        # server takes new plans mid-stream when the ack lists "replan".
+        self.tiers = TierSampler(tier_plans) if tier_plans else None
+        self.plan_name = None
+        self.replan = False
+        # Keyframe/delta encoding of id-keyed ext values (capture.ext_delta),
+        # when the server's schema ack lists the feature.
+        self.ext_delta = None
+        # Binary batch encoder (capture.binary), when the ack lists "binary".
+        self.binary = None
+        # Gorilla time-series batches (capture.gorilla), when the ack lists "gorilla".
+        self.gorilla = None
+        # Columnar JSON batches (capture.columnar), when the ack lists "columnar".
+        self.columnar = None
+        # Batch-constant session info (track/car) for the columnar header.
+        self.batch_meta = {}
+        # Dictionary-primed zlib (network.compression): `compress` is set per
+        # connection when the ack lists "zlib"; the compressor lives for the
+        # whole session so its ratio/CPU stats span reconnects.
+        self.compress = False
+        self.compressor = None
+        # Batch sequence numbers + server acks (network.resend), when the ack
+        # lists "ack". `stream` + seq is the server's dedupe key; the window
+        # outlives reconnects so unacked batches can go out again.
+        self.stream = uuid.uuid4().hex
+        self.acked = False
+        self.window = ResendWindow(resend_window, ack_timeout)
+        # Generation of the ext delta / tier cadence state prepare_batch()
+        # carries from batch to batch. A prepared batch that never reaches
+        # the server breaks it: the batches prepared on it can't go out
+        # either (stale()), and the next one prepared starts a new one.
+        self.epoch = 0
+        self._broken = -1   # newest epoch with a batch lost
+        # Held while a schema ack sets up the stream (websocket thread), so a
+        # tier plan switch (sender) lands wholly before or after it.
+        self._negotiating = threading.Lock()
+
+    def connect(self, timeout: float = 10):
+        """Connect to WebSocket server.
+
+        Waits for the handshake to settle (open, error or close), up to
+        `timeout` seconds. On failure the reconnect loop is stopped too.
+        """
         try:
             print(f"DEBUG WS: Connecting to: {self.url}")
 
@@ -34,19 +112,26 @@ class WebSocketClient:
                 on_open=self._on_open,
                 on_message=self._on_message,
                 on_error=self._on_error,
-                on_close=self._on_close
+                on_close=self._on_close,
+                on_pong=self._on_pong,
             )
 
             # Run in separate thread
+            self._settled.clear()
+            start = time.monotonic()
             self.running = True
             self.thread = threading.Thread(target=self._run, daemon=True)
             self.thread.start()
 
-            # Wait a bit for connection
             print("DEBUG WS: Waiting for connection...")
-            time.sleep(2)  # Increased wait time
+            if not self._settled.wait(timeout):
+                print(f"DEBUG WS: No handshake after {timeout:g} s")
+            self.connect_time_s = time.monotonic() - start
 
-            print(f"DEBUG WS: Connection status: {self.connected}")
+            print(f"DEBUG WS: Connection status: {self.connected} "
+                  f"({self.connect_time_s * 1000:.0f} ms)")
+            if not self.connected:
+                self.disconnect()
             return self.connected
 
         except Exception as e:
@@ -59,10 +144,26 @@ class WebSocketClient:
         """Disconnect from WebSocket server"""
         self.running = False
         if self.ws:
+            if self.sending_since is not None:
+                self._shutdown()  # a close frame would only queue behind the stuck send
             self.ws.close()
         self.connected = False
+
+    def abort(self, reason):
+        """Drop the connection now, without a close handshake: a send that
+        won't finish fails, and the reconnect loop opens a new connection."""
+        print(f"WebSocket aborted: {reason}")
+        self._shutdown()
+
+    def _shutdown(self):
+        sock = getattr(getattr(self.ws, 'sock', None), 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
     
-    def send_telemetry(self, data: dict):
+    def send_telemetry(self, data):
         """Send a single telemetry frame to the server"""
         if not self.connected or not self.ws:
             return False
@@ -70,7 +171,7 @@ class WebSocketClient:
         try:
             message = json.dumps({
                 'type': 'telemetry',
-                'data': data
+                'data': as_dict(data)
             })
             self.ws.send(message)
             return True
@@ -78,28 +179,293 @@ class WebSocketClient:
             print(f"Error sending telemetry: {e}")
             return False
 
-    def send_batch(self, frames: list):
-        """Send several telemetry frames in one message (high-rate capture)."""
-        if not self.connected or not self.ws or not frames:
+    def send_batch(self, frames: list, times: Optional[list] = None):
+        """Send several telemetry frames in one message (high-rate capture).
+
+        Frames may be compact Frame records (the capture path) or plain dicts.
+        Once the server has acked our channel schema, a batch of records that
+        share one layout goes out as positional rows keyed by that layout (see
+        capture.schema) — split into per-tier blocks on their own timebases
+        when tiers are configured and capture `times` are given, and packed
+        as negotiated: one Gorilla or binary message, a columnar JSON
+        message, or JSON rows (with the ext values as keyframes/deltas).
+        Anything else goes out as the list of named frame objects.
+
+        Same as prepare_batch() + encode_batch() + send_encoded(), inline; the
+        capture path runs the middle step on network.pipeline's worker pool.
+        """
+        job = self.prepare_batch(frames, times)
+        if job is None:
+            return False
+        try:
+            payload, binary, _ = self.encode_batch(job)
+        except Exception as e:
+            print(f"Error sending telemetry batch: {e}")
             return False
+        return self.send_encoded(payload, binary)
+
+    def prepare_batch(self, frames: list, times: Optional[list] = None, seq: Optional[int] = None):
+        """Stateful half of send_batch: tier sampling, ext deltas, sequence
+        numbers.
+
+        Must run in send order, on one thread. Returns a job for
+        encode_batch() — (encode, args, payload kind, compressor, seq), where
+        a None `encode` means `args` is the message itself — or None if there
+        is nothing to send. Pass the `seq` of a batch from due_resends() to
+        send it again: it is encoded standalone, without tiers or deltas.
+        The job belongs to the current `epoch`.
+        """
+        if not self.connected or not self.ws or not frames:
+            return None
+        if self._broken == self.epoch:
+            # A batch of this epoch was lost: restart from keyframes.
+            self.epoch += 1
+            if self.ext_delta:
+                self.ext_delta.reset()
+            if self.tiers:
+                self.tiers.reset()
 
         try:
-            self.ws.send(json.dumps({
-                'type': 'telemetry_batch',
-                'data': frames
-            }))
+            resend = seq is not None
+            seq = self.window.add(frames, times, seq) if self.acked else None
+            layout = self._layout(frames)
+            if layout is None:
+                message = {
+                    'type': 'telemetry_batch',
+                    'data': [as_dict(f) for f in frames]
+                }
+                return None, message, KIND_JSON, None, seq
+            delta = None if resend else self.ext_delta
+            tiered = bool(self.tiers and times) and not resend
+            compressor = self.compressor if self.compress else None
+            if self.gorilla or self.binary:
+                encoder, kind = (self.gorilla, KIND_GORILLA) if self.gorilla else (self.binary, KIND_BINARY)
+                blocks = self._blocks(layout, frames, times, tiered)
+                return encoder.encode, (layout, self.schema_version, blocks, tiered), kind, compressor, seq
+            if self.columnar:
+                blocks = self._blocks(layout, frames, times, tiered)
+                return (self.columnar.encode, (layout, self.schema_version, blocks, tiered,
+                                               self.batch_meta), KIND_JSON, compressor, seq)
+            if tiered:
+                blocks = self.tiers.encode(layout, frames, times)
+                if delta:
+                    for n, (tier, block) in enumerate(zip(self.tiers.plans[layout].tiers, blocks)):
+                        block['data'] = delta.rows((layout, n), block['data'], tier.ext_split, tier.hz)
+                message = {
+                    'type': 'telemetry_batch',
+                    'schema': self.schema_version,
+                    'layout': layout,
+                    'tiers': blocks,
+                }
+            else:
+                # Records are tuples, so json encodes each one as a plain array.
+                if delta:
+                    frames = delta.rows((layout, None), frames, frames[0].schema.ext_start)
+                message = {
+                    'type': 'telemetry_batch',
+                    'schema': self.schema_version,
+                    'layout': layout,
+                    'data': frames,
+                }
+                if resend and times:
+                    # Arrives late: say when it was captured.
+                    block = self._blocks(layout, frames, times, False)[0]
+                    message['t0'], message['t'] = block['t0'], block['t']
+            return None, message, KIND_JSON, compressor, seq
+        except Exception as e:
+            print(f"Error sending telemetry batch: {e}")
+            return None
+
+    @staticmethod
+    def encode_batch(job):
+        """Pure half of send_batch: serialise (and compress) a prepared job.
+
+        Touches no connection state, so jobs may be encoded concurrently.
+        Returns (payload, is_binary, seq).
+        """
+        encode, body, kind, compressor, seq = job
+        if encode is not None:
+            body = encode(*body)
+        if kind == KIND_JSON:
+            if seq is not None:
+                body['seq'] = seq
+            body = json.dumps(body)
+        if compressor is not None:
+            payload, binary = compressor.compress(body.encode() if kind == KIND_JSON else body, kind), True
+        else:
+            payload, binary = body, kind != KIND_JSON
+        if binary and seq is not None:
+            payload = wrap(seq, payload)
+        return payload, binary, seq
+
+    def due_resends(self, limit: int = 8):
+        """Unacked batches to send again now, [(seq, frames, times)], oldest
+        first; hand each to prepare_batch() with its seq."""
+        if not self.acked or not self.connected:
+            return []
+        return self.window.due(limit)
+
+    def forget(self, seq, epoch=None):
+        """A batch prepared in `epoch` won't be sent by this client after all
+        (it was spooled, or failed to encode): the server never gets its rows,
+        so the delta and cadence state built on them is dropped too."""
+        if seq is not None:
+            self.window.forget(seq)
+        if epoch is not None:
+            self._broken = max(self._broken, epoch)
+
+    def stale(self, epoch):
+        """Whether a batch prepared in `epoch` builds on a lost one."""
+        return epoch is not None and epoch <= self._broken
+
+    def send_encoded(self, payload, binary: bool):
+        """Put an encoded batch on the socket."""
+        if not self.connected or not self.ws:
+            return False
+        self.sending_since = time.monotonic()
+        try:
+            if binary:
+                self.ws.send(payload, opcode=websocket.ABNF.OPCODE_BINARY)
+            else:
+                self.ws.send(payload)
+            if self.first_send_at is None:
+                self.first_send_at = time.monotonic()
+                if self.on_first_send:
+                    self.on_first_send()
             return True
         except Exception as e:
             print(f"Error sending telemetry batch: {e}")
             return False
-    
+        finally:
+            self.sending_since = None
+
+    def ping(self):
+        """RTT probe: a WebSocket ping frame carrying its send time, which
+        the server's pong echoes back (RFC 6455), so any server answers it.
+
+        Skipped (False) while a batch is going out or the socket buffer is
+        full: the ping would wait behind them and block the caller.
+        """
+        if not self.connected or not self.ws or self.sending_since is not None:
+            return False
+        if not self._writable():
+            return False
+        try:
+            self.ws.send(struct.pack('!Q', time.monotonic_ns()), opcode=websocket.ABNF.OPCODE_PING)
+            return True
+        except Exception as e:
+            print(f"Error sending ping: {e}")
+            return False
+
+    def _writable(self):
+        """Room in the socket's send buffer right now."""
+        sock = getattr(getattr(self.ws, 'sock', None), 'sock', None)
+        if sock is None:
+            return True
+        try:
+            return bool(select.select((), (sock,), (), 0)[1])
+        except (OSError, ValueError):
+            return False
+
+    def _on_pong(self, ws, data):
+        """Pong to one of our pings: report the round trip."""
+        if len(data) != 8:
+            return  # unsolicited, or someone else's
+        rtt = (time.monotonic_ns() - struct.unpack('!Q', data)[0]) / 1e9
+        if 0 <= rtt < 60:
+            self._rtt(rtt)
+
+    def _rtt(self, seconds):
+        self.rtt_s = seconds
+        if self.on_rtt:
+            self.on_rtt(seconds)
+
+    @property
+    def can_replan(self) -> bool:
+        """Whether set_tier_plans() can switch plans now: before the schema
+        is negotiated, or when the server accepts new plans mid-stream."""
+        return bool(self.tiers) and (self.schema_version is None or self.replan)
+
+    def set_tier_plans(self, plans: dict, name: Optional[str] = None, send=None) -> bool:
+        """Switch to other tier plans (capture.tiers.build_plans) from the
+        next prepared batch on.
+
+        Runs on the thread that prepares batches. The new `tier_plan` message
+        (and binary format) goes out through `send` — straight onto the
+        socket by default, so only with no batch in flight; pass the encode
+        pipeline's submit_message to queue it behind the batches already
+        prepared. Slow-tier cadences and ext delta streams restart
+        (keyframes first). Returns False if the server can't take new plans
+        mid-stream, or while a schema ack is being handled (try again with
+        the next batch: this never waits).
+        """
+        if not self._negotiating.acquire(blocking=False):
+            return False
+        try:
+            return self._replan(plans, name, send)
+        finally:
+            self._negotiating.release()
+
+    def _replan(self, plans, name, send):
+        if not self.can_replan:
+            return False
+        self.tiers = TierSampler(plans)
+        self.plan_name = name
+        if self.schema_version is None:
+            return True  # announced with the next schema ack
+        send = send or self.ws.send
+        try:
+            send(json.dumps({'type': 'tier_plan', 'layouts': self.tiers.describe(), 'name': name}))
+            if self.ext_delta:
+                self.ext_delta = ExtDeltaStreams()
+            if self.binary:
+                binary = BinaryBatchEncoder(plans)
+                send(json.dumps({'type': 'binary_format', 'version': FORMAT_VERSION,
+                                 'layouts': binary.describe()}))
+                self.binary = binary
+            if self.gorilla:
+                self.gorilla = GorillaBatchEncoder(plans)
+            if self.columnar:
+                self.columnar = ColumnarEncoder(plans)
+            return True
+        except Exception as e:
+            print(f"Error sending tier plan: {e}")
+            return False
+
+    def _blocks(self, layout, frames, times, tiered):
+        """Per-tier blocks, or one block of whole rows on the capture timebase."""
+        if tiered:
+            return self.tiers.encode(layout, frames, times)
+        if times:
+            t0 = int(times[0] * 1000)
+            offsets = [int(t * 1000) - t0 for t in times]
+        else:
+            t0, offsets = int(time.time() * 1000), [0] * len(frames)
+        return [{'t0': t0, 't': offsets, 'data': frames}]
+
+    def compression_stats(self):
+        """Session totals of the batch compressor (None if never negotiated)."""
+        return self.compressor.stats() if self.compressor else None
+
+    def _layout(self, frames):
+        """Shared frame layout id if the batch can go id-keyed, else None."""
+        if self.schema_version is None or not is_frame(frames[0]):
+            return None
+        schema = frames[0].schema
+        for f in frames:
+            if getattr(f, 'schema', None) is not schema:
+                return None
+        return schema.id
+
     def _run(self):
         """Run WebSocket connection loop"""
+        sockopt = ((socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer),) if self.send_buffer else None
         while self.running:
             try:
-                self.ws.run_forever()
+                self.ws.run_forever(sockopt=sockopt)
             except Exception as e:
                 print(f"WebSocket error: {e}")
+            self._settled.set()
             
             # Reconnect logic
             if self.running and self.reconnect_attempts < self.max_reconnect_attempts:
@@ -114,10 +480,38 @@ class WebSocketClient:
         print("✓ WebSocket connected")
         self.connected = True
         self.reconnect_attempts = 0
-        
+        self._reset_stream()
+        try:
+            ws.send(json.dumps(self._announcement()))
+        except Exception as e:
+            print(f"Error announcing schema: {e}")
+        self._settled.set()
+
         if self.on_connected:
             self.on_connected()
     
+    def _reset_stream(self):
+        """New connection: nothing negotiated yet."""
+        self.schema_version = None
+        self.ext_delta = None  # resync: a new connection starts from keyframes
+        self.binary = None
+        self.gorilla = None
+        self.columnar = None
+        self.compress = False
+        self.acked = False
+        self.replan = False
+        if self.tiers:
+            self.tiers.reset()
+
+    def _announcement(self):
+        """The channel schema, sent once per connection; batches stay
+        name-keyed until the server acks it. `features` are the optional
+        encodings we can use; the ack says which the server accepts."""
+        features = ['ext_delta', 'binary', 'gorilla', 'columnar', 'ack', 'replan']
+        if dictionary(SCHEMA_VERSION):
+            features.append('zlib')
+        return dict(announcement(), features=features, stream=self.stream)
+
     def _on_message(self, ws, message):
         """Called when message is received"""
         try:
@@ -125,21 +519,69 @@ class WebSocketClient:
             # Handle server messages if needed
             if data.get('type') == 'ping':
                 ws.send(json.dumps({'type': 'pong'}))
+            elif data.get('type') == 'schema_ack':
+                with self._negotiating:
+                    self._negotiated(ws, data)
+            elif data.get('type') == 'ack':
+                self.window.ack(int(data['seq']), data.get('received') or ())
+            elif data.get('type') == 'resync':
+                # Server lost ext delta state: next row of every stream is a keyframe.
+                if self.ext_delta:
+                    self.ext_delta.reset()
         except:
             pass
     
+    def _negotiated(self, ws, data):
+        """Schema ack: set up the negotiated encodings for this connection."""
+        if data.get('version') != SCHEMA_VERSION:
+            return
+        # The sender prepares batches on another thread and goes
+        # id-keyed as soon as schema_version is set: negotiate
+        # everything and announce the plans first, publish it last.
+        if self.tiers:
+            ws.send(json.dumps({'type': 'tier_plan', 'layouts': self.tiers.describe(),
+                                'name': self.plan_name}))
+        features = data.get('features') or ()
+        self.replan = 'replan' in features
+        if 'ext_delta' in features:
+            self.ext_delta = ExtDeltaStreams()
+        if 'binary' in features:
+            binary = BinaryBatchEncoder(self.tiers.plans if self.tiers else None)
+            ws.send(json.dumps({'type': 'binary_format', 'version': FORMAT_VERSION,
+                                'layouts': binary.describe()}))
+            self.binary = binary
+        if 'gorilla' in features:
+            self.gorilla = GorillaBatchEncoder(self.tiers.plans if self.tiers else None)
+        if 'columnar' in features:
+            self.columnar = ColumnarEncoder(self.tiers.plans if self.tiers else None)
+        if 'zlib' in features and dictionary(SCHEMA_VERSION):
+            if self.compressor is None:
+                self.compressor = BatchCompressor(dictionary(SCHEMA_VERSION), SCHEMA_VERSION)
+            self.compress = True
+        if 'ack' in features:
+            self.window.rewind()  # whatever the last connection lost
+            self.acked = True
+        self.schema_version = SCHEMA_VERSION
+        print(f"✓ Channel schema v{SCHEMA_VERSION} accepted")
+
     def _on_error(self, ws, error):
         """Called on error"""
         print(f"DEBUG WS ERROR: {error}")
         print(f"DEBUG WS ERROR TYPE: {type(error)}")
         import traceback
         traceback.print_exc()
+        self._settled.set()
     
     def _on_close(self, ws, close_status_code, close_msg):
         """Called when connection is closed"""
         print(f"WebSocket disconnected: {close_status_code} - {close_msg}")
         self.connected = False
-        
+        self.schema_version = None
+        self.compress = False
+        self.acked = False
+        self.replan = False
+        self._settled.set()
+
         if self.on_disconnected:
             self.on_disconnected()
     
@@ -0,0 +1,385 @@
+"""
+Preset zlib dictionaries for batch compression, keyed by channel schema
+version (see network/compression.py). Generated by
+scripts/train_zlib_dict.py --write; never edit or replace an entry, the
+server decompresses with the same bytes.
+"""
+
+import base64
+import zlib
+
+_DICTS = {
+    2: (
+        "eNq1fXuMZed90LWdhsSqVIuapqnadHP/wRY7l+/9cP3YmXVo0ySURIWCNqvp3dk7u4NnZ8Z37tpe"
+        "W6skFQYJEC6qKnUdoVZ1VFQJOUVBxhRanARUQ50KFaQVKEUYNUCVgIiqplQqmN/rO4/vnDuzdmA0"
+        "9/zO+Z3v+53vnPM9fu8zfejMBa3VLEQXvFE5B5VtOnsGcUlrr5KOKWqVHeOyS1Ynl7Rz3mrE6ZlK"
+        "XkVvY3I65sg4Y6BecDkrY51jnPXJOWe0TSHqfPHsmeny6NoUGhCMB1KwzbgNCbcx4DZ53GaLhY9X"
+        "i8Vy7+DK9t7B0fUV1ttQM5NsdD7oADfgjDVnzxDSuWjgatEAEmgJ1uscsP3WG2gVIc+eyX4GzcwZ"
+        "SjttNDQE2j3D5l2wZ8/AfcwM4GJQ6uwZx8W1UkrrDI/LJGiyDoACEGcuBvrLVnu8Aa8NVttIQWco"
+        "aBQXtNHiITyIhHC1vL6AIyVkGpgbmAGqzr81dMpaBo6BZ8DVbWSQGDCt5GZetfeq8lmFf3CfOs+M"
+        "6v4BzmHzofU+JKvwUQyLaKWzVwiNxTsttxJnkVsu3YGARWD1TEeqbuCpKHplcDt9HN3aAOUGqKBn"
+        "Ht9dDjp5q6TTjODsCM4h7gz0C2/STXzdeI/0oEwO1EdTxO7n8CFABTUDGGdKw0BJNseYgRb0VT+D"
+        "Th59gg6otNM2LDYU3Cig8JFvGO2oh6pCgp/R7nz/GMBzUwU9eQMekYPzUwMHTmGPhAMLB1BDYf+b"
+        "eixmsWfCQeIzcD040ErKRTzQ3Uradmvp0KsmRLCL+ZkyDCwD133PUsLjINzZv77audoOQZ3wlnCr"
+        "cucvMc4wsAwcA6Kz2lsutleLa0fbu/tER8Erwi4DQAs0Aq1AJ7AmsGQCngl4IeCFgBcCXgj4HoHn"
+        "pit8fBrHN/7BK1d4EknCDt4HvBfjsUfCiNBY8/J8NcfzFxx2GOjPUE5LJ9HaUTO4MWFmUzVirDV4"
+        "hQ2YKj2OGBh4vtcnsCcWwr1nWl+FXwsBuE4eJ12/lfpC/uLFm9gL+08BqrdPoXfLMODphRfgCvDY"
+        "4/HAUI8wGbeWOrylsjDIFY1rRUMZxxKU6c+8WfUxb7dx1cTanTJlvE33lvMdWESmOKXP1MWAQ8E6"
+        "GTQJDyINyBmtEFOLowTWCWzd1MlIs7CGlBnDhVkMGcZ3DNFHeEPwIFzK+DhkvCeYNiOMQegK1ufg"
+        "y2Jks3U6pKShMnQM77Gn8XQBdHBxXTddBGWw09FsoT0sAtg2Gc3OlskCVr4Z3lCgOSDBk8ejWKYb"
+        "Q/PIw1s/+bUf+tO/8N4f+s37fuNh+/v/8MuT9Ma/vP/lz37x77z7fz78X3/g79/R+Yn83fi9d7/2"
+        "ix965ddw/3d++6/+yFd3fvkx3L9Lzt8n8Ozffmjrfd89mdxNR89s4fb73v9Hv/7RD04mH/vg5NNc"
+        "58FPvvClPzj6qXNc54Fzn3j1A89//cbVc9sPfuRhbM1k8quPf+Vhbg2WwNYgfFvn0yxbfEXI38DW"
+        "jzMaGedPXoZha2hraetoOz41GqyFW83AMLAMHIPR2TAnfKeZ124EhoFlIOfWzINqRvOc8BoIjUAr"
+        "sJwHAila7ErQP2DdTLTjDQ5m2HE0YrHrwDKL11o8s5qtbsD1dg+XO4vta8/KNbE/eey8CK1ABi4K"
+        "dAJ1IXR8/fhocXC8d3iwvVrOn1rsCzHsxJH6/okg5IbQ/t7R9nK+2jvcXu4XCkFKGYFWoBdYqCwu"
+        "bz9x7SrUMgaPYe6xCZlEhyu78KfR0ppwZTHHBuJgW11dHq5W+4vmZeO6FIg7itob7yOWurScP9Ep"
+        "oqVEZ1kddjXoEsNSO9eXy8XBant/frS92rsGT/4YG8Ls2fTyYn81314dbl9aHK/4VGHZ6j4J60VF"
+        "ndgyozstx5mLeV5k+PSQDfSErRYSYpXzLHSfIDxjfnSOuT9TPSC8jOHLmNHLmLWXMZ3LhPoydngZ"
+        "y5cZMrU0scNqquuHjjjLwDEYH+Rxxqy/FmAY2JpRjkwnCp0h/wMvnvjoWdACjUAr0AlcM+4dE3BC"
+        "wAkBJwScEHA9AttLqm2BLYJBEbJTGdiHgNwEoUBkgo2yGdlXRoGABqJPgkXaFZQysGQBE2wbFCyF"
+        "IJFZHVxT0XuXogrKOx67u9dhzC8X1+Z7BzgC9vdWiyV23gs+zlCYdCBXgiQFayYQZZw2IOMRDS8o"
+        "uGyEtZdZdca4DDxEtCihFpSGpsAJp6k1hAvJR1iwYdB7fM9TK8yxwv7ETABOCDo3TEAwNENObaYF"
+        "VSdeXokp2MjMsjthv5mmt8xKgMCCR05YCZwqp56vAAwAThURz1kfoeHAaRfeQivgHYBxMAoYG2+J"
+        "QUDJBx6oMAc40Zqo4RVlkDpTxFeP3AXwGjmgTALylU8olEP/Rg6W+YtgA/ZGIBGlUznXHzSE813c"
+        "xcGMBn2OlxpZaWShkXVGSHaHlJI1a7jA4spAd0OUmDtBYBkMKGmhNBiObsaj1fEQJjqO6bgROg5v"
+        "IsxE7NYFGoFWoBPoRx4CTQCx4tUzoQxtLW3rS5eJYPgs4gwZddgix88MJFZgcQqlqdEbJzEEtwLM"
+        "8JFpUzWRdDIwFiqh2sxiT1gm+XmAcn0UKm38AOVcxhcCky4Dy8AjAM4jV+ztdH58vFjBUrZzuDye"
+        "T5sZP86SWruwaFbIlI7Kygx8/6JuqRcWK92VNBfTncP969cOcN55bgoMScMPXDAgq+JqVq5KKwny"
+        "8n0egXDVqkc4M6xqR6q6btWLY7wFyVwsRnZuEXG6HrOAMyPl7Eg5Ge+8NFoGjoFnEBhEBolBJhDd"
+        "zJqOHik1b3AoZrHIYnH5YSEURJ6QcbqeatJ2zFxPRnYi2MD0ClNar7+SRkRrbhFJPNi9qFdD/zCw"
+        "WDkRfpziMjip402aihBOvgm6vim9CB6Jr6bALAoDAlUn0kUdMab+ypl1HSgji85CieoBISwjXveH"
+        "nLFDlBui/ADlUZ7oD0wYYwOUG6I8o/Zl9si8mmTWByE0Aq1AJ7CRBOY7O7CA78+JAgxwnfsvAlBG"
+        "dVDWM053cYwyw5q2WyowznVxrmrH4QG2g2UW3GoB3TcfGGcZ4Gs1OUAfAJYEVlcVeU0Z5bYvGFIP"
+        "GBItDDA8uMUV1SieaxwxNSPM+AVecxMIIbkswHigOwfGdg7wETQHKrQHPqcx3jFB3wUOKDlgsYQH"
+        "I5S1wZmikyAMMGDwH7MhDg9R3TnBuOHcYU7jAWBCwKFiNG+rFYanC9jSeDLrVn81Y87BaAH1QsXD"
+        "GQEPSTO++luiY5mOHaHDEx0Cx+C56erG0QIqT1eL/cW1xWp5Y/vSHKhOsaU7V4E9ReEQDvbnNw7p"
+        "MrarcsIOoEnv1VoINOvJxULAOgBpVzjRPqADlxs3DzCRAnwBsa/nwoma52lSvxlSv7GO3ZD6zZD6"
+        "zZC9wJxVZFqA5SU0YAOVcK5/2Ejtq+vLS9C5Dw+PVyJqU0G02TSgi1Kl4sHh8tp8f+9ZWGCPDo/3"
+        "QFo/YAImKBLGASYnOznxjtZGdkyQnWbYHy+OWXmAQ3R/sVtGG3DR8DBZ2Yi7yTa7yFvLboi8i2oa"
+        "RbpaBFqgEWgLrLoR4sZ4QUN6D9xqBoaBZcDCqF8zCmBdIK7AkDIXAK8VTguoNLmIG2UFDemeDauG"
+        "DavBDWvBDSvBDenAb0Ldq5P275c++3ijH2PMrz4+GTnf/XvXX/rzpOF77dGHrn/tC/+mp+17v8C/"
+        "tTw8/z1w8G45/upT/+Xc7/+jj7nPXJtMfupa0fZ97uiRe2+/9KHXirbvSTz8a8+c+08b97F+8dw/"
+        "/XK56l/84gOPYGtQ9/hOzv/IX/jjh+U88RsolDUdV4O4xeY23DZ2IY/qYTiXrQOpkWxPLnXtQh7V"
+        "tskhoxpVYryCAWqS8XjGgthMGgCF07HIYSEYM6bndcga8sxBy5kBaYEpGhb9iKffsJl4aNROEJZl"
+        "OmdF28WkVTqhJq4iogJIaQbyo0KJFO+QjIdwW8rBwNTe8ZphgS0zAe4hJRDPs0U+ziZkbJKycD8x"
+        "h8Q4CzxmhGfpfRAlQDLA0TkY1InUAjyHn6QF8HALUCNmlw0K4oxSMXu4MswFUVAqAUtgMyyWJFsz"
+        "LipcFHN22hWU1ynmlAyviIQDnsaI0GlE6jQidhpWlCIcG+uaZBkt0oTlypbrWq5q18u7MAOnocbJ"
+        "5CGORVcrByzPWrtGF8UqpmKNZl2UswJqAx3gfFcYzDPms2LFyDlSTSV4XrpIZHTbfQ1Xs/5Bpwm6"
+        "t/4lUkkB+Z55XA/XP1Z+9UaChYnadASHRO3B8ZWQGZV2Ey0WErtMo2OC1PRe2xvpmPXR64VAQwss"
+        "AS3QCLQF1vMy4Pw6SS7PxKSvCzQCrUAn0I8rXLQaalW0ADNyygxZKb4EXwHkh55g71mAGODcEAcy"
+        "LPYLB7IWAcOA1JDBzsaNd/Yky2JPlsKVstJMoOQUh5JTHEpOFYp7VK1duHjz4k1eV1t/iDNkBzFN"
+        "X8l9Va7p8nkWxmGfz8ORSVZZm7s93Qx7euKSa1g9odPA2MBkK08QRaeAxyNgGFgGXB1VPJb8Qggw"
+        "rWRYcC4dK8/iwLcjU59HYBgIsqfKklPreBo1pIs41s7QUFI8ktSQLuJG+Xx46UOqlqlapmqZqh2h"
+        "apEqMT/PTh8aWsjRas435fl+SdDPwrYNmkLGMtyqIX/m2brhpeuK7L9G/8+OFIqVfQSNQCvQCRzX"
+        "/2tRCItLB0Ij0AoUH64ugYfORJ7K1i7EMM0m07PST7usNylSUMy7SaMdheaD69cuLZYiKXWnU4P+"
+        "Cq7/OoqNjUbViTa2JF2v43lVm9iwE41a1XBtqEYky/mkSkdjqBI2bINYJODOvIpRASBrPIlaqpHE"
+        "jc/xBPM8rkhG1FjwxmMsVnjDfjiu3Tem3beq3S+uBsA+pZujM6leO5OiXK9ChFZaHYHrSizqV6iI"
+        "3iHAzFF/FauKI10vSUkCXO4CZJmiUc7ZaKBhZJmpFH+9ORa2144Wq71nobcsWl1g1DM0wLK3k7PE"
+        "1RRvJzLRsgMDTN+eHgZ7MBgS5NiBQc1QlyN+UPBGbXmsDQUdeiR07NLQqRBhk7GFxSa4HHwywPgi"
+        "cyg9a9XwxyNF1o0YeEoJON+gHPAijvnh6eXl8fb8qfne/vzSPg6a8rwQvzhA5OUO9sqcRtbJTxPF"
+        "YGJZQKDefgYvnAOPZUTcYGuyksNnqe/A0o6NaU3mvDBWsxH1FqUj9AcQzh2KKPV8c3IReqjUwdYX"
+        "WZ5U5GmYB7gtB9f39/vY5Rh2OVp2WZc9WsLUdR09GLC8AbZQrKNarKN6YF5dLot9VuyyukBRx2ix"
+        "z2oxm3UMvP3LXTDEGxm20Bo20Bq2zxo2z5qedbatvhTBnnzRuLrn6p6re67uR6uzW4QJVD1w9cDV"
+        "+3YBGIoDOyDgujpAO8aW6hkb6tgjmKUU5kgQOLE09bjTNXKRmbF7jGWfGcs+M1aQ7DMzQmkgCvmZ"
+        "MGLsJWfZvbFwZ44B0LlgWbWIoOYUEOcFVIs74iKDViXbds8Llg0rVo9Q1UxVj1DVTFUPqPIbRB2e"
+        "rWwliBPgGQQBleIbcTXV5fTMBR6DwAajEzWsBEaWBgU8bESfaR9aVNIu5AjiVWhQISDjTIoAwQAr"
+        "5GGdJLuXoKxY8m262J9beWCgfwD0sAjiJhvCPPsMAA69vzP6mpsWB0uzNc6w0V9wDpb1KBcVFNSE"
+        "FVxHnRsUHASLiouiyu4rvMnboxoA5PpxihLc0ORgeG4wPDUYnhkMTwykwen1hDUMM7lj4VYAc6ya"
+        "mVmiZMcoDfhSMmobtmkbNmkbtmgbNmgj8ArbTtpgAlpgObYF1qytEw38mIgb2Q8lih9KFD+UKDNt"
+        "lJk2ylRVPUqSKVlhkIauUIldf3pOsUQvCbUx3z3U07F/BvnaZlKMMpef+wyrqhhWbKV2MHysjSmj"
+        "yqphWAMZfwrDasedwohDrO6QcYN2Mt8JI1BjLEPSyGb4uNYcpcm5fNT3S1hUcjiv+4U0CAszPXRh"
+        "QSuCsLjA6gsUn+kkhss09q7IASaIHbr584QztLW0dbRd6+4QyN0hpN6LxekEVS+RxDrYmoEDRRzX"
+        "gim+J7kluSO5IbkfbAxLgKNe0dTtgTvsmvVz1+cA/Z1rQzuLe5r91mtzcSDsmsuYvltA/zK17d4I"
+        "qqvmsUPcSAPsWANIOywxCokMlOukGo2ag1S4dg+MUhDWHJXjWjhzNYuFFS9o7Rs8STsFb2yDJ8mn"
+        "4K1u8eKGhbayIhJBW51rPKRSmjlYfVz0VqKP8DZg25fqyHEUI5lyMCABoaKa2CV5fFEAv8DIKtzI"
+        "Kty4XoUb1VBdGwWwojay9jayU1Jc50I41L1wt0fAStwoyIHuJRZl40hAhQRQGF2rBS1N8QifWc2W"
+        "IL9sW3VtDw1yCofFpf3DnSdICV8JncZ6dWp4xFplKnSyWUwuKOEFcPWGFRslNgcyVU6GJABEGZdQ"
+        "z69RoW+kmIPXa4MV7T1iotYmJdcwG4jLzqAHoLHIRXRizGDJx1idTMq4jCI5cF/6bGe6zhm4xZ4+"
+        "r5rvjOICPfXFoGOAnGirMLA1c7joBEcncdET1p3FuJEmdKbzZnkQxSIsbyPnWNk43TvefqrD54Cs"
+        "eBqjb2gw4Xag7WJ1k2Ftk2Flkym6phE+h2JCcDugpJmSZkrsQ4NgXP9GkSS4HdBxTMcxHcd0XKU+"
+        "Y2VoSLA+NFOy73vr9aL/MktIbR/BTsENdOrk4D9HBftmPujDvm/c8BiWxpNXxOFlWYDCCDZbeckw"
+        "QWq86zbeVw32faUZtpit1E6HVmYRRWUtdBg7QC+5I7bovpirAxmSxkRYHdXIKbqORqXQ8BTXItPC"
+        "QGwIIQ3wWD7IVboqHCo/pLPcYLU22lWi78UMGN+uHWfJi9ezqdia0J6xIda2Yg+zaw4Y6poaIcUb"
+        "6gJSz+DCALKW88rBO8H3jU67wGQ4p1HZCnMhvkU83YYE+ZzGVueAIXGhmIpxji2G3ujEDIxRsTBT"
+        "BpSJN6yJ5PuAdx7Oionk4vANo7SZ6xBMQKUhKndQJH7aWZmeOvGcSg9RpotapzYJ8Mxr71OFy/4A"
+        "pYcoU1mtENfxhSN/gN/4yN/453/2dz7367j/r/d/+sN/7rd+sefJwPC/v/SFLf59nn6TyVc38be7"
+        "+x/oN3ntA4/T79N/eB5/z/3MFSjzKkU3fe7o5mM/d/AnH2NKb7311qeY8muf6v8mk98Fmv9rk8+e"
+        "vv/fvh+3/wCu/z/g9+5zk8l3nn/xVgb4aYqbwggr9Lu4R+7irvtf/nmq+My1jxCsFDlO3AkyczGZ"
+        "uZjMXExmLibfkSLHw/Q1DCKNeYhLvJUDVtQke6qEq9OMDWnU1sRt5XAuAsNw1H7DLUkARSQyXpTH"
+        "hvxPke8EbiLxOdIWOxdDy6xyLevb3dAlQBEDDQGOGGgIlCAB3A3Nrmf1NflcTT3jyYmqCRWImWwe"
+        "JVYgOXRtamMFgD03Di9ideKgiaDQ9m8bFxWclqK28GzQMYJCBXSMQRtb1NSkJgH+OAUfDat5BGVg"
+        "BdGORWBGhRxijLajrdG0+AH70MSBIGvnUgaGW2V3cWROZtUPzhsW2JLQ6mo0enBADxL3RdbfQKNB"
+        "sDWpiUYBVAw+dEoEbZWVhAWCgos79CBJ0ddNWCJ30DcAn+7IbLtLNvF34shMwSLiu0yiEvsrBxo5"
+        "xV9Z9zxbi8Oy5VhCdlhWvC9OynUDyeqRPIYz3Gzs1Ggq7fpgyDBt+RQ/Y5EaX1LHDtayfygUn6bn"
+        "TTMeSanmQREngMdf4mDvdUK/zjM2tQ4pZaaUmVJmSlkojZhf2dQ6oIM4AayFS6yFS31pSbJV6JK1"
+        "QqAVKAEGZtQZgz0xOUiOQO1qwRFnmjW0CNY9DRjHxOvNFDupsjiqBZihvF+5dYzOj+xMGrh5ge+N"
+        "ffoRCIdb81ro0WkVe5OZbDuMjmbdgFUCix/m01cXi/1ttigVCuzRWUB3vwGl+pXiQb5hZpqVESfA"
+        "XGCnOjuSspsq229T7nuvxtaptfZmvdLr3YE6beAFJXCHDoNQPtY46qJyHPRJYmRxy06ggaWZAR3D"
+        "NidDJqfij4C+pUNjLxqf+8bejpDdVu3ULEYvrLC2/M2LNwNJRzaQdIRgOEXSLM3uspF8CwjU1oXI"
+        "hCITikJorXdfMnXsfzIcQ9WJKUFU7Z5juO/369lhIddFrXdCprkxK8540c6WiOmJTeNWL47Ak/Aq"
+        "dreYKTuMvGLPi7XCMLLuoXJPQFztLoe4NILrORvxjKMrYRRR/Zmfu65wymNiV9CsAe0w1AMRzDn2"
+        "Lx7IYMCHDE4suUYenliKSpFOrOszkVUMA0u6OHe9DUP6tHVVIb1HruLHSPdLIzOPxI8xdzwemGz1"
+        "2sBkTABQBSYrYlrxMmb0Mmvjn+1alTElGBhehqebPIx/bmScDwr86F//8Pnv/r7J5Dvo6HWSXl75"
+        "7M/GLz40mXzpoeKtffulo0fu/TOfanIzUK6Gy0+du/f2S+Ij/j0f+sobH3209h3//30eWvFIwe3u"
+        "/hJJcX/i1uXfPfuNf9KT6B4U+PmP/fhd99w9Obp99vVbcO4u9lG/h7Z/5fyv/MBk8i7Yu7L7ypa1"
+        "5zcff/zHNyevTyYf/vz/eevFW5/Z/Mffe/fkZz5w9+Su3d03tvj32/D7t1u1m/yLt97cfPHW78Hv"
+        "m/D7o82vvDHZ+sob74Lfe+D3nVu3bv3CFhX79w988sceP/fiLfjLP8xP9YGfOLe7+62tF29dhKIJ"
+        "yL8IxV/ZojJf+5vn3iPtfeHutr3PP/HK1oOfPL/50LW2vfe/3Gnv80+8scU/jCru8M9oOapQpsfi"
+        "N0cYRG0jcPYexBDLweAcdUGhnorCVxW6C415L5mw1nuJzVc2OFas8EI23N6Rv5FJM1/yzyhJTtNH"
+        "DPxT70DB3TSV9C1AC8Sg6BSqaNj/3FPZkv4FRIyg0GgB0plNqIVGJgQ94D0IXyC+WBc8+Wm2tpik"
+        "9Em2mICZ2EoCGM0uoMWBytAkyhlg0NNKFweqFFgtFtnLjKLQU+2b5YKhnB1E2mZ2xJiyNGqKHxXv"
+        "mtTskoDLu0VY1aEVVZOleJsmyZYJGPMJ01RWFoPb4ZGFktmoY7TBkEKn0CwAEp2PXmNmLUqrpNrM"
+        "WvAAm8xaVdfhB8eeSg5W8hRRzs09VDa12CCzpWEhjKCvdRFDs3f27Jnd0bMiqm9PQIwZYOywmhsU"
+        "6gpzY7wIx7BLCLtEsIeRNBQSzF5i2Y/LU2fBLRczadQj6aQsnR1JVWX8jIMOTYccRfyJuTXWotEY"
+        "bbeWtq9pkxU/+aG7e7TjtOuizYVK5pjdkjmGEqd1IOlz6NhUUI+kxNl9RihtWHY83LDes06NdUEb"
+        "FFODENNPneXkbGGM0o1CCScInFJxh7wweSfwDr143hEMh2mMJethehgdT8l6EL6D+Eddp0DDEPFe"
+        "cjKaZzDfzcA+asgZY/CG/LCo0YZSsRnNUzK/Mcu2BcvGAhstAy9+dSXGjb1cPIevkxs3q/41V9CR"
+        "c6VAPVj/77p78upv8vp/D6//uIZa+5PnX/1B1p5aexvW2/du3v/y+zb/82cmk3+39b9h/f/w5l2T"
+        "90jpL/u29CfS7a0XvvTezXtvt6Vf+BKWvk9KfyK1pZ985PbW819/7+Zk8r1N6ee/jqXfL6XffKgt"
+        "/cLW7a3n7r9381sPtKWfu/9HofQHpfSTj7SlX/7h21tPPnLv5jc+3pZ+8hEs/aCUnrRGt1o7OmpT"
+        "jtSXEYhvTxbfniy+PVl8e/KaJDXvmABrCzUvfATEyz2Ll3u2JUOpwHE/zpJpRFKNvMP439WeyLG1"
+        "oO7eDv8guS2MWhNhgu6orh9KjFGfahjR4HrioxsaH8OwGo2o1M0dmUvuSFreNXlM81CZGnGutpQj"
+        "z4RONRN71XK3mjXdak2evdjJrKdYOSrOHd6E2E3G6R0wl57T0ko2To66BD5FfCAjSDJRFx4gzNA/"
+        "m7JuoHLYuiYbZ5v+xgct6W/OxtpN0nuyuyLIBFKjajo6LroqfDFZXlD2AoPAWGAdeAW4RhMxl8QL"
+        "luJHCOgCK8OFZcMsQSdwPAkDLiVV7B6maVFDVJODAZlnVG9zH1/tbO9QH8d3N790vN2exl6/OLiy"
+        "dwBLyfxIlgFaX5DnPrx+gFI3COE32uMiy4t7AvkeZDL0TNcEb1vovBKwPT3aW20/vXdw+fDp7ePV"
+        "fLkS97wOekHXRCS5sOjiwlIQrU/LMDSlePoBW0mGkk7uxRhOzr2omHXm5Its6rZd208ThlB0+40d"
+        "KLAZCCjYJhMjKXtLQtdONtdOLlcmq02XLmV2bQhzRElDmTyuCmndmph05zIy1qdH88vb+3u7ovNh"
+        "+Wh6ee94p4NleWnaydh3eX5tfkXOqvqkpPMrJzWZSGo1Mdd6er5aLGl+RgccjlYozjLX5s9sS3CQ"
+        "40l1Z3u+s9p7atFUxy5ao/YaehyNP10ewi0WFNkdpkXpvKEPOkY31ic/tVi2npLDlAfFKMcpDJe7"
+        "c+Ctriz3jugUudWQUhx66DY5P+FF6T006MuwJO1I/gPg9JvrHC0Xl/foZrbZI4iGRDmLzjrz/b3L"
+        "OJJk9CGaBtgRPENGc/AQtXo533mCWobDZ3X9WMKqFsXja+9gBe+LzFPsoQ9w1MwRZ+x7NnA8QpwA"
+        "KcHhx3admjPNNNuPNFtuh+mkE1srElsrMOfQGg07K7QGTTIcfGA4+MDo4ptjR33kYEUZT5MYhuF8"
+        "o15WErI66mUlYazT6sWtRiNuMG6EUj1WHBMl2NVDRgizkdV4Lp86+DaKBqWoruMGJaTDMjg+bTHT"
+        "8ADk0aZmunFX4awWNHQ20KUC382sSUHH6h7DRHkMcKwM9212jqGO6ZrAVdQLkT9M4AC8s4Olgy2E"
+        "sCB4SebR/l8sJu+gZzGagPncPWYoRHqJItaHMX05WBOtNgbKheTIIQvmUno662awclJTMu3ODNat"
+        "1WYf3ZV5zRT0/ODK/qJBc2qrSlhkXypxFK/EvyUlFqQMANORtKuURbgZr31HK6bXzO27o3M7Yrth"
+        "ZOMpWpyZCZPU+KhNiRXis+yC1fJG0N6YqmxbzOxo48nxbNrlWTCi0FUJvLoJnYA+1eHpTGbxmBm5"
+        "zlKQMf9CZTSvY1YxzNvfvMny37/4Vz357x7SHv/l8698v0hJrAcHGe2+zXO/MpncPX3rrcnknMh/"
+        "WPoPrralf/A7Xt/61gMTkNHa0t964JzIf/eQfrYt/ei9r2994+MTkNHa0t/4+DmR/7D0/Qdt6U9+"
+        "1+tbbz472Xzz2bb0m8+eE/kPS7901JZ+7v7Xt26/NNm8/VJb+vZL50T+w9JoPEgZe1jl9rCPbN7B"
+        "8fb1fXhgsEhPG30MJyXuSPuafXcMAxCwax+fgbgfRsz14+J+ZDd+G41AJzAQxFQLg/juMIIb8ZyG"
+        "GwFcP0cXcH5tji480J0D00mfqdscXXDQ5ugKVuVGYChhmRdM1jPUOyJE3SRC4xmSJTjzbSL0uVv9"
+        "WcppFjgTJkEvMDKUQ4o5QOh6WZFlAmqyIjtJh9xAG0yVMoPT53HWEPZG4bzTxK5mDHLox4KTMwqa"
+        "Cm3rjJLI4aH1QZX0op1ECZIgBT9HcUpKkLHEJWuyJgjRBoYGZlclycqF6lr5f5st5vPlekUAHlxd"
+        "zC+TQDEiX0hskLmDMJzCNXQ12GNcxSkMxdsPm8URLVb2bgJLI2b2jimTcHUGSyOW9ga3LijMS4xD"
+        "N7IUc6r0E08TzoyUsyO4QbY6zLtyWsbaOnMEegVzfMbAIB3QXc+dlBkh9qM79TsO8x7MtkOB1dW5"
+        "FEzgRZBFJJ6PS5cL4+FomZzEes+EowxP+24Nf1JmRBr2ipNDDNJ6+sDxQUaYW1TZszucfLSGxOSA"
+        "it9+OkiafzxfkOafhO5w+mYnF6wxazIPkb7MDPRloiJLlZcE3aTE/vpc+SaropHufKVGcV6jqpjp"
+        "sdXrfJh9HEmqU76a0knLmcS1pk2hiyhTfbsGcb2Eno5xrotbF0YOBdumiJP/QOzfP1HsP4lpXjZM"
+        "cyX173eUf92c/cuu+rCzbHXUBH2mmU5soNbfDJhmloI0Sfl9nrmQsz2WuedN3Wa4e3ULPatbbwL2"
+        "sO56FVj7hce+OXvfN//ez/3aY+jdXbyvi5dB1wsb/9D7e+CN/ci97I39xz/xkc3aZ+A9An/2P87P"
+        "/9afKunz2CHjD/+Zij/96GTydx9lh4ziUH6Xmry0xb+fp9/Qw7zvs/5do7Z1E+VzLrwdpAgZw5F3"
+        "wBqAnT9Yp7IztmRfeztpQy6E8hUhkgQ9fU+KBa2S0K7IUBuGLAzkBbjO5t+mxgMOtp0S1uQRyGSf"
+        "yuyentk9PXMegTzymaTsT8l46RR7CXUTmin26OnOooizw2JuiKq9kRHXE9h6CmxpRKAwoVPsf8VQ"
+        "cWpaH/4EzZ1n8ok8u67P5MNS5UCFlGchVLP4txlbR9FQZiij4IJhT/l2kqSFdP1SHckoEbuOdlY/"
+        "zIFlbZ0YYqQJdb1uE0bcasi7YNytxkbKDmgjJWS3STNgU0DLz5/i/Y4qHTvq/e5nKVZR4LT4o/Km"
+        "qMi14a9a0NrvUZQbS93NiU1Y9uAsJSx7qLqtInugpqqVPQJJK63sodjxtvu5Pt1JInCHapL1a+Hu"
+        "SSrwcrJeC7uVqq/XNPr+7kq4v24l3O9aAaqVkCvp4ULYUru0bPNrw9iqIxMQ11POjKbc9vQVCM/J"
+        "9j1/BcLzVyA8f2zIlw8/1Hl7yROYv05HoHx80Qi0Ap3A0/ykVX67ftIpd6P80A84+/z/Vo2JBkKY"
+        "pLVjw1ZHj9l8QSxYHE34DQ/+9gq80ch011g5UQ2b8OMssKxGY0OwFMfqTaOWiF4be5JfVE6wTIQO"
+        "7+ks57pzTgu0AjlrcHBl7DeavTv5eINGm37vWwidBAeYDbkvxmGiPc6670ez7vuTsu6LKVbJlwSV"
+        "iJRKUvSZYe5ICvsOuVIWvtOI6koIV0MJXA0jbNUw9lKdIEkWmbGdmjv2HlGQJphDTwzk1yUP5xqT"
+        "nVkT3NFaq8Ysd4hfa72jRvYseM1VRsx4hB6Y8sh4NTTndQNByDBxZ6Y8XAKpTX0juDS0NYSXJlbG"
+        "cMAODOKN09VJRvHGbtc3jDfGw7XGcXQpaJ/0GgN5dao1kjeWv66h/MwarT/GPxCfN2riHDFvrjVt"
+        "rjdrjpg0R82Z60yZHTPm3uqGEC397xgacljGEjOXl/bmdGmetaf04t+h/9s6/x/MTfU2/X8MBzeP"
+        "J4AJMv13VF/8xU3OylhNj6nyWWh0JoajpUe+n3PHiQZnVU7B6st7xSJm1vtENmYuPF8brfZ747Tl"
+        "yDraCTzR4co6Gorqc4KFM+vTHDffJdFBdlR4VU5RzoI7kuej0Rq17PkaYUQ4+1FhpHD7g0wfnJVm"
+        "XEnMtpKxpajYT+7M7GzjuONZyn2PY8kXTbyz0aekNnZUckRZCNKGry2JJDuQeytLC4qyX4i0oIkS"
+        "SwtWZN/Ox2RYXODLsarQY0xeL11qHQdXxl4pUueD9ONKs9EzS6kz0IWMRVONlqvDqURfMoimGsEv"
+        "15RfdsufkKEUGhLwe3hslO6zHzaKxr37TabT+JExHfYJDIhT30YmIWNJmDXykXOCRqAVWM6vy1Nn"
+        "KE/Yt2P/0SfYf+wJXw9955/zHB/UI7aFE589jPXmI9f/FwpfcpU="
+    ),
+    1: (
+        "eNq9fWusZdd50Jk4DYlVqRY1TVK1qXP/YIu5h/V+uH7MXDuQkASRiEelsXV7PXNmfPGde6/PvWN7"
+        "bI2SRhgkQLioqtRJVLWqo6BKlVMUFNySFicB1VC7oAhpKEoRRi0PJSCqqimVWsz32nuvvfbad8bm"
+        "MfY93znfXvs7a5+91vf+vh3d6bu0MkvnFPyL2hvvY4fzJe7R03dtPLbeeWK1vbt/eOV44967zmm1"
+        "pKFLpxkYBpYBkez+yQiPZI6OV6v17v6lgpImSpopaaakmZJuUNJC6fzelePzjxd0HNFxTMcxHcd0"
+        "XIOOG1+zWlpTXLMVnK1/G8C5Bq78vWzj90pLoAgvml4NvTLG0evMj5PxtEynZTot02mZTsty2uSX"
+        "MHgWvmoGhoEgHQO/glMvrI+2V/s7j+2tLsCZF3f2jhB7vLtebR+vLh9uX9wDtIa7p8foNaFNhV7z"
+        "aFejeXQY0Ifr1dHRFXhD9INdZvoXdPJWmein45BEcNW4yTCaQPA3HUbUVNY+2Kh04KXmTYRJ+hxC"
+        "TjHwUlMxW2NN1jEmH3jFB2uiCs5ab10wpn3jNtXSWO8Snh6thxcNd4GwwQaVYoyAVE4lwUb4pPBr"
+        "tPERZ0TYpHKIPsFB41OOHRYuTUUFJHLysaObkzHZZmWTiSFEWhlX1uvV/vH23s7h9vHu5dX25SOc"
+        "HC70dDrhJdplMgwsA8fAj7ZLc5WFJcwdX3U51jBOgGXgGNBqrRbXOWQ3lrkOrVclC1bJilWyZBHW"
+        "BNZMwDEBJwScEHBCwAkBNyZAawQvIcGtZ2AZOAZzDCsvYYHiq8rFv8Q4w8AycAya29QYpIOvNR3E"
+        "GQaWgWMw8wOmpcLrA6AFGoFWoBNYXf/pu4JZwprBr1XZBK9hoLdLZGvJARjzzJzgjuJYF502GnlZ"
+        "SEuD8uEcTdTBFE/fFYOC+TgaH3EhaZ0NkM/0Y+DuNgpWTaB/2WpY7/Ct2uBZmylonJexNFDD5sGP"
+        "2qaE8Hh9ZYWXwmR6CJyIoV0agKr433o6ZAODyAAndt/Wj/7OD//pn33PD//6Hb92n/29f/j1RXrt"
+        "n9/50ue++vfe9T/u+88/+A9u6fhC/l39r+965ec+9OVfwfe/9Y2//uFvnv/5B/H9KTl+h8DTf/fe"
+        "rfd+72LxDvr0zBa+fv/7//BXP/bBxeLjH1x8ms+555EXvvb7h585w+fcfeaTL3/g+W9dffzM9j0f"
+        "vQ9ns1j88sOv38ezwRE4G4Rv6bgKg5wqtpOzIC1TCBZlH7EjuJcW1yAcMcppBWyTUQoYkE/G6+xx"
+        "5zkLTBQWhs8x+EDnmbwETgl3GMbBsnGM0hkXlnEOhHA9CWLh52zEXYN81yXlQuJ7l0Cau2C1dd0X"
+        "IE4Hlx2sM/pWREXgNFHBQoI1Bl+AKLj7wcFEAc3TANTRzsa103c9t4HMcf/K5cdWePkWt/zhanVh"
+        "+4nLj8NnAyvWOVjzyHQdnbqxPrwMR4Crw/LauLTawfMQf/z4+uD4eG+Q+lpZ2HJjraJSDFDG+Bab"
+        "gSVNB9os3OF2Qfm92jve2T4+2H5sdXTMhzZ9SFZN+Y32TJBGIrWB3wi17kzYe87WrE3BTSYug3Jq"
+        "2IhpmUl7UwKNQEcQ1ohj6WDgdsCpgLJTlJui/AQFnIqYTyHWg52i3BTlJyi4o0vXsXO/NKpWDgEn"
+        "wDCwDByDOckQlipNhaHKJY5FouZXATxO29G4ptDN1WRZztBkM08282QBuHoqWWbOAoDW4WO7O7ho"
+        "1JL0iI3j89tHq+NjuCpc+4w4T18N22hj57Gj4jAu5tX+pd19WJM7h7jCcPxVIH3+4PLhwZV9VClB"
+        "w7w6fIYBF6+s9rZlCeI3w6RQr9k4At1s92Cf1/je6qKsZgv6GBgjKOA2DnePt5/e3b9w8PT20fHO"
+        "GmdVoVf0nYhc7+zub2t1eXe/RNgOce3ao9cube8d7IuuBrogaVHAHkBqLBNyDUJHgU4gqUKrZ46X"
+        "x1fWj8G2Ozg4ohtDM5QXEIr9e37pTto/WF/e2dt9FtjL4cHR7vEuTwBGuIy8i99keYM6KL9x3ZvY"
+        "vckdyZnf7Rz8cNplsyQRCG+T7d9GT29leryTRfV/bsPQaqDF4BS9xy2RrqGMh9EBWHwETTQDbU1s"
+        "2SdcvobtoO6aN4EPZOO0d6BQg0YNHHC1iezH00GYA0zI53jSHFIYzcHoa48+Sgz7GHEatYzuHy48"
+        "+iHxV7mwc7yDH84lmKsCBRqUcKuVd/BtJapxJ1yEXcMsL6QUMiomG3B8+xk4CHoRauv0+SpxaFCH"
+        "zJhN0sFnifWDSo7rGlbZDu0fuBWmULSs54P0vd6QqrwBe/L8E9uX1ruHuMKPr+CdTKyb88ZZry7D"
+        "Okams7d7vFrj8RyX2QxKmcrVZkISIYIqfK2WducP9q5c3kcaz41kHmimGmT0SOghyqgBZZPgdIGL"
+        "gjPTU23jVFee+mhLgJJuzxy1tMud2BylDQ440xhnG+PEfs8qzspXuEN0r1vylVavj9rmKYNmRtWL"
+        "2IIgL/mAixDuweQ4nrZ7tP0UrMkLeAhQvClqdZ9WMOwqm60KrN7UFtHJQ0jBimTDwKTAZCruQhCc"
+        "qe4W4mx1oxFX3sHQvoO4PNX4JiBKj+8VLeLpKDtFuSnqZr4qv4Q7BS+aXg29wnf2rolzYFyAfggq"
+        "TkhwYxXqsjZF+hFVAh5mgN8iKixNiKCRJJV8tmxIAC8FFRXU0hCz6Km4Y120RnkvPz+Y5Et4G7So"
+        "pCyG53b0OY/frQ2cwXwWp08oBXo0fLMJOgoKBJYJNuvAWjnjooLlCfaSI3OOUB6YdU7JsD5POFBc"
+        "ReUHlRxvAoJaZzBisCGorVTARQap1yqeRqqiwyuiiqCmijgvoKKKuMigpsr3SjNV3aCqmapuUNVM"
+        "VRdUQc8FtcdWyx9x5bJOM4wJvVw1Y0JczZgQZxo42zjXNcbdbHEbcsLhqwB2HGh2HGh2HOiRO0dc"
+        "VmAOoAyyEZmagqtBmW8Tf4okR0T6osoQOw3AqLAMJoBaDiqjQTsMtIJMm0ukufcwGaei8QEWsVOi"
+        "O4E+CpocMFbnrQ9kryeFq5E5KlIybX0AZ2GjXqL6Q8oBmKLk49mwzHN1wCvxxJ1ToP2+EfCTNaT2"
+        "bMg1ZmSFic6xunBlky9h6dlR7dmV7dmV7dnpx66XE3Q4MGKyLlSHRHZNNpU2gTg7HeamKD9FhZJY"
+        "P6FOPznneFchCALKbSC4xCCfBu6wRPXWJvw14Q252+kOWMeqp2YFTY302U1NdhAtGTccALYXyOOC"
+        "p8pacbBULHBFbcFQz4p9AilF0hfpxAjb2GXrgVvlCPY+691wE4Gn4nnA7JTFzeA9OvN4qcSktWst"
+        "laDYatak92rQ2FipJgMSrwejAZsORsEUOkfwuaCm/mfQc5Wq7EhA6QKVGGXKUYFxI3PTMc6VuNrz"
+        "QgzTOYfzJaAFGoFWoBPo274b/MFxRBAKQSgEoRCEAkCf4Lq17Xx3YH/izR98dwqGjn13mk5GX5sq"
+        "fXdm4rwDE5lGzjjvhE4PnUBP7Kp03plIh0DRJpAJWMWAT7eGgWXAtCIKtJGjUhZIF+HYBUW7cCB7"
+        "5gBeWIAXHuCFCXjhAn7igV2LBzYygSgEohCIQiAKgTglIDNgnzICLdAItAKdQD+Wirx0TAAreuwv"
+        "QVQqULheEZc7nMgYK44CkTG9G/Vmcge4AC4b8j2Q0s/AMpjoEXrWawLyiWWWYQlm5BNLsCklI5Qm"
+        "/nRPdNh1Y9h1Y9h1g2BCRxzWnePadbDUHOaskogihoDc7yz3O8v9znK/s28GAzMG/TIFAzMFAzMF"
+        "AzMFA/NsMBCZd0beDa/0NlFgMFFgMNmZYGCmTZs5GJg5GEjzjIpipaAusuE8NXbOiWwOAa2d4YMu"
+        "PuDv3H/AHdx/IC+KfABjvxW8QFsFpE2KFpTv7PBuEMpbuGGZlOosqAB3Bla2I8WbMBEuwIUYo0XW"
+        "RSigkZTPCoxBIQXc3uSYow3WpHIK5K3koLORqLORsLMhXkiwdf9gf3CYzHEIzXEIzXEIzcmxOSeh"
+        "A/E2CUYvTZ7iOHRt5QPHs237LkeaUeQZRZ5R5BnFhjcXcH4x/PvC5x7u4wOM+eWHF43j5b93/tW/"
+        "SBGOVx6498rvfOlfj6Id7xf4d9YHD30ffHiXfP7mU//pzO/9o4+7H7u8WHzmchft+Pzh/bffePFD"
+        "r3TRjifx49945sx/2LyD4ytn/snXu2/9K1+9+36cDcZe3s7xD/+lP7pPjvumO8nPupNQYCmWW4rF"
+        "lgBPgkqRnFIkphRJKUVCSpGMUiSiFEkoRQKKtItBQGU1xrzVyVWytpSipdBD1y1K+aV6dMOQVmwx"
+        "rI6qtHja0NdkvXjdUOG2QT4gXxUDoTvJ6eEkF4qTvGONmxyrGz70vhEf6a3xBpndRnTk5I3Gefjx"
+        "ehvDYnQVYz3Rea3RGxmcQeWK4gD8Y7gYElgFobM6QOWJaLGD7eZRSV5t4kxAm3M96/JwtNNljajO"
+        "V5lLZtpACLRAU3nPEWcFdmNHSvizLBsUx7sReoFBYBSYBPZe3M5LeA6uThT/wU0IuKBKHKP0OGyL"
+        "qJGDkX+rUEZ3rYwjGXfvXZH53qwjIgVQR0ardOJZ9OhRuXYrcTSU6ONftAukkcp5YiANJuLsSBmt"
+        "WDKzuim3TUuXS11VFx4/DHnhjQG9NrFQlFQIdBRYQ55qHdG71Kc0FMYGrlRSGRJ9ddIlOc60kZSK"
+        "qNv07Cw9V9NjtVtyM6IuuXluE3ezxH1HvHA0oIJbi59AKlEVGuxyGmaigV4yDaLAzBCDnKzG+yqo"
+        "Z/IEhQ6YGqUnKJ/Ejh7sM58nKLTs7MSKE5TjtJZ5JzhZiQS0QCPQdrDO28A8hDmdkYN+SqJ+SsJ+"
+        "CK1AJ7Clc0Q8G15UdfMjkYlEJIoLqbiNUahN9ZCoxls7eVQbenMQ1lm1XXvTMIlndtiNrL/C719v"
+        "ttowFMWzaRhmoZJEidYCWSkbmYWODhn246JRY0kEE+DTTSZgFQOmFSOb63zRQ0wg3zx/DzQm1qXs"
+        "JNspsmoWOdsocrJRnE3p05QKiK8TSpwZqDk1UHNuoE4zWX5gUbGtNaGDOAEywjEY2541G9FscyFg"
+        "fjMb5rZLZpRGC6gpWaZkmZKdMdiAxXDg2zC/MfKJI+TT8HUYha/LBCi9jLxiohZoBMpKiuJwiAUB"
+        "9kB71CZChKUILxzQjEt0WYEhYZzEOCvvwc4RRsEPts8frI92KLq9Ot59FsTiaqNzVzr0+CdxV4IW"
+        "g26ZTvdBN34edJ/kKE7b6z7we4GkBk3GBCchNJfQExfGMVa8KgPbQ6OzOqRgPWg8OMZ7PRheSVvd"
+        "aTxFDAo+jtdkoKVGaY+JnEYIbJ1qwI4YBHNrkkJIRAcBL8MJHcO+GwQe9dyNxylmatRU59XKVzpv"
+        "wbGHU4sz96/s7XUnzI6/9ui1yM7/Yt2CBDG5Soaj1NcE6m7os9yUhK+G6xm8Zp4jAIXXTPg9MOJ4"
+        "csabooEjf6YD48KM/cAwIdTstGG6OVLKHczcqkr580yQ5q7LyYtiO6SUxEZKSeSUksh5I1GQjZSS"
+        "OOfWUVO6iNMMDANBTpwzSuhOVphtUGUdC4FhIMgJVUwq7NebmskmjWzXRcmmjJJNGSWbMg46TtsZ"
+        "qHl3ItACjUArUFKmVNsZKAGJLiLRhSS6mEQXlOijEo2U6nNibFqaA4EqFGAtu+OJA2qQw8pSWNP1"
+        "qCHAMwyzDhQU5yjdT1AcYh7GxNhl7eV2ah+NAruZPTJ6OFMlzNGLIxSmZIfMMVBBeXHvlMNgBi5T"
+        "OmGPMsaCegFMfTINjiMqMVXJsu3CEZuYeMjGAKMkHqL5kwAVq/yeLsSVfY8zyYdcx0MMWv/K5ZQD"
+        "iDdDbqugEhu2Eg+xGHEGexgGWMVhC6WyM9bDr25SNCFS8NWb3tWGSZfNdJ5NEGtLjOBzQMS62EV4"
+        "lDE92wMeQvZll0GSTlPGiBqYhpXiiIYyiAzIDBwP86e6hGrQ7dPJLI/znOfiBEKmg5Siz145nMEo"
+        "ydexoTpa4L6BCwVu0Owy8efMbDqzMscO0i5YN3KdZT/J02uqefxTZBapmUVqtgJqsqlFtiFfM4nN"
+        "zPI1s3zNVkAdodcTooWwbXMO2LvLuQIMHX3rGJd9xNA8xudx2vUk5BWinR6g4ozum2r2ERqkuJwj"
+        "cqbCfJ6UotxwKnnZeWpnd4+TbtD7UuUGIvW9g/NPkAN8oo6ULjjYKCjh0RRBjgob4mSbMqAGqsAa"
+        "hZ0dNWUVoj2qMMUE05JSTJyTrzymKeeoovC5gOERZ0bJJ4CzIXkVbQK7xWbFHh9v0OcFm06jQ/3R"
+        "3s9yzifkcz5ZenXtOLtPidPcUHE1aIT5Is6OPIfi7NolcnZymB0dSkvXxdk12lN9oB0HaTW81SUp"
+        "bUta2o2IaV9S04MPUReUc0nO6JKcMSNyxpbk0LygoCiq1EEcdmFWngILZBVDC2B1QrOmQWkWVkzt"
+        "xsY5Z6gmCl8FGAaWgWPQOJ1lJli6HNPSAji0pdkIptN9+/S1RAc12clagCGQ2GWTJOaZJOaZJOaZ"
+        "JOaZWu4IOruu/cHQOzvK2L3Ffqiu8KfhgiATCV9HBqSntAB6IQ9GNBOnRmxHQRRfk1ySXJFckFwP"
+        "ToaZIMkfxzFHx4FFxzFHzlqcjeBgfryaqpaOV4aTT7wyHK+Mdski3IMpocCEAhMKTIiD8wjaFrAm"
+        "wUBACxSRSQIHoTjick+ALjlwst/IiRXYYYBw1pmV2eIWO0GJoaDEUkDouvqcdvUonS5nT12aWgkh"
+        "oTNrZaBSkLh8T1IU+JXL94KZVo+G8nqNjSpwajDYz8g1BLhcAh+XwEsVVt55EyzmIb11l0BQ5Fom"
+        "xqolI6NjrMRxmd1hSmEa8peYczBjzcshf0l7ZqCmy4AyHQPtyBHDHOjpOCKIStqoBKu5QKnK13CV"
+        "r+EqX8NVvgRqfUNJ4fBIiTkhacphJu/YvkXUKGnKM85Oh7kpylfpVogrs6ZSEa8pjD5rMXEuJhWD"
+        "Fi+QxVxBo+AkLNMMPQ4V4YC565z/iQ5GA2vCUJyKrBTKKgSbKDoW34zS3lqvEtdUtQ0j+PlALwbz"
+        "QLHdhYFDsPbTUO1kiE7OmkwinhMWUBi8jVJ3xaiIaUypT7pClAPxb1MMWKyFjjTQbK4eYhBn43i1"
+        "t7q8Ol5f3X5sB+4/lmkcnX8cVCgp6tjbuXrANURlyJF4REQ7qQhWqG4DTkpqgJ+mRqzCT4cauBWe"
+        "PWF+iC7YQMuf8gARWAaePE6Sx8EJO8C4PDuEyV6OhubEJ2h2xaEmS/HgX/vo3/qnf/a3Pv+r+P5f"
+        "7v34R/7cb/zcKJLN8L+9+KUt/vsi/S0W3zyLfxcv/jv6W7zygYfp79N/8BD+PfcTl2DMy1Td9/nD"
+        "aw/+1P6ffJApvfnmm59iyq98avy3WPw20PyfZ/nozd//lx/A11+A7//v8PeuM4vFdz/02esZ4Kep"
+        "bhArDDHufptcxak7X/oZOvGZyx8lCPIXo6zKaVBIycg2FJgGlM0hggGrKblTUAl4Vo68LgUFaw5Y"
+        "PG0EwYBy60FPJaeloCzYwRb3S2omvbEHNkavHaeW917ZGLCc2fnC0FcRtd3eLSs4B+wrypcKCs6M"
+        "qtuQjIIPwZKHQ+bRBcbIeMK4b5H1i4EVqu8j6WPB4KzTddmpw6ZoHSTzhK3ib93XVLn146+pyxW0"
+        "oMYbaYJrTKAe0phNHTVIpCkRdAJ9nTbcSPC3HI8fXJ6I0RNM5STIcrXjQW6C8eVpLVWC0zDcUnJm"
+        "FKfJKM6dUdO2D+J1Ozpe+ipjrs5gB73tpCEoOZDx1EN6AxPbKgx1HJd2KGI+1hQ2TjQ26Qd628Ym"
+        "pnTmXFdtRM5rBRwrHwnUbyq0wqCF7ILSi0xaiVMUnCGdJHkHgvFav6T1cuQBT57j/MNd5IgOCIp8"
+        "k6xRRQNbud9OUhYKnWBD87zcKJfKdfqVxJGGSxzrl3i5nFilFQfdEIp31Yp31TZVVwq74Surk3yy"
+        "nCunSjhx1D6hobqCzsGuOZ2ne1yckPKhGatrmkB+yaWqlutXLdevWkFysF+inSOra5KJ4jB3osod"
+        "AZxX4wAJovQUVZe6Ic5Oh7kSVUxBcuqp/Ynl/ieWG6BY7oBiuQWK7Xqg1KWQlFvoLWq+BLRAIxDX"
+        "RudDMINnwcSROyF1yjV9yqVzgdKlNrGtzJLWmWZlm3Rra3qC1g1v2TmCW6zLo5JK077KEX6h0MUB"
+        "0VcLok+BIMiSA+UylaiIpxfs6ghaIPwZVE8tWt+buJqTidhNBJTS6AMlEKnBVxxh67GvmLqM1B5Z"
+        "N/UiNjakw5+9rpPEXwBLP3K3By0XhdMepPYdSfhMQM/HOKGJ2IznqnFmMwHTrHo2Y9gfOLidM7s2"
+        "BzaDkS1fR4YM3ryC67jiigvHv+I2LlTXiwXMFw/W5+H1qugom8EkvLGbQVN0ACCFaDaD0rjCNkG7"
+        "oeM+cZywpnT52Y6SpiSwTc7p2eTMIwCY0rvJNUoI+q1wtLd7uL2zf2mvcyQVxQxTaGo4c1FEabPn"
+        "Qlww4ZnVeGY8vqF2eE4L8PNpAdSxgylZce03KFmmZGf6omDmEecfTfqrBCbK+r1kKCGYCyKfGAoe"
+        "lCwlis5J+R9pyV761MjaSALYt584Qp7m28dwq5gpJc7kRsDh1sTtY9Jc+xhuFTOhYziTzXAGmuHE"
+        "MQRj31Fv43xQ4Mf+5kce+t7vXyy+iz69StbLlz/3k/Gr9y4WX7u3y9a98eLh/bf/mU/1vUmoV8mF"
+        "p87cfuNFyRH+vg+9/trHHqhzh/9fH4dZ3N/hLl78Allxf+L6hd8+/e1fGll09wj84sf/8qnbTi3c"
+        "G6dfvQ7HTnGO8m30+shDv/iDi8U74d2li1/Zsvbo7MbGZ84uXl0sPvLF//XmZ69fP/uP3/eOxU98"
+        "4B2LUxcvfmOL//4t/P3mVp0m/dnrf3j29dcWW6+/9k74ezf8fTf83QF/d8Lf+7auX//CFg37zbsf"
+        "+VcfOgO0r1//pQ+fef01+Pexbf517/4RwO/C8IfhK34WTvnKFo3747995t0y5xfeMcz5+Se+snXP"
+        "I0dnfzoMc77zpWLOzz/xja3nn+gildoUgUxcmks7IFKMvo5iog2dQMOH/6xGVwjlSRiuACwzVJCg"
+        "TgFsQGTRyslY7VSRoJJDn6AykjTexK5YgVKoQU3iIKlwN/IUOP424+XrisBseVnNU/oMlbr9CZdd"
+        "NQwmzOw2Y4V6MN+0kTyXwUpEh04r9aXGNSZQD5mZTVW9Op5NVU5qVJ90Q4md3pKB39nRmBtUoUy0"
+        "hUHef/KY6hYzxp2TtdxPhztNUCs/rKY7zR1FWknsJswmsVcJSsy9p6+35HPFZNMu/15Jcv4Yobhe"
+        "zAjw7TQBKiqyXFRkuajI+nEqMxHi5jC2aw4zW9sNaocZZ/4DxqoJRo9bOiDKTAbZCcaVJQQnO1+B"
+        "/506tXj515n/3cb8D/mHtT/60Ms/xN4ja28Ar3nP2Ttfeu/Z//hji8W/2fpj4H8fOXtq8W4Z/XU/"
+        "jP5kurH1wtfec/b2G8PoF76Go++Q0Z9Mw+gn77+x9fy33nN2sXhfP/r5b+Ho98voN+4dRr+wdWPr"
+        "uTtvP/udu4fRz935F2D0B2X0k/cPo1/68ze2nrz/9rPf/sQw+sn7cfQ9MnoxFDZQVyfbqf5hKHMA"
+        "/Zm1+0zKvtUkc1ld35SM7L4Gggqh+ioITRXJHHJcWq6CkJoIjf6PPhmQTOG+DgL2chxyAbESzycD"
+        "dzPqzveG/bSG7i0aeAUcw+wX6xScHcQI0M6nDARtxJoHysqjai/hurAL34b/15a7tXNolVq5ZW9u"
+        "mQzC/la/DOEmucGcgziTC8JUOhAZkFI+ygMh97NlDzG5fS27iek8S75iG9hxvOTcj2nuG4cdEXAm"
+        "SBSkmyb+xpl8VE6QRaDrPqiW01yVpMgqyZFVdprc2henSmB2Skz6UylpUKWkQ5XyE2JDoaoksxld"
+        "O5ucv7mzaez8D7gCB+e/yl1PWHKCTKrcJr5/6tjaKlMI5M0bU9ZDu1mgndvk9Dy9sSkBtE8oDeYq"
+        "KUmIUEtT5WCyqQtEQ2/qanIxiKnLXQjZ1PVSRz74PdjU5bi7mLr8PkrfoDyWBhTwSxFlwmAOc2F3"
+        "v/GomqjysBrdmwGp5XkTDyaJxY0Lu0fnQUpdlJQBFpMbR1eODlf75FS5sHN555IcVfXB4/XOUyjv"
+        "1p33BKf99OMrwJEFW5z19A5IQlqTmJNDWkNfkXN555ltqQlyvBbPb++cP959asWs0kgPsgKHo3Z2"
+        "e4JwzXg164OdCz2K7K2+DxOm6eF63rgUywYSUe4Xqay2byaRPa1RCcY6cstJkgtplV0zCbrfWoj5"
+        "WIRiibL2JWkOzPa0JTArxCm3paMu2S1M3riCvPEF+c6BxeS5rK8nb1JJnpxYTL5zSO9h/7b9o+0r"
+        "e8e7l+HuNLoiurqaCysaXdX6iu8cb9qumis02yKCNHB+2gox1NHjZl/EKE2Zy0KydhMnYRDNJk7A"
+        "NPYLBxy7HZ9arYcmTtMmb9LZjR0zV9YXd86vqFcXHSKvMh7BVnTb9GPhD0X+wB59AfjxedG/wArq"
+        "v+dwvbqwS4t6myfb94TCo1VfqI4iqZiHsJkYTXXePOtGFzFXprrt7h/Dxl3GuktyHZzDNiuukZ3n"
+        "nK/xax4fJ3gezxlYc0pxoBTMVtusrtCs1TKrKz6rmyFg3kqsGh+UY4jrwSoi/6fGbLdxkiqiRqEK"
+        "HqZV5UhE3Mi5aGZSNimULWJgnJ0p1TpiFyq2ztTNWs3gr19nTXgOLI5yH3yXoSE4x7guknKLzRnz"
+        "ic0Zk/QY/L/bnHHCgFTFgLBMjjvREmtk1gOziQPrse2OrNKhDVbo29B/OWdWLLnars3qLehPlAye"
+        "ljEakEYha0mhDxY1gROqnGHdBquCtzGBjHSWuyrid6chG5yaNbSywZXv2kDAsU6k06aZE+ndQY2u"
+        "6VKkdweo2puF/A4sUN5efbV47b/ugymlR/oZPrYJ1golSDW81RhoycQkKq/6ugu7DK11x6mXFFXB"
+        "g4egEpCCc1HUnsxNuAqNKWUuoCwKGzP3zuow7Vw2raaPO9ACTOOQmWa7ce3nbLEmqLw61DxJVyVF"
+        "rBrr1BiXKxaHzRzZ/v9n/2Jk/99G3tMfeejLPyBWMvuBwUa/4+yZX1ws3rHx5puLxRmx/3H07z8+"
+        "jP6h73p16zt3L8BGH0Z/5+4zYv/fRr7JYfQDt7+69e1PLMBGH0Z/+xNnxP7H0XfuD6Mf+Z5Xt954"
+        "dnH2jWeH0W88e0bsfxz94uEw+rk7X9268eLi7I0Xh9E3Xjwj9j+OBtEWx7cBbrabxkG99MIsi8Kk"
+        "F2YZ4PTSC7OIaXlphVmdaes6LWmFOQRaJ4FQRxsWX7WAurGXISGCwDHohUhLGzgXLRgvkcNtIQaB"
+        "3IAmJI7bZW4HVplHE22xM7K6xnljI6vLC7OUR45tof2013KqFbqJaZcasb12llg09E1YcskwCEwE"
+        "QfAnsUtJB5umnjbVEPFKNNUQ8VTcWvtOFEDRNB6mMcVzWYWyEzyPd5ySUSk/aqrrqGlmC6GqFj9W"
+        "Fy1+rC5a/FiqLuo/FC1+rC5a/Fg1Sq/knnQGVhHWQSF0kSG53rOoPZmztRH6POmm4QI/CYagFxgZ"
+        "ykeMCBJsBk33JGiqnVRw9VBq+PWkga1hBl02haSGinUHW+yueAuNIkHmRlV3oQWcrppuIc40xtkG"
+        "ztWdbj0/aOHEJ/bUlZNYpNwt/yqvxvODHPowvu1dG1xKza4NO00Q6cL4tk8Wordokea8tLnqU0ye"
+        "jZCWqYzzo+Qs4/xW13H+ZsX7Tapr3eQsnSZdJnSeoER+j1DT9hTGlKi5IhKfpLlL0S4QcEFV7QIR"
+        "p6vmFkkS14fmg4iyVdtCxE0aDbYKUnxeis7X60Wc8zZxB+2d6A46SXfsDnIyTekOKs4aNMfOSWTG"
+        "emOHVlyxNtIbJQdPlPqx3rhmnRK1n4naSMdG2bRDh6uXtzCzdogmc4ZtGVW29ksP/u7yvb/70z/1"
+        "Kw9idm+XfdtFmcssXPyH2b+TbNz7b+ds3D/6ax89W8eM3y3wJ//9zkO/8ae69lkckP+Dr6j44w8s"
+        "Fn//AQ7IdwnFp9TixS3++xn6m2YYj3OWv4etDmzeSou4auDOCSTKOSzmBRGnNVkzaujCmXTou3BW"
+        "kTuWfdh9DSxl7k1sfAOBKcInI+ZigCZK2y1+NXU1RwtHUcwBmHYDHssPQSp0l8he9dR8ooJuqCut"
+        "toUz3+Trb/L8TfyEIV2HgVvf5MfEGyFXakkwCbn2XZ4MS4HC41ynsHbKX/txYZ0jcfCcoximhNS2"
+        "B8NZaZFauNQ7jQFkUopVTVnRcp9j832b/SxO+E5bx0KdKhuxb7Lv0rge6ET7vzPUb9bWCsvE3kon"
+        "K5hwHSGr3aAU3Go4PlMVQpv1e4roa/o9RRyim6pnhKAfkVKkc/Gaitc4MYqQTXPWRgeKV6agdL7p"
+        "Yy+M4SwNgLZ7wwXq8MZ7ecNPvTCY6niTZiGg+9x6s5DCFTAWeRdPjIBcPCkC0js5TOUtWbe9JZ0k"
+        "pJy9kdQbRGQl8vZIrCVKba1F3h4/OChOBZ6Qc4WXpMiUcX00mbNbqemJOiF1okivYf8fB2yKU0g/"
+        "59hL91gUFepHpBhHOjd7z8lXLl5xTjgil/bQEpifUWOIV9rTXIw0dmBi4RMFeqPJ/JST4f++BQPW"
+        "qcPX2PJ5QJb7moG0E2gFcuvf4DqG1ZuJI89aldTf58ZH7uw9PAujqPaAb6oeDZVJ6aa2HtOSDisH"
+        "W43XQElWXjpTeqkkEZNCySPmTNV3Dcg9vtq5QEyt4Ws9KXzTcE1WLIzX7f+nR2MMtm+X7Tk2fyfY"
+        "tYwdGjp4VbnMpq15pi1UZxIVuFJ3gLmHuWpubbnQ2HKRMD4EixOICPDplvt1WO4JaJlWcpxKXxhS"
+        "NwlhtyojN/Rc7LYLWDXDt3SkEcJF/GwYl9xQ01AuohvhXEJPQroUvJqGdUs3GSUu3looDxPVaE7j"
+        "p13JRIcnXnVTrJ56BdjJk6/6POuTnn7Vx+0aQZYTnuaEj0rKxS89E2ypDg0Blz7yVwZd3mb951z8"
+        "A2vzbj3+Id4Xm2er4YJwmcL1waVeXJhdscdURTt6fwJsMjWTsjmjnWKInfS8Zoi3Ed6dDe3Oh3Ub"
+        "Id1mOHculFuEcXePrwrRbv8dwUQOOk7+2Oxj3poFaXUaZe+OuyrPJCx9bBLx2Rvs9rrY4BkJyXYm"
+        "Oh6vozR7o306hGkKdwQeKPSzwiXBsfiJjjam2QhbofNJfHCDK7rWxLm7wVQVN+irrDMV3lYOAm+Z"
+        "SlJKP7O2rGSnd0tOdo7wW3NE2zjT3LOKeElYimNG+iYVfI5Gtir44D6GRhKVkxwVVujpbHI0Zu7n"
+        "QH5GbzmtdfTkNM8n0wnsaMSehKMnxNXFHx3v6YaMFiB7ElqusuaRtZwz8TG0+q80x9W5FuKVmORa"
+        "NPDrmfHrcvxcrgVYyDCRgL3SyBqoClrxAbl1bvOsO+CkDKITWii5/6OqVks5JgS0QCPQCuyOz3Uv"
+        "MdQnZlb+bfOXgwZ8oiCc05/tCY+IfftPc21v6oZD5uSKYsXsCK/hfwMwnHpZ"
+    ),
+}
+
+_cache = {}
+
+
+def dictionary(version):
+    """Dictionary bytes for a schema version (None if there is none)."""
+    if version not in _cache:
+        blob = _DICTS.get(version)
+        _cache[version] = zlib.decompress(base64.b64decode(blob)) if blob else None
+    return _cache[version]
@@ -14,6 +14,8 @@ import requests
 import json
 from pathlib import Path
 
+from network import rest
+
 API_BASE = 'https://myracingdata.com/api/v1'
 WS_URL = 'wss://myracingdata.com/api/v1/ws'
 
@@ -163,10 +165,10 @@ class LoginWindow:
         self.config.set('ws_url', WS_URL)
 
         try:
-            resp = requests.post(
-                f"{API_BASE}/auth/login",
+            resp = rest.post(
+                f"{API_BASE}/auth/login", 'auth',
                 json={'email': email, 'password': password},
-                timeout=10, verify=False
+                verify=False
             )
             if resp.status_code != 200:
                 try:
@@ -188,7 +190,7 @@ class LoginWindow:
             # Reuse the account's existing key if it has one…
             api_key = None
             try:
-                me = requests.get(f"{API_BASE}/auth/me", headers=headers, timeout=10, verify=False)
+                me = rest.get(f"{API_BASE}/auth/me", 'auth', headers=headers, verify=False)
                 if me.status_code == 200:
                     api_key = me.json().get('api_key')
             except requests.exceptions.RequestException:
@@ -196,9 +198,9 @@ class LoginWindow:
 
             # …otherwise mint one for this app.
             if not api_key:
-                mk = requests.post(
-                    f"{API_BASE}/api-keys", headers=headers,
-                    json={'key_name': 'Telemetry App'}, timeout=10, verify=False
+                mk = rest.post(
+                    f"{API_BASE}/api-keys", 'auth', headers=headers,
+                    json={'key_name': 'Telemetry App'}, verify=False
                 )
                 if mk.status_code in (200, 201):
                     api_key = mk.json().get('api_key')
@@ -238,10 +240,10 @@ class LoginWindow:
             self.config.set('api_url', API_BASE)
             self.config.set('ws_url', WS_URL)
 
-            response = requests.get(
-                f"{API_BASE}/users/me",
+            response = rest.get(
+                f"{API_BASE}/users/me", 'auth',
                 headers={'Authorization': f'Bearer {api_key}'},
-                timeout=10, verify=False
+                verify=False
             )
 
             if response.status_code == 200:
@@ -281,10 +283,10 @@ class LoginWindow:
                     self.config.set('api_url', API_BASE)
                     self.config.set('ws_url', WS_URL)
 
-                    response = requests.get(
-                        f"{API_BASE}/users/me",
+                    response = rest.get(
+                        f"{API_BASE}/users/me", 'auth',
                         headers={'Authorization': f'Bearer {api_key}'},
-                        timeout=5, verify=False
+                        timeout=(3.05, 5), verify=False
                     )
 
                     if response.status_code == 200:
@@ -9,11 +9,11 @@ main.py if pywebview isn't available.
 
 import logging
 
-import requests
 import urllib3
 import webview
 
 from config import Config
+from network import rest
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logger = logging.getLogger(__name__)
@@ -54,10 +54,10 @@ class Api:
         if not key:
             return {'ok': False, 'error': 'Please enter your API key'}
         try:
-            r = requests.get(
-                f"{self.app.config.api_url}/users/me",
+            r = rest.get(
+                f"{self.app.config.api_url}/users/me", 'auth',
                 headers={'Authorization': f'Bearer {key}'},
-                timeout=10, verify=False,
+                verify=False,
             )
             if r.status_code == 200:
                 self.app.config.set('api_key', key)
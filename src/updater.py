@@ -11,7 +11,7 @@ import os
 import subprocess
 import sys
 
-import requests
+from network import rest
 
 REPO = "Dishairano/myracingdata-telemetry"
 LATEST_URL = f"https://api.github.com/repos/{REPO}/releases/latest"
@@ -31,7 +31,7 @@ def _ver_tuple(v):
 def check_for_update(current_version):
     """Return {available, version, url} — available True only if a newer release exists."""
     try:
-        r = requests.get(LATEST_URL, timeout=8, headers={"Accept": "application/vnd.github+json"})
+        r = rest.get(LATEST_URL, "update_check", headers={"Accept": "application/vnd.github+json"})
         if r.status_code != 200:
             return {"available": False}
         rel = r.json()
@@ -65,7 +65,7 @@ def download_and_apply(url=None):
         folder = os.path.dirname(current)
         new_exe = os.path.join(folder, "MyRacingData-Telemetry.new.exe")
 
-        with requests.get(url, timeout=180, stream=True) as r:
+        with rest.get(url, "update_download", stream=True) as r:
             r.raise_for_status()
             expected = int(r.headers.get("Content-Length") or 0)
             written = 0